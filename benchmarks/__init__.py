@@ -0,0 +1,5 @@
+"""
+Offline benchmarks of the package, run from the root of the repository with python -m benchmarks.
+
+The services are benchmarked against the local fake server of nmbrs.testing, so no network or Nmbrs account is needed.
+"""
@@ -0,0 +1,7 @@
+"""Run the benchmarks, e.g. python -m benchmarks --compare 1.0.13."""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
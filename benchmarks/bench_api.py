@@ -0,0 +1,50 @@
+"""Benchmarks of constructing the Nmbrs class and the lazy initialization of its services, against the fake server."""
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+
+
+def setup():
+    """Start the fake server."""
+    SERVER.start()
+
+
+def teardown():
+    """Stop the fake server."""
+    SERVER.stop()
+
+
+def _api() -> Nmbrs:
+    return Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+
+
+def time_construct_with_domain():
+    """Construct the Nmbrs class without initializing a service."""
+    _api()
+
+
+def time_construct_with_token():
+    """Construct the Nmbrs class, retrieving the domain with the debtor service."""
+    Nmbrs("username", "token", base_uri=SERVER.base_uri)
+
+
+def time_init_debtor_service():
+    """Initialize the debtor service, loading its WSDL."""
+    _api().debtor  # pylint: disable=expression-not-assigned
+
+
+def time_init_company_service():
+    """Initialize the company service and its microservices, loading its WSDL."""
+    _api().company  # pylint: disable=expression-not-assigned
+
+
+def time_init_employee_service():
+    """Initialize the employee service and its microservices, loading its WSDL."""
+    _api().employee  # pylint: disable=expression-not-assigned
+
+
+def time_init_report_service():
+    """Initialize the report service, loading its WSDL."""
+    _api().report  # pylint: disable=expression-not-assigned
@@ -0,0 +1,61 @@
+"""
+Benchmarks of calls made with zeep, and with the static bindings generated from the WSDLs of the fake server.
+
+The static bindings render the requests and parse the responses without zeep, so the difference is the time zeep
+spends binding the arguments, building the request and converting the response to its objects.
+"""
+
+from types import ModuleType
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.bindings.generate import generate_bindings
+from src.nmbrs.bindings.static import StaticBinding, register_bindings, unregister_bindings
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+EMPLOYEES = 2000
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=EMPLOYEES, seed=1))
+_api: Nmbrs | None = None
+_bindings: StaticBinding | None = None
+
+
+def setup():
+    """Start the fake server, create the API and generate the static bindings of the employee service."""
+    global _api, _bindings  # pylint: disable=global-statement
+    SERVER.start()
+    _api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+    module = ModuleType("employee_service")
+    exec(generate_bindings(f"{SERVER.base_uri}EmployeeService.asmx?WSDL"), module.__dict__)  # pylint: disable=exec-used
+    _bindings = StaticBinding.from_module(module)
+
+
+def teardown():
+    """Stop the fake server."""
+    SERVER.stop()
+    unregister_bindings()
+
+
+def _call(description: str, call, static: bool):
+    def benchmark():
+        if static:
+            register_bindings(_bindings)
+        else:
+            unregister_bindings()
+        call()
+
+    benchmark.__doc__ = f"{description}, with {'static bindings' if static else 'zeep'}."
+    return benchmark
+
+
+_CALLS = {
+    "salary_get_all_by_company": (f"Retrieve the salaries of {EMPLOYEES} employees", lambda: _api.employee.salary.get_all_by_company(1)),
+    "absence_get_all_by_company": (f"Retrieve the absences of {EMPLOYEES} employees", lambda: _api.employee.absence.get_all_by_company(1)),
+    "hour_component_get_fixed": (
+        "Retrieve the fixed hour components of an employee",
+        lambda: _api.employee.hour_component.get_fixed(1, 1, 2024),
+    ),
+}
+
+for _name, (_description, _function) in _CALLS.items():
+    for _static in (False, True):
+        globals()[f"time_{_name}_{'static' if _static else 'zeep'}"] = _call(_description, _function, _static)
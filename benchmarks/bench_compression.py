@@ -0,0 +1,72 @@
+"""
+Benchmarks of compressed and uncompressed requests and responses, at several payload sizes.
+
+The fake server simulates a limited bandwidth, so the transfer time of the bodies is part of the timings, as it is for
+workers far away from the Nmbrs API. Compressing costs CPU time on both sides, which only pays off when the transfer
+time saved is larger.
+"""
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.data_classes.employee import DaysWorked
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.compression import CompressionTransport
+
+BANDWIDTH = 2_000_000  # bytes per second, about 16 Mbit/s
+EMPLOYEES = (50, 500, 2000)
+BATCH_SIZES = (100, 1000, 10000)
+
+SERVERS = {
+    employees: FakeNmbrsServer(
+        Dataset.generate(companies=1, employees=employees, seed=1),
+        compress_responses=True,
+        accept_compressed_requests=True,
+        bandwidth=BANDWIDTH,
+    )
+    for employees in EMPLOYEES
+}
+_apis = {}
+
+
+def setup():
+    """Start the fake servers, and create the API with an uncompressed and a compressed transport for each."""
+    for employees, server in SERVERS.items():
+        server.start()
+        for name, transport in (
+            ("identity", CompressionTransport(accept_encoding=None)),
+            ("gzip", CompressionTransport(accept_encoding="gzip", compress_requests=True)),
+        ):
+            _apis[employees, name] = Nmbrs(
+                "username", "token", auth_type="domain", domain="fake", base_uri=server.base_uri, transport=transport
+            )
+
+
+def teardown():
+    """Stop the fake servers."""
+    for server in SERVERS.values():
+        server.stop()
+
+
+def _get_salaries(employees: int, encoding: str):
+    def benchmark():
+        _apis[employees, encoding].employee.salary.get_all_by_company(1)
+
+    benchmark.__doc__ = f"Retrieve the salaries of {employees} employees, with {encoding} responses."
+    return benchmark
+
+
+def _post_days(size: int, encoding: str):
+    days = [DaysWorked(employee_id, 5, 1, 2024) for employee_id in range(size)]
+
+    def benchmark():
+        _apis[EMPLOYEES[0], encoding].employee.days.post_batch_fixed(days, False)
+
+    benchmark.__doc__ = f"Set the fixed days of {size} employees in a batch, with {encoding} requests."
+    return benchmark
+
+
+for _employees in EMPLOYEES:
+    for _encoding in ("identity", "gzip"):
+        globals()[f"time_salary_get_all_by_company_{_employees}_{_encoding}"] = _get_salaries(_employees, _encoding)
+for _size in BATCH_SIZES:
+    for _encoding in ("identity", "gzip"):
+        globals()[f"time_days_fixed_set_batch_{_size}_{_encoding}"] = _post_days(_size, _encoding)
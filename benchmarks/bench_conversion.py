@@ -0,0 +1,61 @@
+"""
+Benchmarks of converting the responses of the bulk endpoints to DataClass objects.
+
+The responses are retrieved from the fake server once, after which the endpoints are called with a client answering
+with the same zeep objects, so only serialize_object, the DataClass construction and the decorators are measured.
+"""
+
+from types import SimpleNamespace
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+EMPLOYEES = 200
+
+# The microservice of the employee service, the operation and the name of its company parameter
+BULK_ENDPOINTS = {
+    "salary": ("Salary_GetAll_AllEmployeesByCompany", "CompanyID"),
+    "contract": ("Contract_GetAll_AllEmployeesByCompany", "CompanyID"),
+    "schedule": ("Schedule_GetAll_AllEmployeesByCompany", "CompanyID"),
+    "address": ("Address_GetAll_AllEmployeesByCompany", "CompanyID"),
+    "absence": ("Absence_GetAll_AllEmployeesByCompany", "CompanyId"),
+}
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=EMPLOYEES, seed=1))
+_services = {}
+
+
+def setup():
+    """Retrieve the response of every bulk endpoint, and create its microservice with a client replaying the response."""
+    with SERVER:
+        api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+        for name, (operation, parameter) in BULK_ENDPOINTS.items():
+            service = getattr(api.employee, name)
+            response = getattr(service.client.service, operation)(**{parameter: 1}, _soapheaders=api.auth_manager.header)
+            client = SimpleNamespace(service=SimpleNamespace(**{operation: lambda response=response, **_: response}))
+            _services[name] = type(service)(api.auth_manager, client)
+
+
+def time_salary_get_all_by_company():
+    """Convert the salaries of every employee of a company."""
+    _services["salary"].get_all_by_company(1)
+
+
+def time_contract_get_all_by_company():
+    """Convert the contracts of every employee of a company."""
+    _services["contract"].get_all_by_company(1)
+
+
+def time_schedule_get_all_by_company():
+    """Convert the schedules of every employee of a company."""
+    _services["schedule"].get_all_by_company(1)
+
+
+def time_address_get_all_by_company():
+    """Convert the addresses of every employee of a company."""
+    _services["address"].get_all_by_company(1)
+
+
+def time_absence_get_all_by_company():
+    """Convert the absences of every employee of a company, with a nested absence cause."""
+    _services["absence"].get_all_by_company(1)
@@ -0,0 +1,36 @@
+"""Benchmarks of the methods of DataClass, on the absences of a company as returned by the employee service."""
+
+import copy
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.data_classes.serialize import serialize
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=200, seed=1))
+_absences = []
+_copies = []
+
+
+def setup():
+    """Retrieve the absences of a company, and a copy of them to compare with."""
+    with SERVER:
+        api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+        _absences[:] = api.employee.absence.get_all_by_company(1)
+    _copies[:] = copy.deepcopy(_absences)
+
+
+def time_to_dict():
+    """Convert the absences to dictionaries."""
+    for absence in _absences:
+        absence.to_dict()
+
+
+def time_serialize():
+    """Serialize the list of absences."""
+    serialize(_absences)
+
+
+def time_eq():
+    """Compare the absences with equal copies."""
+    for absence, other in zip(_absences, _copies):
+        absence == other  # pylint: disable=pointless-statement
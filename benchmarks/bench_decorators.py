@@ -0,0 +1,65 @@
+"""Benchmarks of the overhead of the decorators wrapping every operation of the services."""
+
+import logging
+
+import zeep.exceptions
+
+from src.nmbrs.exceptions import NotFoundException
+from src.nmbrs.utils.nmbrs_exception_handler import nmbrs_exception_handler
+from src.nmbrs.utils.return_list import return_list
+
+RECORDS = list(range(100))
+FAULTS = 1000
+
+
+def _get() -> list[int]:
+    return RECORDS
+
+
+_handled = nmbrs_exception_handler(resource="Benchmark:Get")(_get)
+_listed = return_list(_get)
+_both = return_list(nmbrs_exception_handler(resource="Benchmark:Get")(_get))
+
+
+@nmbrs_exception_handler(resource="Benchmark:Get")
+def _not_found():
+    raise zeep.exceptions.Fault("Server was unable to process request. ---> 2046: Not found")
+
+
+def setup():
+    """Silence the errors logged for the faults, as bulk jobs expecting them do."""
+    logging.getLogger("src.nmbrs.utils.nmbrs_exception_handler").disabled = True
+
+
+def teardown():
+    """Log the errors of the faults again."""
+    logging.getLogger("src.nmbrs.utils.nmbrs_exception_handler").disabled = False
+
+
+def time_undecorated():
+    """Call the function without decorators, the baseline of the other benchmarks."""
+    _get()
+
+
+def time_nmbrs_exception_handler():
+    """Call the function decorated with nmbrs_exception_handler."""
+    _handled()
+
+
+def time_return_list():
+    """Call the function decorated with return_list."""
+    _listed()
+
+
+def time_return_list_and_nmbrs_exception_handler():
+    """Call the function with both decorators, as the list operations of the services are decorated."""
+    _both()
+
+
+def time_not_found_faults():
+    """Catch 1000 NotFoundException (2046) raised for faults by nmbrs_exception_handler, as a bulk job expecting them."""
+    for _ in range(FAULTS):
+        try:
+            _not_found()
+        except NotFoundException:
+            pass
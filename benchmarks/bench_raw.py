@@ -0,0 +1,52 @@
+"""
+Benchmarks of the *_GetAll endpoints returning data classes, and of their raw calls returning lxml elements or bytes.
+
+The raw calls skip the conversion of the responses to zeep objects, dictionaries and data classes, so the difference
+with the data classes is the time spent in that conversion.
+"""
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.raw import raw_call
+
+EMPLOYEES = 2000
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=EMPLOYEES, seed=1))
+_api: Nmbrs | None = None
+
+
+def setup():
+    """Start the fake server, and create the API."""
+    global _api  # pylint: disable=global-statement
+    SERVER.start()
+    _api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+
+
+def teardown():
+    """Stop the fake server."""
+    SERVER.stop()
+
+
+# The operation and the name of its company parameter, by microservice
+OPERATIONS = {
+    "salary": ("Salary_GetAll_AllEmployeesByCompany", "CompanyID"),
+    "absence": ("Absence_GetAll_AllEmployeesByCompany", "CompanyId"),
+    "schedule": ("Schedule_GetAll_AllEmployeesByCompany", "CompanyID"),
+}
+
+
+def _get_all(name: str, mode: str | None):
+    def benchmark():
+        if mode is None:
+            getattr(_api.employee, name).get_all_by_company(1)
+        else:
+            operation, param = OPERATIONS[name]
+            raw_call(_api.employee, operation, mode, **{param: 1})
+
+    benchmark.__doc__ = f"Retrieve the {name} records of {EMPLOYEES} employees, as {mode or 'data classes'}."
+    return benchmark
+
+
+for _name in ("salary", "absence", "schedule"):
+    for _mode in (None, "element", "bytes"):
+        globals()[f"time_{_name}_get_all_by_company_{_mode or 'data_classes'}"] = _get_all(_name, _mode)
@@ -0,0 +1,51 @@
+"""Benchmarks of parsing the XML of reports, journals and wage tax declarations, as generated by the fake server."""
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.data_classes.journal import Journal, journal_totals
+from src.nmbrs.data_classes.utils.xml import iter_xml_records, parse_xml_to_dict
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=50, seed=1))
+_xml = {}
+
+
+def setup():
+    """Generate a wage codes report, a journals report and a wage tax declaration of a company."""
+    with SERVER:
+        api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+        header = api.auth_manager.header
+        for name, operation in (
+            ("wage_codes", "Reports_GetWageCodesByYear_Background"),
+            ("journals", "Reports_Accountant_JournalsReportByYear_Background"),
+        ):
+            task_id = getattr(api.report.client.service, operation)(CompanyId=1, Year=2024, _soapheaders=header)
+            _xml[name] = api.report.background_task_status(task_id)["Content"]
+        wage_tax = api.company.wage_tax.get_all_wagetax(1, 2024)[0]
+        _xml["wage_tax"] = api.company.wage_tax.get_wagetax_details(1, wage_tax.loonaangifte_id).xml
+
+
+def time_wage_codes_parse():
+    """Parse a wage codes report into a dictionary, as done by ReportService.background_task_result."""
+    parse_xml_to_dict(_xml["wage_codes"])
+
+
+def time_wage_codes_iter_records():
+    """Parse the rows of a wage codes report one at a time, as done by ReportService.background_task_records."""
+    for _ in iter_xml_records(_xml["wage_codes"], "WageCode"):
+        pass
+
+
+def time_journal_iter_entries():
+    """Parse the entries of a journal into JournalEntry objects."""
+    for _ in Journal(company_id=1, run_id=0, xml=_xml["journals"]).iter_entries():
+        pass
+
+
+def time_journal_totals():
+    """Total the entries of a journal per ledger account."""
+    journal_totals(Journal(company_id=1, run_id=0, xml=_xml["journals"]).iter_entries())
+
+
+def time_wage_tax_parse():
+    """Parse a wage tax declaration into a dictionary."""
+    parse_xml_to_dict(_xml["wage_tax"])
@@ -0,0 +1,55 @@
+"""
+Benchmarks of the serialization of requests by zeep, and by the request templates of the operations.
+
+zeep binds the arguments and builds and serializes the XSD objects of the whole envelope for every request, the
+templates render only the values of the parameters and of the authentication header. The requests are serialized
+without sending them, so the difference is the time spent creating the envelopes.
+"""
+
+from zeep.wsdl.utils import etree_to_string
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.bindings.templates import request_template
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+REQUESTS = 1000
+
+SERVER = FakeNmbrsServer(Dataset.generate(companies=1, employees=1, seed=1))
+_api: Nmbrs | None = None
+
+
+def setup():
+    """Start the fake server, and create the API."""
+    global _api  # pylint: disable=global-statement
+    SERVER.start()
+    _api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=SERVER.base_uri)
+
+
+def teardown():
+    """Stop the fake server."""
+    SERVER.stop()
+
+
+def _serialize(operation: str, template: bool):
+    def benchmark():
+        client = _api.employee.client
+        binding = client.service._binding  # pylint: disable=protected-access
+        header = _api.employee.auth_manager.header
+        if template:
+            request = request_template(binding.get(operation))
+            for employee_id in range(REQUESTS):
+                request.render({"EmployeeId": employee_id}, header)
+        else:
+            for employee_id in range(REQUESTS):
+                envelope, _ = binding._create(  # pylint: disable=protected-access
+                    operation, (), {"EmployeeId": employee_id, "_soapheaders": header}, client=client
+                )
+                etree_to_string(envelope)
+
+    benchmark.__doc__ = f"Serialize {REQUESTS} requests of {operation}, with {'the request template' if template else 'zeep'}."
+    return benchmark
+
+
+for _operation in ("Absence_GetList", "Schedule_GetCurrent"):
+    for _template in (False, True):
+        globals()[f"time_{_operation.lower()}_{'template' if _template else 'zeep'}"] = _serialize(_operation, _template)
@@ -0,0 +1,221 @@
+"""
+This module discovers, runs and compares the benchmarks of the package, in the style of asv.
+
+Benchmarks are the functions named time_* in the bench_*.py modules of this package. A module can define setup() and
+teardown() functions, which are called once before and after its benchmarks, e.g. to start a fake server. The results
+are stored per release in benchmarks/results/<version>.json, so the timings of releases can be compared.
+
+Functions:
+    discover(pattern) -> list: Find the benchmark modules and their benchmarks.
+    time_benchmark(func, repeat) -> dict: Time a benchmark.
+    run(pattern, repeat) -> dict: Run the benchmarks and return their timings.
+    save_results(timings, path) -> str: Store the timings with the version, commit and machine.
+    load_results(path_or_version) -> dict: Load stored results.
+    compare(baseline, timings, threshold) -> list: Compare timings with a baseline.
+    main(argv) -> int: The command line interface, python -m benchmarks.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Callable
+
+from src.nmbrs.__version__ import __version__
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.2
+
+
+def discover(pattern: str | None = None) -> list[tuple[ModuleType, list[tuple[str, Callable]]]]:
+    """
+    Find the benchmark modules and their benchmarks, in the order they are defined.
+
+    Args:
+        pattern (str, optional): Only include benchmarks whose name contains the pattern, e.g. "bench_api" or "salary".
+
+    Returns:
+        list[tuple[ModuleType, list[tuple[str, Callable]]]]: The modules with their benchmarks, by name "<module>.<function>".
+    """
+    found = []
+    for module_info in sorted(pkgutil.iter_modules([os.path.dirname(__file__)]), key=lambda info: info.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{__package__}.{module_info.name}")
+        benchmarks = [
+            (f"{module_info.name}.{name}", func)
+            for name, func in vars(module).items()
+            if name.startswith("time_") and callable(func) and (pattern is None or pattern in f"{module_info.name}.{name}")
+        ]
+        if benchmarks:
+            found.append((module, benchmarks))
+    return found
+
+
+def time_benchmark(func: Callable, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Time a benchmark, calling it often enough to take at least 0.2 seconds per repeat.
+
+    Args:
+        func (Callable): The benchmark.
+        repeat (int, optional): The number of times to repeat the measurement. Defaults to 5.
+
+    Returns:
+        dict: The minimum and median seconds per call, and the number of calls per repeat.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat, number)]
+    return {"min": min(times), "median": statistics.median(times), "number": number, "repeat": repeat}
+
+
+def run(pattern: str | None = None, repeat: int = DEFAULT_REPEAT, report: Callable[[str, dict], None] | None = None) -> dict:
+    """
+    Run the benchmarks and return their timings.
+
+    Args:
+        pattern (str, optional): Only run benchmarks whose name contains the pattern.
+        repeat (int, optional): The number of times to repeat each measurement. Defaults to 5.
+        report (Callable[[str, dict], None], optional): Called with the name and timing of each benchmark once it is done.
+
+    Returns:
+        dict: The timings by benchmark name.
+    """
+    timings = {}
+    for module, benchmarks in discover(pattern):
+        if hasattr(module, "setup"):
+            module.setup()
+        try:
+            for name, func in benchmarks:
+                timings[name] = time_benchmark(func, repeat)
+                if report is not None:
+                    report(name, timings[name])
+        finally:
+            if hasattr(module, "teardown"):
+                module.teardown()
+    return timings
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def save_results(timings: dict, path: str | None = None) -> str:
+    """
+    Store the timings with the version of the package, the commit and the machine they were measured on.
+
+    Args:
+        timings (dict): The timings by benchmark name, as returned by run.
+        path (str, optional): The file to write. Defaults to benchmarks/results/<version>.json.
+
+    Returns:
+        str: The path of the file.
+    """
+    path = path or os.path.join(RESULTS_DIR, f"{__version__}.json")
+    results = {
+        "version": __version__,
+        "commit": _git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "system": platform.system(),
+            "processor": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": timings,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+    return path
+
+
+def load_results(path_or_version: str) -> dict:
+    """
+    Load stored results.
+
+    Args:
+        path_or_version (str): The path of a results file, or the version of a release in benchmarks/results.
+
+    Returns:
+        dict: The results, with the timings by benchmark name in "benchmarks".
+    """
+    path = path_or_version
+    if not os.path.exists(path):
+        path = os.path.join(RESULTS_DIR, f"{path_or_version}.json")
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(baseline: dict, timings: dict, threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, float, float, float]]:
+    """
+    Compare timings with a baseline, using the minimum time per call, which is the least affected by other processes.
+
+    Args:
+        baseline (dict): The timings of the baseline by benchmark name.
+        timings (dict): The timings by benchmark name.
+        threshold (float, optional): The ratio above which a benchmark is a regression. Defaults to 1.2.
+
+    Returns:
+        list[tuple[str, float, float, float]]: The name, baseline time, time and ratio of every regressed benchmark.
+    """
+    regressions = []
+    for name, timing in timings.items():
+        if name not in baseline:
+            continue
+        ratio = timing["min"] / baseline[name]["min"]
+        if ratio > threshold:
+            regressions.append((name, baseline[name]["min"], timing["min"], ratio))
+    return regressions
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a unit fitting its size, e.g. "12.3us"."""
+    for unit, factor in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * factor >= 1:
+            return f"{seconds * factor:.3g}{unit}"
+    return f"{seconds * 1e9:.3g}ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line, returning exit code 1 when a benchmark regressed."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the offline benchmarks of the package.")
+    parser.add_argument("-k", "--pattern", help="only run benchmarks whose name contains the pattern")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--save", action="store_true", help=f"store the results in {os.path.relpath(RESULTS_DIR)}/<version>.json")
+    parser.add_argument("--output", help="store the results in this file instead")
+    parser.add_argument("--compare", help="a results file, or the version of a release with stored results, to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.compare)["benchmarks"] if args.compare else {}
+
+    def report(name: str, timing: dict) -> None:
+        line = f"{name:<60} {format_time(timing['median']):>10} (min {format_time(timing['min'])})"
+        if name in baseline:
+            line += f"  {timing['min'] / baseline[name]['min']:.2f}x"
+        print(line, flush=True)
+
+    timings = run(args.pattern, args.repeat, report)
+    if args.save or args.output:
+        print(f"Results stored in {save_results(timings, args.output)}")
+
+    regressions = compare(baseline, timings, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {format_time(before)} -> {format_time(after)} ({ratio:.2f}x)", file=sys.stderr)
+    return 1 if regressions else 0
@@ -10,6 +10,11 @@ requires = [
     "zeep>=4.2.1",
 ]
 
+extras = {
+    "numpy": ["numpy>=1.24.0"],
+    "opentelemetry": ["opentelemetry-api>=1.20.0"],
+}
+
 about = {}
 here = os.path.abspath(os.path.dirname(__file__))
 version_file = os.path.join(here, "src", "nmbrs", "__version__.py")
@@ -33,6 +38,7 @@ setup(
     keywords=["nmbrs", "soap"],
     python_requires=">=3.10",
     install_requires=requires,
+    extras_require=extras,
     package_data={"": ["LICENSE", "NOTICE"]},
     package_dir={"": "src"},
     include_package_data=True,
@@ -11,3 +11,5 @@ from .__version__ import (
 from .__logging__ import logger_config
 from .service.sso_service import SingleSingOnService
 from .data_classes.serialize import serialize
+from .data_classes.columnar import to_columns, to_structured_array
+from .data_classes.export import write_csv, write_jsonl
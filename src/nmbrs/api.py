@@ -2,6 +2,9 @@
 
 import logging
 import time
+
+from zeep import Transport
+
 from .auth.token_manager import AuthManager
 from .exceptions import ParameterMissingError
 from .service.company_service import CompanyService
@@ -29,6 +32,8 @@ class Nmbrs:
         auth_type: str = "token",
         domain: str = None,
         sandbox: bool = True,
+        base_uri: str = None,
+        transport: Transport = None,
     ):
         """
         Initializes a Nmbrs SOAP API instance with authentication details and settings.
@@ -39,11 +44,15 @@ class Nmbrs:
             auth_type (str): The type of authentication to be used. Options: "token", "domain". Default "token"
             domain (str, optional): Nmbrs environment subdomain (used when the auth_type paramater is set to "domain").
             sandbox (bool, optional): A boolean indicating whether to use the sandbox environment. Default is True.
+            base_uri (str, optional): Base URI of the SOAP services, overriding the environment, e.g. a local fake server.
+            transport (Transport, optional): The zeep transport used by the services, e.g. to record or replay the traffic.
         """
         if not sandbox:
             logger.warning("Live environment is activated")  # pragma: no cover
 
         self.sandbox = sandbox
+        self.base_uri = base_uri
+        self.transport = transport
         self.auth_manager = AuthManager()
 
         # Initialize service attributes to None
@@ -65,7 +74,7 @@ class Nmbrs:
         """
         if self._debtor_service is None:
             start_time = time.time()
-            self._debtor_service = DebtorService(self.auth_manager, self.sandbox)
+            self._debtor_service = DebtorService(self.auth_manager, self.sandbox, base_uri=self.base_uri, transport=self.transport)
             end_time = time.time()
             logger.debug("DebtorService initialization time: %s seconds", end_time - start_time)
         return self._debtor_service
@@ -77,7 +86,7 @@ class Nmbrs:
         """
         if self._company_service is None:
             start_time = time.time()
-            self._company_service = CompanyService(self.auth_manager, self.sandbox)
+            self._company_service = CompanyService(self.auth_manager, self.sandbox, base_uri=self.base_uri, transport=self.transport)
             end_time = time.time()
             logger.debug("CompanyService initialization time: %s seconds", end_time - start_time)
         return self._company_service
@@ -89,7 +98,7 @@ class Nmbrs:
         """
         if self._employee_service is None:
             start_time = time.time()
-            self._employee_service = EmployeeService(self.auth_manager, self.sandbox)
+            self._employee_service = EmployeeService(self.auth_manager, self.sandbox, base_uri=self.base_uri, transport=self.transport)
             end_time = time.time()
             logger.debug("EmployeeService initialization time: %s seconds", end_time - start_time)
         return self._employee_service
@@ -101,7 +110,7 @@ class Nmbrs:
         """
         if self._report_service is None:
             start_time = time.time()
-            self._report_service = ReportService(self.auth_manager, self.sandbox)
+            self._report_service = ReportService(self.auth_manager, self.sandbox, base_uri=self.base_uri, transport=self.transport)
             end_time = time.time()
             logger.debug("ReportService initialization time: %s seconds", end_time - start_time)
         return self._report_service
@@ -68,3 +68,22 @@ class AuthManager:
             return self.header["AuthHeaderWithDomain"]["Domain"]
         logger.warning("Authentication header is not set.")
         return ""
+
+
+def get_tenant(header: dict | None) -> str | None:
+    """
+    Gets the tenant of an authentication header, e.g. to attribute metrics and spans.
+
+    Args:
+        header (dict | None): An AuthHeaderWithDomain or AuthHeader header, as used for _soapheaders.
+
+    Returns:
+        str | None: The domain, else the username, or None if there is no header or it is not a dictionary.
+    """
+    # zeep also accepts the headers as a list of elements or objects, their tenant is not known
+    if not header or not isinstance(header, dict):
+        return None
+    fields = next(iter(header.values()))
+    if not isinstance(fields, dict):
+        return None
+    return fields.get("Domain") or fields.get("Username")
@@ -0,0 +1,15 @@
+"""Static bindings imports"""
+
+from .generate import generate_bindings
+from .static import (
+    RequestTemplate,
+    StaticBinding,
+    StaticOperation,
+    StaticValue,
+    get_static_operation,
+    load_bindings,
+    register_bindings,
+    unregister_bindings,
+)
+from .templates import request_template, use_request_templates
+from .proxy import BindingOperationProxy, bind_client
@@ -0,0 +1,223 @@
+"""
+This module generates the static bindings of the operations of a service from its WSDL.
+
+The generated module holds the data of the bindings as Python literals: the namespace and the authentication headers
+of the service, the fields of the complex types as (name, type, many) tuples, and per operation the SOAP action, the
+parameters as (name, type, required) tuples and the type of the response. The bindings are compiled when the module is
+registered, see nmbrs.bindings.static.
+
+Operations are only generated when the static binding gives the same result as zeep: the parameters are simple types,
+and the types of the response are sequences of elements in the namespace of the service, without attributes. Other
+operations are left out, and are called with zeep.
+
+Functions:
+    generate_bindings(wsdl, transport) -> str: Generate the source of the module with the static bindings of a service.
+    module_name(service) -> str: The name of the module of a service, e.g. "employee_service".
+    request_params(operation, namespace, headers) -> tuple[tuple, tuple]: Get the parameters and headers of an operation.
+    main(argv) -> None: Generate the modules of the services from the command line.
+"""
+
+import argparse
+import logging
+import os
+import pprint
+import re
+
+from zeep import Client, Transport
+from zeep.wsdl.bindings.soap import Soap11Binding
+from zeep.wsdl.messages import DocumentMessage
+from zeep.xsd import AnySimpleType, ComplexType, Element, Sequence
+from zeep.xsd.types.builtins import default_types
+
+from ..utils.payload_size import get_resource
+
+logger = logging.getLogger(__name__)
+
+XSD_NS = "http://www.w3.org/2001/XMLSchema"
+
+# The builtin XSD type of the simple types, restrictions of a builtin type (e.g. enumerations) use the class of the builtin
+_BUILTIN_TYPES = {}
+for _qname, _xsd_type in default_types.items():
+    if _qname.namespace == XSD_NS:
+        _BUILTIN_TYPES.setdefault(type(_xsd_type), _qname.localname)
+
+
+class UnsupportedType(Exception):
+    """Raised for a type the static bindings do not support, the operations using it are called with zeep."""
+
+
+def _elements(xsd_type, namespace: str) -> list[Element]:
+    """Get the elements of a complex type, a sequence of elements in the namespace without attributes."""
+    if not isinstance(xsd_type, ComplexType) or xsd_type.attributes:
+        raise UnsupportedType(f"{xsd_type} is not a complex type without attributes")
+    nested = xsd_type.elements_nested
+    if not nested:
+        return []
+    if len(nested) != 1 or not isinstance(nested[0][1], Sequence):
+        raise UnsupportedType(f"{xsd_type} is not a sequence")
+    elements = list(nested[0][1])
+    for element in elements:
+        if not isinstance(element, Element) or element.qname.namespace != namespace:
+            raise UnsupportedType(f"{xsd_type} has an element that is not in {namespace}")
+    return elements
+
+
+def _simple_type(xsd_type) -> str:
+    """Get the name of the builtin type of a simple type, e.g. "xsd:int"."""
+    name = _BUILTIN_TYPES.get(type(xsd_type)) if isinstance(xsd_type, AnySimpleType) else None
+    if name is None:
+        raise UnsupportedType(f"{xsd_type} is not a builtin simple type")
+    return f"xsd:{name}"
+
+
+def _collect(name: str, xsd_type, namespace: str, types: dict) -> str:
+    """Add the fields of a complex type and the types of its fields to types, returning the name of the type."""
+    if name in types:
+        return name
+    types[name] = None  # Reserved, for recursive types
+    fields = []
+    for element in _elements(xsd_type, namespace):
+        if isinstance(element.type, AnySimpleType):
+            type_name = _simple_type(element.type)
+        else:
+            # Anonymous types are named after the type and the element containing them
+            is_global = getattr(element.type, "is_global", False) and element.type.qname is not None
+            type_name = element.type.qname.localname if is_global else f"{name}.{element.name}"
+            type_name = _collect(type_name, element.type, namespace, types)
+        fields.append((element.name, type_name, element.max_occurs != 1))
+    types[name] = tuple(fields)
+    return name
+
+
+def request_params(operation, namespace: str, headers: dict) -> tuple[tuple, tuple]:
+    """
+    Get the parameters and the names of the headers of the requests of an operation, adding the fields of its headers.
+
+    Args:
+        operation (zeep.wsdl.definitions.Operation): The operation of the binding.
+        namespace (str): The namespace of the service.
+        headers (dict): The fields of the headers by header name, the headers of the operation are added.
+
+    Returns:
+        tuple[tuple, tuple]: The parameters as (name, type, required) tuples, and the names of the headers.
+
+    Raises:
+        UnsupportedType: When a parameter or a header is not supported by the static bindings.
+    """
+    if not isinstance(operation.binding, Soap11Binding) or not isinstance(operation.input, DocumentMessage):
+        raise UnsupportedType(f"{operation.name} is not a document operation of a SOAP 1.1 binding")
+    body = operation.input.body
+    if body is None or body.qname.namespace != namespace or operation.abstract.wsa_action:
+        raise UnsupportedType(f"{operation.name} is not an operation in {namespace} without WS-Addressing")
+    params = []
+    for element in _elements(body.type, namespace):
+        if element.max_occurs != 1:
+            raise UnsupportedType(f"{element.name} is a list")
+        params.append((element.name, _simple_type(element.type), element.min_occurs >= 1))
+
+    operation_headers = []
+    for name, element in operation.input.header.type.elements:
+        if element.qname.namespace != namespace:
+            raise UnsupportedType(f"{name} is not a header in {namespace}")
+        fields = _elements(element.type, namespace)
+        for field in fields:
+            _simple_type(field.type)
+        headers[name] = tuple(field.name for field in fields)
+        operation_headers.append(name)
+    return tuple(params), tuple(operation_headers)
+
+
+def _operation(operation, namespace: str, headers: dict, types: dict) -> dict:
+    """Get the definition of an operation, adding the types of its response and its headers."""
+    output = operation.output.body
+    if output is None or operation.output.header.type.elements:
+        raise UnsupportedType(f"{operation.name} is not an operation without response headers")
+    params, operation_headers = request_params(operation, namespace, headers)
+    response = _collect(output.qname.localname, output.type, namespace, types)
+    return {
+        "soap_action": operation.soapaction,
+        "params": params,
+        "headers": operation_headers,
+        "response": response,
+    }
+
+
+def _generate(wsdl: str, transport: Transport | None) -> tuple[str, str]:
+    """Generate the module of a service, returning the name of the service and the source of the module."""
+    client = Client(wsdl, transport=transport)
+    binding = client.service._binding  # pylint: disable=protected-access
+    service = get_resource(client.service._binding_options["address"], "").rstrip(":")  # pylint: disable=protected-access
+    namespace = binding.port_name.namespace
+
+    headers, types, operations, skipped = {}, {}, {}, []
+    for name, operation in sorted(binding.all().items()):
+        try:
+            scratch_headers, scratch_types = dict(headers), dict(types)
+            operations[name] = _operation(operation, namespace, scratch_headers, scratch_types)
+        except UnsupportedType as e:
+            logger.info("Skipped %s:%s, it is called with zeep: %s", service, name, e)
+            skipped.append(name)
+            continue
+        headers, types = scratch_headers, scratch_types
+
+    return service, _source(wsdl, service, namespace, skipped, headers=headers, types=types, operations=operations)
+
+
+def _source(wsdl: str, service: str, namespace: str, skipped: list[str], **data: dict) -> str:
+    """Write the source of the module of a service, with the headers, types and operations as Python literals."""
+    literals = "".join(f"\n{name.upper()} = {pprint.pformat(value, width=120, sort_dicts=False)}\n" for name, value in data.items())
+    return (
+        f'"""\nStatic bindings of the {service}, generated from {wsdl} by nmbrs.bindings.generate.\n\n'
+        f"Operations called with zeep: {', '.join(skipped) or 'none'}.\n"
+        '"""\n\n'
+        f"SERVICE = {service!r}\n"
+        f"NAMESPACE = {namespace!r}\n"
+        f"{literals}"
+    )
+
+
+def generate_bindings(wsdl: str, transport: Transport | None = None) -> str:
+    """
+    Generate the source of the module with the static bindings of a service.
+
+    Args:
+        wsdl (str): The URL or path of the WSDL, e.g. "https://api.nmbrs.nl/soap/v3/EmployeeService.asmx?WSDL".
+        transport (Transport, optional): The transport loading the WSDL.
+
+    Returns:
+        str: The source of the module.
+    """
+    return _generate(wsdl, transport)[1]
+
+
+def module_name(service: str) -> str:
+    """
+    Get the name of the module of a service.
+
+    Args:
+        service (str): The name of the service, e.g. "EmployeeService".
+
+    Returns:
+        str: The name of the module, e.g. "employee_service".
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", service).lower()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generate the modules of the services, e.g. python -m nmbrs.bindings.generate <WSDL> --output-dir bindings."""
+    parser = argparse.ArgumentParser(description="Generate the static bindings of Nmbrs SOAP services from their WSDLs.")
+    parser.add_argument("wsdl", nargs="+", help="the URLs or paths of the WSDLs")
+    parser.add_argument("--output-dir", default=".", help="the directory of the generated modules")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for wsdl in args.wsdl:
+        service, source = _generate(wsdl, None)
+        path = os.path.join(args.output_dir, f"{module_name(service)}.py")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(source)
+        print(f"Generated {path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,97 @@
+"""
+This module provides the operations of the clients of the services, calling the operations with the static bindings
+and the request templates instead of zeep when the call is supported by them.
+
+The operations are instrumented operations (see nmbrs.utils.tracing), which send the requests and record their sizes.
+They only differ in how the request is created and the response converted: with the static binding of the operation
+when one is registered (see nmbrs.bindings.static), else the request is rendered from the template of the operation,
+built on its first call, when the templates are enabled for the client (see nmbrs.bindings.templates). Calls the
+bindings do not support are made with zeep.
+
+Classes:
+    BindingOperationProxy: An instrumented operation, calling the operation with its static binding or template.
+
+Functions:
+    bind_client(client) -> Client: Instrument the operations of a zeep client, with the bindings of the operations.
+"""
+
+from functools import partial
+
+from zeep import Client
+from zeep.loader import parse_xml
+
+from .static import RequestTemplate, StaticOperation, get_static_operation
+from .templates import request_template
+from ..utils.tracing import InstrumentedOperationProxy, TracingPlugin, instrument_client, mark_phase
+
+
+class BindingOperationProxy(InstrumentedOperationProxy):
+    """
+    An instrumented operation of a zeep client, rendering its requests with the static binding of the operation, else
+    with its request template when the templates are enabled for the client, and parsing its responses with the static
+    binding.
+
+    The bindings are not used for positional arguments, or for clients with plugins or WS-Security, as they do not
+    apply them. Calls with arguments or authentication headers the bindings do not support are made with zeep.
+    """
+
+    _NO_TEMPLATE = object()
+
+    def __init__(self, service_proxy, operation_name: str, resource: str):
+        super().__init__(service_proxy, operation_name, resource)
+        self._template = self._NO_TEMPLATE
+
+    def _request_template(self, client: Client, args: tuple) -> RequestTemplate | None:
+        """Get the static binding of the operation, else its request template, when the call does not need zeep."""
+        if args or client.wsse is not None or not all(isinstance(plugin, TracingPlugin) for plugin in client.plugins):
+            return None
+        operation = self._proxy._binding.get(self._op_name)  # pylint: disable=protected-access
+        static = get_static_operation(self._resource)
+        # A binding generated from another WSDL, e.g. of another version of the API, is not used
+        if static is not None and static.soap_action == operation.soapaction:
+            return static
+        if not getattr(client, "request_templates", False):
+            return None
+        if self._template is self._NO_TEMPLATE:
+            self._template = request_template(operation)
+        return self._template
+
+    def create_message(self, args: tuple, kwargs: dict):
+        client = self._proxy._client  # pylint: disable=protected-access
+        template = self._request_template(client, args)
+        message = template.render(kwargs, kwargs.get("_soapheaders")) if template is not None else None
+        if message is None:
+            return super().create_message(args, kwargs)
+        http_headers = dict(template.http_headers)
+        if client.settings.extra_http_headers:
+            http_headers.update(client.settings.extra_http_headers)
+        if isinstance(template, StaticOperation):
+            return message, http_headers, partial(self._static_reply, template)
+        return message, http_headers, None
+
+    def _static_reply(self, static: StaticOperation, response):
+        """Parse a response with the static binding, faults are raised by zeep."""
+        # pylint: disable=protected-access
+        client = self._proxy._client
+        binding = self._proxy._binding
+        if response.status_code != 200:
+            return binding.process_reply(client, binding.get(self._op_name), response)
+        doc = parse_xml(response.content, binding.transport, settings=client.settings)
+        if static.has_fault(doc):
+            return binding.process_error(doc, binding.get(self._op_name))
+        mark_phase("parse_response")
+        return static.parse(doc)
+
+
+def bind_client(client: Client) -> Client:
+    """
+    Instrument the operations of a zeep client (see instrument_client), calling the operations with their static
+    bindings and request templates when the call is supported by them.
+
+    Args:
+        client (Client): The client.
+
+    Returns:
+        Client: The same client, with the tracing plugin and the operations of its default service.
+    """
+    return instrument_client(client, BindingOperationProxy)
@@ -0,0 +1,372 @@
+"""
+This module loads the static bindings generated from the WSDLs, and uses them to call operations without zeep.
+
+A call through zeep looks up the operation, binds the arguments to its signature, builds the XSD objects of the
+request and serializes them, and parses the response into zeep objects. A static binding renders the request from
+precomputed strings and parses the response with precompiled mappings from the elements to the fields, giving the same
+values as zeep (dictionaries, lists and the Python values of the XSD types), so the data classes are constructed as
+before.
+
+The operations of the clients of the services (see nmbrs.bindings.proxy) use the static binding of an operation when one
+is registered, and fall back to zeep when the call is not supported by it: positional arguments, unknown or missing
+parameters, an unknown authentication header, or a client with plugins or WS-Security. Operations without a static
+binding can render their requests from a RequestTemplate built at runtime (see nmbrs.bindings.templates).
+
+Classes:
+    StaticValue: A dictionary whose items can also be read as attributes, like the zeep objects.
+    RequestTemplate: The template of the SOAP envelopes of the requests of an operation.
+    StaticOperation: The static binding of an operation, rendering its requests and parsing its responses.
+    StaticBinding: The static bindings of the operations of a service.
+
+Functions:
+    register_bindings(bindings) -> StaticBinding: Use the static bindings of a service for every client.
+    unregister_bindings(service) -> None: Stop using the static bindings of a service, or of all services.
+    load_bindings(path) -> StaticBinding: Import a generated module from a file and register its bindings.
+    get_static_operation(resource) -> StaticOperation | None: Get the registered static binding of an operation.
+"""
+
+import importlib.util
+import threading
+from types import ModuleType
+from xml.sax.saxutils import escape
+
+from zeep.xsd.types.builtins import default_types
+
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+XSD_NS = "http://www.w3.org/2001/XMLSchema"
+
+_ENVELOPE_START = f"<?xml version='1.0' encoding='utf-8'?>\n<soap-env:Envelope xmlns:soap-env=\"{SOAP_ENV_NS}\">"
+_BODY = f"{{{SOAP_ENV_NS}}}Body"
+_FAULT = f"{{{SOAP_ENV_NS}}}Fault"
+
+_SIMPLE_TYPES = {qname.localname: xsd_type for qname, xsd_type in default_types.items() if qname.namespace == XSD_NS}
+
+
+class StaticValue(dict):
+    """A dictionary whose items can also be read as attributes, like the zeep objects."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+
+def _simple_parser(type_name: str):
+    """Get the function converting the text of an element of a simple type, as zeep does."""
+    pythonvalue = _SIMPLE_TYPES[type_name].pythonvalue
+
+    def parse(element):
+        text = element.text
+        if text is None:
+            return None
+        try:
+            return pythonvalue(text)
+        except (TypeError, ValueError):
+            return None
+
+    return parse
+
+
+class _ComplexType:
+    """A complex type compiled to the mapping of the tags of its elements to its fields."""
+
+    __slots__ = ("fields", "names", "lists", "tags")
+
+    def __init__(self):
+        self.fields: tuple = ()
+        self.names: dict[str, None] = {}
+        self.lists: tuple[str, ...] = ()
+        self.tags: dict[str, tuple] = {}
+
+    def compile(self, fields: tuple, namespace: str, types: dict[str, "_ComplexType"]) -> None:
+        """Compile the fields, (name, type, many) tuples with the name of an XSD type ("xsd:int") or of a complex type."""
+        self.fields = fields
+        self.names = dict.fromkeys(name for name, _, _ in fields)
+        self.lists = tuple(name for name, _, many in fields if many)
+        for name, type_name, many in fields:
+            if type_name.startswith("xsd:"):
+                field = (name, _simple_parser(type_name[4:]), None, many)
+            else:
+                field = (name, None, types[type_name], many)
+            # Like zeep, elements in another namespace or without a namespace are matched by their local name
+            self.tags[f"{{{namespace}}}{name}"] = field
+            self.tags[name] = field
+
+    def parse(self, element, allow_none: bool = True) -> StaticValue | None:
+        """Parse an element of the type, an element without children and attributes is None as in zeep."""
+        if allow_none and len(element) == 0 and not element.attrib:
+            return None
+        value = StaticValue(self.names)
+        for name in self.lists:
+            value[name] = []
+        tags = self.tags
+        for child in element:
+            field = tags.get(child.tag)
+            if field is None:
+                continue
+            name, parse_simple, complex_type, many = field
+            item = parse_simple(child) if complex_type is None else complex_type.parse(child)
+            if many:
+                value[name].append(item)
+            else:
+                value[name] = item
+        return value
+
+
+class RequestTemplate:
+    """
+    The template of the SOAP envelopes of the requests of an operation, only the values of the parameters and of the
+    authentication header are rendered per call.
+    """
+
+    def __init__(self, namespace: str, name: str, soap_action: str, params: tuple, headers: dict):
+        """
+        Constructor method for RequestTemplate class.
+
+        Args:
+            namespace (str): The namespace of the service.
+            name (str): The name of the operation, e.g. "Absence_GetList".
+            soap_action (str): The SOAP action of the operation.
+            params (tuple): The parameters as (name, type, required) tuples, with the name of an XSD type ("xsd:int").
+            headers (dict): The fields of the authentication headers of the operation, by header name.
+        """
+        self.name = name
+        self.soap_action = soap_action
+        self.http_headers = {"SOAPAction": f'"{soap_action}"', "Content-Type": "text/xml; charset=utf-8"}
+        self._params = {
+            param: (f"<ns0:{param}>", f"</ns0:{param}>", _SIMPLE_TYPES[type_name[4:]].xmlvalue, required)
+            for param, type_name, required in params
+        }
+        self._headers = {
+            header: (
+                f'<ns0:{header} xmlns:ns0="{namespace}">',
+                tuple((field, f"<ns0:{field}>", f"</ns0:{field}>") for field in fields),
+                f"</ns0:{header}>",
+                frozenset(fields),
+            )
+            for header, fields in headers.items()
+        }
+        self._body_start = f'<soap-env:Body><ns0:{name} xmlns:ns0="{namespace}">'
+        self._end = f"</ns0:{name}></soap-env:Body></soap-env:Envelope>"
+
+    def render(self, kwargs: dict, soap_headers: dict | None) -> bytes | None:
+        """
+        Render the SOAP envelope of a request.
+
+        Args:
+            kwargs (dict): The arguments of the call, by parameter name.
+            soap_headers (dict | None): The authentication header, e.g. {"AuthHeaderWithDomain": {"Username": ...}}.
+
+        Returns:
+            bytes | None: The envelope, None when the call is not supported and should be made with zeep.
+        """
+        if not kwargs.keys() - {"_soapheaders"} <= self._params.keys():
+            return None
+        # zeep also accepts the headers as a list of elements or objects, which are rendered by zeep
+        if soap_headers and not isinstance(soap_headers, dict):
+            return None
+        parts = [_ENVELOPE_START]
+        if soap_headers:
+            parts.append("<soap-env:Header>")
+            for header, values in soap_headers.items():
+                template = self._headers.get(header)
+                if template is None or not isinstance(values, dict) or not values.keys() <= template[3]:
+                    return None
+                parts.append(template[0])
+                for field, start, end in template[1]:
+                    value = values.get(field)
+                    if value is not None:
+                        parts += (start, escape(str(value)), end)
+                parts.append(template[2])
+            parts.append("</soap-env:Header>")
+        parts.append(self._body_start)
+        # The parameters are rendered in the order of the schema, as zeep does
+        for param, (start, end, xmlvalue, required) in self._params.items():
+            value = kwargs.get(param)
+            if value is None:
+                if required:
+                    return None
+                continue
+            try:
+                parts += (start, escape(xmlvalue(value)), end)
+            except (TypeError, ValueError, AttributeError):
+                return None
+        parts.append(self._end)
+        return "".join(parts).encode("utf-8")
+
+
+class StaticOperation(RequestTemplate):
+    """The static binding of an operation, rendering its requests and parsing its responses."""
+
+    def __init__(self, service: str, namespace: str, name: str, definition: dict, headers: dict, types: dict[str, _ComplexType]):
+        """
+        Constructor method for StaticOperation class.
+
+        Args:
+            service (str): The name of the service, e.g. "EmployeeService".
+            namespace (str): The namespace of the service.
+            name (str): The name of the operation, e.g. "Absence_GetList".
+            definition (dict): The "soap_action", the "params" as (name, type, required) tuples, the "headers" and the
+                "response" type of the operation, as generated.
+            headers (dict): The fields of the authentication headers of the service, by header name.
+            types (dict[str, _ComplexType]): The compiled complex types of the service, by name.
+        """
+        operation_headers = {header: headers[header] for header in definition["headers"]}
+        super().__init__(namespace, name, definition["soap_action"], definition["params"], operation_headers)
+        self.service = service
+        self.resource = f"{service}:{name}"
+        self._response = types[definition["response"]]
+        self._unwrap = self._unwrapping(self._response)
+
+    @staticmethod
+    def _unwrapping(response: _ComplexType) -> tuple[str | None, str | None]:
+        """Get the fields zeep unwraps from a response: its single field, and the single field of that field's type."""
+        if len(response.fields) != 1:
+            return None, None
+        name, type_name, _ = response.fields[0]
+        item_type = response.tags[name][2]
+        if type_name.startswith("xsd:") or len(item_type.fields) != 1:
+            return name, None
+        return name, item_type.fields[0][0]
+
+    def parse(self, doc):
+        """
+        Parse the response of the operation into the values zeep returns, unwrapped as zeep does.
+
+        Args:
+            doc (lxml.etree._Element): The SOAP envelope of the response, without a fault.
+
+        Returns:
+            any: The result, e.g. a list of StaticValue for the *_GetAll operations, or None.
+        """
+        body = doc.find(_BODY)
+        element = body[0] if body is not None and len(body) else None
+        if element is None:
+            return None
+        result = self._response.parse(element, allow_none=False)
+        field, item = self._unwrap
+        if field is None:
+            return result if self._response.fields else None
+        result = result[field]
+        if item is not None and isinstance(result, StaticValue):
+            return result[item]
+        return result
+
+    @staticmethod
+    def has_fault(doc) -> bool:
+        """
+        Determine whether a response is a SOAP fault.
+
+        Args:
+            doc (lxml.etree._Element): The SOAP envelope of the response.
+
+        Returns:
+            bool: True for a fault.
+        """
+        return doc.find(f"{_BODY}/{_FAULT}") is not None
+
+
+class StaticBinding:
+    """The static bindings of the operations of a service, compiled from a generated module."""
+
+    def __init__(self, service: str, namespace: str, headers: dict, types: dict, operations: dict):
+        """
+        Constructor method for StaticBinding class.
+
+        Args:
+            service (str): The name of the service, e.g. "EmployeeService".
+            namespace (str): The namespace of the service.
+            headers (dict): The fields of the authentication headers, by header name.
+            types (dict): The fields of the complex types as (name, type, many) tuples, by type name.
+            operations (dict): The definitions of the operations, by name.
+        """
+        self.service = service
+        self.namespace = namespace
+        compiled = {name: _ComplexType() for name in types}
+        for name, fields in types.items():
+            compiled[name].compile(fields, namespace, compiled)
+        self.operations = {
+            name: StaticOperation(service, namespace, name, definition, headers, compiled) for name, definition in operations.items()
+        }
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> "StaticBinding":
+        """
+        Compile the bindings of a generated module.
+
+        Args:
+            module (ModuleType): The module, with SERVICE, NAMESPACE, HEADERS, TYPES and OPERATIONS.
+
+        Returns:
+            StaticBinding: The bindings.
+        """
+        return cls(module.SERVICE, module.NAMESPACE, module.HEADERS, module.TYPES, module.OPERATIONS)
+
+
+_bindings: dict[str, StaticBinding] = {}
+_lock = threading.Lock()
+
+
+def register_bindings(bindings: StaticBinding | ModuleType) -> StaticBinding:
+    """
+    Use the static bindings of a service for every client, replacing the bindings registered for that service.
+
+    Args:
+        bindings (StaticBinding | ModuleType): The bindings, or a generated module.
+
+    Returns:
+        StaticBinding: The registered bindings.
+    """
+    if isinstance(bindings, ModuleType):
+        bindings = StaticBinding.from_module(bindings)
+    with _lock:
+        _bindings[bindings.service] = bindings
+    return bindings
+
+
+def unregister_bindings(service: str | None = None) -> None:
+    """
+    Stop using the static bindings of a service, the calls are made with zeep again.
+
+    Args:
+        service (str, optional): The name of the service, e.g. "EmployeeService". Defaults to all services.
+    """
+    with _lock:
+        if service is None:
+            _bindings.clear()
+        else:
+            _bindings.pop(service, None)
+
+
+def load_bindings(path: str) -> StaticBinding:
+    """
+    Import a module generated by nmbrs.bindings.generate from a file, and register its bindings.
+
+    Args:
+        path (str): The path of the module.
+
+    Returns:
+        StaticBinding: The registered bindings.
+    """
+    spec = importlib.util.spec_from_file_location(f"nmbrs_static_bindings_{abs(hash(path))}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return register_bindings(module)
+
+
+def get_static_operation(resource: str) -> StaticOperation | None:
+    """
+    Get the registered static binding of an operation.
+
+    Args:
+        resource (str): The resource of the operation, e.g. "EmployeeService:Absence_GetList".
+
+    Returns:
+        StaticOperation | None: The binding, None when no binding is registered for the operation.
+    """
+    service, _, operation = resource.partition(":")
+    bindings = _bindings.get(service)
+    return bindings.operations.get(operation) if bindings is not None else None
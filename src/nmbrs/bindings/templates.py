@@ -0,0 +1,59 @@
+"""
+This module builds the request templates of the operations without a static binding, from their zeep operations.
+
+Most calls send small envelopes of the same structure: the authentication header and one or two integers, e.g. the
+EmployeeId of Absence_GetList. zeep builds and serializes the XSD objects of the whole envelope on every call, a
+request template is built once per operation, when it is first called, and renders only the values of the parameters
+and of the authentication header. The responses are still parsed by zeep.
+
+Templates are built for the operations whose parameters are simple types, as the static bindings (see
+nmbrs.bindings.generate), other operations are called with zeep. The templates are only used by the clients they are
+enabled for with use_request_templates, as they are only checked against the WSDLs of the fake server
+(nmbrs.testing), not against the WSDLs of Nmbrs.
+
+Functions:
+    request_template(operation) -> RequestTemplate | None: Build the request template of a zeep operation.
+    use_request_templates(service, enabled) -> None: Render the requests of the calls of a service from templates.
+"""
+
+import logging
+
+from .generate import UnsupportedType, request_params
+from .static import RequestTemplate
+
+logger = logging.getLogger(__name__)
+
+
+def request_template(operation) -> RequestTemplate | None:
+    """
+    Build the request template of a zeep operation.
+
+    Args:
+        operation (zeep.wsdl.definitions.Operation): The operation of the binding, e.g. binding.get("Absence_GetList").
+
+    Returns:
+        RequestTemplate | None: The template, None when the operation is not supported and is called with zeep.
+    """
+    body = getattr(operation.input, "body", None)
+    namespace = body.qname.namespace if body is not None else None
+    headers = {}
+    try:
+        params, _ = request_params(operation, namespace, headers)
+    except UnsupportedType as e:
+        logger.debug("No request template for %s, it is called with zeep: %s", operation.name, e)
+        return None
+    return RequestTemplate(namespace, operation.name, operation.soapaction, params, headers)
+
+
+def use_request_templates(service, enabled: bool = True) -> None:
+    """
+    Render the requests of the calls of a service from the templates of the operations, instead of with zeep.
+
+    The microservices share the client of their service, e.g. enabling the templates of api.employee applies to
+    api.employee.salary as well.
+
+    Args:
+        service: The service, e.g. api.employee.
+        enabled (bool, optional): Whether to use the templates. Defaults to True.
+    """
+    service.client.request_templates = enabled
@@ -0,0 +1,147 @@
+"""
+Convert lists of DataClass objects to columns, so they can be aggregated without looping over the objects.
+
+Functions:
+    to_columns(objects, use_numpy=False, decimal="decimal") -> dict: Convert DataClass objects to a dictionary of columns.
+    to_structured_array(objects, decimal="float") -> numpy.ndarray: Convert DataClass objects to a NumPy structured array.
+
+Dependencies:
+    numpy (optional): Needed for the NumPy output, install with `pip install nmbrs[numpy]`.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable
+
+from .data_class import DataClass
+from .utils.fields import flatten, get_columns
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+DECIMAL_MODES = ("decimal", "float", "cents")
+
+
+def to_columns(objects: Iterable[DataClass], use_numpy: bool = False, decimal: str = "decimal") -> dict:
+    """
+    Convert DataClass objects to a dictionary of columns.
+
+    Nested DataClass objects are flattened, e.g. the cause of an Absence results in the columns "cause.id" and
+    "cause.cause".
+
+    When NumPy is used every column is converted to a typed array:
+        - int and bool fields become int64 and bool arrays.
+        - Decimal fields become float64 arrays ("float") or int64 arrays in hundredths ("cents").
+        - datetime fields become datetime64[us] arrays, date fields datetime64[D] arrays.
+        - Other fields (str, list, mixed types) become object arrays.
+
+    Missing values become NaN or NaT where the dtype allows it, otherwise a masked array is returned for that column.
+
+    Args:
+        objects (Iterable[DataClass]): The objects to convert, e.g. the result of Salary_GetAll_AllEmployeesByCompany.
+        use_numpy (bool, optional): Return NumPy arrays instead of lists. Defaults to False.
+        decimal (str, optional): How to convert Decimal values: "decimal" (keep), "float" or "cents". Defaults to "decimal".
+
+    Returns:
+        dict: The column names mapped to a list or NumPy array of values.
+    """
+    if decimal not in DECIMAL_MODES:
+        raise ValueError(f"Unknown decimal mode '{decimal}', use one of: {', '.join(DECIMAL_MODES)}")
+    if use_numpy:
+        _require_numpy()
+
+    rows = [flatten(obj) for obj in objects]
+    columns = get_columns(rows)
+    result = {}
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        kind = _column_kind(values)
+        if kind == "decimal":
+            values = [_convert_decimal(value, decimal) for value in values]
+            kind = {"decimal": "object", "float": "float", "cents": "int"}[decimal]
+        result[column] = _to_array(values, kind) if use_numpy else values
+    return result
+
+
+def to_structured_array(objects: Iterable[DataClass], decimal: str = "float"):
+    """
+    Convert DataClass objects to a NumPy structured array, with one field per column.
+
+    Masked values (e.g. a missing integer) are replaced by the default fill value of NumPy for that dtype.
+
+    Args:
+        objects (Iterable[DataClass]): The objects to convert.
+        decimal (str, optional): How to convert Decimal values: "decimal" (keep), "float" or "cents". Defaults to "float".
+
+    Returns:
+        numpy.ndarray: A structured array containing all the objects.
+    """
+    columns = to_columns(objects, use_numpy=True, decimal=decimal)
+    arrays = [np.ma.filled(array) if np.ma.isMaskedArray(array) else array for array in columns.values()]
+    dtype = [(name, array.dtype) for name, array in zip(columns, arrays)]
+    result = np.empty(len(arrays[0]) if arrays else 0, dtype=dtype)
+    for name, array in zip(columns, arrays):
+        result[name] = array
+    return result
+
+
+def _require_numpy() -> None:
+    """Raise an ImportError when NumPy is not installed."""
+    if np is None:
+        raise ImportError("NumPy is required for this functionality, install it with: pip install nmbrs[numpy]")  # pragma: no cover
+
+
+def _column_kind(values: list) -> str:  # pylint: disable=too-many-return-statements
+    """Determine the kind of values stored in a column, ignoring missing values."""
+    types = {type(value) for value in values if value is not None}
+    if not types:
+        return "object"
+    if types == {bool}:
+        return "bool"
+    if types == {int}:
+        return "int"
+    if types <= {int, float}:
+        return "float"
+    if types == {Decimal}:
+        return "decimal"
+    if all(issubclass(_type, datetime) for _type in types):
+        return "datetime"
+    if types == {date}:
+        return "date"
+    return "object"
+
+
+def _convert_decimal(value: Decimal | None, mode: str) -> Decimal | float | int | None:
+    """Convert a Decimal value based on the selected decimal mode."""
+    if value is None or mode == "decimal":
+        return value
+    if mode == "float":
+        return float(value)
+    return int((value * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _to_datetime64(value: datetime) -> datetime:
+    """Convert timezone aware datetimes to naive UTC datetimes, as datetime64 does not support timezones."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_array(values: list, kind: str):
+    """Convert a list of values to a NumPy array based on the kind of column."""
+    if kind == "float":
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    if kind == "datetime":
+        return np.array([np.datetime64("NaT") if value is None else _to_datetime64(value) for value in values], dtype="datetime64[us]")
+    if kind == "date":
+        return np.array([np.datetime64("NaT") if value is None else value for value in values], dtype="datetime64[D]")
+    if kind in ("int", "bool"):
+        dtype = np.int64 if kind == "int" else np.bool_
+        mask = [value is None for value in values]
+        data = np.array([0 if value is None else value for value in values], dtype=dtype)
+        return np.ma.array(data, mask=mask) if any(mask) else data
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from .data_class import DataClass
 from .general import CodeDescription
-from .utils.xml import parse_xml_to_dict
+from .xml_data_class import XMLDataClass
 
 
 class Company(DataClass):
@@ -109,15 +109,15 @@ class WageTax(DataClass):
         self.correction_tijdvak_end: datetime = data.get("CorrectionTijdvakEnd")
 
 
-class WageTaxXML(DataClass):
+class WageTaxXML(XMLDataClass):
     """A class representing wage tax XML."""
 
     def __init__(self, xml: str) -> None:
         self.xml: str = xml
 
     def to_dict(self) -> dict | str:
-        """Convert the instance to a dictionary."""
-        return parse_xml_to_dict(self.xml)
+        """Convert the instance to a dictionary, the XML is parsed only once."""
+        return self.parse_xml()
 
 
 class ContactPerson(DataClass):
@@ -201,15 +201,24 @@ class Pension(DataClass):
         self.correctie_tijdvak_end: datetime = data.get("CorrectionTijdvakEnd")
 
 
-class PensionXML(DataClass):
+class PensionXML(XMLDataClass):
     """A class representing a pension export xml."""
 
     def __init__(self, xml: str) -> None:
         self.xml: str = xml
 
     def to_dict(self) -> dict | str:
-        """Convert the instance to a dictionary."""
-        return parse_xml_to_dict(self.xml)
+        """Convert the instance to a dictionary, the XML is parsed only once."""
+        return self.parse_xml()
+
+
+class PensionRecord(DataClass):
+    """A class representing the data of a single employee in a pension export."""
+
+    def __init__(self, company_id: int, pension_export_id: int, data: dict) -> None:
+        self.company_id = company_id
+        self.pension_export_id: int = pension_export_id
+        self.data: dict = data
 
 
 class RunRequest(DataClass):
@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from .data_class import DataClass
-from .utils.xml import parse_xml_to_dict
+from .xml_data_class import XMLDataClass
 
 
 class Domain(DataClass):
@@ -14,7 +14,7 @@ class Domain(DataClass):
         self.sub_domain: str = data.get("SubDomain")
 
 
-class AbsenceVerzuim(DataClass):
+class AbsenceVerzuim(XMLDataClass):
     """A class representing absence data."""
 
     def __init__(self, data: dict) -> None:
@@ -25,7 +25,7 @@ class AbsenceVerzuim(DataClass):
 
     def to_dict(self) -> dict:
         """
-        Convert the instance to a dictionary.
+        Convert the instance to a dictionary, the XML is parsed only once.
 
         :return: A dictionary representation of the instance.
         """
@@ -33,7 +33,7 @@ class AbsenceVerzuim(DataClass):
             "debtor_id": self.debtor_id,
             "company_id": self.company_id,
             "employee_id": self.employee_id,
-            "xml": parse_xml_to_dict(self.xml),
+            "xml": self.parse_xml(),
         }
 
 
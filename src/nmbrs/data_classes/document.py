@@ -0,0 +1,62 @@
+"""This module defines the data classes used for downloaded documents."""
+
+import os
+from typing import IO
+
+from .data_class import DataClass
+
+
+class DocumentFile(DataClass):
+    """A class representing a document written to a file or stream."""
+
+    def __init__(self, path: str | None, size: int, sha256: str, employee_id: int | None = None) -> None:
+        self.path: str | None = path
+        self.size: int = size
+        self.sha256: str = sha256
+        self.employee_id: int | None = employee_id
+
+
+class PayslipDownload(DataClass):
+    """A class representing the outcome of downloading the payslips of a run."""
+
+    def __init__(self) -> None:
+        self.downloaded: list[DocumentFile] = []
+        self.skipped: list[DocumentFile] = []
+        self.failed: dict[int, Exception] = {}
+        self.elapsed: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of downloaded bytes per second."""
+        return sum(document.size for document in self.downloaded) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def payslips_per_second(self) -> float:
+        """The number of downloaded payslips per second."""
+        return len(self.downloaded) / self.elapsed if self.elapsed else 0.0
+
+
+class DocumentUpload(DataClass):
+    """A class representing a document to upload for an employee."""
+
+    def __init__(
+        self,
+        employee_id: int,
+        source: str | os.PathLike | IO[bytes],
+        document_type_guid: str,
+        document_name: str | None = None,
+    ) -> None:
+        self.employee_id: int = employee_id
+        self.source: str | os.PathLike | IO[bytes] = source
+        self.document_type_guid: str = document_type_guid
+        self.document_name: str | None = document_name
+
+
+class DocumentUploadResult(DataClass):
+    """A class representing the outcome of uploading a document."""
+
+    def __init__(self, upload: DocumentUpload, success: bool, attempts: int, error: Exception | None = None) -> None:
+        self.upload: DocumentUpload = upload
+        self.success: bool = success
+        self.attempts: int = attempts
+        self.error: Exception | None = error
@@ -0,0 +1,151 @@
+"""
+Write DataClass objects to JSON Lines or CSV files, one object at a time.
+
+Functions:
+    write_jsonl(objects, target, compress=False) -> int: Write DataClass objects as JSON Lines (NDJSON).
+    write_csv(objects, target, columns=None, compress=False) -> int: Write DataClass objects as CSV.
+
+The objects are consumed lazily, so memory usage stays constant when a generator is passed.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import IO, Iterable, Iterator
+
+from .data_class import DataClass
+from .serialize import serialize
+from .utils.fields import flatten
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj: any) -> any:
+    """Convert values the json module cannot encode by itself."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_JSON_ENCODER = json.JSONEncoder(default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+_CSV_CONVERTERS = {
+    type(None): lambda value: "",
+    str: lambda value: value,
+    int: str,
+    bool: str,
+    float: repr,
+    Decimal: str,
+    datetime: lambda value: value.isoformat(),
+    date: lambda value: value.isoformat(),
+    time: lambda value: value.isoformat(),
+}
+
+
+def _to_csv_value(value: any) -> str:
+    """Convert a single value to its CSV representation."""
+    converter = _CSV_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    return _JSON_ENCODER.encode(serialize(value))
+
+
+@contextmanager
+def _open_target(target: str | os.PathLike | IO, compress: bool) -> Iterator[IO]:
+    """
+    Open the target as a text stream.
+
+    Paths are opened (and closed) by this function, files ending in ".gz" are always compressed. Streams are written to
+    directly, when compress is True the stream has to be a binary stream.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        if compress or os.fspath(target).endswith(".gz"):
+            with gzip.open(target, "wt", encoding="utf-8", newline="") as file:
+                yield file
+        else:
+            with open(target, "w", encoding="utf-8", newline="") as file:
+                yield file
+    elif compress:
+        with gzip.GzipFile(fileobj=target, mode="wb") as gzip_file:
+            wrapper = io.TextIOWrapper(gzip_file, encoding="utf-8", newline="")
+            yield wrapper
+            wrapper.flush()
+            wrapper.detach()
+    else:
+        yield target
+
+
+def write_jsonl(objects: Iterable[DataClass], target: str | os.PathLike | IO, compress: bool = False) -> int:
+    """
+    Write DataClass objects as JSON Lines (NDJSON), one object per line.
+
+    Decimal values are written as numbers and datetime values as ISO 8601 strings.
+
+    Args:
+        objects (Iterable[DataClass]): The objects to write, may be a generator.
+        target (str | os.PathLike | IO): A file path or a text stream (binary stream when compress is True).
+        compress (bool, optional): Compress the output with gzip. Defaults to False.
+
+    Returns:
+        int: The number of objects written.
+    """
+    count = 0
+    with _open_target(target, compress) as file:
+        for obj in objects:
+            file.write(_JSON_ENCODER.encode(serialize(obj)))
+            file.write("\n")
+            count += 1
+    logger.debug("Written %s objects as JSON Lines.", count)
+    return count
+
+
+def write_csv(
+    objects: Iterable[DataClass],
+    target: str | os.PathLike | IO,
+    columns: list[str] | None = None,
+    compress: bool = False,
+) -> int:
+    """
+    Write DataClass objects as CSV, one object per row.
+
+    Nested DataClass objects are flattened (e.g. "cause.id"). When no columns are given they are derived from the fields
+    of the first object, fields that are not part of the columns are skipped.
+
+    Args:
+        objects (Iterable[DataClass]): The objects to write, may be a generator.
+        target (str | os.PathLike | IO): A file path or a text stream (binary stream when compress is True).
+        columns (list[str], optional): The columns to write, in order. Defaults to the fields of the first object.
+        compress (bool, optional): Compress the output with gzip. Defaults to False.
+
+    Returns:
+        int: The number of objects written.
+    """
+    count = 0
+    skipped = set()
+    column_set = set(columns or ())
+    with _open_target(target, compress) as file:
+        writer = csv.writer(file)
+        if columns is not None:
+            writer.writerow(columns)
+        for obj in objects:
+            row = flatten(obj)
+            if columns is None:
+                columns = list(row)
+                column_set = set(columns)
+                writer.writerow(columns)
+            if not row.keys() <= column_set:
+                skipped.update(row.keys() - column_set)
+            writer.writerow([_to_csv_value(row.get(column)) for column in columns])
+            count += 1
+    if skipped:
+        logger.warning("Fields not written to CSV, as they are not part of the columns: %s", ", ".join(sorted(skipped)))
+    logger.debug("Written %s objects as CSV.", count)
+    return count
@@ -0,0 +1,30 @@
+"""This module defines the data classes used when harvesting documents of many companies."""
+
+from typing import Hashable
+
+from .data_class import DataClass
+
+
+class HarvestResult(DataClass):
+    """A class representing the outcome of harvesting a single item, e.g. a wage tax declaration."""
+
+    def __init__(self, key: Hashable, item: any, status: str, result: any = None, error: Exception | None = None) -> None:
+        self.key: Hashable = key
+        self.item: any = item
+        self.status: str = status
+        self.result: any = result
+        self.error: Exception | None = error
+
+
+class HarvestSummary(DataClass):
+    """A class representing the outcome of a harvest."""
+
+    def __init__(self) -> None:
+        self.harvested: list[HarvestResult] = []
+        self.skipped: list[HarvestResult] = []
+        self.failed: list[HarvestResult] = []
+        self.elapsed: float = 0.0
+
+    def add(self, result: HarvestResult) -> None:
+        """Add the result of a single item to the summary."""
+        {"Success": self.harvested, "Skipped": self.skipped}.get(result.status, self.failed).append(result)
@@ -0,0 +1,146 @@
+"""
+This module defines the data classes for journals and helpers to aggregate journal entries.
+
+Functions:
+    journal_totals(entries, by="ledger_account") -> dict: Total the debit and credit amounts of journal entries in one pass.
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Iterator
+
+from .data_class import DataClass
+from .xml_data_class import XMLDataClass
+
+JOURNAL_ENTRY_TAG = "JournalEntry"
+_AMBIGUOUS_COMMA = re.compile(r"[+-]?\d{1,3},\d{3}$")
+
+
+def _to_decimal(value: str | None) -> Decimal:
+    """
+    Convert an amount from the journal XML to a Decimal, a missing amount becomes 0.
+
+    The API formats amounts with a decimal point and without thousands separators, e.g. "1234.56", so a single point is
+    always the decimal separator. Amounts with a decimal comma and thousands separators are read when they are not
+    ambiguous:
+
+        "1.234,56", "1,234.56": Both a comma and a point occur, the last one is the decimal separator.
+        "1.234.567", "1,234,567": A separator occurring more than once separates thousands.
+        "12,5": A single comma is the decimal separator, unless it is followed by three digits as in "1,234".
+
+    Raises:
+        ValueError: When the amount is not a number or its separators are ambiguous.
+    """
+    if not value:
+        return Decimal(0)
+    amount = value.strip().replace(" ", "")
+    if "," in amount and "." in amount:
+        decimal_mark = "," if amount.rfind(",") > amount.rfind(".") else "."
+        integer, _, fraction = amount.rpartition(decimal_mark)
+        amount = _strip_thousands(integer, "." if decimal_mark == "," else ",", value) + "." + fraction
+    elif amount.count(",") > 1 or amount.count(".") > 1:
+        amount = _strip_thousands(amount, "," if "," in amount else ".", value)
+    elif "," in amount:
+        if _AMBIGUOUS_COMMA.match(amount):
+            raise ValueError(f"Ambiguous amount in journal, the comma may separate thousands or decimals: {value!r}")
+        amount = amount.replace(",", ".")
+    try:
+        result = Decimal(amount)
+    except InvalidOperation:
+        result = None
+    if result is None or not result.is_finite():
+        raise ValueError(f"Invalid amount in journal: {value!r}")
+    return result
+
+
+def _strip_thousands(integer: str, separator: str, value: str) -> str:
+    """Remove the thousands separators of the integer part of an amount, which must separate groups of three digits."""
+    if not re.fullmatch(rf"[+-]?\d{{1,3}}(?:{re.escape(separator)}\d{{3}})*", integer):
+        raise ValueError(f"Invalid amount in journal: {value!r}")
+    return integer.replace(separator, "")
+
+
+class JournalEntry(DataClass):
+    """A class representing a single line of a journal."""
+
+    def __init__(self, company_id: int, run_id: int, data: dict) -> None:
+        self.company_id: int = company_id
+        self.run_id: int = run_id
+        self.ledger_account: str = data.get("LedgerAccount")
+        self.description: str = data.get("Description")
+        self.debit: Decimal = _to_decimal(data.get("Debit"))
+        self.credit: Decimal = _to_decimal(data.get("Credit"))
+        self.cost_center: str = data.get("CostCenter")
+        self.cost_unit: str = data.get("CostUnit")
+        self.department: str = data.get("Department")
+        self.employee_id: str = data.get("EmployeeId")
+        self.period: str = data.get("Period")
+        self.year: str = data.get("Year")
+
+
+class Journal(XMLDataClass):
+    """A class representing a journal XML of a run."""
+
+    def __init__(self, company_id: int, run_id: int, xml: str) -> None:
+        self.company_id: int = company_id
+        self.run_id: int = run_id
+        self.xml: str = xml
+
+    def iter_entries(self, tag: str = JOURNAL_ENTRY_TAG) -> Iterator[JournalEntry]:
+        """
+        Yield the entries of the journal one at a time, without parsing the complete document into a dictionary.
+
+        Args:
+            tag (str, optional): The name of the element containing a single entry. Defaults to "JournalEntry".
+
+        Returns:
+            Iterator[JournalEntry]: The entries of the journal.
+        """
+        for record in self.iter_records(tag):
+            yield JournalEntry(self.company_id, self.run_id, record)
+
+    def to_dict(self) -> dict:
+        """Convert the instance to a dictionary, the XML is parsed only once."""
+        return {"company_id": self.company_id, "run_id": self.run_id, "xml": self.parse_xml()}
+
+
+class JournalTotal(DataClass):
+    """A class representing the total debit and credit amounts of a group of journal entries."""
+
+    def __init__(self) -> None:
+        self.debit: Decimal = Decimal(0)
+        self.credit: Decimal = Decimal(0)
+        self.count: int = 0
+
+    @property
+    def balance(self) -> Decimal:
+        """The debit amount minus the credit amount."""
+        return self.debit - self.credit
+
+
+def journal_totals(entries: Iterable[JournalEntry], by: str | tuple[str, ...] = "ledger_account") -> dict[any, JournalTotal]:
+    """
+    Total the debit and credit amounts of journal entries in one pass.
+
+    The entries are consumed lazily, so the entries of many journals can be totalled by chaining their iterators, e.g.
+    itertools.chain.from_iterable(journal.iter_entries() for journal in journals).
+
+    Args:
+        entries (Iterable[JournalEntry]): The entries to total.
+        by (str | tuple[str, ...], optional): The attribute(s) to group by, e.g. "cost_center" or
+            ("company_id", "ledger_account"). Defaults to "ledger_account".
+
+    Returns:
+        dict[any, JournalTotal]: The totals per group, keyed by the attribute value (a tuple when grouping by several).
+    """
+    attributes = (by,) if isinstance(by, str) else tuple(by)
+    totals = {}
+    for entry in entries:
+        key = getattr(entry, attributes[0]) if len(attributes) == 1 else tuple(getattr(entry, name) for name in attributes)
+        total = totals.get(key)
+        if total is None:
+            total = totals[key] = JournalTotal()
+        total.debit += entry.debit
+        total.credit += entry.credit
+        total.count += 1
+    return totals
@@ -0,0 +1,30 @@
+"""This module defines the data classes used by the report service."""
+
+from typing import Hashable
+
+from .data_class import DataClass
+
+
+class BackgroundTaskResult(DataClass):
+    """A class representing the outcome of a background report task."""
+
+    def __init__(
+        self,
+        key: Hashable,
+        task_name: str,
+        task_id: str | None,
+        status: str,
+        result: dict | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.key: Hashable = key
+        self.task_name: str = task_name
+        self.task_id: str | None = task_id
+        self.status: str = status
+        self.result: dict | None = result
+        self.error: Exception | None = error
+
+    @property
+    def success(self) -> bool:
+        """Whether the report was generated successfully."""
+        return self.status == "Success"
@@ -0,0 +1,53 @@
+"""
+This module provides helpers for turning DataClass objects into flat records.
+
+Functions:
+    flatten(obj: DataClass, separator: str = ".") -> dict: Flatten a DataClass into a single level dictionary.
+    get_columns(rows: list[dict]) -> list[str]: Retrieve the column names of a list of flattened DataClass objects.
+"""
+
+from ..data_class import DataClass
+
+
+def flatten(obj: DataClass, separator: str = ".") -> dict:
+    """
+    Flatten a DataClass into a single level dictionary.
+
+    Nested DataClass objects are expanded into their own fields, the name of the field is prefixed with the name of
+    the attribute holding the nested object (e.g. "cause.id"). Lists are kept as they are.
+
+    Args:
+        obj (DataClass): The object to flatten.
+        separator (str, optional): String used to join the names of nested fields. Defaults to ".".
+
+    Returns:
+        dict: A dictionary containing all the fields of the object.
+    """
+    result = {}
+    for key, value in obj.__dict__.items():
+        if isinstance(value, DataClass):
+            for sub_key, sub_value in flatten(value, separator).items():
+                result[f"{key}{separator}{sub_key}"] = sub_value
+        else:
+            result[key] = value
+    return result
+
+
+def get_columns(rows: list[dict]) -> list[str]:
+    """
+    Retrieve the column names of a list of flattened DataClass objects.
+
+    The order of the columns follows the order in which the fields are defined on the class. Fields that only exist on
+    some of the objects (e.g. an AbsenceCause without data) are appended in the order they are first encountered.
+
+    Args:
+        rows (list[dict]): The flattened objects, see flatten().
+
+    Returns:
+        list[str]: The column names.
+    """
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    return list(columns)
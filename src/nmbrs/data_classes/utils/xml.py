@@ -5,12 +5,20 @@ Functions:
     parse_xml_to_dict(xml: str) -> dict | str: Try to parse the XML string into a dictionary.
         If parsing fails, return the original XML string.
     get_xml(xml: str) -> dict | None: Retrieve XML data as a dictionary.
+    iter_xml_records(source, tag: str) -> Iterator[dict]: Yield the elements with a given tag as dictionaries,
+        without building the full document in memory.
+    find_records(data: dict | list, tag: str) -> Iterator[dict]: Yield the records with a given tag from an already
+        parsed document.
 
 Dependencies:
     xmltodict: A library for parsing XML into Python dictionaries.
 """
 
 import logging
+import os
+from typing import IO, Iterator
+from xml.etree.ElementTree import Element, XMLPullParser
+
 import xmltodict
 
 logger = logging.getLogger(__name__)
@@ -49,3 +57,115 @@ def get_xml(xml: str) -> dict | None:
         logger.warning("Failed to parse XML into dictionary.")
         return None
     return xml
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _local_name(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_to_dict(element: Element) -> dict | str | None:
+    """
+    Convert an element to the same structure xmltodict would produce.
+
+    Attributes are prefixed with "@", text next to attributes or children is stored as "#text" and repeated children
+    are collected in a list. Namespaces are stripped from the names.
+    """
+    result = {f"@{_local_name(key)}": value for key, value in element.attrib.items()}
+    for child in element:
+        name = _local_name(child.tag)
+        value = _element_to_dict(child)
+        if name not in result:
+            result[name] = value
+        elif isinstance(result[name], list):
+            result[name].append(value)
+        else:
+            result[name] = [result[name], value]
+
+    text = element.text.strip() if element.text else ""
+    if not result:
+        return text or None
+    if text:
+        result["#text"] = text
+    return result
+
+
+def _read_chunks(source: str | bytes | os.PathLike | IO) -> Iterator[str | bytes]:
+    """Yield the content of an XML string, file path or file object in chunks."""
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), CHUNK_SIZE):
+            yield source[start : start + CHUNK_SIZE]
+    elif isinstance(source, os.PathLike):
+        with open(source, "rb") as file:
+            yield from iter(lambda: file.read(CHUNK_SIZE), b"")
+    else:
+        yield from iter(lambda: source.read(CHUNK_SIZE), source.read(0))
+
+
+def iter_xml_records(source: str | bytes | os.PathLike | IO, tag: str) -> Iterator[dict]:
+    """
+    Yield the elements with a given tag as dictionaries, one at a time.
+
+    The document is parsed incrementally and every element is discarded once it has been yielded, so only a single
+    record is kept in memory instead of the complete document. Elements are matched on their name without namespace.
+    Elements with the same tag nested in a matching element are part of the outer record.
+
+    Args:
+        source (str | bytes | os.PathLike | IO): The XML document, a path to an XML file or a file object.
+        tag (str): The name of the elements to yield, e.g. "NatPers" for each employee in a loonaangifte.
+
+    Returns:
+        Iterator[dict]: The matching elements, in the same format as parse_xml_to_dict.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    parents = []
+    depth = 0
+    for chunk in _read_chunks(source):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            matches = _local_name(element.tag) == tag
+            if event == "start":
+                parents.append(element)
+                depth += matches
+                continue
+
+            parents.pop()
+            if matches:
+                depth -= 1
+                if depth == 0:
+                    yield _element_to_dict(element)
+            if depth == 0:
+                # Discard everything outside a record, it will never be yielded.
+                element.clear()
+                if parents:
+                    parents[-1].remove(element)
+    parser.close()
+
+
+def find_records(data: dict | list, tag: str) -> Iterator[dict]:
+    """
+    Yield the records with a given tag from an already parsed document.
+
+    Keys are matched on their name without namespace prefix, lists of records are yielded one by one.
+
+    Args:
+        data (dict | list): A document parsed by parse_xml_to_dict.
+        tag (str): The name of the records to yield.
+
+    Returns:
+        Iterator[dict]: The matching records.
+    """
+    if isinstance(data, list):
+        for item in data:
+            yield from find_records(item, tag)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if key.rsplit(":", 1)[-1] != tag:
+                yield from find_records(value, tag)
+            elif isinstance(value, list):
+                yield from value
+            else:
+                yield value
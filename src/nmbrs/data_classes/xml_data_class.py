@@ -0,0 +1,71 @@
+"""A base class for data classes containing an XML document, which is parsed only once."""
+
+from abc import abstractmethod
+from typing import Iterator
+
+from .data_class import DataClass
+from .utils.xml import find_records, iter_xml_records, parse_xml_to_dict
+
+_NOT_PARSED = object()
+
+
+class XMLDataClass(DataClass):
+    """
+    A base class for data classes containing an XML document in the xml attribute.
+
+    The document is parsed the first time it is needed and the result is reused afterward (e.g. by to_dict and ==).
+    The parsed document is stored in a slot, so it is not part of the fields of the instance, and is discarded when
+    another document is assigned to the xml attribute.
+    """
+
+    __slots__ = ("_parsed_xml",)
+
+    xml: str | None
+
+    @abstractmethod
+    def __init__(self) -> None:
+        """Initializes instance variables, including the xml attribute."""
+
+    def __setattr__(self, name, value):
+        """Set an attribute, assigning the xml attribute discards the parsed document."""
+        if name == "xml":
+            try:
+                object.__delattr__(self, "_parsed_xml")
+            except AttributeError:
+                pass
+        super().__setattr__(name, value)
+
+    def parse_xml(self, release_xml: bool = False) -> dict | str:
+        """
+        Parse the XML document, the result is memoized.
+
+        Args:
+            release_xml (bool, optional): Drop the raw XML string after parsing, to free memory. Defaults to False.
+
+        Returns:
+            dict | str: A dictionary representation of the XML or the original XML string if it could not be parsed.
+        """
+        parsed = getattr(self, "_parsed_xml", _NOT_PARSED)
+        if parsed is _NOT_PARSED:
+            parsed = parse_xml_to_dict(self.xml)
+            object.__setattr__(self, "_parsed_xml", parsed)
+        if release_xml:
+            # Set directly, the parsed document replaces the released XML
+            self.__dict__["xml"] = None
+        return parsed
+
+    def iter_records(self, tag: str) -> Iterator[dict]:
+        """
+        Yield the elements with a given tag, without parsing the complete document into a dictionary.
+
+        When the raw XML has been released, the records are taken from the already parsed document.
+
+        Args:
+            tag (str): The name of the elements to yield, e.g. "NatPers" for each employee in a loonaangifte.
+
+        Returns:
+            Iterator[dict]: The matching elements as dictionaries.
+        """
+        if self.xml is None:
+            return find_records(self.parse_xml(), tag)
+        return iter_xml_records(self.xml, tag)
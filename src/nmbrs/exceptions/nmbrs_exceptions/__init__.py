@@ -5,3 +5,4 @@ from .e1000 import *
 from .e2000 import *
 from .e9000 import *
 from .background_task import *
+from .fault import *
@@ -10,7 +10,7 @@ class UnknownNmbrsException(NmbrsBaseException):
         self,
         resource: str,
     ) -> None:
-        super().__init__(1001, resource=resource)
+        super().__init__(9999, resource=resource)
 
 
 class UnknownException(NmbrsBaseException):
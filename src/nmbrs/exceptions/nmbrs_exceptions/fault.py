@@ -0,0 +1,164 @@
+"""
+Structured faults of the Nmbrs SOAP API, and the exceptions raised for them.
+
+Nmbrs returns the error code in the fault string, e.g. "Server was unable to process request. ---> 2046: Not found".
+NmbrsFault parses the code once, and tells whether the call can be retried and whether the error is caused by the
+request (a client error), so callers do not need to match the text of the fault.
+"""
+
+import re
+
+from .nmbrs_base_exception import NmbrsBaseException, is_client_error, is_retryable
+from .e1000 import (
+    InvalidCredentialsException,
+    AuthenticationException,
+    AuthorizationException,
+    AuthorizationDataException,
+    NoValidSubscriptionException,
+    LoginSecurityFailureException,
+)
+from .e2000 import (
+    InvalidHourComponentException,
+    InvalidWageComponentException,
+    UnauthorizedEmployeeException,
+    UnauthorizedCompanyException,
+    InvalidPeriodException,
+    UnauthorizedDebtorException,
+    ProtectedModeException,
+    WageTaxDeclarationAlreadySentException,
+    NotAvailableOnFreeTrialException,
+    InvalidBankAccountIbanException,
+    InvalidBankAccountNumberException,
+    InvalidBankAccountTypeException,
+    InvalidLabourAgreementIdException,
+    InvalidLeaveIdException,
+    TaskStatusNotAvailableException,
+    TaskStatusNotAvailable2Exception,
+    InvalidTaskResultException,
+    InvalidLeaveTypeException,
+    StartTimeAfterEndTimeException,
+    TimeSlotsOverlapException,
+    InvalidSetOfValuesException,
+    BankAccountIbanRequiredException,
+    TaxTypeRequiredException,
+    InvalidTaxTypeException,
+    TaxFormRequiredException,
+    InvalidTaxFormException,
+    InvalidCostCenterIdException,
+    InvalidCostCenterCode,
+    DuplicatedCostCenterCodeExceptionException,
+    ProvideExtensionException,
+    FileTooLargeException,
+    MultipleEnvironmentAccountsException,
+    DomainNotFoundException,
+    InvalidEndpointException,
+    InvalidNameException,
+    NotFoundException,
+    InvalidDocumentTypeException,
+)
+from .e9000 import UnknownNmbrsException, UnknownException
+
+FAULT_CODE = re.compile(r"---> (\d+):")
+# The only error without a code, returned by the single sign-on
+INVALID_CREDENTIALS = "---> Invalid combination email/password"
+
+EXCEPTIONS: dict[int, type[NmbrsBaseException]] = {
+    1000: InvalidCredentialsException,
+    1001: AuthenticationException,
+    1002: AuthorizationException,
+    1003: AuthorizationDataException,
+    1004: NoValidSubscriptionException,
+    1006: LoginSecurityFailureException,
+    2001: InvalidHourComponentException,
+    2002: InvalidWageComponentException,
+    2003: UnauthorizedEmployeeException,
+    2004: UnauthorizedCompanyException,
+    2006: InvalidPeriodException,
+    2009: UnauthorizedDebtorException,
+    2011: ProtectedModeException,
+    2012: WageTaxDeclarationAlreadySentException,
+    2013: NotAvailableOnFreeTrialException,
+    2014: InvalidBankAccountIbanException,
+    2015: InvalidBankAccountNumberException,
+    2016: InvalidBankAccountTypeException,
+    2017: InvalidLabourAgreementIdException,
+    2018: InvalidLeaveIdException,
+    2019: TaskStatusNotAvailableException,
+    2020: TaskStatusNotAvailable2Exception,
+    2021: InvalidTaskResultException,
+    2022: InvalidLeaveTypeException,
+    2028: StartTimeAfterEndTimeException,
+    2029: TimeSlotsOverlapException,
+    2030: InvalidSetOfValuesException,
+    2032: BankAccountIbanRequiredException,
+    2033: TaxTypeRequiredException,
+    2034: InvalidTaxTypeException,
+    2035: TaxFormRequiredException,
+    2036: InvalidTaxFormException,
+    2037: InvalidCostCenterIdException,
+    2038: InvalidCostCenterCode,
+    2039: DuplicatedCostCenterCodeExceptionException,
+    2040: ProvideExtensionException,
+    2041: FileTooLargeException,
+    2042: MultipleEnvironmentAccountsException,
+    2043: DomainNotFoundException,
+    2044: InvalidEndpointException,
+    2045: InvalidNameException,
+    2046: NotFoundException,
+    2047: InvalidDocumentTypeException,
+    9999: UnknownNmbrsException,
+}
+
+
+class NmbrsFault:
+    """
+    A fault returned by the Nmbrs SOAP API.
+
+    Attributes:
+        code (int | None): The Nmbrs error code, e.g. 2046, None when the fault has no code.
+        detail (str): The fault string as returned by Nmbrs.
+        retryable (bool): Whether retrying the call tends to solve the error.
+        client_error (bool): Whether the error is caused by the request.
+    """
+
+    __slots__ = ("code", "detail", "retryable", "client_error")
+
+    def __init__(self, code: int | None, detail: str = ""):
+        self.code = code
+        self.detail = detail
+        self.retryable = is_retryable(code)
+        self.client_error = is_client_error(code)
+
+    @classmethod
+    def from_fault(cls, fault) -> "NmbrsFault":
+        """
+        Parse the fault raised by zeep.
+
+        Args:
+            fault (zeep.exceptions.Fault): The fault.
+
+        Returns:
+            NmbrsFault: The structured fault.
+        """
+        detail = fault.message or ""
+        match = FAULT_CODE.search(detail)
+        if match is not None:
+            return cls(int(match.group(1)), detail)
+        return cls(1000 if INVALID_CREDENTIALS in detail else None, detail)
+
+    def exception(self, resource: str) -> NmbrsBaseException:
+        """
+        Create the exception of the fault, UnknownException for an unknown code.
+
+        Args:
+            resource (str): The resource of the call, e.g. "EmployeeService:Absence_GetList".
+
+        Returns:
+            NmbrsBaseException: The exception, with the fault in its fault attribute.
+        """
+        exception = EXCEPTIONS.get(self.code, UnknownException)(resource=resource)
+        exception.fault = self
+        return exception
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(code={self.code!r}, detail={self.detail!r})"
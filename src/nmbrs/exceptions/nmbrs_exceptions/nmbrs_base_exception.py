@@ -1,12 +1,214 @@
 """Base for nmbrs errors"""
 
+import copyreg
+from functools import cached_property
+
 from ...__version__ import __git_issues__
 
+# The title, cause and solution of the Nmbrs error codes
+ERRORS: dict[int, tuple[str, str, str]] = {
+    1000: (
+        "Invalid combination email/password",
+        "Invalid combination email/password",
+        "Make sure that the email and the password that you use are right",
+    ),
+    1001: (
+        "Invalid Authentication",
+        "The email address, API token or domain is not valid.",
+        (
+            "Make sure that the email and the token that you use are right. For more information see"
+            " [API Invalid Authentication](https://support.nmbrs.com/hc/en-us/articles/360015628919-API-"
+            "error-1001-Invalid-Authentication)"
+        ),
+    ),
+    1002: (
+        "Unauthorized Access",
+        "You do not have the rights for the debtor, company or the employee services. ",
+        (
+            "Contact the administrator of the environment and review the API template. See"
+            " [API User Template](https://support.nmbrs.com/hc/en-us/articles/360013527371-API-User-Template)"
+        ),
+    ),
+    1003: (
+        "Unauthorized Access Data",
+        "You do not have the rights for the debtor or company.",
+        "Contact the administrator of the environment and review access rights by tags/filters.",
+    ),
+    1004: ("Disabled, no valid subscription", "Disabled, no valid subscription", ""),
+    1006: ("Generic Login Security Failure", "Unknown", "Retrying tends to solve the issue."),
+    2001: (
+        "Invalid Hour component",
+        "Hour component number is not right. Hour component is not inserted.",
+        "Use valid hour component number. To see the hour components that are in use see method HourModel_GetHourCodes.",
+    ),
+    2002: (
+        "Invalid Wage Component",
+        "Wage component number is incorrect, therefore the wage component is not inserted.",
+        "Insert a valid wage component number. To see the wage components that are in use, see method WageModel_GetWageCodes.",
+    ),
+    2003: (
+        "Unauthorized Access",
+        "You do not have the rights to the employee that you are using the API method for.",
+        "Make sure you have the correct EmployeeID.",
+    ),
+    2004: (
+        "Unauthorized Access",
+        "You do not have the rights to the company that you are using the API method for.",
+        "Make sure you have the correct CompanyID.",
+    ),
+    2006: (
+        "Invalid Period",
+        "Inserted period is not according to the company's period type.",
+        "Use the period type according to company settings.",
+    ),
+    2009: (
+        "Unauthorized Access",
+        "You do not have the rights to the debtor that you are using the API method for.",
+        "Make sure you have the correct DebtorId.",
+    ),
+    2011: (
+        "Protected Mode: Cannot Change in the Past",
+        "You are changing something in the past or future without unprotected mode on.",
+        "You need to put the unprotected mode on by filling <UnprotectedMode>boolean</UnprotectedMode> with true.",
+    ),
+    2012: ("Wage Tax Declaration Already Sent", "Wage tax declaration already sent", ""),
+    2013: (
+        "Operation Not Possible On Free Trial",
+        "Operation not possible on free trial",
+        "Update your account from the free trial. See this list of enumerations.",
+    ),
+    2014: ("Invalid BankAccount IBAN", "Invalid BankAccount IBAN", "Insert a valid bank account IBAN."),
+    2015: ("Invalid BankAccount Number", "Invalid BankAccount Number", "Insert a valid bank account number."),
+    2016: (
+        "Invalid BankAccount Type",
+        "Invalid BankAccount Type",
+        "Insert a valid bank account type. See the BankAccountType enumeration for valid values.",
+    ),
+    2017: (
+        "Invalid Labour Agreement ID",
+        "Invalid Labour Agreement ID",
+        "Insert a valid Labour Agreement ID. You may get them using the methods LabourAgreements_Get and LabourAgreements_GetCurrent.",
+    ),
+    2018: (
+        "Invalid Leave ID",
+        "Invalid Leave ID",
+        "Insert a valid Leave ID. You can get the available Leave IDs with the method Leave_GetList_V2.",
+    ),
+    2019: (
+        "Task Status Not Available",
+        "Possibly caused by an error or the task ID belongs to a different task.",
+        "Insert a valid task ID or retry launching the task.",
+    ),
+    2020: (
+        "Task Status Not Available",
+        "Possibly caused by an error or the task ID belongs to a different task.",
+        "Insert a valid task ID or retry launching the task.",
+    ),
+    2021: (
+        "Invalid Task Result",
+        "Task doesn’t have the correct format or the task ID used belongs to a different task.",
+        "Insert a valid task ID or retry launching a task.",
+    ),
+    2022: (
+        "Invalid Leave Type",
+        "Invalid Leave Type or the leave type requested isn’t available.",
+        "Insert a valid leave type from the enumeration.",
+    ),
+    2028: (
+        "Start Time Cannot Be After End Time",
+        "The start time must always be before the end time",
+        "Make sure the end time is not before the start time",
+    ),
+    2029: (
+        "Time Slots Cannot Overlap",
+        "Time ScheduleAll in SE cannot have overlapping slots",
+        "Check what are the current time slots and make sure what you are trying to add is not overlapping",
+    ),
+    2030: (
+        "Invalid Set of Values",
+        "The values inputted are invalid",
+        "Review if you are not inserting any type of value incorrectly. For example, characters where it's expected int.",
+    ),
+    2032: ("Bank Account IBAN Required", "The IBAN was not given in the input", "Add the IBAN to the input."),
+    2033: ("Tax Type Required", "SE-only. The tax type was not inputted.", "Add a tax type to the input."),
+    2034: ("Invalid Tax Type", "SE-only. The tax type is invalid.", "Add a valid tax type to the input."),
+    2035: ("Tax Form Required", "SE-only. The tax form for was not inputted.", "Add a tax form to the input."),
+    2036: ("Invalid Tax Form", "SE-only. The tax form is invalid.", "Add a valid tax form to the input."),
+    2037: ("Invalid CostCenterId", "The CostCenterId inputted is invalid", "Get the list of valid cost centers and try again."),
+    2038: ("Invalid CostCenterCode", "The CostCenterCode inputted is invalid", "Get the list of valid cost centers and try again."),
+    2039: (
+        "Duplicated Cost Center Code",
+        "The cost center code is duplicated and that's not allowed",
+        "Only one cost center can be added at a time.",
+    ),
+    2040: (
+        "Provide File Name with an Extension",
+        "The file added was not inputted with an extension",
+        "It's mandatory to add the extension of the file when uploading. Please try again with the extension.",
+    ),
+    2041: ("File Too Large", "File is too big to be uploaded", "Try uploading the file again in a smaller size."),
+    2042: (
+        "User Belongs to Multiple Environments, Cannot SSO",
+        "This username belongs to multiple environments, it could not be authenticated.",
+        "Use the call GetTokenWithDomain instead of GetToken to authenticate and SSO.",
+    ),
+    2043: ("Invalid Domain", "An invalid domain was inputted", "Add a valid domain."),
+    2044: ("Invalid Endpoint", "Endpoint does not have a valid format", "Add an endpoint with a valid format, with 'https://' on the URL."),
+    2045: ("Invalid Name", "Name cannot be empty, it's a mandatory field", "Add a name for this webhook setting."),
+    2046: ("Not Found", "Could not find the requested resource", "Input a valid resource, use a GET call to retrieve the data."),
+    9999: ("Unkown", "Unknown", f"Create a issue on our git page: {__git_issues__}"),
+    # Special errors for background tasks
+    10001: (
+        "Error Retrieving Background Report",
+        "The 'Error' was returned when retrieving the background report from the Nmbrs API.",
+        "Please check your network connection and try again. If the issue persists, contact nmbrs support",
+    ),
+    # Special errors for background tasks
+    10002: (
+        "Unknown Error Retrieving Background Report",
+        "The 'Unknown' was returned when retrieving the background report from the Nmbrs API.",
+        "¯_(ツ)_/¯",
+    ),
+}
+UNKNOWN_ERROR = ("Unknown Nmbrs error", "Unknown", f"Create a issue on our git page: {__git_issues__}")
+
+# Generic login security failures and unknown errors of Nmbrs tend to be solved by retrying
+RETRYABLE_CODES = frozenset({1006, 9999})
+
+
+def is_retryable(code: int | None) -> bool:
+    """
+    Determine whether a call failing with an error code can be retried.
+
+    Args:
+        code (int | None): The Nmbrs error code, None for a fault without a code.
+
+    Returns:
+        bool: True when retrying the call tends to solve the error.
+    """
+    return code in RETRYABLE_CODES
+
+
+def is_client_error(code: int | None) -> bool:
+    """
+    Determine whether an error code is caused by the request, e.g. invalid values, missing rights or a missing record.
+
+    Args:
+        code (int | None): The Nmbrs error code, None for a fault without a code.
+
+    Returns:
+        bool: True for the documented errors of the 1000 and 2000 ranges, except the retryable ones.
+    """
+    return code is not None and 1000 <= code < 3000 and code not in RETRYABLE_CODES
+
 
 class NmbrsBaseException(Exception):
     """
     Base for nmbrs errors
 
+    The title, cause, solution and message are formatted when they are first read, e.g. when the exception is
+    displayed, so exceptions caught in bulk loops are cheap to construct.
+
     For more details on Nmbrs API error codes, refer to:
         - [Nmbrs API Error Codes](https://support.nmbrs.com/hc/en-us/articles/360013526891-Nmbrs-API-error-codes)
         - [API Invalid Authentication](https://support.nmbrs.com/hc/en-us/articles/360015628919-API-error-1001-Invalid-Authentication)
@@ -16,226 +218,50 @@ class NmbrsBaseException(Exception):
     def __init__(self, error_code: int, resource: str):
         self.error_code = error_code
         self.resource = resource
+        # The fault returned by Nmbrs, set when the exception is raised for a fault (see NmbrsFault)
+        self.fault = None
+        super(Exception, self).__init__(error_code, resource)
+
+    def get_error(self) -> tuple[str, str, str]:
+        """Get the title, cause and solution of an exception."""
+        return ERRORS.get(self.error_code, UNKNOWN_ERROR)
+
+    @cached_property
+    def title(self) -> str:
+        """The title of the error."""
+        return self.get_error()[0]
+
+    @cached_property
+    def cause(self) -> str:
+        """The cause of the error."""
+        return self.get_error()[1]
+
+    @cached_property
+    def solution(self) -> str:
+        """The solution of the error."""
+        return self.get_error()[2]
+
+    @cached_property
+    def message(self) -> str:
+        """The message of the exception, with the title, resource, cause and solution of the error."""
+        return f"Error: {self.title}\n" f"  Resource: {self.resource}\n" f"  Cause: {self.cause}\n" f"  Solution: {self.solution}\n"
+
+    @property
+    def retryable(self) -> bool:
+        """Whether retrying the call tends to solve the error."""
+        return self.fault.retryable if self.fault is not None else is_retryable(self.error_code)
+
+    @property
+    def client_error(self) -> bool:
+        """Whether the error is caused by the request, e.g. invalid values, missing rights or a missing record."""
+        return self.fault.client_error if self.fault is not None else is_client_error(self.error_code)
+
+    def __str__(self):
+        return self.message
 
-        self.title = ""
-        self.cause = ""
-        self.solution = ""
-
-        self.get_error()
-
-        self.message = f"Error: {self.title}\n" f"  Resource: {self.resource}\n" f"  Cause: {self.cause}\n" f"  Solution: {self.solution}\n"
-        super(Exception, self).__init__(self.message)
-
-    def get_error(self):
-        """Get the name, cause and solution of an exception."""
-        match self.error_code:
-            case 1000:
-                self.title = "Invalid combination email/password"
-                self.cause = "Invalid combination email/password"
-                self.solution = "Make sure that the email and the password that you use are right"
-            case 1001:
-                self.title = "Invalid Authentication"
-                self.cause = "The email address, API token or domain is not valid."
-                self.solution = (
-                    "Make sure that the email and the token that you use are right. For more information see"
-                    " [API Invalid Authentication](https://support.nmbrs.com/hc/en-us/articles/360015628919-API-"
-                    "error-1001-Invalid-Authentication)"
-                )
-            case 1002:
-                self.title = "Unauthorized Access"
-                self.cause = "You do not have the rights for the debtor, company or the employee services. "
-                self.solution = (
-                    "Contact the administrator of the environment and review the API template. See"
-                    " [API User Template](https://support.nmbrs.com/hc/en-us/articles/360013527371-API-User-Template)"
-                )
-            case 1003:
-                self.title = "Unauthorized Access Data"
-                self.cause = "You do not have the rights for the debtor or company."
-                self.solution = "Contact the administrator of the environment and review access rights by tags/filters."
-            case 1004:
-                self.title = "Disabled, no valid subscription"
-                self.cause = "Disabled, no valid subscription"
-                self.solution = ""
-            case 1006:
-                self.title = "Generic Login Security Failure"
-                self.cause = "Unknown"
-                self.solution = "Retrying tends to solve the issue."
-            case 2001:
-                self.title = "Invalid Hour component"
-                self.cause = "Hour component number is not right. Hour component is not inserted."
-                self.solution = (
-                    "Use valid hour component number. To see the hour components that are in use see method HourModel_GetHourCodes."
-                )
-            case 2002:
-                self.title = "Invalid Wage Component"
-                self.cause = "Wage component number is incorrect, therefore the wage component is not inserted."
-                self.solution = (
-                    "Insert a valid wage component number. To see the wage components that are in use, "
-                    "see method WageModel_GetWageCodes."
-                )
-            case 2003:
-                self.title = "Unauthorized Access"
-                self.cause = "You do not have the rights to the employee that you are using the API method for."
-                self.solution = "Make sure you have the correct EmployeeID."
-            case 2004:
-                self.title = "Unauthorized Access"
-                self.cause = "You do not have the rights to the company that you are using the API method for."
-                self.solution = "Make sure you have the correct CompanyID."
-            case 2006:
-                self.title = "Invalid Period"
-                self.cause = "Inserted period is not according to the company's period type."
-                self.solution = "Use the period type according to company settings."
-            case 2009:
-                self.title = "Unauthorized Access"
-                self.cause = "You do not have the rights to the debtor that you are using the API method for."
-                self.solution = "Make sure you have the correct DebtorId."
-            case 2011:
-                self.title = "Protected Mode: Cannot Change in the Past"
-                self.cause = "You are changing something in the past or future without unprotected mode on."
-                self.solution = "You need to put the unprotected mode on by filling <UnprotectedMode>boolean</UnprotectedMode> with true."
-            case 2012:
-                self.title = "Wage Tax Declaration Already Sent"
-                self.cause = "Wage tax declaration already sent"
-                self.solution = ""
-            case 2013:
-                self.title = "Operation Not Possible On Free Trial"
-                self.cause = "Operation not possible on free trial"
-                self.solution = "Update your account from the free trial. See this list of enumerations."
-            case 2014:
-                self.title = "Invalid BankAccount IBAN"
-                self.cause = "Invalid BankAccount IBAN"
-                self.solution = "Insert a valid bank account IBAN."
-            case 2015:
-                self.title = "Invalid BankAccount Number"
-                self.cause = "Invalid BankAccount Number"
-                self.solution = "Insert a valid bank account number."
-            case 2016:
-                self.title = "Invalid BankAccount Type"
-                self.cause = "Invalid BankAccount Type"
-                self.solution = "Insert a valid bank account type. See the BankAccountType enumeration for valid values."
-            case 2017:
-                self.title = "Invalid Labour Agreement ID"
-                self.cause = "Invalid Labour Agreement ID"
-                self.solution = (
-                    "Insert a valid Labour Agreement ID. You may get them using the methods LabourAgreements_Get "
-                    "and LabourAgreements_GetCurrent."
-                )
-            case 2018:
-                self.title = "Invalid Leave ID"
-                self.cause = "Invalid Leave ID"
-                self.solution = "Insert a valid Leave ID. You can get the available Leave IDs with the method Leave_GetList_V2."
-            case 2019:
-                self.title = "Task Status Not Available"
-                self.cause = "Possibly caused by an error or the task ID belongs to a different task."
-                self.solution = "Insert a valid task ID or retry launching the task."
-            case 2020:
-                self.title = "Task Status Not Available"
-                self.cause = "Possibly caused by an error or the task ID belongs to a different task."
-                self.solution = "Insert a valid task ID or retry launching the task."
-            case 2021:
-                self.title = "Invalid Task Result"
-                self.cause = "Task doesn’t have the correct format or the task ID used belongs to a different task."
-                self.solution = "Insert a valid task ID or retry launching a task."
-            case 2022:
-                self.title = "Invalid Leave Type"
-                self.cause = "Invalid Leave Type or the leave type requested isn’t available."
-                self.solution = "Insert a valid leave type from the enumeration."
-            case 2028:
-                self.title = "Start Time Cannot Be After End Time"
-                self.cause = "The start time must always be before the end time"
-                self.solution = "Make sure the end time is not before the start time"
-            case 2029:
-                self.title = "Time Slots Cannot Overlap"
-                self.cause = "Time ScheduleAll in SE cannot have overlapping slots"
-                self.solution = "Check what are the current time slots and make sure what you are trying to add is not overlapping"
-            case 2030:
-                self.title = "Invalid Set of Values"
-                self.cause = "The values inputted are invalid"
-                self.solution = (
-                    "Review if you are not inserting any type of value incorrectly. For example, characters where it's expected int."
-                )
-            case 2032:
-                self.title = "Bank Account IBAN Required"
-                self.cause = "The IBAN was not given in the input"
-                self.solution = "Add the IBAN to the input."
-            case 2033:
-                self.title = "Tax Type Required"
-                self.cause = "SE-only. The tax type was not inputted."
-                self.solution = "Add a tax type to the input."
-            case 2034:
-                self.title = "Invalid Tax Type"
-                self.cause = "SE-only. The tax type is invalid."
-                self.solution = "Add a valid tax type to the input."
-            case 2035:
-                self.title = "Tax Form Required"
-                self.cause = "SE-only. The tax form for was not inputted."
-                self.solution = "Add a tax form to the input."
-            case 2036:
-                self.title = "Invalid Tax Form"
-                self.cause = "SE-only. The tax form is invalid."
-                self.solution = "Add a valid tax form to the input."
-            case 2037:
-                self.title = "Invalid CostCenterId"
-                self.cause = "The CostCenterId inputted is invalid"
-                self.solution = "Get the list of valid cost centers and try again."
-            case 2038:
-                self.title = "Invalid CostCenterCode"
-                self.cause = "The CostCenterCode inputted is invalid"
-                self.solution = "Get the list of valid cost centers and try again."
-            case 2039:
-                self.title = "Duplicated Cost Center Code"
-                self.cause = "The cost center code is duplicated and that's not allowed"
-                self.solution = "Only one cost center can be added at a time."
-            case 2040:
-                self.title = "Provide File Name with an Extension"
-                self.cause = "The file added was not inputted with an extension"
-                self.solution = "It's mandatory to add the extension of the file when uploading. Please try again with the extension."
-            case 2041:
-                self.title = "File Too Large"
-                self.cause = "File is too big to be uploaded"
-                self.solution = "Try uploading the file again in a smaller size."
-            case 2042:
-                self.title = "User Belongs to Multiple Environments, Cannot SSO"
-                self.cause = "This username belongs to multiple environments, it could not be authenticated."
-                self.solution = "Use the call GetTokenWithDomain instead of GetToken to authenticate and SSO."
-            case 2043:
-                self.title = "Invalid Domain"
-                self.cause = "An invalid domain was inputted"
-                self.solution = "Add a valid domain."
-            case 2044:
-                self.title = "Invalid Endpoint"
-                self.cause = "Endpoint does not have a valid format"
-                self.solution = "Add an endpoint with a valid format, with 'https://' on the URL."
-            case 2045:
-                self.title = "Invalid Name"
-                self.cause = "Name cannot be empty, it's a mandatory field"
-                self.solution = "Add a name for this webhook setting."
-            case 2046:
-                self.title = "Not Found"
-                self.cause = "Could not find the requested resource"
-                self.solution = "Input a valid resource, use a GET call to retrieve the data."
-            case 9999:
-                self.unknown_error()
-                self.title = "Unkown"  # Actual title returned by nmbrs
-            case 10001:
-                # Special errors for background tasks
-                self.title = "Error Retrieving Background Report"
-                self.cause = "The 'Error' was returned when retrieving the background report from the Nmbrs API."
-                self.solution = "Please check your network connection and try again. If the issue persists, contact nmbrs support"
-            case 10002:
-                # Special errors for background tasks
-                self.title = "Unknown Error Retrieving Background Report"
-                self.cause = "The 'Unknown' was returned when retrieving the background report from the Nmbrs API."
-                self.solution = "¯_(ツ)_/¯"
-            case _:
-                # Exception for unknown nmbrs errors
-                self.unknown_error()
-
-    def unknown_error(self):
-        """Unknown error, No documentation found"""
-        self.title = "Unknown Nmbrs error"
-        self.cause = "Unknown"
-        self.solution = f"Create a issue on our git page: {__git_issues__}"
+    def __reduce__(self):
+        # The subclasses take other arguments than the base, the exception is restored from its attributes
+        return copyreg.__newobj__, (self.__class__,), self.__dict__
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.message})"
@@ -1,8 +1,10 @@
 """Module for handling the Company Nmbrs services."""
 
 import logging
+import os
+from typing import IO
 
-from zeep import Client
+from zeep import Client, Transport
 from zeep.helpers import serialize_object
 
 from .microservices.company import (
@@ -25,8 +27,10 @@ from .microservices.company import (
 )
 from .service import Service
 from ..auth.token_manager import AuthManager
+from ..utils.document_upload import get_document_name, post_document
 from ..utils.nmbrs_exception_handler import nmbrs_exception_handler
 from ..utils.return_list import return_list
+from ..bindings.proxy import bind_client
 from ..data_classes.company import (
     Company,
     Period,
@@ -43,11 +47,11 @@ logger = logging.getLogger(__name__)
 class CompanyService(Service):
     """A class representing Company Service for interacting with Nmbrs company-related functionalities."""
 
-    def __init__(self, auth_manager: AuthManager, sandbox: bool = True):
-        super().__init__(auth_manager, sandbox)
+    def __init__(self, auth_manager: AuthManager, sandbox: bool = True, base_uri: str | None = None, transport: Transport | None = None):
+        super().__init__(auth_manager, sandbox, base_uri, transport)
 
         # Initialize nmbrs client
-        self.client = Client(f"{self.base_uri}{self.company_uri}")
+        self.client = bind_client(Client(f"{self.base_uri}{self.company_uri}", transport=self.transport))
 
         # Micro services
         self._address = None
@@ -156,7 +160,7 @@ class CompanyService(Service):
         Lazily initializes and returns the CompanySalaryDocumentService instance.
         """
         if self._salary_documents is None:
-            self._salary_documents = CompanySalaryDocumentService(self.auth_manager, self.client)
+            self._salary_documents = CompanySalaryDocumentService(self.auth_manager, self.client, self.run)
         return self._salary_documents
 
     @property
@@ -410,6 +414,36 @@ class CompanyService(Service):
             _soapheaders=self.auth_manager.header,
         )
 
+    @nmbrs_exception_handler(resource="CompanyService:FileExplorer_UploadFile")
+    def upload_file_from(
+        self, company_id: int, source: str | os.PathLike | IO[bytes], document_sub_folder: str, document_name: str | None = None
+    ) -> None:
+        """
+        Upload a file for a company, the file is encoded while it is sent instead of being read into memory.
+
+        For further details, see the official documentation:
+            [FileExplorer_UploadFile](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=FileExplorer_UploadFile)
+
+        Args:
+            company_id (int): The ID of the company.
+            source (str | os.PathLike | IO[bytes]): A file path or a seekable binary stream.
+            document_sub_folder (str): The subfolder in which the document will be uploaded.
+            document_name (str, optional): The name of the document. Defaults to the file name of the source.
+
+        Returns:
+            None
+        """
+        post_document(
+            self.client,
+            "FileExplorer_UploadFile",
+            "Body",
+            source,
+            CompanyId=company_id,
+            StrDocumentName=document_name or get_document_name(source),
+            StrDocumentSubFolder=document_sub_folder,
+            _soapheaders=self.auth_manager.header,
+        )
+
     @nmbrs_exception_handler(resource="CompanyService:Schedule_GetCurrent")
     def get_current_schedule(self, company_id: int) -> FulltimeSchedules:
         """
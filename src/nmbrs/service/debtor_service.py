@@ -5,7 +5,7 @@ Module for handling the Debtor Nmbrs services.
 import logging
 from datetime import datetime
 
-from zeep import Client
+from zeep import Client, Transport
 from zeep.helpers import serialize_object
 
 from .microservices.debtor import DebtorDepartmentService, DebtorFunctionService, DebtorTitleService, DebtorWebHooksService
@@ -13,6 +13,7 @@ from .service import Service
 from ..auth.token_manager import AuthManager
 from ..utils.nmbrs_exception_handler import nmbrs_exception_handler
 from ..utils.return_list import return_list
+from ..bindings.proxy import bind_client
 from ..data_classes.debtor import (
     Debtor,
     AbsenceVerzuim,
@@ -37,11 +38,11 @@ class DebtorService(Service):
         1 [Converter_GetDebtors_IntToGuid](https://api.nmbrs.nl/soap/v3/DebtorService.asmx?op=Converter_GetDebtors_IntToGuid)
     """
 
-    def __init__(self, auth_manager: AuthManager, sandbox: bool = True):
-        super().__init__(auth_manager, sandbox)
+    def __init__(self, auth_manager: AuthManager, sandbox: bool = True, base_uri: str | None = None, transport: Transport | None = None):
+        super().__init__(auth_manager, sandbox, base_uri, transport)
 
         # Initialize nmbrs services
-        self.client = Client(f"{self.base_uri}{self.debtor_uri}")
+        self.client = bind_client(Client(f"{self.base_uri}{self.debtor_uri}", transport=self.transport))
 
         # Micro services
         self._department = None
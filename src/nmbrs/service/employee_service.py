@@ -5,7 +5,7 @@ Module for handling the Employee Nmbrs services.
 import logging
 from datetime import datetime
 
-from zeep import Client
+from zeep import Client, Transport
 from zeep.helpers import serialize_object
 
 from .microservices.employee import (
@@ -43,7 +43,7 @@ from ..auth.token_manager import AuthManager
 from ..data_classes.employee import EmployeeTypes, Employee, Period
 from ..utils.nmbrs_exception_handler import nmbrs_exception_handler
 from ..utils.return_list import return_list
-
+from ..bindings.proxy import bind_client
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +51,11 @@ logger = logging.getLogger(__name__)
 class EmployeeService(Service):
     """A class representing Employee Service for interacting with Nmbrs employee-related functionalities."""
 
-    def __init__(self, auth_manager: AuthManager, sandbox: bool = True):
-        super().__init__(auth_manager, sandbox)
+    def __init__(self, auth_manager: AuthManager, sandbox: bool = True, base_uri: str | None = None, transport: Transport | None = None):
+        super().__init__(auth_manager, sandbox, base_uri, transport)
 
         # Initialize nmbrs services
-        self.client = Client(f"{self.base_uri}{self.employee_uri}")
+        self.client = bind_client(Client(f"{self.base_uri}{self.employee_uri}", transport=self.transport))
 
         # Micro services
         self._absence = None
@@ -1,11 +1,13 @@
 # pylint: disable=line-too-long
 """Microservice responsible for journal related actions on the company level."""
+
 import logging
 
 from zeep import Client
 
 from ..micro_service import MicroService
 from ....auth.token_manager import AuthManager
+from ....data_classes.journal import Journal
 from ....utils.nmbrs_exception_handler import nmbrs_exception_handler
 
 logger = logging.getLogger(__name__)
@@ -18,101 +20,198 @@ class CompanyJournalService(MicroService):
         super().__init__(auth_manager, client)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCompany")
-    def get_run_by_company(self):
+    def get_run_by_company(self, company_id: int, run_id: int) -> Journal:
         """
         Returns the Journal XML, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCompany](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCompany)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCompany(CompanyId=company_id, RunId=run_id, _soapheaders=self.auth_manager.header)
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCompany_v2")
-    def get_run_by_company_2(self):
+    def get_run_by_company_2(self, company_id: int, run_id: int, year: int) -> Journal:
         """
         Returns the Journal XML.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCompany_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCompany_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCompany_v2(
+            CompanyId=company_id, RunId=run_id, Year=year, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCostCenter")
-    def get_run_by_cost_center(self):
+    def get_run_by_cost_center(self, company_id: int, run_id: int) -> Journal:
         """
         Returns the Journal XML, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCostCenter](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCostCenter)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCostCenter(CompanyId=company_id, RunId=run_id, _soapheaders=self.auth_manager.header)
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCostCenter_v2")
-    def get_run_by_cost_center_2(self):
+    def get_run_by_cost_center_2(self, company_id: int, run_id: int, year: int) -> Journal:
         """
         Returns the Journal XML.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCostCenter_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCostCenter_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCostCenter_v2(
+            CompanyId=company_id, RunId=run_id, Year=year, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCostCenterCostUnit")
-    def get_run_by_cost_center_nad_cost_unit(self):
+    def get_run_by_cost_center_nad_cost_unit(self, company_id: int, run_id: int) -> Journal:
         """
         Returns the Journal XML with Cost Center/Cost Unit information, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCostCenterCostUnit](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCostCenterCostUnit)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCostCenterCostUnit(
+            CompanyId=company_id, RunId=run_id, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunCostCenterCostUnitPerYear")
-    def get_run_by_cost_center_nad_cost_unit_per_year(self):
+    def get_run_by_cost_center_nad_cost_unit_per_year(self, company_id: int, run_id: int, year: int) -> Journal:
         """
         Returns the Journal XML with Cost Center/Cost Unit information of the given year.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunCostCenterCostUnitPerYear](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunCostCenterCostUnitPerYear)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunCostCenterCostUnitPerYear(
+            CompanyId=company_id, RunId=run_id, Year=year, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunDepartment")
-    def get_run_by_department(self):
+    def get_run_by_department(self, company_id: int, run_id: int) -> Journal:
         """
         Returns the Journal XML, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunDepartment](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunDepartment)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunDepartment(CompanyId=company_id, RunId=run_id, _soapheaders=self.auth_manager.header)
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunDepartment_v2")
-    def get_run_by_department_2(self):
+    def get_run_by_department_2(self, company_id: int, run_id: int, year: int) -> Journal:
         """
         Returns the Journal XML.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunDepartment_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunDepartment_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunDepartment_v2(
+            CompanyId=company_id, RunId=run_id, Year=year, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunEmployee")
-    def get_run_by_employee(self):
+    def get_run_by_employee(self, company_id: int, run_id: int) -> Journal:
         """
         Returns the Journal XML, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunEmployee](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunEmployee)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunEmployee(CompanyId=company_id, RunId=run_id, _soapheaders=self.auth_manager.header)
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
 
     @nmbrs_exception_handler(resource="CompanyService:Journals_GetByRunEmployee_v2")
-    def get_run_by_employee_2(self):
+    def get_run_by_employee_2(self, company_id: int, run_id: int, year: int) -> Journal:
         """
         Returns the Journal XML.
 
         For more information, refer to the official documentation:
             [Journals_GetByRunEmployee_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=Journals_GetByRunEmployee_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+
+        Returns:
+            Journal: The journal, use iter_entries to parse its entries one at a time.
         """
-        raise NotImplementedError()  # pragma: no cover
+        journal = self.client.service.Journals_GetByRunEmployee_v2(
+            CompanyId=company_id, RunId=run_id, Year=year, _soapheaders=self.auth_manager.header
+        )
+        return Journal(company_id=company_id, run_id=run_id, xml=journal)
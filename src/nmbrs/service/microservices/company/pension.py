@@ -1,18 +1,27 @@
 """Microservice responsible for pension related actions on the company level."""
 
+import gzip
 import logging
+import os
+from time import monotonic
+from typing import Iterable, Iterator
 
 from zeep import Client
 from zeep.helpers import serialize_object
 
 from ..micro_service import MicroService
 from ....auth.token_manager import AuthManager
-from ....data_classes.company import Pension, PensionXML
+from ....data_classes.company import Pension, PensionRecord, PensionXML
+from ....data_classes.harvest import HarvestSummary
+from ....data_classes.utils.xml import iter_xml_records
+from ....utils.harvest import Manifest, fan_out, write_compressed
 from ....utils.nmbrs_exception_handler import nmbrs_exception_handler
 from ....utils.return_list import return_list
 
 logger = logging.getLogger(__name__)
 
+PENSION_RECORD_TAG = "Employee"
+
 
 class CompanyPensionService(MicroService):
     """Microservice responsible for pension related actions on the company level."""
@@ -58,3 +67,84 @@ class CompanyPensionService(MicroService):
             CompanyId=company_id, PensionExportID=pension_export_id, _soapheaders=self.auth_manager.header
         )
         return PensionXML(serialize_object(pension_xml))
+
+    def export(self, company_ids: Iterable[int], years: Iterable[int], dest: str | os.PathLike, max_workers: int = 8) -> HarvestSummary:
+        """
+        Store the XML of every pension export of the given companies and years on disk.
+
+        The export lists of every company and year are requested concurrently, the XML of every export is requested as
+        soon as its list is available. Each XML is stored gzip compressed as "<company id>/<pension export id>.xml.gz" in
+        the destination directory. Exports that were stored before are skipped, the stored exports are recorded in
+        "manifest.json", keyed by "<company id>/<pension export id>". Every export is journaled in the manifest as soon
+        as it is stored (see Manifest), so an interrupted export skips the exports it stored.
+
+        Args:
+            company_ids (Iterable[int]): The IDs of the companies.
+            years (Iterable[int]): The years of the exports.
+            dest (str | os.PathLike): The directory to store the exports in.
+            max_workers (int, optional): The maximum number of requests at the same time. Defaults to 8.
+
+        Returns:
+            HarvestSummary: The harvested, skipped and failed exports.
+        """
+        start_time = monotonic()
+        dest = os.fspath(dest)
+        manifest = Manifest(os.path.join(dest, "manifest.json"))
+        # Iterables such as generators can only be iterated once, years is iterated for every company
+        company_ids, years = list(company_ids), list(years)
+        keys = [(company_id, year) for company_id in company_ids for year in years]
+
+        def is_exported(pension: Pension) -> bool:
+            metadata = manifest.get(_manifest_key(pension.company_id, pension.pension_export_id))
+            return metadata is not None and os.path.exists(os.path.join(dest, metadata["path"]))
+
+        def store(pension: Pension) -> dict:
+            pension_xml = self.get_xml(pension.company_id, pension.pension_export_id)
+            path = os.path.join(str(pension.company_id), f"{pension.pension_export_id}.xml.gz")
+            size = write_compressed(os.path.join(dest, path), pension_xml.xml or "")
+            metadata = {**pension.to_dict(), "path": path, "size": size}
+            manifest.add(_manifest_key(pension.company_id, pension.pension_export_id), metadata)
+            return metadata
+
+        summary = HarvestSummary()
+        try:
+            for result in fan_out(keys, lambda key: self.get(*key), store, max_workers, is_exported):
+                summary.add(result)
+        finally:
+            manifest.save()
+        summary.elapsed = monotonic() - start_time
+        logger.info(
+            "Exported %s pension exports in %.1f seconds, skipped %s, failed %s.",
+            len(summary.harvested),
+            summary.elapsed,
+            len(summary.skipped),
+            len(summary.failed),
+        )
+        return summary
+
+    @staticmethod
+    def iter_exported_records(dest: str | os.PathLike, tag: str = PENSION_RECORD_TAG) -> Iterator[PensionRecord]:
+        """
+        Yield the employee records of every pension export stored by export, one at a time.
+
+        The compressed files are decompressed and parsed incrementally, only a single record is kept in memory.
+
+        Args:
+            dest (str | os.PathLike): The directory the exports were stored in.
+            tag (str, optional): The name of the element containing the data of a single employee. Defaults to "Employee".
+
+        Returns:
+            Iterator[PensionRecord]: The employee records of all the exports.
+        """
+        dest = os.fspath(dest)
+        manifest = Manifest(os.path.join(dest, "manifest.json"))
+        for key in sorted(manifest.entries):
+            metadata = manifest.entries[key]
+            with gzip.open(os.path.join(dest, metadata["path"]), "rb") as file:
+                for record in iter_xml_records(file, tag):
+                    yield PensionRecord(metadata["company_id"], metadata["pension_export_id"], record)
+
+
+def _manifest_key(company_id: int, pension_export_id: int) -> str:
+    """The key of a pension export in the manifest."""
+    return f"{company_id}/{pension_export_id}"
@@ -1,238 +1,720 @@
 # pylint: disable=line-too-long
 """Microservice responsible for salary documents related actions on the company level."""
+
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic
+from typing import IO
 
 from zeep import Client
+from zeep.helpers import serialize_object
 
+from .run import CompanyRunService
 from ..micro_service import MicroService
 from ....auth.token_manager import AuthManager
+from ....data_classes.document import DocumentFile, PayslipDownload
+from ....utils.document_stream import CHUNK_SIZE, write_base64_element, write_base64_elements
 from ....utils.nmbrs_exception_handler import nmbrs_exception_handler
+from ....utils.soap_request import stream_operation
 
 logger = logging.getLogger(__name__)
 
+PAYSLIP_TAG = "PDF"
+EMPLOYEE_ID_TAG = "EmployeeId"
+CHECKSUM_FILE = "SHA256SUMS"
+
 
 class CompanySalaryDocumentService(MicroService):
     """Microservice responsible for salary documents related actions on the company level."""
 
-    def __init__(self, auth_manager: AuthManager, client: Client):
+    def __init__(self, auth_manager: AuthManager, client: Client, run: CompanyRunService | None = None):
         super().__init__(auth_manager, client)
+        self.run = run if run is not None else CompanyRunService(auth_manager, client)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_AnualStatement")
-    def get_annual_statement(self):
+    def get_annual_statement(self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None) -> bytes | DocumentFile:
         """
         Get Annual Statement in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_AnualStatement](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_AnualStatement)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_AnualStatement", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_CompanyWageComponentsCumulative")
-    def get_annual_wage_components(self):
+    def get_annual_wage_components(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Company Wage Components Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_CompanyWageComponentsCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_CompanyWageComponentsCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_CompanyWageComponentsCumulative", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_JournalEntriesCompanyrCumulative")
-    def get_annual_journal_entries_company(self):
+    def get_annual_journal_entries_company(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Journal Entries company Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_JournalEntriesCompanyrCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_JournalEntriesCompanyrCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_JournalEntriesCompanyrCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_JournalEntriesCostCenterCumulative")
-    def get_annual_journal_entries_cost_center(self):
+    def get_annual_journal_entries_cost_center(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Journal Entries Cost Center Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_JournalEntriesCostCenterCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_JournalEntriesCostCenterCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_JournalEntriesCostCenterCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_JournalEntriesDepartmentCumulative")
-    def get_annual_journal_entries_department(self):
+    def get_annual_journal_entries_department(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Journal Entries Department Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_JournalEntriesDepartmentCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_JournalEntriesDepartmentCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_JournalEntriesDepartmentCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_JournalEntriesEmployeeCumulative")
-    def get_annual_journal_entries_employee(self):
+    def get_annual_journal_entries_employee(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Journal Entries Employee Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_JournalEntriesEmployeeCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_JournalEntriesEmployeeCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_JournalEntriesEmployeeCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_LeaveSaldos")
-    def get_annual_leave_saldo(self):
+    def get_annual_leave_saldo(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Leave Saldos in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_LeaveSaldos](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_LeaveSaldos)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_LeaveSaldos", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_PaymentListCumulative")
-    def get_annual_payment_list(self):
+    def get_annual_payment_list(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Payment List Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_PaymentListCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_PaymentListCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_PaymentListCumulative", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_PayrollRegister")
-    def get_annual_payroll(self):
+    def get_annual_payroll(self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None) -> bytes | DocumentFile:
         """
         Get Annual Journal Entries Department Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_PayrollRegister](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_PayrollRegister)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_PayrollRegister", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_PayrollRegisterAllEmployees")
-    def get_annual_payroll_employees(self):
+    def get_annual_payroll_employees(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual PayrollRegister All Employee in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_PayrollRegisterAllEmployees](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_PayrollRegisterAllEmployees)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_PayrollRegisterAllEmployees", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_PayrollRegisterSummaryCumulative")
-    def get_annual_payroll_summary(self):
+    def get_annual_payroll_summary(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Payroll Register Summary Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_PayrollRegisterSummaryCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_PayrollRegisterSummaryCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_PayrollRegisterSummaryCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_ReservationSaldos")
-    def get_annual_reservation_saldo(self):
+    def get_annual_reservation_saldo(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Reservation Saldo in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_ReservationSaldos](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_ReservationSaldos)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_ReservationSaldos", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_SentWageTaxDeclarations")
-    def get_annual_wage_tax_declaration(self):
+    def get_annual_wage_tax_declaration(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Document Sent Wage Tax Declarations in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_SentWageTaxDeclarations](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_SentWageTaxDeclarations)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_AnnualDocument_SentWageTaxDeclarations", target, CompanyId=company_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewByPeriod")
-    def get_annual_wage_tax_declaration_by_period(self):
+    def get_annual_wage_tax_declaration_by_period(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Document WageTax Declaration Overview Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewByPeriod](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewByPeriod)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewByPeriod", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewCumulative")
-    def get_annual_wage_tax_declaration_cumulative(self):
+    def get_annual_wage_tax_declaration_cumulative(
+        self, company_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get Annual Document WageTax Declaration Overview Cumulative in PDF.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewCumulative](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewCumulative)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the document.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document(
+            "SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewCumulative", target, CompanyId=company_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetAllPayslipsPDFByRunCompany")
-    def get_annual_all_payslips(self):
+    def get_annual_all_payslips(
+        self, company_id: int, run_id: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get all payslip PDF's of a company for a specific run period, takes year from active year of the company.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetAllPayslipsPDFByRunCompany](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetAllPayslipsPDFByRunCompany)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_GetAllPayslipsPDFByRunCompany", target, CompanyId=company_id, RunId=run_id)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetAllPayslipsPDFByRunCompany_v2")
-    def get_annual_all_payslips_2(self):
+    def get_annual_all_payslips_2(
+        self, company_id: int, run_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get all payslip PDF's of a company for a specific run period.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetAllPayslipsPDFByRunCompany_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetAllPayslipsPDFByRunCompany_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_GetAllPayslipsPDFByRunCompany_v2", target, CompanyId=company_id, RunId=run_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany")
-    def get_annual_all_payslips_as_one(self):
+    def get_annual_all_payslips_as_one(
+        self,
+        company_id: int,
+        run_id: int,
+        year: int,
+        employee_ids: list[int] | None = None,
+        target: str | os.PathLike | IO[bytes] | None = None,
+    ) -> bytes | DocumentFile:
         """
         Get all employees payslips in one PDF by run company for a specific run period.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            employee_ids (list[int], optional): The IDs of the employees. Defaults to every employee of the run.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        if employee_ids is None:
+            employee_ids = [employee.id for employee in self.run.get_all_employees_by_run(company_id, year, run_id)]
+        return self._get_payslips_in_one(company_id, run_id, year, employee_ids, target)
+
+    @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany")
+    def get_employee_payslip(
+        self, company_id: int, run_id: int, year: int, employee_id: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
+        """
+        Get the payslip of a single employee for a specific run period.
+
+        For more information, refer to the official documentation:
+            [SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            employee_id (int): The ID of the employee.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The payslip, or the path, size and checksum of the payslip when a target is given.
+        """
+        document = self._get_payslips_in_one(company_id, run_id, year, [employee_id], target)
+        if isinstance(document, DocumentFile):
+            document.employee_id = employee_id
+        return document
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetEmployeePayslipsPDFByRunCompany")
-    def get_annual_all_payslips_by_employee(self):
+    def get_annual_all_payslips_by_employee(
+        self, company_id: int, run_id: int, directory: str | os.PathLike | None = None
+    ) -> list[dict] | list[DocumentFile]:
         """
         Get employee payslips in PDF by run company for a specific run period, takes year from active year of the company
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetEmployeePayslipsPDFByRunCompany](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetEmployeePayslipsPDFByRunCompany)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            directory (str | os.PathLike, optional): A directory to write the payslips to, named "<employee id>.pdf".
+
+        Returns:
+            list[dict] | list[DocumentFile]: The payslips, or the paths, sizes and checksums when a directory is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_employee_documents(
+            "SalaryDocuments_GetEmployeePayslipsPDFByRunCompany", directory, CompanyId=company_id, RunId=run_id
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetEmployeePayslipsPDFByRunCompany_v2")
-    def get_annual_all_payslips_by_employee_2(self):
+    def get_annual_all_payslips_by_employee_2(
+        self, company_id: int, run_id: int, year: int, directory: str | os.PathLike | None = None
+    ) -> list[dict] | list[DocumentFile]:
         """
         Get employee payslips in PDF by run company for a specific run period.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetEmployeePayslipsPDFByRunCompany_v2](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetEmployeePayslipsPDFByRunCompany_v2)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            directory (str | os.PathLike, optional): A directory to write the payslips to, named "<employee id>.pdf".
+
+        Returns:
+            list[dict] | list[DocumentFile]: The payslips, or the paths, sizes and checksums when a directory is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_employee_documents(
+            "SalaryDocuments_GetEmployeePayslipsPDFByRunCompany_v2", directory, CompanyId=company_id, RunId=run_id, Year=year
+        )
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetSEPA")
-    def get_SEPA(self):
+    def get_SEPA(
+        self, company_id: int, run_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get SEPA file.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetSEPA](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetSEPA)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self._get_document("SalaryDocuments_GetSEPA", target, CompanyId=company_id, RunId=run_id, Year=year)
 
     @nmbrs_exception_handler(resource="CompanyService:SalaryDocuments_GetSEPA_Tax")
-    def get_SEPA_tax(self):
+    def get_SEPA_tax(
+        self, company_id: int, run_id: int, year: int, target: str | os.PathLike | IO[bytes] | None = None
+    ) -> bytes | DocumentFile:
         """
         Get SEPA Tax file.
 
         For more information, refer to the official documentation:
             [SalaryDocuments_GetSEPA_Tax](https://api.nmbrs.nl/soap/v3/CompanyService.asmx?op=SalaryDocuments_GetSEPA_Tax)
-        """
-        raise NotImplementedError()  # pragma: no cover
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            target (str | os.PathLike | IO[bytes], optional): A file path or binary stream to write the document to.
+
+        Returns:
+            bytes | DocumentFile: The document, or the path, size and checksum of the document when a target is given.
+        """
+        return self._get_document("SalaryDocuments_GetSEPA_Tax", target, CompanyId=company_id, RunId=run_id, Year=year)
+
+    def download_payslips(self, company_id: int, year: int, run_id: int, dest: str | os.PathLike, max_workers: int = 8) -> PayslipDownload:
+        """
+        Download the payslip of every employee in a run to a directory, one "<employee id>.pdf" file per employee.
+
+        The payslips are requested concurrently and written as soon as they arrive. The checksum of every downloaded file
+        is appended to a SHA256SUMS file in the directory as soon as the file is complete, so an interrupted download
+        keeps the payslips it finished: payslips that are already present with a matching checksum are skipped when
+        downloading again. Errors are collected per employee and do not stop the other downloads, a response without a
+        payslip is an error as well and writes no file.
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the run.
+            run_id (int): The ID of the run.
+            dest (str | os.PathLike): The directory to write the payslips to, created if it does not exist.
+            max_workers (int, optional): The maximum number of payslips requested at the same time. Defaults to 8.
+
+        Returns:
+            PayslipDownload: The downloaded, skipped and failed payslips and the throughput.
+        """
+        start_time = monotonic()
+        if not any(run.id == run_id for run in self.run.get(company_id, year)):
+            raise ValueError(f"Run {run_id} does not exist for company {company_id} in {year}")
+        employees = self.run.get_all_employees_by_run(company_id, year, run_id)
+
+        dest = os.fspath(dest)
+        os.makedirs(dest, exist_ok=True)
+        checksums = _read_checksums(dest)
+        result = PayslipDownload()
+        pending = []
+        for employee in employees:
+            document = _find_downloaded(dest, employee.id, checksums)
+            if document is not None:
+                result.skipped.append(document)
+            else:
+                pending.append((employee.id, os.path.join(dest, f"{employee.id}.pdf")))
+
+        with open(os.path.join(dest, CHECKSUM_FILE), "a", encoding="utf-8") as manifest:
+            self._download_pending(company_id, run_id, year, pending, max_workers, result, manifest)
+        for document in result.downloaded:
+            checksums[os.path.basename(document.path)] = document.sha256
+
+        # The appended lines replace the lines of the files downloaded again
+        _write_checksums(dest, checksums)
+        result.elapsed = monotonic() - start_time
+        logger.info(
+            "Downloaded %s payslips (%.1f per second, %.0f bytes per second), skipped %s, failed %s.",
+            len(result.downloaded),
+            result.payslips_per_second,
+            result.bytes_per_second,
+            len(result.skipped),
+            len(result.failed),
+        )
+        return result
+
+    def _download_pending(
+        self,
+        company_id: int,
+        run_id: int,
+        year: int,
+        pending: list[tuple[int, str]],
+        max_workers: int,
+        result: PayslipDownload,
+        manifest: IO[str],
+    ) -> None:
+        """
+        Download the pending payslips concurrently, adding them to the downloaded or failed payslips of the result.
+
+        The checksum of every payslip is appended to the manifest and flushed as soon as the payslip is complete.
+        """
+        lock = threading.Lock()
+
+        def download(employee_id: int, path: str) -> DocumentFile:
+            document = self._download_payslip(company_id, run_id, year, employee_id, path)
+            with lock:
+                manifest.write(f"{document.sha256}  {os.path.basename(path)}\n")
+                manifest.flush()
+            return document
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download, employee_id, path): employee_id for employee_id, path in pending}
+            for future in as_completed(futures):
+                try:
+                    document = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Downloading the payslip of employee %s failed: %s", futures[future], e)
+                    result.failed[futures[future]] = e
+                    continue
+                result.downloaded.append(document)
+
+    def _download_payslip(self, company_id: int, run_id: int, year: int, employee_id: int, path: str) -> DocumentFile:
+        """
+        Download a payslip to a temporary file, which replaces the final file once it is complete.
+
+        Raises:
+            ValueError: When the response contains no payslip, the temporary file is removed.
+        """
+        temp_path = f"{path}.part"
+        try:
+            document = self.get_employee_payslip(company_id, run_id, year, employee_id, target=temp_path)
+            # A response without the result element, or with an empty result, is written as an empty file
+            if not document.size:
+                raise ValueError(f"No payslip returned for employee {employee_id}")
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        document.path = path
+        return document
+
+    def _get_payslips_in_one(
+        self, company_id: int, run_id: int, year: int, employee_ids: list[int], target: str | os.PathLike | IO[bytes] | None
+    ) -> bytes | DocumentFile:
+        """Call SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany with every parameter of the operation, see _get_document."""
+        return self._get_document(
+            "SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany",
+            target,
+            CompanyId=company_id,
+            RunId=run_id,
+            Year=year,
+            EmployeeIds={"int": employee_ids},
+        )
+
+    def _get_document(self, operation: str, target: str | os.PathLike | IO[bytes] | None, **kwargs) -> bytes | DocumentFile:
+        """
+        Call an operation returning a base64 encoded document.
+
+        Without a target the document is returned as bytes. With a target the body of the response is streamed, decoded
+        in chunks and written to the target, so neither the response nor the document is held in memory as a whole.
+        """
+        if target is None:
+            return getattr(self.client.service, operation)(**kwargs, _soapheaders=self.auth_manager.header)
+        with self._stream(operation, **kwargs) as body:
+            document = write_base64_element(body, f"{operation}Result", target)
+        logger.debug("Written %s bytes of %s to %s.", document.size, operation, document.path or "stream")
+        return document
+
+    def _get_employee_documents(self, operation: str, directory: str | os.PathLike | None, **kwargs) -> list[dict] | list[DocumentFile]:
+        """Call an operation returning a base64 encoded document per employee, see _get_document."""
+        if directory is None:
+            response = getattr(self.client.service, operation)(**kwargs, _soapheaders=self.auth_manager.header)
+            return serialize_object(response) or []
+        with self._stream(operation, **kwargs) as body:
+            documents = write_base64_elements(body, PAYSLIP_TAG, EMPLOYEE_ID_TAG, directory)
+        logger.debug("Written %s documents of %s to %s.", len(documents), operation, directory)
+        return documents
+
+    def _stream(self, operation: str, **kwargs):
+        """Call an operation and iterate over the chunks of the body of its response, SOAP faults are raised by zeep."""
+        return stream_operation(self.client, operation, {**kwargs, "_soapheaders": self.auth_manager.header}, CHUNK_SIZE)
+
+
+def _file_sha256(path: str) -> str:
+    """Calculate the SHA-256 checksum of a file."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _find_downloaded(directory: str, employee_id: int, checksums: dict[str, str]) -> DocumentFile | None:
+    """Return the payslip of an employee if it was downloaded before and its checksum matches."""
+    name = f"{employee_id}.pdf"
+    path = os.path.join(directory, name)
+    expected = checksums.get(name)
+    if expected is None or not os.path.exists(path) or _file_sha256(path) != expected:
+        return None
+    return DocumentFile(path, os.path.getsize(path), expected, employee_id=employee_id)
+
+
+def _read_checksums(directory: str) -> dict[str, str]:
+    """Read the checksums of previously downloaded files, in the format of sha256sum, the last line of a file counts."""
+    path = os.path.join(directory, CHECKSUM_FILE)
+    if not os.path.exists(path):
+        return {}
+    checksums = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            checksum, _, name = line.rstrip("\n").partition("  ")
+            if name:
+                checksums[name] = checksum
+    return checksums
+
+
+def _write_checksums(directory: str, checksums: dict[str, str]) -> None:
+    """Write the checksums of the downloaded files, one line per file, the file is replaced atomically."""
+    path = os.path.join(directory, CHECKSUM_FILE)
+    with open(f"{path}.part", "w", encoding="utf-8") as file:
+        for name in sorted(checksums):
+            file.write(f"{checksums[name]}  {name}\n")
+    os.replace(f"{path}.part", path)
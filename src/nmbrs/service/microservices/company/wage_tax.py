@@ -1,13 +1,18 @@
 """Microservice responsible for managing wage tax-related actions on the company level."""
 
 import logging
+import os
+from time import monotonic
+from typing import Iterable
 
 from zeep import Client
 from zeep.helpers import serialize_object
 
 from ....auth.token_manager import AuthManager
 from ....data_classes.company import WageTax, WageTaxXML
+from ....data_classes.harvest import HarvestSummary
 from ..micro_service import MicroService
+from ....utils.harvest import Manifest, fan_out, write_compressed
 from ....utils.nmbrs_exception_handler import nmbrs_exception_handler
 from ....utils.return_list import return_list
 
@@ -84,3 +89,59 @@ class CompanyWageTaxService(MicroService):
             _soapheaders=self.auth_manager.header,
         )
         return response
+
+    def harvest(self, company_ids: Iterable[int], year: int, dest: str | os.PathLike, max_workers: int = 8) -> HarvestSummary:
+        """
+        Store the XML of every wage tax declaration of the given companies and year on disk.
+
+        The declarations of every company are listed concurrently, the XML of every declaration is requested as soon as
+        the list of its company is available. Each XML is stored gzip compressed as "<company id>/<loonaangifte id>.xml.gz"
+        in the destination directory, declarations that were stored before are skipped. The metadata of every stored
+        declaration is kept in "index.json", keyed by "<company id>/<loonaangifte id>". The metadata is journaled as
+        soon as a declaration is stored (see Manifest), so an interrupted harvest skips the declarations it stored.
+
+        Args:
+            company_ids (Iterable[int]): The IDs of the companies, e.g. of all the companies of a debtor.
+            year (int): The year of the declarations.
+            dest (str | os.PathLike): The directory to store the declarations in.
+            max_workers (int, optional): The maximum number of requests at the same time. Defaults to 8.
+
+        Returns:
+            HarvestSummary: The harvested, skipped and failed declarations.
+        """
+        start_time = monotonic()
+        dest = os.fspath(dest)
+        index = Manifest(os.path.join(dest, "index.json"))
+
+        def is_harvested(wage_tax: WageTax) -> bool:
+            metadata = index.get(_index_key(wage_tax))
+            return metadata is not None and os.path.exists(os.path.join(dest, metadata["path"]))
+
+        def store(wage_tax: WageTax) -> dict:
+            details = self.get_wagetax_details(wage_tax.company_id, wage_tax.loonaangifte_id)
+            path = os.path.join(str(wage_tax.company_id), f"{wage_tax.loonaangifte_id}.xml.gz")
+            size = write_compressed(os.path.join(dest, path), details.xml or "")
+            metadata = {**wage_tax.to_dict(), "path": path, "size": size}
+            index.add(_index_key(wage_tax), metadata)
+            return metadata
+
+        summary = HarvestSummary()
+        try:
+            for result in fan_out(company_ids, lambda company_id: self.get_all_wagetax(company_id, year), store, max_workers, is_harvested):
+                summary.add(result)
+        finally:
+            index.save()
+        summary.elapsed = monotonic() - start_time
+        logger.info(
+            "Harvested %s wage tax declarations in %.1f seconds, skipped %s, failed %s.",
+            len(summary.harvested),
+            summary.elapsed,
+            len(summary.skipped),
+            len(summary.failed),
+        )
+        return summary
+
+
+def _index_key(wage_tax: WageTax) -> str:
+    """The key of a wage tax declaration in the index."""
+    return f"{wage_tax.company_id}/{wage_tax.loonaangifte_id}"
@@ -1,15 +1,25 @@
 """Microservice responsible for document related actions on the employee level."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from typing import IO, Iterable
 
+import requests
 from zeep import Client
 
 from ..micro_service import MicroService
 from ....auth.token_manager import AuthManager
+from ....data_classes.document import DocumentUpload, DocumentUploadResult
+from ....utils.backoff import backoff_delays
+from ....utils.document_upload import get_document_name, post_document
 from ....utils.nmbrs_exception_handler import nmbrs_exception_handler
 
 logger = logging.getLogger(__name__)
 
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
 
 class EmployeeDocumentService(MicroService):
     """Microservice responsible for document related actions on the employee level."""
@@ -18,21 +28,171 @@ class EmployeeDocumentService(MicroService):
         super().__init__(auth_manager, client)
 
     @nmbrs_exception_handler(resource="EmployeeService:EmployeeDocument_UploadDocument")
-    def upload(self):
+    def upload(self, employee_id: int, document_name: str, body: bytes, document_type_guid: str) -> bool:
         """
         Uploads document for employee.
 
         For more information, refer to the official documentation:
             [EmployeeDocument_UploadDocument](https://api.nmbrs.nl/soap/v3/EmployeeService.asmx?op=EmployeeDocument_UploadDocument)
+
+        Args:
+            employee_id (int): The ID of the employee.
+            document_name (str): The name of the document, including the extension.
+            body (bytes): The content of the document.
+            document_type_guid (str): The GUID of the document type.
+
+        Returns:
+            bool: A boolean indicating whether the document was uploaded successfully.
         """
-        raise NotImplementedError()  # pragma: no cover
+        response = self.client.service.EmployeeDocument_UploadDocument(
+            EmployeeId=employee_id,
+            StrDocumentName=document_name,
+            Body=body,
+            GuidDocumentType=document_type_guid,
+            _soapheaders=self.auth_manager.header,
+        )
+        return response
 
     @nmbrs_exception_handler(resource="EmployeeService:EmployeeDocument_UploadDocumentFull")
-    def upload_full(self):
+    def upload_full(self, employee_id: int, document_name: str, body: bytes, document_type_guid: str, year: int, period: int) -> bool:
         """
         Uploads document for employee with all the fields.
 
         For more information, refer to the official documentation:
             [EmployeeDocument_UploadDocumentFull](https://api.nmbrs.nl/soap/v3/EmployeeService.asmx?op=EmployeeDocument_UploadDocumentFull)
+
+        Args:
+            employee_id (int): The ID of the employee.
+            document_name (str): The name of the document, including the extension.
+            body (bytes): The content of the document.
+            document_type_guid (str): The GUID of the document type.
+            year (int): The year the document belongs to.
+            period (int): The period the document belongs to.
+
+        Returns:
+            bool: A boolean indicating whether the document was uploaded successfully.
+        """
+        response = self.client.service.EmployeeDocument_UploadDocumentFull(
+            EmployeeId=employee_id,
+            StrDocumentName=document_name,
+            Body=body,
+            GuidDocumentType=document_type_guid,
+            Year=year,
+            Period=period,
+            _soapheaders=self.auth_manager.header,
+        )
+        return response
+
+    @nmbrs_exception_handler(resource="EmployeeService:EmployeeDocument_UploadDocument")
+    def upload_from(
+        self, employee_id: int, source: str | os.PathLike | IO[bytes], document_type_guid: str, document_name: str | None = None
+    ) -> bool:
+        """
+        Uploads a file for employee, the file is encoded while it is sent instead of being read into memory.
+
+        For more information, refer to the official documentation:
+            [EmployeeDocument_UploadDocument](https://api.nmbrs.nl/soap/v3/EmployeeService.asmx?op=EmployeeDocument_UploadDocument)
+
+        Args:
+            employee_id (int): The ID of the employee.
+            source (str | os.PathLike | IO[bytes]): A file path or a seekable binary stream.
+            document_type_guid (str): The GUID of the document type.
+            document_name (str, optional): The name of the document. Defaults to the file name of the source.
+
+        Returns:
+            bool: A boolean indicating whether the document was uploaded successfully.
+        """
+        return post_document(
+            self.client,
+            "EmployeeDocument_UploadDocument",
+            "Body",
+            source,
+            EmployeeId=employee_id,
+            StrDocumentName=document_name or get_document_name(source),
+            GuidDocumentType=document_type_guid,
+            _soapheaders=self.auth_manager.header,
+        )
+
+    @nmbrs_exception_handler(resource="EmployeeService:EmployeeDocument_UploadDocumentFull")
+    def upload_full_from(
+        self,
+        employee_id: int,
+        source: str | os.PathLike | IO[bytes],
+        document_type_guid: str,
+        year: int,
+        period: int,
+        document_name: str | None = None,
+    ) -> bool:
+        """
+        Uploads a file for employee with all the fields, the file is encoded while it is sent instead of being read into memory.
+
+        For more information, refer to the official documentation:
+            [EmployeeDocument_UploadDocumentFull](https://api.nmbrs.nl/soap/v3/EmployeeService.asmx?op=EmployeeDocument_UploadDocumentFull)
+
+        Args:
+            employee_id (int): The ID of the employee.
+            source (str | os.PathLike | IO[bytes]): A file path or a seekable binary stream.
+            document_type_guid (str): The GUID of the document type.
+            year (int): The year the document belongs to.
+            period (int): The period the document belongs to.
+            document_name (str, optional): The name of the document. Defaults to the file name of the source.
+
+        Returns:
+            bool: A boolean indicating whether the document was uploaded successfully.
         """
-        raise NotImplementedError()  # pragma: no cover
+        return post_document(
+            self.client,
+            "EmployeeDocument_UploadDocumentFull",
+            "Body",
+            source,
+            EmployeeId=employee_id,
+            StrDocumentName=document_name or get_document_name(source),
+            GuidDocumentType=document_type_guid,
+            Year=year,
+            Period=period,
+            _soapheaders=self.auth_manager.header,
+        )
+
+    def upload_many(
+        self, uploads: Iterable[DocumentUpload], max_workers: int = 4, retries: int = 3, retry_delay: float = 1
+    ) -> list[DocumentUploadResult]:
+        """
+        Uploads many documents concurrently, each file is streamed with upload_from.
+
+        Uploads failing because of a connection error or timeout are retried with an exponentially growing delay. Other
+        errors (e.g. an invalid document type) are not retried. Errors are collected per upload and do not stop the
+        other uploads.
+
+        Args:
+            uploads (Iterable[DocumentUpload]): The documents to upload.
+            max_workers (int, optional): The maximum number of uploads at the same time. Defaults to 4.
+            retries (int, optional): The number of times a failed upload is retried. Defaults to 3.
+            retry_delay (float, optional): Time (in seconds) before the first retry, doubled for each retry. Defaults to 1.
+
+        Returns:
+            list[DocumentUploadResult]: The result of every upload, in the order of the uploads.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda upload: self._upload_with_retries(upload, retries, retry_delay), uploads))
+        failed = sum(1 for result in results if not result.success)
+        logger.info("Uploaded %s documents, %s failed.", len(results) - failed, failed)
+        return results
+
+    def _upload_with_retries(self, upload: DocumentUpload, retries: int, retry_delay: float) -> DocumentUploadResult:
+        """Upload a single document, retrying connection errors."""
+        delays = backoff_delays(retry_delay)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                success = self.upload_from(upload.employee_id, upload.source, upload.document_type_guid, upload.document_name)
+                return DocumentUploadResult(upload, success, attempt)
+            except RETRY_EXCEPTIONS as e:
+                if attempt > retries:
+                    logger.error("Uploading %s failed after %s attempts: %s", upload.source, attempt, e)
+                    return DocumentUploadResult(upload, False, attempt, error=e)
+                logger.warning("Uploading %s failed, retrying: %s", upload.source, e)
+                sleep(next(delays))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Uploading %s failed: %s", upload.source, e)
+                return DocumentUploadResult(upload, False, attempt, error=e)
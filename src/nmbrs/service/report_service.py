@@ -1,68 +1,328 @@
+# pylint: disable=line-too-long
 """
 Service class for managing reports in Nmbrs.
 """
 
 import logging
-from time import sleep
+import tempfile
+from collections import deque
+from time import monotonic, sleep
+from typing import IO, Callable, Hashable, Iterator
 
 import xmltodict
-from zeep import Client
+from zeep import Client, Transport
 
 from ..auth.token_manager import AuthManager
+from ..data_classes.report import BackgroundTaskResult
+from ..data_classes.utils.xml import iter_xml_records
 from ..exceptions.nmbrs_exceptions.background_task import (
     BackgroundTaskException,
     UnknownBackgroundTaskException,
     UnknownCall,
 )
 from .service import Service
+from ..utils.backoff import backoff_delays
+from ..utils.document_stream import write_text_elements
 from ..utils.nmbrs_exception_handler import nmbrs_exception_handler
+from ..utils.soap_request import stream_operation
+from ..bindings.proxy import bind_client
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+class _ReportTimeout(Exception):
+    """Raised when a cached report did not complete within the wait limit, so that it is not cached."""
+
+
 class ReportService(Service):
     """Service class for managing reports in Nmbrs."""
 
-    def __init__(self, auth_manager: AuthManager, sandbox: bool = True):
-        super().__init__(auth_manager, sandbox)
+    def __init__(
+        self,
+        auth_manager: AuthManager,
+        sandbox: bool = True,
+        cache_ttl: float = 300,
+        base_uri: str | None = None,
+        transport: Transport | None = None,
+    ):
+        super().__init__(auth_manager, sandbox, base_uri, transport)
 
         # Initialize nmbrs services
-        self.client = Client(f"{self.base_uri}{self.report_uri}")
+        self.client = bind_client(Client(f"{self.base_uri}{self.report_uri}", transport=self.transport))
+        self.report_cache = TTLCache(cache_ttl)
         logger.info("ReportService initialized.")
 
     @nmbrs_exception_handler(resource="ReportService:Reports_BackgroundTask_Result")
-    def background_task_result(self, task_id: str, wait_limit: int = 60) -> dict | None:
+    def background_task_result(
+        self,
+        task_id: str,
+        wait_limit: float = 60,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 10,
+        backoff_factor: float = 2,
+        progress_callback: Callable[[str, str, int, float], None] | None = None,
+    ) -> dict | None:
         """
         Retrieve the report generated by a background task.
 
+        The status of the task is checked immediately, after that the time between checks starts at poll_interval and
+        grows by backoff_factor up to max_poll_interval. A final check is done when the wait limit is reached.
+
         For more information, refer to the official documentation:
             [Reports_BackgroundTask_Result](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_BackgroundTask_Result)
 
         Args:
             task_id (str): The ID of the background task.
-            wait_limit (int, optional): Time limit (in seconds) to wait for the task result. Defaults to 60 (1 minute).
+            wait_limit (float, optional): Time limit (in seconds) to wait for the task result. Defaults to 60 (1 minute).
+            poll_interval (float, optional): Time (in seconds) between the first and second check. Defaults to 0.5.
+            max_poll_interval (float, optional): Maximum time (in seconds) between two checks. Defaults to 10.
+            backoff_factor (float, optional): Factor the time between checks grows with after each check. Defaults to 2.
+            progress_callback (Callable, optional): Called after every check with the task ID, the status, the number of
+                checks done and the elapsed time in seconds.
 
         Returns:
             dict | None: The result of the background task, or None if the task did not complete within the specified time limit.
         """
-        with self.client.settings(xml_huge_tree=True):
-            for _ in range(wait_limit):
-                result = self.client.service.Reports_BackgroundTask_Result(
-                    TaskId=task_id,
-                    _soapheaders=self.auth_manager.header,
-                )
-                if result["Status"] in ("Executing", "Enqueued"):
-                    sleep(1)
-                elif result["Status"] == "Unknown":
-                    logger.error("Unknown status received for background task.")
-                    raise UnknownBackgroundTaskException()
-                elif result["Status"] == "Error":
-                    logger.error("Background task encountered an error.")
-                    raise BackgroundTaskException()
-                elif result["Status"] == "Success":
-                    logger.info("Background task completed successfully.")
-                    return xmltodict.parse(result["Content"])
+        content = self._wait_for_background_task(task_id, wait_limit, poll_interval, max_poll_interval, backoff_factor, progress_callback)
+        if content is None:
+            return None
+        return xmltodict.parse(content)
+
+    @nmbrs_exception_handler(resource="ReportService:Reports_BackgroundTask_Result")
+    def background_task_records(
+        self,
+        task_id: str,
+        record_tag: str,
+        spool: bool = False,
+        wait_limit: float = 60,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 10,
+        backoff_factor: float = 2,
+        progress_callback: Callable[[str, str, int, float], None] | None = None,
+    ) -> Iterator[dict] | None:
+        """
+        Retrieve the report generated by a background task, yielding its rows one at a time.
+
+        Unlike background_task_result the report is parsed incrementally, only a single row is kept in memory instead
+        of the complete report as a dictionary. Without spool the report is still received as a single string. When
+        spool is True the responses of the task are streamed and the report is written to a temporary file as it
+        arrives, so neither the response nor the report is held in memory as a whole.
+
+        For more information, refer to the official documentation:
+            [Reports_BackgroundTask_Result](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_BackgroundTask_Result)
+
+        Args:
+            task_id (str): The ID of the background task.
+            record_tag (str): The name of the element containing a single row of the report, e.g. "Employee".
+            spool (bool, optional): Stream the report to a temporary file before parsing it. Defaults to False.
+            wait_limit (float, optional): Time limit (in seconds) to wait for the task result. Defaults to 60 (1 minute).
+            poll_interval (float, optional): Time (in seconds) between the first and second check. Defaults to 0.5.
+            max_poll_interval (float, optional): Maximum time (in seconds) between two checks. Defaults to 10.
+            backoff_factor (float, optional): Factor the time between checks grows with after each check. Defaults to 2.
+            progress_callback (Callable, optional): Called after every check with the task ID, the status, the number of
+                checks done and the elapsed time in seconds.
+
+        Returns:
+            Iterator[dict] | None: The rows of the report, or None if the task did not complete within the specified time limit.
+        """
+        if not spool:
+            content = self._wait_for_background_task(
+                task_id, wait_limit, poll_interval, max_poll_interval, backoff_factor, progress_callback
+            )
+            return iter_xml_records(content, record_tag) if content is not None else None
+
+        file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        try:
+            content = self._wait_for_background_task(
+                task_id, wait_limit, poll_interval, max_poll_interval, backoff_factor, progress_callback, spool=file
+            )
+        except BaseException:
+            file.close()
+            raise
+        if content is None:
+            file.close()
             return None
+        file.seek(0)
+        logger.debug("Report of background task %s spooled to a temporary file.", task_id)
+        return self._iter_spooled_records(file, record_tag)
+
+    @staticmethod
+    def _iter_spooled_records(file: IO, record_tag: str) -> Iterator[dict]:
+        """Yield the records of a spooled report, the file is closed once all records are read."""
+        with file:
+            yield from iter_xml_records(file, record_tag)
+
+    def _wait_for_background_task(
+        self,
+        task_id: str,
+        wait_limit: float,
+        poll_interval: float,
+        max_poll_interval: float,
+        backoff_factor: float,
+        progress_callback: Callable[[str, str, int, float], None] | None,
+        spool: IO[str] | None = None,
+    ) -> str | IO[str] | None:
+        """
+        Wait for a background task to complete, see background_task_result for a description of the arguments.
+
+        With a spool file the responses are streamed and the report is written to the file, see _background_task_status.
+
+        Returns:
+            str | IO[str] | None: The raw content of the report, the spool file when given, or None if the task did not
+                complete within the specified time limit.
+        """
+        start_time = monotonic()
+        deadline = start_time + wait_limit
+        delays = backoff_delays(poll_interval, backoff_factor, max_poll_interval)
+        attempt = 0
+        while True:
+            result = self._background_task_status(task_id, spool)
+            attempt += 1
+            if progress_callback is not None:
+                progress_callback(task_id, result["Status"], attempt, monotonic() - start_time)
+
+            if self._is_completed(result):
+                return result["Content"]
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                logger.warning("Background task %s did not complete within %s seconds.", task_id, wait_limit)
+                return None
+            sleep(min(next(delays, max_poll_interval), remaining))
+
+    def _background_task_status(self, task_id: str, spool: IO[str] | None = None) -> dict:
+        """
+        Call Reports_BackgroundTask_Result once.
+
+        With a spool file the response is streamed, the file is emptied and the content of the report is written to it
+        while the response arrives. The file is returned as the content of the report.
+        """
+        if spool is None:
+            with self.client.settings(xml_huge_tree=True):
+                return self.client.service.Reports_BackgroundTask_Result(TaskId=task_id, _soapheaders=self.auth_manager.header)
+        spool.seek(0)
+        spool.truncate()
+        kwargs = {"TaskId": task_id, "_soapheaders": self.auth_manager.header}
+        with stream_operation(self.client, "Reports_BackgroundTask_Result", kwargs) as body:
+            texts = write_text_elements(body, {"Status": None, "Content": spool})
+        return {"Status": texts["Status"], "Content": spool}
+
+    @staticmethod
+    def _is_completed(result: dict) -> bool:
+        """
+        Check the status returned by Reports_BackgroundTask_Result.
+
+        Args:
+            result (dict): The response of Reports_BackgroundTask_Result.
+
+        Returns:
+            bool: True when the report is ready, False when the task is still running.
+        """
+        if result["Status"] == "Unknown":
+            logger.error("Unknown status received for background task.")
+            raise UnknownBackgroundTaskException()
+        if result["Status"] == "Error":
+            logger.error("Background task encountered an error.")
+            raise BackgroundTaskException()
+        if result["Status"] == "Success":
+            logger.info("Background task completed successfully.")
+            return True
+        return False
+
+    @nmbrs_exception_handler(resource="ReportService:Reports_BackgroundTask_Result")
+    def background_task_status(self, task_id: str) -> dict:
+        """
+        Check the status of a background task once, without waiting for it to complete.
+
+        For more information, refer to the official documentation:
+            [Reports_BackgroundTask_Result](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_BackgroundTask_Result)
+
+        Args:
+            task_id (str): The ID of the background task.
+
+        Returns:
+            dict: The response containing the "Status" and, once the task is completed, the "Content" of the report.
+        """
+        return self._background_task_status(task_id)
+
+    def run_background_tasks(  # pylint: disable=too-many-locals
+        self,
+        tasks: dict[Hashable, tuple[str, dict]],
+        max_concurrency: int = 5,
+        wait_limit: float = 600,
+        poll_interval: float = 1,
+        max_poll_interval: float = 10,
+        backoff_factor: float = 2,
+    ) -> Iterator[BackgroundTaskResult]:
+        """
+        Generate multiple background reports at the same time, yielding every report as soon as it is completed.
+
+        At most max_concurrency tasks are running at Nmbrs at the same time, a new task is submitted as soon as another
+        one completes. The status of all running tasks is checked in a single loop, the time between two rounds of
+        checks grows from poll_interval to max_poll_interval and is reset whenever a new task is submitted.
+
+        Errors do not stop the other tasks, they are reported on the result of the task that failed. A task that did not
+        complete within wait_limit seconds after it was submitted, is reported with the status "Timeout".
+
+        Args:
+            tasks (dict[Hashable, tuple[str, dict]]): The tasks to run, a key of your choice (e.g. the company ID) mapped
+                to the name of the report and its arguments, as used by get_task_id.
+            max_concurrency (int, optional): Maximum number of tasks running at the same time. Defaults to 5.
+            wait_limit (float, optional): Time limit (in seconds) to wait for each task. Defaults to 600 (10 minutes).
+            poll_interval (float, optional): Initial time (in seconds) between two rounds of checks. Defaults to 1.
+            max_poll_interval (float, optional): Maximum time (in seconds) between two rounds of checks. Defaults to 10.
+            backoff_factor (float, optional): Factor the time between rounds grows with. Defaults to 2.
+
+        Returns:
+            Iterator[BackgroundTaskResult]: The result of every task, in the order they complete.
+        """
+        pending = deque(tasks.items())
+        running = {}
+        delays = backoff_delays(poll_interval, backoff_factor, max_poll_interval)
+        while pending or running:
+            while pending and len(running) < max_concurrency:
+                key, (task_name, task_args) = pending.popleft()
+                try:
+                    task_id = self.get_task_id(task_name, task_args)
+                except Exception as e:
+                    yield BackgroundTaskResult(key, task_name, None, "Error", error=e)
+                    continue
+                running[key] = (task_name, task_id, monotonic())
+                delays = backoff_delays(poll_interval, backoff_factor, max_poll_interval)
+
+            for key, (task_name, task_id, submitted_at) in list(running.items()):
+                result = self._check_background_task(key, task_name, task_id, monotonic() - submitted_at >= wait_limit)
+                if result is not None:
+                    del running[key]
+                    yield result
+
+            if running and not (pending and len(running) < max_concurrency):
+                sleep(next(delays, max_poll_interval))
+
+    def _check_background_task(self, key: Hashable, task_name: str, task_id: str, expired: bool) -> BackgroundTaskResult | None:
+        """
+        Check the status of a task started by run_background_tasks.
+
+        Args:
+            key (Hashable): The key of the task.
+            task_name (str): The name of the report.
+            task_id (str): The ID of the background task.
+            expired (bool): Whether the wait limit of the task has been reached.
+
+        Returns:
+            BackgroundTaskResult | None: The result of the task, or None when it is still running.
+        """
+        try:
+            response = self.background_task_status(task_id)
+            if self._is_completed(response):
+                return BackgroundTaskResult(key, task_name, task_id, "Success", result=xmltodict.parse(response["Content"]))
+        except Exception as e:
+            return BackgroundTaskResult(key, task_name, task_id, "Error", error=e)
+        if expired:
+            logger.warning("Background task %s did not complete within the wait limit.", task_id)
+            return BackgroundTaskResult(key, task_name, task_id, "Timeout")
+        return None
 
     @nmbrs_exception_handler(resource="ReportService")
     def get_task_id(self, task_name: str, task_args: dict) -> str:
@@ -85,3 +345,147 @@ class ReportService(Service):
         except AttributeError as e:
             logger.error("Unknown call made to the ReportService %s", task_name)
             raise UnknownCall(task_name) from e
+
+    def request_report(self, task_name: str, task_args: dict, wait_limit: float = 600, use_cache: bool = True) -> dict | None:
+        """
+        Start a background report and wait for its result.
+
+        Results are cached by operation and arguments for cache_ttl seconds (see the constructor), identical reports
+        requested within that window, also from other threads, are generated only once. Reports that did not complete
+        within the wait limit are not cached, nor are reports with arguments that cannot be used as a key.
+
+        Args:
+            task_name (str): The name of the background task, e.g. "Reports_GetWageCodesByYear_Background".
+            task_args (dict): The arguments required for the background task.
+            wait_limit (float, optional): Time limit (in seconds) to wait for the report. Defaults to 600 (10 minutes).
+            use_cache (bool, optional): Use a cached result if available. Defaults to True.
+
+        Returns:
+            dict | None: The report as a dictionary, or None if it did not complete within the specified time limit.
+        """
+
+        def generate() -> dict | None:
+            task_id = self.get_task_id(task_name, task_args)
+            return self.background_task_result(task_id, wait_limit=wait_limit)
+
+        def generate_finished() -> dict:
+            # Raising keeps the unfinished report out of the cache, threads waiting for it generate it again
+            result = generate()
+            if result is None:
+                raise _ReportTimeout(task_name)
+            return result
+
+        if not use_cache:
+            return generate()
+        try:
+            key = (task_name, _cache_key(task_args))
+        except TypeError:
+            logger.debug("Report %s is not cached, its arguments cannot be used as a key.", task_name)
+            return generate()
+        try:
+            return self.report_cache.get_or_compute(key, generate_finished)
+        except _ReportTimeout:
+            return None
+
+    def wage_codes_by_year(self, company_id: int, year: int, wait_limit: float = 600, use_cache: bool = True) -> dict | None:
+        """
+        Generate the report with the wage codes of a company for a whole year.
+
+        For more information, refer to the official documentation:
+            [Reports_GetWageCodesByYear_Background](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_GetWageCodesByYear_Background)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the report.
+            wait_limit (float, optional): Time limit (in seconds) to wait for the report. Defaults to 600 (10 minutes).
+            use_cache (bool, optional): Use a cached result if available. Defaults to True.
+
+        Returns:
+            dict | None: The report as a dictionary, or None if it did not complete within the specified time limit.
+        """
+        return self.request_report(
+            "Reports_GetWageCodesByYear_Background",
+            {"CompanyId": company_id, "Year": year},
+            wait_limit=wait_limit,
+            use_cache=use_cache,
+        )
+
+    def wage_codes_by_run(self, company_id: int, run_id: int, year: int, wait_limit: float = 600, use_cache: bool = True) -> dict | None:
+        """
+        Generate the report with the wage codes of a company for a single payroll run.
+
+        For more information, refer to the official documentation:
+            [Reports_GetWageCodesByRunCompany_v2_Background](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_GetWageCodesByRunCompany_v2_Background)
+
+        Args:
+            company_id (int): The ID of the company.
+            run_id (int): The ID of the run.
+            year (int): The year of the run.
+            wait_limit (float, optional): Time limit (in seconds) to wait for the report. Defaults to 600 (10 minutes).
+            use_cache (bool, optional): Use a cached result if available. Defaults to True.
+
+        Returns:
+            dict | None: The report as a dictionary, or None if it did not complete within the specified time limit.
+        """
+        return self.request_report(
+            "Reports_GetWageCodesByRunCompany_v2_Background",
+            {"CompanyId": company_id, "RunId": run_id, "Year": year},
+            wait_limit=wait_limit,
+            use_cache=use_cache,
+        )
+
+    def journals_by_year(self, company_id: int, year: int, wait_limit: float = 600, use_cache: bool = True) -> dict | None:
+        """
+        Generate the journals report of a company for a whole year.
+
+        For more information, refer to the official documentation:
+            [Reports_Accountant_JournalsReportByYear_Background](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_Accountant_JournalsReportByYear_Background)
+
+        Args:
+            company_id (int): The ID of the company.
+            year (int): The year of the report.
+            wait_limit (float, optional): Time limit (in seconds) to wait for the report. Defaults to 600 (10 minutes).
+            use_cache (bool, optional): Use a cached result if available. Defaults to True.
+
+        Returns:
+            dict | None: The report as a dictionary, or None if it did not complete within the specified time limit.
+        """
+        return self.request_report(
+            "Reports_Accountant_JournalsReportByYear_Background",
+            {"CompanyId": company_id, "Year": year},
+            wait_limit=wait_limit,
+            use_cache=use_cache,
+        )
+
+    def company_contact_persons(self, wait_limit: float = 600, use_cache: bool = True) -> dict | None:
+        """
+        Generate the report with the contact persons of all companies of the accountant.
+
+        For more information, refer to the official documentation:
+            [Reports_Accountant_CompanyContactPerson_Background](https://api.nmbrs.nl/soap/v3/ReportService.asmx?op=Reports_Accountant_CompanyContactPerson_Background)
+
+        Args:
+            wait_limit (float, optional): Time limit (in seconds) to wait for the report. Defaults to 600 (10 minutes).
+            use_cache (bool, optional): Use a cached result if available. Defaults to True.
+
+        Returns:
+            dict | None: The report as a dictionary, or None if it did not complete within the specified time limit.
+        """
+        return self.request_report("Reports_Accountant_CompanyContactPerson_Background", {}, wait_limit=wait_limit, use_cache=use_cache)
+
+
+def _cache_key(value) -> Hashable:
+    """
+    Convert the arguments of a report to a key of the report cache, lists become tuples and dictionaries sorted tuples.
+
+    Raises:
+        TypeError: When a value is not hashable and cannot be converted.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _cache_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_cache_key(item) for item in value)
+    hash(value)
+    return value
@@ -1,6 +1,9 @@
 """Abstract base class for defining service interfaces."""
 
 from abc import ABC, abstractmethod
+
+from zeep import Transport
+
 from ..auth.token_manager import AuthManager
 
 
@@ -17,7 +20,8 @@ class Service(ABC):
         nmbrs_base_uri (str): Base URI for the Nmbrs SOAP API.
         nmbrs_sandbox_base_uri (str): Base URI for the Nmbrs sandbox environment.
         sso_url (str): URL suffix for Single Sign-On (SSO) service.
-        base_uri (str): Base URI determined by the environment (sandbox or production).
+        base_uri (str): Base URI determined by the environment (sandbox or production), unless given explicitly.
+        transport (Transport | None): The zeep transport of the clients, None uses the default transport of zeep.
         sso_uri (str): URI for the Single Sign-On (SSO) service WSDL.
         employee_uri (str): URI for the EmployeeService WSDL.
         company_uri (str): URI for the CompanyService WSDL.
@@ -26,9 +30,10 @@ class Service(ABC):
     """
 
     @abstractmethod
-    def __init__(self, auth_manager: AuthManager, sandbox: bool = True):
+    def __init__(self, auth_manager: AuthManager, sandbox: bool = True, base_uri: str | None = None, transport: Transport | None = None):
         self.auth_manager = auth_manager
         self.sandbox = sandbox
+        self.transport = transport
 
         self.nmbrs_base_uri = "https://api.nmbrs.nl/soap/v3/"
         self.nmbrs_sandbox_base_uri = "https://api-sandbox.nmbrs.nl/soap/v3/"
@@ -38,6 +43,8 @@ class Service(ABC):
         if self.sandbox:
             self.sso_url = ".nmbrs-sandbox.nl"
             self.base_uri = self.nmbrs_sandbox_base_uri
+        if base_uri is not None:
+            self.base_uri = base_uri
 
         self.sso_uri = "SingleSignOn.asmx?WSDL"
         self.employee_uri = "EmployeeService.asmx?WSDL"
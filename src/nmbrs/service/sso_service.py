@@ -4,10 +4,11 @@ Module for handling Single Sign-On (SSO) for Nmbrs services.
 
 import logging
 
-from zeep import Client
+from zeep import Client, Transport
 
 from .service import Service
 from ..utils.nmbrs_exception_handler import nmbrs_exception_handler
+from ..bindings.proxy import bind_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +18,11 @@ class SingleSingOnService(Service):
     A class responsible for managing Single Sign-On (SSO) for Nmbrs services.
     """
 
-    def __init__(self, sandbox: bool = True):
-        super().__init__(None, sandbox)
+    def __init__(self, sandbox: bool = True, base_uri: str | None = None, transport: Transport | None = None):
+        super().__init__(None, sandbox, base_uri, transport)
 
         # Initialize nmbrs services
-        self.sso_service = Client(f"{self.base_uri}{self.sso_uri}")
+        self.sso_service = bind_client(Client(f"{self.base_uri}{self.sso_uri}", transport=self.transport))
         logger.info("SingleSignOnService initialized.")
 
     def get_sso_url(self, token: str, nmbrs_env: str, target: str = "nmbrs") -> str:
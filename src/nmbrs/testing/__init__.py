@@ -0,0 +1,6 @@
+"""Testing imports"""
+
+from .cassette import Cassette, CassetteMiss, RecordingTransport, ReplayTransport
+from .dataset import Dataset
+from .fake_server import FakeFault, FakeNmbrsServer
+from .wsdl import ArrayOf, ComplexType, Operation
@@ -0,0 +1,232 @@
+"""
+This module records the SOAP traffic of the services to a cassette file, and replays it without the Nmbrs API.
+
+The transports are passed to Nmbrs (or a service) with the transport argument. Recording captures every WSDL load and
+SOAP request with the raw response and its latency, the credentials in the authentication headers are scrubbed before
+they are stored. Replaying answers the same requests from the cassette, optionally with the recorded latency, so
+parsing and concurrency changes can be compared on the same traffic.
+
+Classes:
+    Cassette: Recorded interactions, saved as a gzip compressed JSON Lines file.
+    CassetteMiss: Exception raised when a replayed request was not recorded.
+    RecordingTransport: A zeep transport recording the traffic to a cassette.
+    ReplayTransport: A zeep transport answering from a cassette.
+
+Functions:
+    scrub(message) -> str: Replace the values in the authentication headers of a SOAP request.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+
+import requests
+from zeep import Transport
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "nmbrs-cassette"
+FORMAT_VERSION = 1
+SCRUBBED = "***"
+
+_AUTH_HEADER = re.compile(r"<((?:[\w.-]+:)?AuthHeader(?:WithDomain)?)\b[^>]*>.*?</\1>", re.DOTALL)
+_FIELD = re.compile(r"(<((?:[\w.-]+:)?\w+)\b[^>/]*>)[^<]*(</\2>)")
+
+
+def scrub(message: str) -> str:
+    """
+    Replace the values in the authentication headers of a SOAP request, e.g. the username, token and domain.
+
+    Args:
+        message (str): The SOAP envelope.
+
+    Returns:
+        str: The SOAP envelope with every field of the AuthHeader and AuthHeaderWithDomain elements set to "***".
+    """
+    return _AUTH_HEADER.sub(lambda header: _FIELD.sub(rf"\1{SCRUBBED}\3", header[0]), message)
+
+
+def _decode(content: bytes | str) -> str:
+    """Decode a body to text, undecodable bytes are kept as surrogates so the body is restored exactly by _encode."""
+    return content if isinstance(content, str) else content.decode("utf-8", errors="surrogateescape")
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", errors="surrogateescape")
+
+
+class CassetteMiss(LookupError):
+    """Exception raised when a replayed request was not recorded in the cassette."""
+
+    def __init__(self, method: str, url: str, action: str):
+        self.method = method
+        self.url = url
+        self.action = action
+        super().__init__(f"No recorded response for {method} {url} {action}".rstrip())
+
+
+class Cassette:
+    """
+    Recorded interactions, in the order they were made.
+
+    An interaction is a dictionary with the method ("GET" for WSDL loads, "POST" for SOAP requests), the url, the SOAP
+    action, the scrubbed request, the status, content type and body of the response, and the elapsed seconds.
+    """
+
+    def __init__(self, interactions: list[dict] | None = None):
+        self.interactions = interactions if interactions is not None else []
+        self._lock = threading.Lock()
+
+    def record(self, interaction: dict) -> None:
+        """
+        Add an interaction, safe to call from multiple threads.
+
+        Args:
+            interaction (dict): The interaction.
+        """
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: str | os.PathLike) -> int:
+        """
+        Write the cassette to a gzip compressed JSON lines file, the file is replaced atomically.
+
+        Args:
+            path (str | os.PathLike): The path of the file, parent directories are created.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        path = os.fspath(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock:
+            interactions = list(self.interactions)
+        with gzip.open(f"{path}.part", "wt", encoding="utf-8", compresslevel=6) as file:
+            file.write(json.dumps({"format": FORMAT, "version": FORMAT_VERSION, "interactions": len(interactions)}) + "\n")
+            for interaction in interactions:
+                file.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+        os.replace(f"{path}.part", path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "Cassette":
+        """
+        Read a cassette written by save.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            Cassette: The cassette.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("format") != FORMAT or header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"{os.fspath(path)} is not a version {FORMAT_VERSION} {FORMAT} file")
+            return cls([json.loads(line) for line in file])
+
+
+class RecordingTransport(Transport):
+    """A zeep transport recording every WSDL load and SOAP request to a cassette, with the credentials scrubbed."""
+
+    def __init__(self, cassette: Cassette | None = None, **kwargs):
+        """
+        Constructor method for RecordingTransport class.
+
+        Args:
+            cassette (Cassette, optional): The cassette to record to. Defaults to a new cassette.
+            **kwargs: The arguments of zeep.Transport, e.g. timeout or session.
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def _load_remote_data(self, url):
+        start_time = time.perf_counter()
+        content = super()._load_remote_data(url)
+        self.cassette.record(
+            {
+                "method": "GET",
+                "url": url,
+                "action": "",
+                "request": "",
+                "status": 200,
+                "content_type": "text/xml",
+                "response": _decode(content),
+                "elapsed": time.perf_counter() - start_time,
+            }
+        )
+        return content
+
+    def post(self, address, message, headers):
+        start_time = time.perf_counter()
+        response = super().post(address, message, headers)
+        self.cassette.record(
+            {
+                "method": "POST",
+                "url": address,
+                "action": headers.get("SOAPAction", ""),
+                "request": scrub(_decode(message)),
+                "status": response.status_code,
+                "content_type": response.headers.get("Content-Type", "text/xml"),
+                "response": _decode(response.content),
+                "elapsed": time.perf_counter() - start_time,
+            }
+        )
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    A zeep transport answering WSDL loads and SOAP requests from a cassette, without network.
+
+    Requests are matched on the url, the SOAP action and the scrubbed envelope, so the credentials do not have to match
+    the recording. Identical requests are answered in the order they were recorded, after which the last recorded
+    response is repeated, e.g. for a background task that is polled more often than during the recording.
+    """
+
+    def __init__(self, cassette: Cassette | str | os.PathLike, latency: float = 0.0, **kwargs):
+        """
+        Constructor method for ReplayTransport class.
+
+        Args:
+            cassette (Cassette | str | os.PathLike): The cassette, or the path of a cassette file.
+            latency (float, optional): The factor applied to the recorded latency of the responses, 1 replays the
+                recorded latency, 0.5 half of it. Defaults to 0, answering without delay.
+            **kwargs: The arguments of zeep.Transport.
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        self.latency = latency
+        self._responses: dict[tuple, deque] = {}
+        self._lock = threading.Lock()
+        for interaction in self.cassette.interactions:
+            key = (interaction["method"], interaction["url"], interaction["action"], interaction["request"])
+            self._responses.setdefault(key, deque()).append(interaction)
+
+    def _replay(self, method: str, url: str, action: str, request: str) -> dict:
+        with self._lock:
+            responses = self._responses.get((method, url, action, request))
+            if not responses:
+                raise CassetteMiss(method, url, action)
+            interaction = responses.popleft() if len(responses) > 1 else responses[0]
+        if self.latency > 0:
+            time.sleep(interaction["elapsed"] * self.latency)
+        return interaction
+
+    def _load_remote_data(self, url):
+        return _encode(self._replay("GET", url, "", "")["response"])
+
+    def post(self, address, message, headers):
+        interaction = self._replay("POST", address, headers.get("SOAPAction", ""), scrub(_decode(message)))
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.headers["Content-Type"] = interaction["content_type"]
+        response.url = address
+        response.encoding = "utf-8"
+        response._content = _encode(interaction["response"])
+        return response
@@ -0,0 +1,421 @@
+"""
+This module provides a synthetic Nmbrs environment, used by the fake server and to measure the parsers at scale.
+
+Classes:
+    Dataset: An in-memory synthetic dataset, indexed by company and employee.
+
+Functions:
+    read_records(path, kind=None) -> Iterator[tuple[str, dict]]: Stream the records of a dataset file.
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "nmbrs-dataset"
+FORMAT_VERSION = 1
+KINDS = ("debtors", "companies", "employees", "runs", "wage_taxes")
+
+FIRST_NAMES = ("Anna", "Bram", "Daan", "Emma", "Fleur", "Julia", "Lars", "Lotte", "Noah", "Sanne", "Sem", "Tess")
+LAST_NAMES = ("Bakker", "de Boer", "Dekker", "de Jong", "Jansen", "Mulder", "Smit", "Visser", "de Vries", "van Dijk")
+STREETS = ("Kerkstraat", "Schoolstraat", "Molenweg", "Dorpsstraat", "Stationsweg", "Julianastraat", "Beatrixlaan")
+CITIES = ("Amsterdam", "Rotterdam", "Utrecht", "Eindhoven", "Groningen", "Tilburg", "Almere", "Breda", "Nijmegen")
+ABSENCE_CAUSES = ((1, "Ziekte"), (2, "Zwangerschap"), (3, "Ongeval"))
+
+SIZES = {
+    "1k": {"companies": 10, "employees": 1_000},
+    "10k": {"companies": 50, "employees": 10_000},
+    "100k": {"companies": 200, "employees": 100_000},
+}
+"""Presets for scale tests, e.g. Dataset.generate(**SIZES["100k"])."""
+
+COUNTS = {
+    "contracts": (1, 2),
+    "salaries": (1, 3),
+    "schedules": (1, 2),
+    "addresses": (1, 2),
+    "absences": (0, 2),
+    "wage_components": (1, 6),
+    "hour_components": (0, 3),
+}
+"""The default (minimum, maximum) number of records of each kind per employee, drawn uniformly."""
+
+
+def _company_sizes(rng: random.Random, companies: int, employees: int, distribution: str) -> list[int]:
+    """Divide the employees over the companies, evenly or with a few large and many small companies."""
+    if distribution == "uniform":
+        weights = [1.0] * companies
+    elif distribution == "zipf":
+        weights = [1 / rank for rank in range(1, companies + 1)]
+        rng.shuffle(weights)
+    else:
+        raise ValueError(f"Unknown distribution {distribution!r}, expected 'uniform' or 'zipf'")
+    total = sum(weights)
+    sizes = [int(employees * weight / total) for weight in weights]
+    for index in range(employees - sum(sizes)):
+        sizes[index % companies] += 1
+    return sizes
+
+
+def _date(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _contract(rng: random.Random, record_id: int, index: int, context: dict) -> dict:
+    start = context["start"] + timedelta(days=365 * index)
+    return {
+        "ContractID": record_id,
+        "CreationDate": _date(start),
+        "StartDate": _date(start),
+        "TrialPeriod": _date(start + timedelta(days=30)),
+        "EndDate": _date(start + timedelta(days=364)) if rng.random() < 0.3 else None,
+        "EmployementType": rng.randrange(1, 4),
+        "EmploymentSequenceTaxId": 1,
+        "Indefinite": rng.random() < 0.7,
+        "PhaseClassification": 0,
+        "WrittenContract": True,
+        "HoursPerWeek": f"{context['hours']:.2f}",
+    }
+
+
+def _salary(rng: random.Random, record_id: int, index: int, context: dict) -> dict:
+    start = _date(context["start"] + timedelta(days=365 * index))
+    return {
+        "ID": record_id,
+        "Value": f"{rng.randrange(250000, 750000) / 100:.2f}",
+        "Type": "Bruto_Fulltime",
+        "StartDate": start,
+        "CreationDate": start,
+    }
+
+
+def _schedule(_rng: random.Random, _record_id: int, index: int, context: dict) -> dict:
+    hours = context["hours"]
+    schedule = {"ScheduleCalcMethod": "Fixed", "StartDate": _date(context["start"] + timedelta(days=365 * index))}
+    for week in ("", "2"):
+        for weekday in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday"):
+            schedule[f"Hours{weekday}{week}"] = f"{hours / 5:.2f}"
+        schedule[f"HoursSaturday{week}"] = schedule[f"HoursSunday{week}"] = "0.00"
+    schedule["ParttimePercentage"] = f"{hours / 40 * 100:.2f}"
+    return schedule
+
+
+def _address(rng: random.Random, record_id: int, index: int, _context: dict) -> dict:
+    return {
+        "Id": record_id,
+        "Default": index == 0,
+        "Street": rng.choice(STREETS),
+        "HouseNumber": str(rng.randrange(1, 200)),
+        "PostalCode": f"{rng.randrange(1000, 9999)} {rng.choice('ABCDEFGHJK')}{rng.choice('LMNPRSTVWX')}",
+        "City": rng.choice(CITIES),
+        "CountryISOCode": "NL",
+        "Type": "HomeAddress" if index == 0 else "PostAddress",
+    }
+
+
+def _absence(rng: random.Random, record_id: int, _index: int, context: dict) -> dict:
+    start = datetime(context["year"], rng.randrange(1, 13), rng.randrange(1, 28), 9)
+    cause_id, cause = rng.choice(ABSENCE_CAUSES)
+    return {
+        "AbsenceId": record_id,
+        "Comment": cause,
+        "Percentage": rng.choice((50, 100)),
+        "Start": _date(start),
+        "RegistrationStartDate": _date(start),
+        "End": _date(start + timedelta(days=rng.randrange(1, 30))),
+        "Dossier": f"Dossier {context['employee_id']}",
+        "Dossiernr": record_id,
+        "AbsenceCause": {"CauseId": cause_id, "Cause": cause},
+    }
+
+
+def _wage_component(rng: random.Random, record_id: int, index: int, _context: dict) -> dict:
+    return {"Id": record_id, "Code": rng.randrange(100, 999), "Value": f"{rng.randrange(100, 50000) / 100:.2f}", "Fixed": index % 2 == 0}
+
+
+def _hour_component(rng: random.Random, record_id: int, index: int, _context: dict) -> dict:
+    return {"Id": record_id, "HourCode": rng.randrange(1, 50), "Hours": f"{rng.randrange(1, 80) / 2:.1f}", "Fixed": index % 2 == 0}
+
+
+RECORDS = {
+    "contracts": ("Contracts", _contract),
+    "salaries": ("Salaries", _salary),
+    "schedules": ("Schedules", _schedule),
+    "addresses": ("Addresses", _address),
+    "absences": ("Absences", _absence),
+    "wage_components": ("WageComponents", _wage_component),
+    "hour_components": ("HourComponents", _hour_component),
+}
+"""The field of the employee holding the records of a kind, and the function generating a single record."""
+
+
+def _employee(rng: random.Random, company_id: int, employee_id: int, number: int, year: int, counts: dict) -> dict:
+    """Generate an employee with the records of every kind nested, using the field names of the Nmbrs SOAP API."""
+    employee = {
+        "CompanyId": company_id,
+        "Id": employee_id,
+        "Number": number,
+        "DisplayName": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+    }
+    context = {
+        "employee_id": employee_id,
+        "start": datetime(year - rng.randrange(0, 10), rng.randrange(1, 13), 1),
+        "hours": rng.choice((16, 24, 32, 36, 38, 40)),
+        "year": year,
+    }
+    for kind, (field, generate) in RECORDS.items():
+        employee[field] = [generate(rng, employee_id * 10 + index, index, context) for index in range(rng.randint(*counts[kind]))]
+    return employee
+
+
+def _add_company(rng: random.Random, data: dict[str, list[dict]], company_id: int, debtor_id: int, year: int, periods: int) -> None:
+    """Generate a company with its monthly runs and wage tax declarations, and add them to the data."""
+    data["companies"].append(
+        {
+            "ID": company_id,
+            "DebtorId": debtor_id,
+            "Number": company_id,
+            "Name": f"Company {company_id}",
+            "Email": f"payroll@company{company_id}.example",
+            "LoonaangifteTijdvak": "Month",
+            "KvkNr": f"{rng.randrange(10**7, 10**8)}",
+        }
+    )
+    for period in range(1, periods + 1):
+        run_at = datetime(year, period, 25, 12)
+        data["runs"].append(
+            {
+                "CompanyId": company_id,
+                "ID": company_id * 1000 + period,
+                "Number": period,
+                "Year": year,
+                "PeriodStart": period,
+                "PeriodEnd": period,
+                "Description": f"Run {period} {year}",
+                "RunAt": _date(run_at),
+                "IsLocked": True,
+            }
+        )
+        data["wage_taxes"].append(
+            {
+                "CompanyId": company_id,
+                "LoonaangifteID": company_id * 1000 + period,
+                "SerialNumber": period,
+                "PaymentReference": str(uuid.UUID(int=rng.getrandbits(128))),
+                "TotalGeneral": rng.randrange(10000, 100000),
+                "Period": period,
+                "Year": year,
+                "Status": "Sent",
+                "SentAt": _date(run_at + timedelta(days=3)),
+                "TijdvakStart": _date(datetime(year, period, 1)),
+                "TijdvakEnd": _date(datetime(year + period // 12, period % 12 + 1, 1) - timedelta(days=1)),
+            }
+        )
+
+
+def read_records(path: str | os.PathLike, kind: str | None = None) -> Iterator[tuple[str, dict]]:
+    """
+    Stream the records of a dataset file, without loading the complete dataset.
+
+    Args:
+        path (str | os.PathLike): The path of a file written by Dataset.save.
+        kind (str, optional): Only yield records of this kind, e.g. "employees".
+
+    Returns:
+        Iterator[tuple[str, dict]]: The kind and the record, in the order they were written.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("format") != FORMAT or header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{os.fspath(path)} is not a version {FORMAT_VERSION} {FORMAT} file")
+        for line in file:
+            record_kind, record = json.loads(line)
+            if kind is None or record_kind == kind:
+                yield record_kind, record
+
+
+class Dataset:
+    """
+    An in-memory synthetic dataset, answering the queries of the fake server.
+
+    The data is a dictionary of lists of records, the records use the field names of the Nmbrs SOAP API so they can be
+    serialized as they are. Records belonging to a company have a CompanyId field, the records of an employee (contracts,
+    salaries, schedules, addresses, absences, wage and hour components) are nested in the employee.
+    """
+
+    def __init__(self, data: dict[str, list[dict]], config: dict | None = None):
+        """
+        Constructor method for Dataset class, the records are indexed by company and employee once.
+
+        Args:
+            data (dict[str, list[dict]]): The records, keyed by "debtors", "companies", "employees", "runs" and "wage_taxes".
+            config (dict, optional): The arguments the dataset was generated with, stored with the dataset.
+        """
+        self.data = data
+        self.config = config or {}
+        self._by_company = {name: self._group(data.get(name, [])) for name in ("employees", "runs", "wage_taxes")}
+        self._employees = {employee["Id"]: employee for employee in data.get("employees", [])}
+
+    @staticmethod
+    def _group(records: list[dict]) -> dict[int, list[dict]]:
+        groups = {}
+        for record in records:
+            groups.setdefault(record["CompanyId"], []).append(record)
+        return groups
+
+    @property
+    def debtors(self) -> list[dict]:
+        """All debtors."""
+        return self.data.get("debtors", [])
+
+    def companies(self, debtor_id: int | None = None) -> list[dict]:
+        """
+        Get the companies, optionally of a single debtor.
+
+        Args:
+            debtor_id (int, optional): The ID of the debtor.
+
+        Returns:
+            list[dict]: The companies.
+        """
+        companies = self.data.get("companies", [])
+        if debtor_id is None:
+            return companies
+        return [company for company in companies if company["DebtorId"] == debtor_id]
+
+    def employees(self, company_id: int) -> list[dict]:
+        """Get the employees of a company."""
+        return self._by_company["employees"].get(company_id, [])
+
+    def employee(self, employee_id: int) -> dict | None:
+        """Get an employee by ID, or None if it does not exist."""
+        return self._employees.get(employee_id)
+
+    def runs(self, company_id: int, year: int | None = None) -> list[dict]:
+        """Get the runs of a company, optionally of a single year."""
+        runs = self._by_company["runs"].get(company_id, [])
+        return runs if year is None else [run for run in runs if run["Year"] == year]
+
+    def wage_taxes(self, company_id: int, year: int | None = None) -> list[dict]:
+        """Get the wage tax declarations of a company, optionally of a single year."""
+        wage_taxes = self._by_company["wage_taxes"].get(company_id, [])
+        return wage_taxes if year is None else [wage_tax for wage_tax in wage_taxes if wage_tax["Year"] == year]
+
+    @classmethod
+    def generate(
+        cls,
+        companies: int = 2,
+        employees: int = 20,
+        year: int = 2024,
+        periods: int = 12,
+        seed: int = 0,
+        debtors: int = 1,
+        distribution: str = "uniform",
+        counts: dict[str, tuple[int, int]] | None = None,
+    ) -> "Dataset":
+        """
+        Generate a deterministic synthetic dataset, see SIZES for the presets used by scale tests.
+
+        Args:
+            companies (int, optional): The number of companies. Defaults to 2.
+            employees (int, optional): The total number of employees, divided over the companies. Defaults to 20.
+            year (int, optional): The year of the runs, wage tax declarations and absences. Defaults to 2024.
+            periods (int, optional): The number of monthly runs and declarations of every company. Defaults to 12.
+            seed (int, optional): The seed of the random generator, the same arguments generate the same dataset. Defaults to 0.
+            debtors (int, optional): The number of debtors, the companies are divided over the debtors. Defaults to 1.
+            distribution (str, optional): How employees are divided over companies, "uniform" or "zipf" (a few large
+                and many small companies). Defaults to "uniform".
+            counts (dict[str, tuple[int, int]], optional): The (minimum, maximum) number of records per employee, by
+                kind, overriding COUNTS, e.g. {"absences": (0, 10)}.
+
+        Returns:
+            Dataset: The generated dataset.
+        """
+        config = {
+            "companies": companies,
+            "employees": employees,
+            "year": year,
+            "periods": periods,
+            "seed": seed,
+            "debtors": debtors,
+            "distribution": distribution,
+            "counts": {**COUNTS, **(counts or {})},
+        }
+        rng = random.Random(seed)
+        data = {kind: [] for kind in KINDS}
+        data["debtors"] = [
+            {"Id": debtor_id, "Number": str(debtor_id), "Name": f"Debtor {debtor_id}"} for debtor_id in range(1, debtors + 1)
+        ]
+        for company_id, size in enumerate(_company_sizes(rng, companies, employees, distribution), start=1):
+            _add_company(rng, data, company_id, (company_id - 1) % debtors + 1, year, periods)
+            for number in range(1, size + 1):
+                data["employees"].append(_employee(rng, company_id, len(data["employees"]) + 1, number, year, config["counts"]))
+        logger.debug("Generated a dataset with %s companies and %s employees.", companies, len(data["employees"]))
+        return cls(data, config)
+
+    def save(self, path: str | os.PathLike) -> int:
+        """
+        Write the dataset to a gzip compressed JSON lines file, the file is replaced atomically.
+
+        The first line holds the format and the generation arguments, every following line a single [kind, record] pair,
+        so the file can be streamed with read_records.
+
+        Args:
+            path (str | os.PathLike): The path of the file, parent directories are created.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        path = os.fspath(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(f"{path}.part", "wt", encoding="utf-8", compresslevel=6) as file:
+            file.write(json.dumps({"format": FORMAT, "version": FORMAT_VERSION, "config": self.config}) + "\n")
+            for kind in KINDS:
+                for record in self.data.get(kind, []):
+                    file.write(json.dumps([kind, record], separators=(",", ":")) + "\n")
+        os.replace(f"{path}.part", path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "Dataset":
+        """
+        Read a dataset written by save.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Returns:
+            Dataset: The dataset.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            config = json.loads(file.readline()).get("config")
+        data = {kind: [] for kind in KINDS}
+        for kind, record in read_records(path):
+            data.setdefault(kind, []).append(record)
+        return cls(data, config)
+
+
+def main(argv: list[str] | None = None) -> None:  # pragma: no cover
+    """Generate a dataset file, e.g. python -m nmbrs.testing.dataset 100k dataset-100k.jsonl.gz."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Nmbrs dataset.")
+    parser.add_argument("size", choices=sorted(SIZES))
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--distribution", choices=("uniform", "zipf"), default="uniform")
+    args = parser.parse_args(argv)
+
+    dataset = Dataset.generate(**SIZES[args.size], seed=args.seed, distribution=args.distribution)
+    size = dataset.save(args.path)
+    print(f"Wrote {len(dataset.data['employees'])} employees to {args.path} ({size / 1024 / 1024:.1f} MiB).")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
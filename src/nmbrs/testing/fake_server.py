@@ -0,0 +1,352 @@
+"""
+This module provides a local stand-in for the Nmbrs SOAP API, to exercise the zeep and HTTP path without network.
+
+Classes:
+    FakeFault: Exception raised by operation handlers to answer with a Nmbrs SOAP fault.
+    FakeNmbrsServer: A threaded HTTP server serving the WSDLs and answering the operations from a synthetic dataset.
+"""
+
+import argparse
+import gzip
+import logging
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import urlsplit
+
+from .dataset import SIZES, Dataset
+from .operations import OPERATIONS
+from .wsdl import Operation, generate_wsdl, parse_request, render_fault, render_response
+
+logger = logging.getLogger(__name__)
+
+PATH_PREFIX = "/soap/v3/"
+
+# The content encodings of compressed requests and responses, "deflate" is the zlib format as in HTTP
+COMPRESSORS = {"gzip": gzip.compress, "deflate": zlib.compress}
+DECOMPRESSORS = {"gzip": gzip.decompress, "deflate": zlib.decompress}
+
+
+class FakeFault(Exception):
+    """Exception raised by operation handlers to answer with a Nmbrs SOAP fault, e.g. "---> 2004: Unauthorized company"."""
+
+    def __init__(self, code: int, message: str = "Fault injected by the fake server"):
+        self.code = code
+        self.message = message
+        super().__init__(f"---> {code}: {message}")
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests to calls of the fake server."""
+
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are sent separately, without TCP_NODELAY every response is delayed by a delayed ACK
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serve the WSDL of a service."""
+        status, body = self.server.fake.handle_get(urlsplit(self.path).path)
+        self._reply(status, body)
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer a SOAP request, decompressing a compressed request when the server accepts them."""
+        fake = self.server.fake
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        fake.transfer(len(body))
+        encoding = self.headers.get("Content-Encoding", "identity").strip().lower()
+        if encoding != "identity":
+            if not fake.accept_compressed_requests or encoding not in DECOMPRESSORS:
+                self._reply(415, b"")
+                return
+            body = DECOMPRESSORS[encoding](body)
+        status, body = fake.handle_post(urlsplit(self.path).path, body)
+        self._reply(status, body)
+
+    def _reply(self, status: int, body: bytes) -> None:
+        encoding = self.server.fake.response_encoding(self.headers.get("Accept-Encoding", "")) if body else None
+        if encoding is not None:
+            body = COMPRESSORS[encoding](body)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.server.fake.transfer(len(body))
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        logger.debug(format, *args)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeNmbrsServer"
+
+
+class FakeNmbrsServer:
+    """
+    A local stand-in for the Nmbrs SOAP API, answering from a synthetic dataset.
+
+    The WSDLs are generated from the registered operations and served at <base_uri><Service>.asmx?WSDL, so the services
+    of the package can be pointed at the server with the base_uri argument, e.g. Nmbrs(..., base_uri=server.base_uri).
+    Every request is delayed by the configured latency, and can be answered with a fault instead, either at random or
+    for specific operations. Compression of the requests and responses, and a limited bandwidth, can be simulated.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset | None = None,
+        latency: float | Callable[[str], float] = 0.0,
+        fault_rate: float = 0.0,
+        fault_code: int = 9999,
+        task_duration: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        compress_responses: bool = False,
+        accept_compressed_requests: bool = False,
+        bandwidth: float | None = None,
+    ):
+        """
+        Constructor method for FakeNmbrsServer class, the server is started by start or by using it as a context manager.
+
+        Args:
+            dataset (Dataset, optional): The data to answer from. Defaults to a small generated dataset.
+            latency (float | Callable[[str], float], optional): The delay of every response in seconds, or a function
+                returning the delay for a resource, e.g. "CompanyService:List_GetAll". Defaults to 0.
+            fault_rate (float, optional): The fraction of requests answered with a fault. Defaults to 0.
+            fault_code (int, optional): The Nmbrs error code of random faults. Defaults to 9999.
+            task_duration (float, optional): The seconds a background report task is running before it succeeds. Defaults to 0.
+            seed (int, optional): The seed of the random generator deciding which requests fail.
+            host (str, optional): The address to listen on. Defaults to "127.0.0.1".
+            port (int, optional): The port to listen on, 0 picks a free port. Defaults to 0.
+            compress_responses (bool, optional): Compress the responses with gzip or deflate when the request accepts
+                it with the Accept-Encoding header. Defaults to False.
+            accept_compressed_requests (bool, optional): Accept requests compressed with gzip or deflate, else they
+                are answered with 415 Unsupported Media Type. Defaults to False.
+            bandwidth (float, optional): The bytes per second of the simulated network, the bodies of the requests
+                and responses are delayed by their size divided by the bandwidth. Defaults to no delay.
+        """
+        self.dataset = dataset if dataset is not None else Dataset.generate()
+        self.latency = latency
+        self.fault_rate = fault_rate
+        self.fault_code = fault_code
+        self.task_duration = task_duration
+        self.compress_responses = compress_responses
+        self.accept_compressed_requests = accept_compressed_requests
+        self.bandwidth = bandwidth
+        self.domain = {"Domain": "fake.nmbrs.nl", "SubDomain": "fake"}
+        self.tasks: dict[str, tuple[float, str]] = {}
+        self.calls: Counter = Counter()  # by resource, e.g. "CompanyService:List_GetAll"
+        self._random = random.Random(seed)
+        self._faults: dict[str, list] = {}
+        self._operations: dict[str, dict[str, Operation]] = {}
+        self._wsdl: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), _RequestHandler, bind_and_activate=False)
+        self._httpd.fake = self
+        self._thread = None
+        for operation in OPERATIONS:
+            self.register(operation)
+
+    @property
+    def base_uri(self) -> str:
+        """The base URI of the services, to pass as base_uri to Nmbrs or a service, the port is known once started."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{PATH_PREFIX}"
+
+    def register(self, operation: Operation) -> None:
+        """
+        Register an operation, replacing a registered operation with the same service and name.
+
+        Args:
+            operation (Operation): The operation.
+        """
+        self._operations.setdefault(operation.service, {})[operation.name] = operation
+        self._wsdl.pop(operation.service, None)
+
+    def inject_fault(
+        self, operation: str, code: int = 9999, message: str = "Fault injected by the fake server", times: int | None = 1
+    ) -> None:
+        """
+        Answer the next calls of an operation with a fault.
+
+        Args:
+            operation (str): The name of the operation in any service, e.g. "List_GetAll", or the resource of the operation
+                in a single service, e.g. "CompanyService:List_GetAll".
+            code (int, optional): The Nmbrs error code. Defaults to 9999.
+            message (str, optional): The error message.
+            times (int | None, optional): The number of calls to fail, None fails every call. Defaults to 1.
+        """
+        with self._lock:
+            self._faults[operation] = [code, message, times]
+
+    def _next_fault(self, operation: Operation) -> FakeFault | None:
+        resource = f"{operation.service}:{operation.name}"
+        with self._lock:
+            self.calls[resource] += 1
+            key = resource if resource in self._faults else operation.name
+            fault = self._faults.get(key)
+            if fault is not None:
+                code, message, times = fault
+                if times is not None:
+                    fault[2] -= 1
+                    if fault[2] <= 0:
+                        del self._faults[key]
+                return FakeFault(code, message)
+            if self.fault_rate and self._random.random() < self.fault_rate:
+                return FakeFault(self.fault_code)
+        return None
+
+    def response_encoding(self, accept_encoding: str) -> str | None:
+        """
+        Choose the content encoding of a response.
+
+        Args:
+            accept_encoding (str): The Accept-Encoding header of the request, e.g. "gzip, deflate".
+
+        Returns:
+            str | None: "gzip" or "deflate", None for an uncompressed response.
+        """
+        if not self.compress_responses:
+            return None
+        accepted = set()
+        for coding in accept_encoding.lower().split(","):
+            name, _, weight = coding.partition(";q=")
+            if not weight or weight.strip() not in ("0", "0.0", "0.00", "0.000"):
+                accepted.add(name.strip())
+        return next((encoding for encoding in COMPRESSORS if encoding in accepted), None)
+
+    def transfer(self, size: int) -> None:
+        """
+        Delay the transfer of a body by its size divided by the bandwidth, when a bandwidth is configured.
+
+        Args:
+            size (int): The size of the body in bytes.
+        """
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    def _service(self, path: str) -> str | None:
+        if not path.startswith(PATH_PREFIX) or not path.endswith(".asmx"):
+            return None
+        service = path[len(PATH_PREFIX) : -len(".asmx")]
+        return service if service in self._operations else None
+
+    def handle_get(self, path: str) -> tuple[int, bytes]:
+        """
+        Answer a GET request, serving the WSDL of a service.
+
+        Args:
+            path (str): The path of the request, e.g. "/soap/v3/CompanyService.asmx".
+
+        Returns:
+            tuple[int, bytes]: The HTTP status and the body.
+        """
+        service = self._service(path)
+        if service is None:
+            return 404, b""
+        if service not in self._wsdl:
+            address = f"{self.base_uri}{service}.asmx"
+            self._wsdl[service] = generate_wsdl(service, self._operations[service].values(), address).encode("utf-8")
+        return 200, self._wsdl[service]
+
+    def handle_post(self, path: str, body: bytes) -> tuple[int, bytes]:
+        """
+        Answer a SOAP request, after the configured latency.
+
+        Args:
+            path (str): The path of the request, e.g. "/soap/v3/CompanyService.asmx".
+            body (bytes): The SOAP envelope.
+
+        Returns:
+            tuple[int, bytes]: The HTTP status and the body.
+        """
+        service = self._service(path)
+        if service is None:
+            return 404, b""
+        try:
+            operation, arguments = parse_request(body, self._operations[service])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Invalid request for %s: %s", service, e)
+            return 500, render_fault(f"---> 9999: Invalid request: {e}")
+
+        latency = self.latency(f"{operation.service}:{operation.name}") if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+        try:
+            fault = self._next_fault(operation)
+            if fault is not None:
+                raise fault
+            result = operation.handler(self, **arguments)
+        except FakeFault as e:
+            return 500, render_fault(str(e))
+        return 200, render_response(operation, result)
+
+    def start(self) -> "FakeNmbrsServer":
+        """Start serving requests on a background thread."""
+        self._httpd.server_bind()
+        self._httpd.server_activate()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="FakeNmbrsServer", daemon=True)
+        self._thread.start()
+        logger.info("Fake Nmbrs server listening at %s", self.base_uri)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeNmbrsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> None:  # pragma: no cover
+    """Run the fake server in the foreground, e.g. python -m nmbrs.testing.fake_server --port 8080."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Nmbrs SOAP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--dataset", help="a dataset file written by Dataset.save, e.g. with python -m nmbrs.testing.dataset")
+    parser.add_argument("--size", choices=sorted(SIZES), help="generate a dataset of a preset size")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--compress", action="store_true", help="compress responses and accept compressed requests")
+    parser.add_argument("--bandwidth", type=float, help="bytes per second")
+    args = parser.parse_args(argv)
+
+    if args.dataset:
+        dataset = Dataset.load(args.dataset)
+    else:
+        dataset = Dataset.generate(**SIZES[args.size]) if args.size else Dataset.generate()
+    server = FakeNmbrsServer(
+        dataset,
+        latency=args.latency,
+        fault_rate=args.fault_rate,
+        host=args.host,
+        port=args.port,
+        compress_responses=args.compress,
+        accept_compressed_requests=args.compress,
+        bandwidth=args.bandwidth,
+    )
+    server.start()
+    print(f"Serving the Nmbrs SOAP API at {server.base_uri}, press Ctrl+C to stop.")
+    try:
+        server._thread.join()  # pylint: disable=protected-access
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
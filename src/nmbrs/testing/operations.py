@@ -0,0 +1,361 @@
+"""
+This module defines the operations answered by the fake server, from the synthetic dataset.
+
+The operations cover the listing and report calls used for load testing, more can be registered on the server with the
+same Operation class.
+"""
+
+import uuid
+from time import monotonic
+from xml.sax.saxutils import escape
+
+from .wsdl import ArrayOf, ComplexType, Operation
+
+DOMAIN = ComplexType("Domain", {"Domain": "string", "SubDomain": "string"})
+DEBTOR = ComplexType("Debtor", {"Id": "int", "Number": "string", "Name": "string"})
+COMPANY = ComplexType(
+    "Company",
+    {
+        "ID": "int",
+        "Number": "int",
+        "Name": "string",
+        "PhoneNumber": "string",
+        "FaxNumber": "string",
+        "Email": "string",
+        "Website": "string",
+        "LoonaangifteTijdvak": "string",
+        "KvkNr": "string",
+    },
+)
+RUN_INFO = ComplexType(
+    "RunInfo",
+    {
+        "ID": "int",
+        "Number": "int",
+        "Year": "int",
+        "PeriodStart": "int",
+        "PeriodEnd": "int",
+        "Description": "string",
+        "RunAt": "dateTime",
+        "IsLocked": "boolean",
+    },
+)
+RUN_EMPLOYEE = ComplexType("RunEmployee", {"EmployeeId": "int", "EmployeeNumber": "int"})
+WAGE_TAX = ComplexType(
+    "WageTax",
+    {
+        "LoonaangifteID": "int",
+        "SerialNumber": "int",
+        "PaymentReference": "string",
+        "TotalGeneral": "int",
+        "Period": "int",
+        "Year": "int",
+        "Status": "string",
+        "SentAt": "dateTime",
+        "TijdvakStart": "dateTime",
+        "TijdvakEnd": "dateTime",
+    },
+)
+DAYS_WORKED = ComplexType("DaysWorked", {"EmployeeId": "int", "Days": "int", "Period": "int", "Year": "int"})
+EMPLOYEE = ComplexType("Employee", {"Id": "int", "Number": "int", "DisplayName": "string"})
+SALARY = ComplexType("Salary_V2", {"ID": "int", "Value": "decimal", "Type": "string", "StartDate": "dateTime", "CreationDate": "dateTime"})
+EMPLOYEE_SALARIES = ComplexType("EmployeeSalaryItem", {"EmployeeId": "int", "EmployeeSalaries": ArrayOf(SALARY)})
+CONTRACT = ComplexType(
+    "EmployeeContract",
+    {
+        "ContractID": "int",
+        "CreationDate": "dateTime",
+        "StartDate": "dateTime",
+        "TrialPeriod": "dateTime",
+        "EndDate": "dateTime",
+        "EmployementType": "int",
+        "EmploymentSequenceTaxId": "int",
+        "Indefinite": "boolean",
+        "PhaseClassification": "int",
+        "WrittenContract": "boolean",
+        "HoursPerWeek": "decimal",
+    },
+)
+EMPLOYEE_CONTRACTS = ComplexType("EmployeeContractItem", {"EmployeeId": "int", "EmployeeContracts": ArrayOf(CONTRACT)})
+SCHEDULE = ComplexType(
+    "Schedule_V2",
+    {
+        "ScheduleCalcMethod": "string",
+        **{
+            f"Hours{day}{week}": "decimal"
+            for week in ("", "2")
+            for day in ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+        },
+        "ParttimePercentage": "decimal",
+        "StartDate": "dateTime",
+    },
+)
+EMPLOYEE_SCHEDULES = ComplexType("EmployeeScheduleItem", {"EmployeeId": "int", "EmployeeSchedules": ArrayOf(SCHEDULE)})
+ADDRESS = ComplexType(
+    "EmployeeAddress_V2",
+    {
+        "Id": "int",
+        "Default": "boolean",
+        "Street": "string",
+        "HouseNumber": "string",
+        "HouseNumberAddition": "string",
+        "PostalCode": "string",
+        "City": "string",
+        "StateProvince": "string",
+        "CountryISOCode": "string",
+        "Type": "string",
+    },
+)
+EMPLOYEE_ADDRESSES = ComplexType("EmployeeAddressItem", {"EmployeeId": "int", "EmployeeAddresses": ArrayOf(ADDRESS)})
+ABSENCE = ComplexType(
+    "EmployeeAbsence",
+    {
+        "EmployeeId": "int",
+        "AbsenceId": "int",
+        "Comment": "string",
+        "Percentage": "int",
+        "Start": "dateTime",
+        "RegistrationStartDate": "dateTime",
+        "End": "dateTime",
+        "RegistrationEndDate": "dateTime",
+        "Dossier": "string",
+        "Dossiernr": "int",
+        "AbsenceCause": ComplexType("AbsenceCause", {"CauseId": "int", "Cause": "string"}),
+    },
+)
+WAGE_COMPONENT = ComplexType("WageComponent", {"Id": "int", "Code": "int", "Value": "decimal"})
+HOUR_COMPONENT = ComplexType("HourCode", {"Id": "int", "HourCode": "int", "Hours": "decimal"})
+BACKGROUND_TASK_RESULT = ComplexType("BackgroundTaskResult", {"TaskId": "string", "Status": "string", "Content": "string"})
+
+
+def _wage_tax_xml(server, CompanyId: int, LoonaangifteID: int) -> str | None:
+    for wage_tax in server.dataset.wage_taxes(CompanyId):
+        if wage_tax["LoonaangifteID"] == LoonaangifteID:
+            fields = "".join(f"<{name}>{escape(str(wage_tax[name]))}</{name}>" for name in WAGE_TAX.fields)
+            return f"<Loonaangifte>{fields}</Loonaangifte>"
+    return None
+
+
+def _run_employees(server, CompanyId: int, Year: int, RunId: int) -> list[dict]:
+    if not any(run["ID"] == RunId for run in server.dataset.runs(CompanyId, Year)):
+        return []
+    return [{"EmployeeId": employee["Id"], "EmployeeNumber": employee["Number"]} for employee in server.dataset.employees(CompanyId)]
+
+
+def _all_employees(records: str, field: str):
+    """Answer a *_GetAll_AllEmployeesByCompany operation, with the records of every employee nested in a field."""
+
+    def handler(server, CompanyID: int) -> list[dict]:
+        return [{"EmployeeId": employee["Id"], field: employee[records]} for employee in server.dataset.employees(CompanyID)]
+
+    return handler
+
+
+def _absences(server, CompanyId: int) -> list[dict]:
+    return [
+        {"EmployeeId": employee["Id"], **absence} for employee in server.dataset.employees(CompanyId) for absence in employee["Absences"]
+    ]
+
+
+def _employee_absences(server, EmployeeId: int) -> list[dict]:
+    employee = server.dataset.employee(EmployeeId)
+    return [] if employee is None else [{"EmployeeId": EmployeeId, **absence} for absence in employee["Absences"]]
+
+
+def _current_schedule(server, EmployeeId: int) -> dict | None:
+    employee = server.dataset.employee(EmployeeId)
+    return employee["Schedules"][-1] if employee is not None and employee["Schedules"] else None
+
+
+def _components(records: str, fixed: bool):
+    """Answer an operation returning the fixed or variable wage or hour components of an employee."""
+
+    def handler(server, EmployeeId: int, **_) -> list[dict]:
+        employee = server.dataset.employee(EmployeeId)
+        return [] if employee is None else [component for component in employee[records] if component["Fixed"] == fixed]
+
+    return handler
+
+
+def _wage_codes_report(server, CompanyId: int, RunId: int | None = None, **_) -> str:
+    rows = []
+    for employee in server.dataset.employees(CompanyId):
+        for salary in employee["Salaries"]:
+            rows.append(
+                f"<WageCode><EmployeeId>{employee['Id']}</EmployeeId><RunId>{RunId or ''}</RunId>"
+                f"<Code>10</Code><Description>Salaris</Description><Value>{salary['Value']}</Value></WageCode>"
+            )
+    return f"<WageCodes>{''.join(rows)}</WageCodes>"
+
+
+def _journals_report(server, CompanyId: int, Year: int) -> str:
+    rows = []
+    for run in server.dataset.runs(CompanyId, Year):
+        for employee in server.dataset.employees(CompanyId):
+            for salary in employee["Salaries"]:
+                for account, debit, credit in (("4000", salary["Value"], "0.00"), ("1600", "0.00", salary["Value"])):
+                    rows.append(
+                        f"<JournalEntry><LedgerAccount>{account}</LedgerAccount><Description>{escape(run['Description'])}</Description>"
+                        f"<Debit>{debit}</Debit><Credit>{credit}</Credit><EmployeeId>{employee['Id']}</EmployeeId>"
+                        f"<Period>{run['PeriodStart']}</Period><Year>{Year}</Year></JournalEntry>"
+                    )
+    return f"<Journals>{''.join(rows)}</Journals>"
+
+
+def _contact_persons_report(server) -> str:
+    rows = [
+        f"<ContactPerson><CompanyId>{company['ID']}</CompanyId><Name>Contact {escape(company['Name'])}</Name></ContactPerson>"
+        for company in server.dataset.companies()
+    ]
+    return f"<ContactPersons>{''.join(rows)}</ContactPersons>"
+
+
+def _start_task(report):
+    def handler(server, **arguments) -> str:
+        task_id = str(uuid.uuid4())
+        server.tasks[task_id] = (monotonic(), report(server, **arguments))
+        return task_id
+
+    return handler
+
+
+def _task_result(server, TaskId: str) -> dict:
+    task = server.tasks.get(TaskId)
+    if task is None:
+        return {"TaskId": TaskId, "Status": "Unknown"}
+    started, content = task
+    if monotonic() - started < server.task_duration:
+        return {"TaskId": TaskId, "Status": "Running"}
+    return {"TaskId": TaskId, "Status": "Success", "Content": content}
+
+
+OPERATIONS = [
+    Operation("DebtorService", "Environment_Get", {}, DOMAIN, lambda server: server.domain),
+    Operation("DebtorService", "List_GetAll", {}, ArrayOf(DEBTOR), lambda server: server.dataset.debtors),
+    Operation("CompanyService", "List_GetAll", {}, ArrayOf(COMPANY), lambda server: server.dataset.companies()),
+    Operation(
+        "CompanyService",
+        "List_GetByDebtor",
+        {"DebtorId": "int"},
+        ArrayOf(COMPANY),
+        lambda server, DebtorId: server.dataset.companies(DebtorId),
+    ),
+    Operation(
+        "CompanyService",
+        "Run_GetList",
+        {"CompanyId": "int", "Year": "int"},
+        ArrayOf(RUN_INFO),
+        lambda server, CompanyId, Year: server.dataset.runs(CompanyId, Year),
+    ),
+    Operation(
+        "CompanyService",
+        "Run_GetEmployeesByRunCompany",
+        {"CompanyId": "int", "Year": "int", "RunId": "int"},
+        ArrayOf(RUN_EMPLOYEE),
+        _run_employees,
+    ),
+    Operation(
+        "CompanyService",
+        "WageTax_GetList",
+        {"CompanyId": "int", "intYear": "int"},
+        ArrayOf(WAGE_TAX),
+        lambda server, CompanyId, intYear: server.dataset.wage_taxes(CompanyId, intYear),
+    ),
+    Operation("CompanyService", "WageTax_GetXML", {"CompanyId": "int", "LoonaangifteID": "int"}, "string", _wage_tax_xml),
+    Operation(
+        "EmployeeService",
+        "List_GetByCompany",
+        {"CompanyId": "int", "EmployeeType": "int"},
+        ArrayOf(EMPLOYEE),
+        lambda server, CompanyId, EmployeeType=None: server.dataset.employees(CompanyId),
+    ),
+    Operation(
+        "EmployeeService",
+        "Salary_GetAll_AllEmployeesByCompany",
+        {"CompanyID": "int"},
+        ArrayOf(EMPLOYEE_SALARIES),
+        _all_employees("Salaries", "EmployeeSalaries"),
+    ),
+    Operation(
+        "EmployeeService",
+        "Contract_GetAll_AllEmployeesByCompany",
+        {"CompanyID": "int"},
+        ArrayOf(EMPLOYEE_CONTRACTS),
+        _all_employees("Contracts", "EmployeeContracts"),
+    ),
+    Operation(
+        "EmployeeService",
+        "Schedule_GetAll_AllEmployeesByCompany",
+        {"CompanyID": "int"},
+        ArrayOf(EMPLOYEE_SCHEDULES),
+        _all_employees("Schedules", "EmployeeSchedules"),
+    ),
+    Operation(
+        "EmployeeService",
+        "Address_GetAll_AllEmployeesByCompany",
+        {"CompanyID": "int"},
+        ArrayOf(EMPLOYEE_ADDRESSES),
+        _all_employees("Addresses", "EmployeeAddresses"),
+    ),
+    Operation("EmployeeService", "Absence_GetAll_AllEmployeesByCompany", {"CompanyId": "int"}, ArrayOf(ABSENCE), _absences),
+    Operation("EmployeeService", "Absence_GetList", {"EmployeeId": "int"}, ArrayOf(ABSENCE), _employee_absences),
+    Operation("EmployeeService", "Schedule_GetCurrent", {"EmployeeId": "int"}, SCHEDULE, _current_schedule),
+    Operation(
+        "EmployeeService",
+        "DaysFixed_Set_Batch",
+        {"EmployeesDaysWorked": ArrayOf(DAYS_WORKED), "UnprotectedMode": "boolean"},
+        None,
+        lambda server, **_: None,
+    ),
+    Operation(
+        "EmployeeService",
+        "WageComponentFixed_Get",
+        {"EmployeeId": "int", "Period": "int", "Year": "int"},
+        ArrayOf(WAGE_COMPONENT),
+        _components("WageComponents", fixed=True),
+    ),
+    Operation(
+        "EmployeeService",
+        "WageComponentVar_Get",
+        {"EmployeeId": "int", "Period": "int", "Year": "int"},
+        ArrayOf(WAGE_COMPONENT),
+        _components("WageComponents", fixed=False),
+    ),
+    Operation(
+        "EmployeeService",
+        "HourComponentFixed_Get",
+        {"EmployeeId": "int", "Year": "int", "Period": "int"},
+        ArrayOf(HOUR_COMPONENT),
+        _components("HourComponents", fixed=True),
+    ),
+    Operation(
+        "EmployeeService",
+        "HourComponentVar_Get",
+        {"EmployeeId": "int", "Year": "int", "Period": "int"},
+        ArrayOf(HOUR_COMPONENT),
+        _components("HourComponents", fixed=False),
+    ),
+    Operation(
+        "ReportService",
+        "Reports_GetWageCodesByYear_Background",
+        {"CompanyId": "int", "Year": "int"},
+        "string",
+        _start_task(_wage_codes_report),
+    ),
+    Operation(
+        "ReportService",
+        "Reports_GetWageCodesByRunCompany_v2_Background",
+        {"CompanyId": "int", "RunId": "int", "Year": "int"},
+        "string",
+        _start_task(_wage_codes_report),
+    ),
+    Operation(
+        "ReportService",
+        "Reports_Accountant_JournalsReportByYear_Background",
+        {"CompanyId": "int", "Year": "int"},
+        "string",
+        _start_task(_journals_report),
+    ),
+    Operation("ReportService", "Reports_Accountant_CompanyContactPerson_Background", {}, "string", _start_task(_contact_persons_report)),
+    Operation("ReportService", "Reports_BackgroundTask_Result", {"TaskId": "string"}, BACKGROUND_TASK_RESULT, _task_result),
+]
@@ -0,0 +1,281 @@
+"""
+This module describes SOAP operations with a small schema, and generates the WSDL and the messages of the fake server.
+
+Classes:
+    ComplexType: A complex type with named fields.
+    ArrayOf: An array type, as used by the Nmbrs SOAP API for lists.
+    Operation: A SOAP operation of a service, with its parameters, result and handler.
+
+Functions:
+    generate_wsdl(service, operations, address) -> str: Generate the WSDL of a service.
+    parse_request(body, operations) -> tuple[Operation, dict]: Parse a SOAP request into the operation and its arguments.
+    render_response(operation, result) -> bytes: Render the SOAP response of an operation.
+    render_fault(message) -> bytes: Render a SOAP fault.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Iterable
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+SOAP_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+SERVICE_NS = "https://api.nmbrs.nl/soap/v3/{service}"
+
+AUTH_HEADERS = {
+    "AuthHeader": ("Username", "Token"),
+    "AuthHeaderWithDomain": ("Username", "Token", "Domain"),
+}
+
+
+class ComplexType:
+    """A complex type with named fields, a field type is the name of an XML schema type, a ComplexType or an ArrayOf."""
+
+    def __init__(self, name: str, fields: dict[str, "str | ComplexType | ArrayOf"]):
+        self.name = name
+        self.fields = fields
+
+
+class ArrayOf:
+    """An array type, e.g. ArrayOfCompany containing Company elements."""
+
+    def __init__(self, item: str | ComplexType, name: str | None = None):
+        self.item = item
+        self.item_name = item if isinstance(item, str) else item.name
+        self.name = name or f"ArrayOf{self.item_name[0].upper()}{self.item_name[1:]}"
+
+
+class Operation:
+    """A SOAP operation of a service, answered by calling its handler with the fake server and the arguments."""
+
+    def __init__(
+        self,
+        service: str,
+        name: str,
+        params: dict[str, str | ComplexType | ArrayOf],
+        result: str | ComplexType | ArrayOf | None,
+        handler: Callable[..., any],
+    ):
+        """
+        Constructor method for Operation class.
+
+        Args:
+            service (str): The name of the service, e.g. "CompanyService".
+            name (str): The name of the operation, e.g. "List_GetAll".
+            params (dict[str, str | ComplexType | ArrayOf]): The types of the parameters, by name.
+            result (str | ComplexType | ArrayOf | None): The type of the result, None for operations without a result.
+            handler (Callable): Function called with the fake server and the arguments as keywords, returning the result.
+        """
+        self.service = service
+        self.name = name
+        self.params = params
+        self.result = result
+        self.handler = handler
+
+
+def _xsd_type(type_: str | ComplexType | ArrayOf) -> str:
+    return f"s:{type_}" if isinstance(type_, str) else f"tns:{type_.name}"
+
+
+def _element(name: str, type_: str | ComplexType | ArrayOf, max_occurs: str = "1", optional: bool = False) -> str:
+    min_occurs = 0 if optional or type_ not in ("int", "long", "decimal", "boolean", "dateTime", "double") else 1
+    return f'<s:element minOccurs="{min_occurs}" maxOccurs="{max_occurs}" name="{name}" type="{_xsd_type(type_)}"/>'
+
+
+def _collect_types(type_: str | ComplexType | ArrayOf | None, types: dict[str, ComplexType | ArrayOf]) -> None:
+    if type_ is None or isinstance(type_, str) or type_.name in types:
+        return
+    types[type_.name] = type_
+    children = [type_.item] if isinstance(type_, ArrayOf) else type_.fields.values()
+    for child in children:
+        _collect_types(child, types)
+
+
+def _type_definition(type_: ComplexType | ArrayOf) -> str:
+    if isinstance(type_, ArrayOf):
+        fields = _element(type_.item_name, type_.item, "unbounded", optional=True)
+    else:
+        # Fields are optional, so records can leave out fields whose value is None
+        fields = "".join(_element(name, field, optional=True) for name, field in type_.fields.items())
+    return f'<s:complexType name="{type_.name}"><s:sequence>{fields}</s:sequence></s:complexType>'
+
+
+def _operation_definitions(namespace: str, operation: Operation) -> tuple[list[str], list[str], str, str]:
+    """Return the schema elements, the messages, the port type operation and the binding operation of an operation."""
+    name = operation.name
+    params = "".join(_element(param, type_) for param, type_ in operation.params.items())
+    result = _element(f"{name}Result", operation.result) if operation.result is not None else ""
+    schema = [
+        f'<s:element name="{name}"><s:complexType><s:sequence>{params}</s:sequence></s:complexType></s:element>',
+        f'<s:element name="{name}Response"><s:complexType><s:sequence>{result}</s:sequence></s:complexType></s:element>',
+    ]
+    messages = [
+        f'<wsdl:message name="{name}SoapIn"><wsdl:part name="parameters" element="tns:{name}"/></wsdl:message>',
+        f'<wsdl:message name="{name}SoapOut"><wsdl:part name="parameters" element="tns:{name}Response"/></wsdl:message>',
+    ]
+    headers = ""
+    for header in AUTH_HEADERS:
+        messages.append(f'<wsdl:message name="{name}{header}"><wsdl:part name="{header}" element="tns:{header}"/></wsdl:message>')
+        headers += f'<soap:header message="tns:{name}{header}" part="{header}" use="literal"/>'
+    port_type = (
+        f'<wsdl:operation name="{name}">'
+        f'<wsdl:input message="tns:{name}SoapIn"/><wsdl:output message="tns:{name}SoapOut"/></wsdl:operation>'
+    )
+    binding = (
+        f'<wsdl:operation name="{name}"><soap:operation soapAction="{namespace}/{name}" style="document"/>'
+        f'<wsdl:input><soap:body use="literal"/>{headers}</wsdl:input>'
+        '<wsdl:output><soap:body use="literal"/></wsdl:output></wsdl:operation>'
+    )
+    return schema, messages, port_type, binding
+
+
+def generate_wsdl(service: str, operations: Iterable[Operation], address: str) -> str:
+    """
+    Generate the WSDL of a service, as document/literal SOAP 1.1 with the Nmbrs authentication headers.
+
+    Args:
+        service (str): The name of the service, e.g. "CompanyService".
+        operations (Iterable[Operation]): The operations of the service.
+        address (str): The URL the operations are posted to.
+
+    Returns:
+        str: The WSDL document.
+    """
+    namespace = SERVICE_NS.format(service=service)
+    types = {}
+    schema, messages, port_type, binding = [], [], [], []
+    for header, fields in AUTH_HEADERS.items():
+        types[header] = ComplexType(header, dict.fromkeys(fields, "string"))
+        schema.append(f'<s:element name="{header}" type="tns:{header}"/>')
+    for operation in operations:
+        _collect_types(operation.result, types)
+        for param in operation.params.values():
+            _collect_types(param, types)
+        definitions = _operation_definitions(namespace, operation)
+        schema.extend(definitions[0])
+        messages.extend(definitions[1])
+        port_type.append(definitions[2])
+        binding.append(definitions[3])
+    schema.extend(_type_definition(type_) for type_ in types.values())
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<wsdl:definitions xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" '
+        f'xmlns:s="http://www.w3.org/2001/XMLSchema" xmlns:tns="{namespace}" targetNamespace="{namespace}">'
+        f'<wsdl:types><s:schema elementFormDefault="qualified" targetNamespace="{namespace}">'
+        f'{"".join(schema)}</s:schema></wsdl:types>{"".join(messages)}'
+        f'<wsdl:portType name="{service}Soap">{"".join(port_type)}</wsdl:portType>'
+        f'<wsdl:binding name="{service}Soap" type="tns:{service}Soap">'
+        f'<soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>{"".join(binding)}</wsdl:binding>'
+        f'<wsdl:service name="{service}"><wsdl:port name="{service}Soap" binding="tns:{service}Soap">'
+        f'<soap:address location="{escape(address)}"/></wsdl:port></wsdl:service></wsdl:definitions>'
+    )
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _parse_value(element: ElementTree.Element, type_: str | ComplexType | ArrayOf) -> any:
+    if isinstance(type_, ArrayOf):
+        return [_parse_value(child, type_.item) for child in element]
+    if isinstance(type_, ComplexType):
+        fields = ((_local_name(child.tag), child) for child in element)
+        return {name: _parse_value(child, type_.fields[name]) for name, child in fields if name in type_.fields}
+    text = element.text or ""
+    if type_ in ("int", "long"):
+        return int(text)
+    if type_ == "boolean":
+        return text == "true"
+    if type_ == "decimal":
+        return Decimal(text)
+    return text
+
+
+def parse_request(body: bytes, operations: dict[str, Operation]) -> tuple[Operation, dict]:
+    """
+    Parse a SOAP request into the operation and its arguments.
+
+    Args:
+        body (bytes): The SOAP envelope.
+        operations (dict[str, Operation]): The operations of the service, by name.
+
+    Returns:
+        tuple[Operation, dict]: The operation and the arguments, by parameter name.
+    """
+    envelope = ElementTree.fromstring(body)
+    request = next(iter(envelope.find(f"{{{SOAP_NS}}}Body")))
+    operation = operations.get(_local_name(request.tag))
+    if operation is None:
+        raise KeyError(_local_name(request.tag))
+    arguments = {}
+    for element in request:
+        name = _local_name(element.tag)
+        if name in operation.params:
+            arguments[name] = _parse_value(element, operation.params[name])
+    return operation, arguments
+
+
+def _format(value: any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (float, Decimal)):
+        return str(value)
+    return escape(str(value))
+
+
+def _render(parts: list[str], name: str, type_: str | ComplexType | ArrayOf, value: any) -> None:
+    if value is None:
+        return
+    if isinstance(type_, ArrayOf):
+        parts.append(f"<{name}>")
+        for item in value:
+            _render(parts, type_.item_name, type_.item, item)
+        parts.append(f"</{name}>")
+    elif isinstance(type_, ComplexType):
+        parts.append(f"<{name}>")
+        for field, field_type in type_.fields.items():
+            _render(parts, field, field_type, value.get(field))
+        parts.append(f"</{name}>")
+    else:
+        parts.append(f"<{name}>{_format(value)}</{name}>")
+
+
+def render_response(operation: Operation, result: any) -> bytes:
+    """
+    Render the SOAP response of an operation.
+
+    Args:
+        operation (Operation): The operation.
+        result (any): The result returned by the handler, records are dictionaries with the field names of the result type.
+
+    Returns:
+        bytes: The SOAP envelope.
+    """
+    parts = [
+        f'<?xml version="1.0" encoding="utf-8"?><soap:Envelope xmlns:soap="{SOAP_NS}"><soap:Body>',
+        f'<{operation.name}Response xmlns="{SERVICE_NS.format(service=operation.service)}">',
+    ]
+    if operation.result is not None:
+        _render(parts, f"{operation.name}Result", operation.result, result)
+    parts.append(f"</{operation.name}Response></soap:Body></soap:Envelope>")
+    return "".join(parts).encode("utf-8")
+
+
+def render_fault(message: str) -> bytes:
+    """
+    Render a SOAP fault, in the format used by the Nmbrs SOAP API.
+
+    Args:
+        message (str): The fault string, e.g. "---> 9999: Unknown error".
+
+    Returns:
+        bytes: The SOAP envelope.
+    """
+    return (
+        f'<?xml version="1.0" encoding="utf-8"?><soap:Envelope xmlns:soap="{SOAP_NS}"><soap:Body><soap:Fault>'
+        "<faultcode>soap:Server</faultcode>"
+        f"<faultstring>System.Web.Services.Protocols.SoapException: Server was unable to process request. {escape(message)}</faultstring>"
+        "<detail/></soap:Fault></soap:Body></soap:Envelope>"
+    ).encode("utf-8")
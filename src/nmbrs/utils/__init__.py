@@ -3,3 +3,9 @@
 from .find_empty_params import find_empty_params
 from .nmbrs_exception_handler import nmbrs_exception_handler
 from .return_list import return_list
+from .backoff import backoff_delays
+from .ttl_cache import TTLCache
+from .metrics import MetricsRegistry, metrics
+from .tracing import InMemoryTracer, OpenTelemetryTracer, Span, Tracer, get_tracer, set_tracer
+from .compression import CompressionTransport
+from .raw import raw_call
@@ -0,0 +1,23 @@
+"""This module provides a generator for exponentially increasing wait times."""
+
+from typing import Iterator
+
+
+def backoff_delays(initial: float, factor: float = 2, maximum: float | None = None) -> Iterator[float]:
+    """
+    Yields an endless sequence of delays, starting at the initial delay and multiplied by the factor after each step.
+
+    Args:
+        initial (float): The first delay in seconds.
+        factor (float, optional): The factor the delay is multiplied with after each step. Defaults to 2.
+        maximum (float, optional): The maximum delay in seconds. Defaults to no maximum.
+
+    Returns:
+        Iterator[float]: The delays in seconds.
+    """
+    delay = initial
+    while True:
+        if maximum is not None:
+            delay = min(delay, maximum)
+        yield delay
+        delay *= factor
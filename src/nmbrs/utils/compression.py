@@ -0,0 +1,80 @@
+"""
+This module provides a zeep transport negotiating compressed responses, and optionally compressing large requests.
+
+SOAP envelopes compress well, so compression saves most of the transferred bytes when the bandwidth is limited. The
+responses are decompressed by requests, according to their Content-Encoding header. Compressed requests are only sent
+when enabled, as not every server accepts them: when the server answers 415 Unsupported Media Type the request is sent
+again uncompressed, and later requests to the same address are no longer compressed.
+
+Classes:
+    CompressionTransport: A zeep transport with options for compressed requests and responses.
+"""
+
+import gzip
+import logging
+import threading
+
+from zeep import Transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+DEFAULT_MIN_REQUEST_SIZE = 16 * 1024
+
+
+class CompressionTransport(Transport):
+    """A zeep transport requesting compressed responses, and optionally compressing requests with gzip."""
+
+    def __init__(
+        self,
+        accept_encoding: str | None = DEFAULT_ACCEPT_ENCODING,
+        compress_requests: bool = False,
+        min_request_size: int = DEFAULT_MIN_REQUEST_SIZE,
+        compression_level: int = 6,
+        **kwargs,
+    ):
+        """
+        Constructor method for CompressionTransport class.
+
+        Args:
+            accept_encoding (str | None, optional): The Accept-Encoding header of the requests, None requests
+                uncompressed responses. Defaults to "gzip, deflate".
+            compress_requests (bool, optional): Compress requests with gzip, only enable this when the server accepts
+                compressed requests. Defaults to False.
+            min_request_size (int, optional): The size in bytes from which requests are compressed, smaller requests
+                gain too little to make up for the compression. Defaults to 16 KiB.
+            compression_level (int, optional): The gzip compression level of requests, from 1 (fastest) to 9 (smallest).
+                Defaults to 6.
+            **kwargs: The arguments of zeep.Transport, e.g. timeout or session.
+        """
+        super().__init__(**kwargs)
+        self.session.headers["Accept-Encoding"] = accept_encoding or "identity"
+        self.compress_requests = compress_requests
+        self.min_request_size = min_request_size
+        self.compression_level = compression_level
+        self._uncompressed_addresses: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _compress(self, address: str, message) -> bool:
+        """Determine whether a request is compressed."""
+        return (
+            self.compress_requests
+            and isinstance(message, bytes)
+            and len(message) >= self.min_request_size
+            and address not in self._uncompressed_addresses
+        )
+
+    def post(self, address, message, headers):
+        if not self._compress(address, message):
+            return super().post(address, message, headers)
+
+        body = gzip.compress(message, compresslevel=self.compression_level)
+        logger.debug("Compressed the request to %s from %s to %s bytes.", address, len(message), len(body))
+        response = self.session.post(address, data=body, headers={**headers, "Content-Encoding": "gzip"}, timeout=self.operation_timeout)
+        if response.status_code != 415:
+            return response
+
+        logger.warning("%s does not accept compressed requests, sending its requests uncompressed.", address)
+        with self._lock:
+            self._uncompressed_addresses.add(address)
+        return super().post(address, message, headers)
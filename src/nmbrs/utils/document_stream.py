@@ -0,0 +1,310 @@
+"""
+This module provides helpers to write base64 encoded documents from SOAP responses to disk without decoding them in memory.
+
+Classes:
+    Base64Writer: Decodes base64 text in chunks and writes the result to a binary stream.
+
+Functions:
+    write_base64_element(source, tag, target) -> DocumentFile: Decode the base64 content of an XML element to a file.
+    write_base64_elements(source, tag, name_tag, directory) -> list[DocumentFile]: Decode repeated elements to files.
+    write_text_elements(source, targets) -> dict[str, str | None]: Write the text of elements to streams.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import tempfile
+import xml.sax
+from typing import IO, Iterable
+
+from ..data_classes.document import DocumentFile
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Base64Writer:
+    """Decodes base64 text in chunks and writes the result to a binary stream, keeping track of the size and checksum."""
+
+    def __init__(self, stream: IO[bytes]):
+        """
+        Constructor method for Base64Writer class.
+
+        Args:
+            stream (IO[bytes]): The binary stream to write the decoded data to.
+        """
+        self.stream = stream
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._remainder = ""
+
+    @property
+    def sha256(self) -> str:
+        """The SHA-256 checksum of the data written so far, as a hexadecimal string."""
+        return self._sha256.hexdigest()
+
+    def write(self, text: str) -> None:
+        """
+        Decode a piece of base64 text, text that does not form a complete group of 4 characters is kept for the next call.
+
+        Args:
+            text (str): Base64 text, may contain whitespace.
+        """
+        text = self._remainder + "".join(text.split())
+        end = len(text) - len(text) % 4
+        self._remainder = text[end:]
+        if end:
+            self._write(base64.b64decode(text[:end]))
+
+    def close(self) -> None:
+        """Decode the remaining text, raises binascii.Error when the base64 text was incomplete."""
+        if self._remainder:
+            self._write(base64.b64decode(self._remainder))
+            self._remainder = ""
+
+    def _write(self, data: bytes) -> None:
+        """Write decoded data to the stream."""
+        self.stream.write(data)
+        self._sha256.update(data)
+        self.size += len(data)
+
+
+class _Base64ElementHandler(xml.sax.ContentHandler):
+    """SAX handler passing the text of the first element with a given local name to a Base64Writer."""
+
+    def __init__(self, tag: str, writer: Base64Writer):
+        super().__init__()
+        self.tag = tag
+        self.writer = writer
+        self.found = False
+        self._depth = 0
+
+    def startElement(self, name, attrs):  # pylint: disable=invalid-name
+        if self._depth:
+            self._depth += 1
+        elif not self.found and name.rpartition(":")[2] == self.tag:
+            self.found = True
+            self._depth = 1
+
+    def endElement(self, name):  # pylint: disable=invalid-name
+        if self._depth:
+            self._depth -= 1
+
+    def characters(self, content):
+        if self._depth == 1:
+            self.writer.write(content)
+
+
+class _Base64ElementsHandler(xml.sax.ContentHandler):
+    """
+    SAX handler writing the text of every element with a given local name to its own file in a directory.
+
+    The file is named after the text of a sibling element (e.g. the employee ID). As the order of the siblings is not
+    known in advance, the data is written to a temporary file that is renamed when the parent element ends.
+    """
+
+    def __init__(self, tag: str, name_tag: str, directory: str, suffix: str):
+        super().__init__()
+        self.tag = tag
+        self.name_tag = name_tag
+        self.directory = directory
+        self.suffix = suffix
+        self.documents: list[DocumentFile] = []
+        self._depth = 0
+        self._parent_depth = None
+        self._file = None
+        self._writer = None
+        self._text = None
+        self._name = None
+
+    def startElement(self, name, attrs):  # pylint: disable=invalid-name
+        self._depth += 1
+        local_name = name.rpartition(":")[2]
+        if self._file is not None and not self._file.closed:
+            return
+        if local_name == self.tag and self._writer is None:
+            self._parent_depth = self._depth - 1
+            self._file = tempfile.NamedTemporaryFile("wb", dir=self.directory, delete=False)  # pylint: disable=consider-using-with
+            self._writer = Base64Writer(self._file)
+        elif local_name == self.name_tag:
+            self._text = []
+
+    def endElement(self, name):  # pylint: disable=invalid-name
+        local_name = name.rpartition(":")[2]
+        if self._writer is not None and self._depth == self._parent_depth + 1 and local_name == self.tag:
+            self._writer.close()
+            self._file.close()
+        elif self._text is not None and local_name == self.name_tag:
+            self._name = "".join(self._text).strip()
+            self._text = None
+        elif self._writer is not None and self._depth == self._parent_depth:
+            self._finish()
+        self._depth -= 1
+
+    def characters(self, content):
+        if self._writer is not None and not self._file.closed:
+            self._writer.write(content)
+        elif self._text is not None:
+            self._text.append(content)
+
+    def _finish(self) -> None:
+        """Rename the temporary file of the finished document to its final name."""
+        if not self._name:
+            raise ValueError(f"No {self.name_tag} found for a {self.tag} element")
+        # The name is read from the response, it must not select a file outside of the directory
+        if os.path.basename(self._name) != self._name or self._name in (os.curdir, os.pardir):
+            raise ValueError(f"Invalid {self.name_tag} {self._name!r} for a {self.tag} element, it is not a file name")
+        path = os.path.join(self.directory, f"{self._name}{self.suffix}")
+        os.replace(self._file.name, path)
+        self.documents.append(DocumentFile(path, self._writer.size, self._writer.sha256, employee_id=_to_int(self._name)))
+        self._file = self._writer = self._name = self._parent_depth = None
+
+    def discard(self) -> None:
+        """Remove the temporary file of an unfinished document."""
+        if self._file is not None:
+            self._file.close()
+            os.remove(self._file.name)
+
+
+class _TextElementsHandler(xml.sax.ContentHandler):
+    """SAX handler writing the text of the first element with each given local name to its stream, or collecting it."""
+
+    def __init__(self, targets: dict[str, IO[str] | None]):
+        super().__init__()
+        self.targets = targets
+        self.texts: dict[str, str | None] = dict.fromkeys(targets)
+        self._name = None
+        self._parts = []
+        self._depth = 0
+
+    def startElement(self, name, attrs):  # pylint: disable=invalid-name
+        if self._depth:
+            self._depth += 1
+            return
+        local_name = name.rpartition(":")[2]
+        if local_name in self.targets and self.texts[local_name] is None:
+            self._name = local_name
+            self._depth = 1
+
+    def endElement(self, name):  # pylint: disable=invalid-name
+        if not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            self.texts[self._name] = "".join(self._parts)
+            self._name = None
+            self._parts = []
+
+    def characters(self, content):
+        if self._depth == 1:
+            target = self.targets[self._name]
+            if target is None:
+                self._parts.append(content)
+            else:
+                target.write(content)
+
+
+def _to_int(value: str) -> int | str:
+    """Convert a value to an integer when possible."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _feed(handler: xml.sax.ContentHandler, source: bytes | Iterable[bytes]) -> None:
+    """Parse a document, or the chunks of a document, in chunks with a SAX handler."""
+    parser = xml.sax.make_parser()
+    parser.setFeature(xml.sax.handler.feature_namespaces, False)
+    parser.setContentHandler(handler)
+    if isinstance(source, (bytes, bytearray)):
+        # Slices of a memoryview are fed without copying the document
+        view = memoryview(source)
+        source = (view[start : start + CHUNK_SIZE] for start in range(0, len(view), CHUNK_SIZE))
+    for chunk in source:
+        parser.feed(chunk)
+    parser.close()
+
+
+def write_base64_element(source: bytes | Iterable[bytes], tag: str, target: str | os.PathLike | IO[bytes]) -> DocumentFile:
+    """
+    Decode the base64 content of an XML element (e.g. the result of a SOAP call) and write it to a file or stream.
+
+    The XML is parsed with SAX, so neither the base64 text nor the decoded document is held in memory as a whole. When
+    the source is an iterable of chunks, e.g. the body of a streamed HTTP response, the XML is not held in memory either.
+
+    Args:
+        source (bytes | Iterable[bytes]): The XML document, or its chunks, e.g. the body of a SOAP response.
+        tag (str): The local name of the element containing the base64 data.
+        target (str | os.PathLike | IO[bytes]): A file path or a binary stream.
+
+    Returns:
+        DocumentFile: The path (None for streams), size and checksum of the written document.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as file:
+            document = write_base64_element(source, tag, file)
+        return DocumentFile(os.fspath(target), document.size, document.sha256)
+
+    writer = Base64Writer(target)
+    handler = _Base64ElementHandler(tag, writer)
+    _feed(handler, source)
+    writer.close()
+    if not handler.found:
+        logger.warning("Element %s not found in the response, no document written.", tag)
+    return DocumentFile(None, writer.size, writer.sha256)
+
+
+def write_base64_elements(
+    source: bytes | Iterable[bytes], tag: str, name_tag: str, directory: str | os.PathLike, suffix: str = ".pdf"
+) -> list[DocumentFile]:
+    """
+    Decode the base64 content of every element with a given name to its own file, e.g. one payslip per employee.
+
+    Each file is named after the text of a sibling element, e.g. "EmployeeId" results in "1234.pdf". The XML is parsed
+    as by write_base64_element.
+
+    Raises:
+        ValueError: When an element has no name, or a name that is not a plain file name, e.g. "../1234".
+
+    Args:
+        source (bytes | Iterable[bytes]): The XML document, or its chunks, e.g. the body of a SOAP response.
+        tag (str): The local name of the elements containing the base64 data.
+        name_tag (str): The local name of the sibling element containing the name of the file.
+        directory (str | os.PathLike): The directory to write the files to, created if it does not exist.
+        suffix (str, optional): The extension of the files. Defaults to ".pdf".
+
+    Returns:
+        list[DocumentFile]: The path, size and checksum of every written document.
+    """
+    directory = os.fspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    handler = _Base64ElementsHandler(tag, name_tag, directory, suffix)
+    try:
+        _feed(handler, source)
+    except Exception:
+        handler.discard()
+        raise
+    return handler.documents
+
+
+def write_text_elements(source: bytes | Iterable[bytes], targets: dict[str, IO[str] | None]) -> dict[str, str | None]:
+    """
+    Write the text of the first element with each given local name to its stream, e.g. a report in a SOAP response.
+
+    The XML is parsed as by write_base64_element, the text is unescaped but not decoded further.
+
+    Args:
+        source (bytes | Iterable[bytes]): The XML document, or its chunks, e.g. the body of a SOAP response.
+        targets (dict[str, IO[str] | None]): The text stream to write each element to by local name, None to return
+            the text of the element instead, e.g. a status next to a report.
+
+    Returns:
+        dict[str, str | None]: The text of the elements by local name, "" for the elements written to their stream and
+            None for the elements that were not found.
+    """
+    handler = _TextElementsHandler(targets)
+    _feed(handler, source)
+    return handler.texts
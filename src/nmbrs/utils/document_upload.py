@@ -0,0 +1,130 @@
+"""
+This module provides helpers to upload documents without holding the document or its base64 encoding in memory.
+
+Classes:
+    Base64Body: A request body consisting of a SOAP envelope with a base64 encoded file streamed into it.
+
+Functions:
+    get_document_name(source) -> str: Use the file name of a path or file object as the name of a document.
+    post_document(client, operation, field, source, **kwargs) -> any: Call an operation, streaming a document into a field.
+"""
+
+import base64
+import logging
+import os
+import secrets
+from typing import IO, Iterator
+
+from zeep import Client
+from zeep.wsdl.utils import etree_to_string
+
+from .payload_size import get_resource, record_payload
+from .soap_request import create_request
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 3 * 64 * 1024
+
+
+class Base64Body:
+    """
+    A request body consisting of a prefix, a base64 encoded binary stream and a suffix.
+
+    The length of the body is known in advance, so it is sent with a Content-Length header instead of chunked. The body
+    can be iterated more than once (e.g. when the request is retried), the stream is rewound each time.
+    """
+
+    def __init__(self, prefix: bytes, stream: IO[bytes], suffix: bytes):
+        """
+        Constructor method for Base64Body class.
+
+        Args:
+            prefix (bytes): The data sent before the encoded stream.
+            stream (IO[bytes]): A seekable binary stream, read from its current position.
+            suffix (bytes): The data sent after the encoded stream.
+        """
+        self.prefix = prefix
+        self.stream = stream
+        self.suffix = suffix
+        self._start = stream.tell()
+        self._size = stream.seek(0, os.SEEK_END) - self._start
+        stream.seek(self._start)
+
+    def __len__(self) -> int:
+        return len(self.prefix) + 4 * -(-self._size // 3) + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.stream.seek(self._start)
+        yield self.prefix
+        # Streams may return fewer bytes than requested, only whole groups of 3 bytes are encoded until the end of the
+        # stream, so that the padding is only added to the last chunk
+        remainder = b""
+        for chunk in iter(lambda: self.stream.read(CHUNK_SIZE), b""):
+            chunk = remainder + chunk
+            end = len(chunk) - len(chunk) % 3
+            remainder = chunk[end:]
+            if end:
+                yield base64.b64encode(chunk[:end])
+        if remainder:
+            yield base64.b64encode(remainder)
+        yield self.suffix
+
+
+def _split_request(client: Client, operation: str, field: str, kwargs: dict) -> tuple[bytes, bytes, dict, str]:
+    """Create the request of a call with a placeholder in a field, returning the envelope before and after the field."""
+    placeholder = secrets.token_bytes(24)
+    envelope, http_headers, address = create_request(client, operation, {**kwargs, field: placeholder})
+    prefix, found, suffix = etree_to_string(envelope).partition(base64.b64encode(placeholder))
+    if not found:
+        # E.g. a plugin changed the field, the document would be left out of the request
+        raise ValueError(f"The {field} field of {operation} is not found in the request")
+    return prefix, suffix, http_headers, address
+
+
+def get_document_name(source: str | os.PathLike | IO[bytes]) -> str:
+    """
+    Use the file name of a path or file object as the name of a document.
+
+    Args:
+        source (str | os.PathLike | IO[bytes]): A file path or a binary stream.
+
+    Returns:
+        str: The file name, without the directory.
+    """
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+    if not isinstance(name, (str, os.PathLike)):
+        raise ValueError("A document name is required when uploading from a stream without a name")
+    return os.path.basename(name)
+
+
+def post_document(client: Client, operation: str, field: str, source: str | os.PathLike | IO[bytes], **kwargs) -> any:
+    """
+    Call an operation with a base64Binary field, streaming the content of a file into the request.
+
+    The SOAP envelope is created by zeep with a placeholder for the field, the placeholder is replaced by the encoded file
+    while sending the request. The response is processed by zeep as usual, so SOAP faults raise the usual exceptions.
+
+    Args:
+        client (Client): The zeep client of the service.
+        operation (str): The name of the operation.
+        field (str): The name of the base64Binary field, e.g. "Body".
+        source (str | os.PathLike | IO[bytes]): A file path or a seekable binary stream.
+        **kwargs: The other arguments of the operation, including _soapheaders.
+
+    Returns:
+        any: The result of the operation.
+
+    Raises:
+        ValueError: When the field is not found in the envelope created by zeep.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return post_document(client, operation, field, file, **kwargs)
+
+    prefix, suffix, http_headers, address = _split_request(client, operation, field, kwargs)
+    body = Base64Body(prefix, source, suffix)
+    logger.debug("Uploading %s bytes with %s.", len(body), operation)
+    response = client.transport.post(address, body, http_headers)
+    record_payload(get_resource(address, operation), kwargs.get("_soapheaders"), body, response)
+    binding = client.service._binding
+    return binding.process_reply(client, binding.get(operation), response)
@@ -0,0 +1,159 @@
+"""
+This module provides helpers to fetch and store many documents concurrently, skipping documents stored before.
+
+Classes:
+    Manifest: A JSON file recording the documents that were stored, with their metadata, journaled per document.
+
+Functions:
+    fan_out(keys, list_items, process, max_workers=8, skip=None) -> Iterator[HarvestResult]: List and process items concurrently.
+    write_compressed(path, text) -> int: Write text to a gzip compressed file, replacing the file atomically.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Hashable, Iterable, Iterator
+
+from ..data_classes.harvest import HarvestResult
+
+logger = logging.getLogger(__name__)
+
+
+class Manifest:
+    """
+    A JSON file recording the documents that were stored, keyed by a string, with their metadata.
+
+    Every entry is appended to a journal ("<path>.log") and flushed as soon as it is added, so an interrupted run keeps
+    the entries of the documents it finished. save writes the JSON file and removes the journal, the entries of a
+    journal left behind are read with the JSON file.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Constructor method for Manifest class, the existing entries are read from the file and its journal.
+
+        Args:
+            path (str | os.PathLike): The path of the JSON file.
+        """
+        self.path = os.fspath(path)
+        self.journal_path = f"{self.path}.log"
+        self.entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._journal = None
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                self.entries = json.load(file)
+        if os.path.exists(self.journal_path):
+            self._read_journal()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> dict | None:
+        """Return the metadata of an entry, or None if it does not exist."""
+        return self.entries.get(key)
+
+    def add(self, key: str, metadata: dict) -> None:
+        """Add or replace an entry, it is appended to the journal immediately and to the file by save."""
+        line = json.dumps({"key": key, "metadata": metadata}, sort_keys=True, default=str)
+        with self._lock:
+            self.entries[key] = metadata
+            if self._journal is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._journal = open(self.journal_path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+            self._journal.write(f"{line}\n")
+            self._journal.flush()
+
+    def save(self) -> None:
+        """Write the manifest, the file is replaced atomically and the journal is removed."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            with open(f"{self.path}.part", "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=1, sort_keys=True, default=str)
+            os.replace(f"{self.path}.part", self.path)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+
+    def _read_journal(self) -> None:
+        """Add the entries of the journal, the last line is incomplete when the process stopped while writing it."""
+        with open(self.journal_path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping an incomplete line of %s", self.journal_path)
+                    continue
+                self.entries[entry["key"]] = entry["metadata"]
+
+
+def write_compressed(path: str | os.PathLike, text: str) -> int:
+    """
+    Write text to a gzip compressed file, the file is replaced atomically so a partial file is never left behind.
+
+    Args:
+        path (str | os.PathLike): The path of the file, parent directories are created.
+        text (str): The text to write.
+
+    Returns:
+        int: The size of the compressed file in bytes.
+    """
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with gzip.open(f"{path}.part", "wt", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(f"{path}.part", path)
+    return os.path.getsize(path)
+
+
+def fan_out(
+    keys: Iterable[Hashable],
+    list_items: Callable[[Hashable], Iterable[any]],
+    process: Callable[[any], any],
+    max_workers: int = 8,
+    skip: Callable[[any], bool] | None = None,
+) -> Iterator[HarvestResult]:
+    """
+    List the items of every key and process every item, both stages running concurrently on the same thread pool.
+
+    Items are processed as soon as the list they belong to is available, results are yielded as soon as they complete.
+    Errors are reported per key or item and do not stop the other tasks.
+
+    Args:
+        keys (Iterable[Hashable]): The keys to list items for, e.g. company IDs.
+        list_items (Callable): Function returning the items of a key, e.g. the wage tax declarations of a company.
+        process (Callable): Function processing a single item, e.g. downloading and storing the declaration.
+        max_workers (int, optional): The maximum number of tasks running at the same time. Defaults to 8.
+        skip (Callable, optional): Function returning True for items that do not need processing.
+
+    Returns:
+        Iterator[HarvestResult]: The result of every item, and of every key whose items could not be listed.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {executor.submit(list_items, key): (key, None) for key in keys}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, item = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Harvesting %s failed: %s", key if item is None else item, e)
+                    yield HarvestResult(key, item, "Error", error=e)
+                    continue
+                if item is not None:
+                    yield HarvestResult(key, item, "Success", result=result)
+                    continue
+                for listed in result:
+                    if skip is not None and skip(listed):
+                        yield HarvestResult(key, listed, "Skipped")
+                    else:
+                        running[executor.submit(process, listed)] = (key, listed)
@@ -0,0 +1,247 @@
+"""
+This module provides an in-process registry of the calls of the Nmbrs SOAP operations, per resource.
+
+Every operation decorated with nmbrs_exception_handler is recorded in the default registry: the number of calls, the
+errors by exception class, a latency histogram and the number of records returned. The sizes of the requests and
+responses are recorded per resource and tenant. The registry can be read with snapshot, top and payloads, or rendered
+in the Prometheus text format.
+
+Classes:
+    MetricsRegistry: Thread-safe metrics of calls, by resource name.
+
+Attributes:
+    metrics (MetricsRegistry): The default registry, used by nmbrs_exception_handler.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+"""The upper bounds of the latency histogram in seconds, slower calls are only counted in the +Inf bucket."""
+
+
+class _ResourceMetrics:
+    """The metrics of a single resource."""
+
+    __slots__ = ("count", "errors", "records", "latency_sum", "latency_buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = Counter()
+        self.records = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def to_dict(self) -> dict:
+        """Get the metrics, with the latency buckets cumulative by upper bound as in Prometheus."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip((*LATENCY_BUCKETS, float("inf")), self.latency_buckets):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "error_count": sum(self.errors.values()),
+            "errors": dict(self.errors),
+            "records": self.records,
+            "latency_sum": self.latency_sum,
+            "latency_buckets": buckets,
+        }
+
+
+class _PayloadMetrics:
+    """The sizes of the requests and responses of a single resource and tenant."""
+
+    __slots__ = ("requests", "request_bytes", "request_wire_bytes", "response_bytes", "response_wire_bytes")
+
+    def __init__(self):
+        self.requests = 0
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+
+    def to_dict(self) -> dict:
+        """Get the sizes by name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Thread-safe metrics of calls, by resource name, e.g. "EmployeeService:Absence_GetList"."""
+
+    def __init__(self, enabled: bool = True):
+        """
+        Constructor method for MetricsRegistry class.
+
+        Args:
+            enabled (bool, optional): Record calls, when False record does nothing. Defaults to True.
+        """
+        self.enabled = enabled
+        self._resources: dict[str, _ResourceMetrics] = {}
+        self._payloads: dict[tuple[str, str], _PayloadMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, resource: str, elapsed: float, records: int = 0, error: BaseException | None = None) -> None:
+        """
+        Record a call of a resource.
+
+        Args:
+            resource (str): The name of the resource, e.g. "EmployeeService:Absence_GetList".
+            elapsed (float): The duration of the call in seconds.
+            records (int, optional): The number of records returned. Defaults to 0.
+            error (BaseException, optional): The exception raised by the call, counted by its class name.
+        """
+        if not self.enabled:
+            return
+        bucket = bisect_left(LATENCY_BUCKETS, elapsed)
+        with self._lock:
+            resource_metrics = self._resources.get(resource)
+            if resource_metrics is None:
+                resource_metrics = self._resources[resource] = _ResourceMetrics()
+            resource_metrics.count += 1
+            resource_metrics.records += records
+            resource_metrics.latency_sum += elapsed
+            resource_metrics.latency_buckets[bucket] += 1
+            if error is not None:
+                resource_metrics.errors[type(error).__name__] += 1
+
+    def record_payload(
+        self, resource: str, tenant: str, request_bytes: int, request_wire_bytes: int, response_bytes: int, response_wire_bytes: int
+    ) -> None:
+        """
+        Record the sizes of a request and its response.
+
+        Args:
+            resource (str): The name of the resource, e.g. "EmployeeService:Absence_GetList".
+            tenant (str): The tenant of the request, e.g. the domain, or "" when unknown.
+            request_bytes (int): The size of the request.
+            request_wire_bytes (int): The size of the request as sent, smaller than request_bytes when compressed.
+            response_bytes (int): The size of the response.
+            response_wire_bytes (int): The size of the response as received, smaller than response_bytes when compressed.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            payload = self._payloads.get((resource, tenant))
+            if payload is None:
+                payload = self._payloads[(resource, tenant)] = _PayloadMetrics()
+            payload.requests += 1
+            payload.request_bytes += request_bytes
+            payload.request_wire_bytes += request_wire_bytes
+            payload.response_bytes += response_bytes
+            payload.response_wire_bytes += response_wire_bytes
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Get the metrics of every resource that was called.
+
+        Returns:
+            dict[str, dict]: By resource, the "count", "error_count", "errors" by exception class, "records",
+                "latency_sum" in seconds and the cumulative "latency_buckets" by upper bound in seconds.
+        """
+        with self._lock:
+            return {resource: resource_metrics.to_dict() for resource, resource_metrics in self._resources.items()}
+
+    def payloads(self) -> dict[str, dict[str, dict]]:
+        """
+        Get the sizes of the requests and responses of every resource that was called, by tenant.
+
+        Returns:
+            dict[str, dict[str, dict]]: By resource and tenant, the number of "requests" and the total "request_bytes",
+                "request_wire_bytes", "response_bytes" and "response_wire_bytes".
+        """
+        result = {}
+        with self._lock:
+            for (resource, tenant), payload in self._payloads.items():
+                result.setdefault(resource, {})[tenant] = payload.to_dict()
+        return result
+
+    def top(self, n: int = 10, key: str = "latency_sum") -> list[tuple[str, dict]]:
+        """
+        Get the resources with the highest value of a metric, e.g. the operations taking most of the wall time.
+
+        Args:
+            n (int, optional): The number of resources. Defaults to 10.
+            key (str, optional): The metric to sort by: "latency_sum", "count", "error_count" or "records".
+                Defaults to "latency_sum".
+
+        Returns:
+            list[tuple[str, dict]]: The resources and their metrics, highest first.
+        """
+        return sorted(self.snapshot().items(), key=lambda item: item[1][key], reverse=True)[:n]
+
+    def reset(self) -> None:
+        """Remove the metrics of all resources."""
+        with self._lock:
+            self._resources.clear()
+            self._payloads.clear()
+
+    def render_prometheus(self, prefix: str = "nmbrs") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): The prefix of the metric names. Defaults to "nmbrs".
+
+        Returns:
+            str: The metrics, with the calls, errors, records and payload sizes as counters and the latency as a histogram.
+        """
+        snapshot = sorted(self.snapshot().items())
+        lines = [
+            f"# HELP {prefix}_calls_total Calls of Nmbrs SOAP operations.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [
+            f'{prefix}_calls_total{{resource="{_label(resource)}"}} {resource_metrics["count"]}' for resource, resource_metrics in snapshot
+        ]
+        lines += [
+            f"# HELP {prefix}_errors_total Failed calls of Nmbrs SOAP operations, by exception class.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [
+            f'{prefix}_errors_total{{resource="{_label(resource)}",exception="{_label(exception)}"}} {count}'
+            for resource, resource_metrics in snapshot
+            for exception, count in sorted(resource_metrics["errors"].items())
+        ]
+        lines += [
+            f"# HELP {prefix}_records_total Records returned by Nmbrs SOAP operations.",
+            f"# TYPE {prefix}_records_total counter",
+        ]
+        lines += [
+            f'{prefix}_records_total{{resource="{_label(resource)}"}} {resource_metrics["records"]}'
+            for resource, resource_metrics in snapshot
+        ]
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds Duration of calls of Nmbrs SOAP operations.",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for resource, resource_metrics in snapshot:
+            label = _label(resource)
+            for bound, count in resource_metrics["latency_buckets"].items():
+                lines.append(
+                    f'{prefix}_call_duration_seconds_bucket{{resource="{label}",le="{"+Inf" if bound == float("inf") else bound}"}} {count}'
+                )
+            lines.append(f'{prefix}_call_duration_seconds_sum{{resource="{label}"}} {resource_metrics["latency_sum"]}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{resource="{label}"}} {resource_metrics["count"]}')
+        payloads = sorted((resource, tenant, sizes) for resource, tenants in self.payloads().items() for tenant, sizes in tenants.items())
+        for name, description in (
+            ("request_bytes", "Bytes of the requests to Nmbrs SOAP operations."),
+            ("request_wire_bytes", "Bytes of the requests to Nmbrs SOAP operations as sent, after compression."),
+            ("response_bytes", "Bytes of the responses of Nmbrs SOAP operations."),
+            ("response_wire_bytes", "Bytes of the responses of Nmbrs SOAP operations as received, before decompression."),
+        ):
+            lines += [f"# HELP {prefix}_{name}_total {description}", f"# TYPE {prefix}_{name}_total counter"]
+            lines += [
+                f'{prefix}_{name}_total{{resource="{_label(resource)}",tenant="{_label(tenant)}"}} {sizes[name]}'
+                for resource, tenant, sizes in payloads
+            ]
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
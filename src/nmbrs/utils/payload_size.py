@@ -0,0 +1,108 @@
+"""
+This module accounts the sizes of the SOAP requests and responses of the Nmbrs operations, per resource and tenant.
+
+The sizes are measured on the bytes sent and received by the transport of the instrumented clients, both as the XML
+(uncompressed) and as transferred over the network (compressed, when the request or response was compressed). They are
+logged at DEBUG level and recorded in the default metrics registry, e.g. to decide which endpoints to cache and whether
+compression pays off.
+
+Functions:
+    get_resource(address, operation) -> str: The resource of an operation, e.g. "EmployeeService:Absence_GetList".
+    payload_sizes(message, response, response_size) -> tuple: The uncompressed and transferred sizes of a request and its
+        response.
+    is_recording() -> bool: Whether record_payload records or logs anything.
+    record_payload(resource, header, message, response, response_size) -> None: Log and record the sizes of a request and
+        its response.
+"""
+
+import logging
+from urllib.parse import urlsplit
+
+import requests
+
+from .metrics import metrics
+from ..auth.token_manager import get_tenant
+
+logger = logging.getLogger(__name__)
+
+
+def get_resource(address: str, operation: str) -> str:
+    """
+    Get the resource of an operation, named like the resources of nmbrs_exception_handler.
+
+    Args:
+        address (str): The address of the service, e.g. "https://api.nmbrs.nl/soap/v3/EmployeeService.asmx".
+        operation (str): The name of the operation, e.g. "Absence_GetList".
+
+    Returns:
+        str: The resource, e.g. "EmployeeService:Absence_GetList".
+    """
+    return f"{urlsplit(address).path.rsplit('/', 1)[-1].split('.', 1)[0]}:{operation}"
+
+
+def _wire_size(response: requests.Response, response_size: int) -> int:
+    """Get the number of bytes of the response body read from the network, before it was decompressed."""
+    tell = getattr(response.raw, "tell", None)
+    size = tell() if tell is not None else None
+    if isinstance(size, int) and size > 0:
+        return size
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+    return response_size
+
+
+def payload_sizes(message, response: requests.Response, response_size: int | None = None) -> tuple[int, int, int, int]:
+    """
+    Get the uncompressed and transferred sizes of a request and its response.
+
+    Args:
+        message (bytes | Sized): The body passed to the transport, bytes or a body with a length such as Base64Body.
+        response (requests.Response): The response of the transport.
+        response_size (int, optional): The number of bytes read from a streamed response, whose content is not kept.
+            Defaults to the size of the content of the response.
+
+    Returns:
+        tuple[int, int, int, int]: The size of the request, the size of the request as sent, the size of the response
+            and the size of the response as received, in bytes.
+    """
+    request_size = len(message)
+    request = getattr(response, "request", None)
+    sent = getattr(request, "body", None)
+    request_wire_size = len(sent) if isinstance(sent, (bytes, str)) else request_size
+    if response_size is None:
+        response_size = len(response.content)
+    return request_size, request_wire_size, response_size, _wire_size(response, response_size)
+
+
+def is_recording() -> bool:
+    """Whether record_payload records or logs anything, i.e. the metrics are enabled or DEBUG logging is on."""
+    return metrics.enabled or logger.isEnabledFor(logging.DEBUG)
+
+
+def record_payload(resource: str, header: dict | None, message, response: requests.Response, response_size: int | None = None) -> None:
+    """
+    Log and record the sizes of a request and its response in the default metrics registry.
+
+    Args:
+        resource (str): The resource of the request, e.g. "EmployeeService:Absence_GetList".
+        header (dict | None): The authentication header of the request, determining the tenant.
+        message (bytes | Sized): The body passed to the transport.
+        response (requests.Response): The response of the transport.
+        response_size (int, optional): The number of bytes read from a streamed response, whose content is not kept.
+            Defaults to the size of the content of the response.
+    """
+    if not is_recording():
+        return
+    tenant = get_tenant(header) or ""
+    request_size, request_wire_size, response_size, response_wire_size = payload_sizes(message, response, response_size)
+    logger.debug(
+        "%s (%s): sent %s bytes (%s transferred), received %s bytes (%s transferred).",
+        resource,
+        tenant,
+        request_size,
+        request_wire_size,
+        response_size,
+        response_wire_size,
+    )
+    metrics.record_payload(resource, tenant, request_size, request_wire_size, response_size, response_wire_size)
@@ -0,0 +1,87 @@
+"""
+This module provides raw calls, returning the SOAP responses of the Nmbrs operations as XML instead of data classes.
+
+Converting a response to data classes takes three passes over it: zeep builds its objects from the XML tree,
+serialize_object converts those to dictionaries and the data classes copy the dictionaries. For large responses, e.g.
+the *_GetAll endpoints, these passes take most of the time and memory of a call, which is wasted when the response is
+passed to another parser or stored as is. raw_call calls an operation of a service and returns either:
+
+    "bytes": The body of the HTTP response, the XML is not parsed at all.
+    "element": The response element of the operation (the first child of the SOAP body) as an lxml element, parsed
+        with the same security settings as zeep.
+
+The operation is called with the raw_response setting of zeep, so its response is returned as received and is never
+converted to zeep objects. SOAP faults are still raised as the exceptions of the SDK, and the calls are recorded in the
+metrics and traced as the calls of the methods of the services.
+
+Functions:
+    raw_call(service, operation, mode, **params) -> bytes | etree._Element | None: Call an operation, returning XML.
+    raw_reply(client, binding, operation_name, response, mode) -> bytes | etree._Element | None: Get the raw response.
+"""
+
+from zeep import Client
+from zeep.loader import parse_xml
+
+from .nmbrs_exception_handler import nmbrs_exception_handler
+from .payload_size import get_resource
+
+RAW_MODES = ("bytes", "element")
+
+
+def raw_call(service, operation: str, mode: str = "element", **params):
+    """
+    Call an operation of a service and return its response as XML.
+
+    The microservices share the client of their service, e.g. raw_call(api.employee, ...) and
+    raw_call(api.employee.salary, ...) call the same EmployeeService operations.
+
+    Args:
+        service: The service, e.g. api.employee.
+        operation (str): The name of the operation, e.g. "Salary_GetAll_AllEmployeesByCompany".
+        mode (str, optional): "bytes" for the body of the HTTP response, "element" for the response element of the
+            operation. Defaults to "element".
+        **params: The parameters of the operation, e.g. CompanyID=1, the authentication header is added.
+
+    Returns:
+        bytes | etree._Element | None: The body of the response, or the response element of the operation.
+    """
+    if mode not in RAW_MODES:
+        raise ValueError(f"Unknown raw mode {mode!r}, expected one of {', '.join(RAW_MODES)}")
+    client = service.client
+    binding = client.service._binding  # pylint: disable=protected-access
+    address = client.service._binding_options.get("address", "")  # pylint: disable=protected-access
+
+    @nmbrs_exception_handler(resource=get_resource(address, operation))
+    def call(owner):
+        with client.settings(raw_response=True):
+            response = client.service[operation](**params, _soapheaders=owner.auth_manager.header)
+        return raw_reply(client, binding, operation, response, mode)
+
+    return call(service)
+
+
+def raw_reply(client: Client, binding, operation_name: str, response, mode: str):
+    """
+    Get the raw response of an operation, raising the faults as zeep does.
+
+    Args:
+        client (Client): The client.
+        binding (zeep.wsdl.bindings.soap.SoapBinding): The binding of the operation.
+        operation_name (str): The name of the operation.
+        response (requests.Response): The response of the transport.
+        mode (str): The raw mode, "bytes" or "element".
+
+    Returns:
+        bytes | etree._Element | None: The body of the response, or the response element of the operation.
+    """
+    if response.status_code != 200:
+        # Faults are answered with status 500, zeep raises them
+        return binding.process_reply(client, binding.get(operation_name), response)
+    if mode == "bytes":
+        return response.content
+
+    doc = parse_xml(response.content, binding.transport, settings=client.settings)
+    body = doc.find("soap-env:Body", namespaces=binding.nsmap)
+    if body.find("soap-env:Fault", namespaces=binding.nsmap) is not None:
+        return binding.process_error(doc, binding.get(operation_name))
+    return body[0] if len(body) else None
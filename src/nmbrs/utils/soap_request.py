@@ -0,0 +1,147 @@
+"""
+This module creates and sends the SOAP requests of zeep operations without the operation proxies of zeep, for the calls
+streaming a document into the request or out of the response.
+
+zeep has no public API returning the envelope of an operation together with its HTTP headers and the address of the
+service, so the private SoapBinding._create and ServiceProxy._binding_options of zeep 4 are used. The version of zeep
+and these attributes are checked before every request, so a zeep release changing them fails with an error naming the
+supported versions instead of an AttributeError or a malformed request halfway a call.
+
+Functions:
+    create_request(client, operation, kwargs) -> tuple: Create the envelope, HTTP headers and address of a call.
+    post_stream(client, address, message, headers) -> ContextManager: Send a request without reading the response.
+    iter_body(response, chunk_size) -> Iterable[bytes]: Iterate over the body of a response in chunks.
+    stream_operation(client, operation, kwargs, chunk_size) -> ContextManager: Call an operation, streaming the response.
+"""
+
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+import requests
+import zeep
+from lxml import etree
+from zeep import Client, Transport
+from zeep.wsdl.utils import etree_to_string
+
+from .payload_size import get_resource, record_payload
+from .tracing import mark_phase
+
+CHUNK_SIZE = 64 * 1024
+SUPPORTED_ZEEP = "zeep>=4.2.1,<5"
+ZEEP_MAJOR_VERSION = zeep.__version__.split(".", 1)[0]
+
+
+def _check_zeep(service) -> None:
+    """Raise an ImportError when the private API of zeep used to create requests may have changed."""
+    binding, options = getattr(service, "_binding", None), getattr(service, "_binding_options", None)
+    if ZEEP_MAJOR_VERSION != "4" or not hasattr(binding, "_create") or not isinstance(options, dict):
+        raise ImportError(f"zeep {zeep.__version__} is not supported for streamed requests, install {SUPPORTED_ZEEP}")
+
+
+def create_request(client: Client, operation: str, kwargs: dict) -> tuple[etree._Element, dict, str]:
+    """
+    Create the request of a call as zeep does, with the egress plugins and the extra HTTP headers of the client applied.
+
+    Args:
+        client (Client): The zeep client of the service.
+        operation (str): The name of the operation.
+        kwargs (dict): The arguments of the operation, including _soapheaders.
+
+    Returns:
+        tuple[etree._Element, dict, str]: The envelope, the HTTP headers and the address of the service.
+    """
+    # pylint: disable=protected-access
+    service = client.service
+    _check_zeep(service)
+    options = service._binding_options
+    envelope, http_headers = service._binding._create(operation, (), kwargs, client=client, options=options)
+    return envelope, http_headers, options["address"]
+
+
+@contextmanager
+def post_stream(client: Client, address: str, message, headers: dict) -> Iterator[requests.Response]:
+    """
+    Send a request without reading the body of the response, which is read while it is iterated. The connection is
+    released when the block ends, also when the body was not read completely.
+
+    Transports overriding post, e.g. the cassettes of nmbrs.testing, receive the request through post as usual, their
+    response is read as a whole.
+
+    Args:
+        client (Client): The zeep client of the service.
+        address (str): The address of the service.
+        message (bytes | Iterable[bytes]): The body of the request.
+        headers (dict): The HTTP headers.
+
+    Yields:
+        requests.Response: The response.
+    """
+    transport = client.transport
+    if isinstance(transport, Transport) and type(transport).post is Transport.post:
+        response = transport.session.post(address, data=message, headers=headers, timeout=transport.operation_timeout, stream=True)
+    else:
+        response = transport.post(address, message, headers)
+    try:
+        yield response
+    finally:
+        # Responses created without a connection have nothing to release
+        if response.raw is not None:
+            response.close()
+
+
+def iter_body(response: requests.Response, chunk_size: int) -> Iterable[bytes]:
+    """
+    Iterate over the body of a response in chunks, also for responses created without a connection.
+
+    Args:
+        response (requests.Response): The response.
+        chunk_size (int): The number of bytes per chunk.
+
+    Returns:
+        Iterable[bytes]: The chunks of the body.
+    """
+    if response.raw is None:
+        return (response.content,)
+    return response.iter_content(chunk_size)
+
+
+@contextmanager
+def stream_operation(client: Client, operation: str, kwargs: dict, chunk_size: int = CHUNK_SIZE) -> Iterator[Iterable[bytes]]:
+    """
+    Call an operation and iterate over the chunks of the body of its response, SOAP faults are raised by zeep.
+
+    Like the instrumented operations (see nmbrs.utils.tracing), the phases of the call are marked in the current span,
+    and the sizes of the request and of the bytes read from the response are recorded with record_payload when the
+    block ends. The streamed response is read within the HTTP phase.
+
+    Args:
+        client (Client): The zeep client of the service.
+        operation (str): The name of the operation.
+        kwargs (dict): The arguments of the operation, including _soapheaders.
+        chunk_size (int, optional): The number of bytes per chunk. Defaults to 64 KiB.
+
+    Yields:
+        Iterable[bytes]: The chunks of the body of the response.
+    """
+    mark_phase("serialize_request")
+    envelope, http_headers, address = create_request(client, operation, kwargs)
+    message = etree_to_string(envelope)
+    resource, header = get_resource(address, operation), kwargs.get("_soapheaders")
+    mark_phase("http")
+    with post_stream(client, address, message, http_headers) as response:
+        if response.status_code != 200:
+            record_payload(resource, header, message, response)
+            binding = client.service._binding  # pylint: disable=protected-access
+            binding.process_reply(client, binding.get(operation), response)
+        received = 0
+
+        def count(chunks: Iterable[bytes]) -> Iterator[bytes]:
+            nonlocal received
+            for chunk in chunks:
+                received += len(chunk)
+                yield chunk
+
+        try:
+            yield count(iter_body(response, chunk_size))
+        finally:
+            record_payload(resource, header, message, response, received)
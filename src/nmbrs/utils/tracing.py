@@ -0,0 +1,372 @@
+"""
+This module traces the calls of the Nmbrs SOAP operations, with the time spent in each phase of a call.
+
+Every operation decorated with nmbrs_exception_handler opens a span while a tracer is set, with the resource and the
+tenant (the domain of the authentication header, else the username) as attributes. The clients of the services are
+instrumented with instrument_client, which splits a span in the phases:
+
+    serialize_request: From the start of the call until the SOAP envelope is built.
+    http: Sending the request and receiving the response, including parsing the response into an XML tree.
+    parse_response: Converting the XML tree to the zeep objects of the operation.
+    build_objects: Converting the zeep objects to the data classes of the SDK, until the call returns.
+
+A call making several requests, e.g. a paginated endpoint, passes through the phases once per request. The default
+tracer records nothing, so no span is opened until a tracer is set with set_tracer.
+
+The instrumented operations send the requests themselves, instead of zeep, to keep the serialized envelope and the
+response for record_payload. The sizes are recorded by default (see nmbrs.utils.metrics), which costs measuring the
+envelope and reading the size of the response on every call, whether or not a tracer is set. When no span is open and
+the payload sizes are not recorded (metrics.enabled is False and DEBUG logging is off), the call is sent by zeep as
+for a client that is not instrumented, unless a subclass creates the request itself.
+
+Classes:
+    Span: A traced call of a SOAP operation.
+    Tracer: The default tracer, recording nothing.
+    InMemoryTracer: A tracer keeping the finished spans in memory, e.g. for tests.
+    OpenTelemetryTracer: A tracer exporting the spans to OpenTelemetry, with a child span per phase.
+    TracingPlugin: A zeep plugin marking the start and end of the HTTP phase.
+    InstrumentedOperationProxy: An operation of a zeep client recording its payload sizes and marking its phases.
+
+Functions:
+    set_tracer(tracer) -> None: Set the tracer of all services.
+    get_tracer() -> Tracer: Get the tracer of all services.
+    start_span(resource, owner) -> Span | None: Open a span for a call, when a tracer is set.
+    end_span(span, error) -> None: Close a span and pass it to the tracer.
+    mark_phase(phase) -> None: Start a phase of the current span, when a span is open.
+    instrument_client(client) -> Client: Record the payload sizes and mark the phases of the calls of a zeep client.
+
+Dependencies:
+    opentelemetry-api (optional): Needed for OpenTelemetryTracer, install with `pip install nmbrs[opentelemetry]`.
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Callable
+
+from zeep import Client, Plugin
+from zeep.proxy import OperationProxy
+from zeep.wsdl.utils import etree_to_string
+
+from .payload_size import get_resource, is_recording, record_payload
+from ..auth.token_manager import get_tenant
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover
+    otel_trace = None
+
+PHASES = ("serialize_request", "http", "parse_response", "build_objects")
+
+_current_span: ContextVar["Span | None"] = ContextVar("nmbrs_current_span", default=None)
+
+
+class Span:
+    """
+    A traced call of a SOAP operation, with the intervals spent in each phase.
+
+    Attributes:
+        name (str): The resource of the call, e.g. "EmployeeService:Absence_GetList".
+        attributes (dict): The attributes, "nmbrs.resource" and "nmbrs.tenant" when the tenant is known.
+        start_time (int): The wall clock time the span started, in nanoseconds since the epoch.
+        start (float): The time.perf_counter value the span started.
+        end (float | None): The time.perf_counter value the span ended, None while the span is open.
+        intervals (list[tuple[str, float, float]]): The phase, start and end time.perf_counter value of each interval.
+        error (BaseException | None): The exception raised by the call.
+    """
+
+    __slots__ = ("name", "attributes", "start_time", "start", "end", "intervals", "error", "_phase", "_phase_start", "_token")
+
+    def __init__(self, name: str, attributes: dict | None = None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.start_time = time.time_ns()
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.intervals: list[tuple[str, float, float]] = []
+        self.error: BaseException | None = None
+        self._phase = PHASES[0]
+        self._phase_start = self.start
+        self._token: Token | None = None
+
+    def mark(self, phase: str) -> None:
+        """
+        End the current phase and start another one, marking the same phase again continues it.
+
+        Args:
+            phase (str): The phase that starts, one of PHASES.
+        """
+        if phase == self._phase:
+            return
+        now = time.perf_counter()
+        self.intervals.append((self._phase, self._phase_start, now))
+        self._phase = phase
+        self._phase_start = now
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """
+        End the current phase and the span.
+
+        Args:
+            error (BaseException, optional): The exception raised by the call.
+        """
+        self.end = time.perf_counter()
+        self.intervals.append((self._phase, self._phase_start, self.end))
+        self.error = error
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds, until now while the span is open."""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """The seconds spent in each phase, by phase."""
+        phases = dict.fromkeys(PHASES, 0.0)
+        for phase, start, end in self.intervals:
+            phases[phase] += end - start
+        return phases
+
+    def to_dict(self) -> dict:
+        """Convert the span to a dictionary."""
+        return {
+            "name": self.name,
+            "attributes": dict(self.attributes),
+            "duration": self.duration,
+            "phases": self.phases,
+            "error": type(self.error).__name__ if self.error is not None else None,
+        }
+
+
+class Tracer:
+    """The default tracer, recording nothing. Tracers export the finished spans, by overriding export."""
+
+    enabled = False
+
+    def export(self, span: Span) -> None:
+        """
+        Export a finished span.
+
+        Args:
+            span (Span): The span.
+        """
+
+
+class InMemoryTracer(Tracer):
+    """A tracer keeping the finished spans in memory, in the order they finished, e.g. for tests."""
+
+    enabled = True
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        """Remove the finished spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    A tracer exporting the spans to OpenTelemetry, as a span per call with a child span per phase interval.
+
+    The spans are created when the call finished, as children of the OpenTelemetry span that is current at that time.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer_provider=None, name: str = "nmbrs"):
+        """
+        Constructor method for OpenTelemetryTracer class.
+
+        Args:
+            tracer_provider (opentelemetry.trace.TracerProvider, optional): The tracer provider. Defaults to the global
+                tracer provider.
+            name (str, optional): The name of the instrumentation scope. Defaults to "nmbrs".
+        """
+        if otel_trace is None:  # pragma: no cover
+            raise ImportError("OpenTelemetry is required for this functionality, install it with: pip install nmbrs[opentelemetry]")
+        self._tracer = otel_trace.get_tracer(name, tracer_provider=tracer_provider)
+
+    def export(self, span: Span) -> None:
+        def to_ns(perf_counter: float) -> int:
+            return span.start_time + int((perf_counter - span.start) * 1e9)
+
+        otel_span = self._tracer.start_span(span.name, start_time=span.start_time, attributes=span.attributes)
+        context = otel_trace.set_span_in_context(otel_span)
+        for phase, start, end in span.intervals:
+            self._tracer.start_span(phase, context=context, start_time=to_ns(start)).end(end_time=to_ns(end))
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, type(span.error).__name__))
+        otel_span.end(end_time=to_ns(span.end))
+
+
+_tracer = Tracer()
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """
+    Set the tracer of all services.
+
+    Args:
+        tracer (Tracer | None): The tracer, None restores the default tracer recording nothing.
+    """
+    global _tracer  # pylint: disable=global-statement
+    _tracer = tracer if tracer is not None else Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the tracer of all services.
+
+    Returns:
+        Tracer: The tracer.
+    """
+    return _tracer
+
+
+def start_span(resource: str, owner=None) -> Span | None:
+    """
+    Open a span for a call and make it the current span of the thread, when a tracer is set.
+
+    Args:
+        resource (str): The resource of the call, e.g. "EmployeeService:Absence_GetList".
+        owner (optional): The service making the call, its authentication header determines the tenant.
+
+    Returns:
+        Span | None: The span, None when the tracer records nothing.
+    """
+    if not _tracer.enabled:
+        return None
+    attributes = {"nmbrs.resource": resource}
+    tenant = get_tenant(getattr(getattr(owner, "auth_manager", None), "header", None))
+    if tenant:
+        attributes["nmbrs.tenant"] = tenant
+    span = Span(resource, attributes)
+    span._token = _current_span.set(span)  # pylint: disable=protected-access
+    return span
+
+
+def end_span(span: Span, error: BaseException | None = None) -> None:
+    """
+    Close a span, restore the span that was current before it and pass it to the tracer.
+
+    Args:
+        span (Span): The span returned by start_span.
+        error (BaseException, optional): The exception raised by the call.
+    """
+    span.finish(error)
+    _current_span.reset(span._token)  # pylint: disable=protected-access
+    _tracer.export(span)
+
+
+def mark_phase(phase: str) -> None:
+    """
+    End the current phase of the current span and start another one, when a span is open.
+
+    Args:
+        phase (str): The phase that starts, one of PHASES.
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.mark(phase)
+
+
+class TracingPlugin(Plugin):
+    """A zeep plugin marking the start and end of the HTTP phase of the current span."""
+
+    def egress(self, envelope, http_headers, operation, binding_options):
+        mark_phase("http")
+        return envelope, http_headers
+
+    def ingress(self, envelope, http_headers, operation):
+        mark_phase("parse_response")
+        return envelope, http_headers
+
+
+class InstrumentedOperationProxy(OperationProxy):
+    """
+    An operation of a zeep client recording the sizes of its requests and responses, and marking the start of the
+    request and the end of parsing the response in the current span.
+
+    The request is sent as zeep sends it, but the serialized envelope and the response of the transport are kept to
+    measure their sizes. When nothing is measured (no span is open and record_payload records nothing), the call is
+    sent by zeep itself. Subclasses may create the requests of the calls they support without zeep, by overriding
+    create_message, their calls are always sent by the proxy.
+    """
+
+    def __init__(self, service_proxy, operation_name: str, resource: str):
+        super().__init__(service_proxy, operation_name)
+        self._resource = resource
+
+    def create_message(self, args: tuple, kwargs: dict) -> tuple[bytes, dict, Callable | None]:
+        """
+        Create the request of a call, with zeep.
+
+        Args:
+            args (tuple): The positional arguments of the call.
+            kwargs (dict): The keyword arguments of the call, with the merged _soapheaders.
+
+        Returns:
+            tuple[bytes, dict, Callable | None]: The serialized envelope, the HTTP headers, and the function converting
+                the response to the result of the call, None to convert it with zeep.
+        """
+        # pylint: disable=protected-access
+        client = self._proxy._client
+        options = self._proxy._binding_options
+        envelope, http_headers = self._proxy._binding._create(self._op_name, args, kwargs, client=client, options=options)
+        return etree_to_string(envelope), http_headers, None
+
+    def __call__(self, *args, **kwargs):
+        # pylint: disable=protected-access
+        if _current_span.get() is None and not is_recording() and type(self).create_message is InstrumentedOperationProxy.create_message:
+            # Nothing is measured, the call is sent by zeep
+            return super().__call__(*args, **kwargs)
+        mark_phase("serialize_request")
+        soap_headers = self._merge_soap_headers(kwargs.get("_soapheaders"))
+        if soap_headers:
+            kwargs["_soapheaders"] = soap_headers
+
+        client = self._proxy._client
+        binding = self._proxy._binding
+        message, http_headers, process_response = self.create_message(args, kwargs)
+        mark_phase("http")
+        response = client.transport.post(self._proxy._binding_options["address"], message, http_headers)
+        record_payload(self._resource, soap_headers, message, response)
+        if client.settings.raw_response:
+            return response
+        if process_response is not None:
+            result = process_response(response)
+        else:
+            result = binding.process_reply(client, binding.get(self._op_name), response)
+
+        mark_phase("build_objects")
+        return result
+
+
+def instrument_client(client: Client, proxy_class: type[InstrumentedOperationProxy] = InstrumentedOperationProxy) -> Client:
+    """
+    Instrument the operations of a zeep client, recording the sizes of the requests and responses with record_payload
+    and marking the phases of the calls in the current span.
+
+    Args:
+        client (Client): The client.
+        proxy_class (type[InstrumentedOperationProxy], optional): The class of the instrumented operations. Defaults to
+            InstrumentedOperationProxy.
+
+    Returns:
+        Client: The same client, with the tracing plugin and instrumented operations of its default service.
+    """
+    client.plugins.append(TracingPlugin())
+    service = client.service
+    address = service._binding_options.get("address", "")  # pylint: disable=protected-access
+    service._operations = {  # pylint: disable=protected-access
+        name: proxy_class(service, name, get_resource(address, name)) for name in service._operations  # pylint: disable=protected-access
+    }
+    return client
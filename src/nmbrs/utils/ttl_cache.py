@@ -0,0 +1,89 @@
+"""This module provides a thread-safe cache whose entries expire after a fixed time."""
+
+import logging
+import threading
+from time import monotonic
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    A thread-safe cache whose entries expire after a fixed number of seconds.
+
+    When several threads request the same missing key at the same time, the value is computed once and the other threads
+    wait for the result. The expired entries are removed whenever a value is stored, so the cache only holds the entries
+    stored within the last ttl seconds.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Constructor method for TTLCache class.
+
+        Args:
+            ttl (float): Time (in seconds) an entry stays valid. A TTL of 0 or less disables caching.
+        """
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, any]] = {}
+        self._pending: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], any]) -> any:
+        """
+        Return the cached value of a key, computing and storing it when it is missing or expired.
+
+        Exceptions raised by compute are not cached, the next call computes the value again.
+
+        Args:
+            key (Hashable): The key of the value.
+            compute (Callable[[], any]): Function computing the value.
+
+        Returns:
+            any: The cached or computed value.
+        """
+        if self.ttl <= 0:
+            return compute()
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > monotonic():
+                    logger.debug("Cache hit for %s", key)
+                    return entry[1]
+                event = self._pending.get(key)
+                if event is None:
+                    event = self._pending[key] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                now = monotonic()
+                self._prune(now)
+                self._entries[key] = (now + self.ttl, value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            event.set()
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a single entry from the cache, if it exists."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def prune(self) -> None:
+        """Remove the expired entries from the cache."""
+        with self._lock:
+            self._prune(monotonic())
+
+    def _prune(self, now: float) -> None:
+        """Remove the entries expired at a time, the lock must be held."""
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
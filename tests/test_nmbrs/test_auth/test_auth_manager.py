@@ -2,7 +2,7 @@
 
 import unittest
 
-from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.auth.token_manager import AuthManager, get_tenant
 
 
 class TestAuthManager(unittest.TestCase):
@@ -44,3 +44,11 @@ class TestAuthManager(unittest.TestCase):
         domain = auth_manager.get_domain()
 
         self.assertEqual(domain, "")
+
+    def test_get_tenant(self):
+        """Test the tenant of the headers, unknown for the list form of zeep."""
+        self.assertEqual(get_tenant({"AuthHeaderWithDomain": {"Username": "user", "Token": "token", "Domain": "domain"}}), "domain")
+        self.assertEqual(get_tenant({"AuthHeader": {"Username": "user", "Token": "token"}}), "user")
+        self.assertIsNone(get_tenant(None))
+        self.assertIsNone(get_tenant([object()]))
+        self.assertIsNone(get_tenant({"AuthHeader": object()}))
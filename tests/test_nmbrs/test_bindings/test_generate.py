@@ -0,0 +1,160 @@
+"""Unit tests for the generator of the static bindings."""
+
+import os
+import tempfile
+import unittest
+
+from src.nmbrs.bindings.generate import generate_bindings, main, module_name
+from src.nmbrs.bindings.static import get_static_operation, load_bindings, unregister_bindings
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+SCHEMA = """
+<s:element name="AuthHeader"><s:complexType><s:sequence>
+    <s:element minOccurs="0" name="Username" type="s:string"/><s:element minOccurs="0" name="Token" type="s:string"/>
+</s:sequence></s:complexType></s:element>
+<s:complexType name="Item"><s:sequence>
+    <s:element name="Id" type="s:int"/>
+    <s:element minOccurs="0" name="Child" type="tns:Item"/>
+    <s:element minOccurs="0" name="Inline"><s:complexType><s:sequence><s:element name="Value" type="s:decimal"/></s:sequence></s:complexType></s:element>
+</s:sequence></s:complexType>
+<s:element name="Item_Get"><s:complexType><s:sequence>
+    <s:element name="Id" type="s:int"/><s:element minOccurs="0" name="Name" type="s:string"/>
+</s:sequence></s:complexType></s:element>
+<s:element name="Item_GetResponse"><s:complexType><s:sequence>
+    <s:element minOccurs="0" name="Item_GetResult" type="tns:Item"/>
+</s:sequence></s:complexType></s:element>
+<s:element name="Choice_Get"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Choice_GetResponse"><s:complexType><s:choice>
+    <s:element name="A" type="s:int"/><s:element name="B" type="s:int"/>
+</s:choice></s:complexType></s:element>
+<s:element name="Attribute_Get"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Attribute_GetResponse"><s:complexType>
+    <s:sequence><s:element name="A" type="s:int"/></s:sequence><s:attribute name="B" type="s:int"/>
+</s:complexType></s:element>
+<s:element name="List_Set"><s:complexType><s:sequence>
+    <s:element maxOccurs="unbounded" name="Id" type="s:int"/>
+</s:sequence></s:complexType></s:element>
+<s:element name="List_SetResponse"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Complex_Set"><s:complexType><s:sequence><s:element name="Item" type="tns:Item"/></s:sequence></s:complexType></s:element>
+<s:element name="Complex_SetResponse"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Header_Get"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Header_GetResponse"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Other_Get"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="Other_GetResponse"><s:complexType><s:sequence><s:element ref="o:Other"/></s:sequence></s:complexType></s:element>
+<s:element name="OtherBody_GetResponse"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="OtherHeader_Get"><s:complexType><s:sequence/></s:complexType></s:element>
+<s:element name="OtherHeader_GetResponse"><s:complexType><s:sequence/></s:complexType></s:element>
+"""
+
+OPERATIONS = (
+    "Item_Get",
+    "Choice_Get",
+    "Attribute_Get",
+    "List_Set",
+    "Complex_Set",
+    "Other_Get",
+    "Header_Get",
+    "OtherBody_Get",
+    "OtherHeader_Get",
+)
+
+
+def _wsdl() -> str:
+    """Create a WSDL with a supported operation, and operations whose types are not supported."""
+    messages, port_type, binding = [], [], []
+    for name in OPERATIONS:
+        # The response of Header_Get has a header, the body of OtherBody_Get and the header of OtherHeader_Get are in another namespace
+        header = f'<soap:header message="tns:{name}AuthHeader" part="AuthHeader" use="literal"/>'
+        output_header = header if name == "Header_Get" else ""
+        body = "o:Other" if name == "OtherBody_Get" else f"tns:{name}"
+        header_element = "o:Other" if name == "OtherHeader_Get" else "tns:AuthHeader"
+        messages.append(
+            f'<wsdl:message name="{name}SoapIn"><wsdl:part name="parameters" element="{body}"/></wsdl:message>'
+            f'<wsdl:message name="{name}SoapOut"><wsdl:part name="parameters" element="tns:{name}Response"/></wsdl:message>'
+            f'<wsdl:message name="{name}AuthHeader"><wsdl:part name="AuthHeader" element="{header_element}"/></wsdl:message>'
+        )
+        port_type.append(
+            f'<wsdl:operation name="{name}"><wsdl:input message="tns:{name}SoapIn"/>'
+            f'<wsdl:output message="tns:{name}SoapOut"/></wsdl:operation>'
+        )
+        binding.append(
+            f'<wsdl:operation name="{name}"><soap:operation soapAction="urn:test/{name}" style="document"/>'
+            f'<wsdl:input><soap:body use="literal"/>{header}</wsdl:input>'
+            f'<wsdl:output><soap:body use="literal"/>{output_header}</wsdl:output></wsdl:operation>'
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<wsdl:definitions xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" '
+        'xmlns:s="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:test" xmlns:o="urn:other" targetNamespace="urn:test"><wsdl:types>'
+        '<s:schema elementFormDefault="qualified" targetNamespace="urn:other"><s:element name="Other" type="s:string"/></s:schema>'
+        f'<s:schema elementFormDefault="qualified" targetNamespace="urn:test"><s:import namespace="urn:other"/>{SCHEMA}</s:schema>'
+        f'</wsdl:types>{"".join(messages)}<wsdl:portType name="TestServiceSoap">{"".join(port_type)}</wsdl:portType>'
+        '<wsdl:binding name="TestServiceSoap" type="tns:TestServiceSoap"><soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>'
+        f'{"".join(binding)}</wsdl:binding>'
+        '<wsdl:service name="TestService"><wsdl:port name="TestServiceSoap" binding="tns:TestServiceSoap">'
+        '<soap:address location="http://localhost/soap/v3/TestService.asmx"/></wsdl:port></wsdl:service></wsdl:definitions>'
+    )
+
+
+class TestGenerateBindings(unittest.TestCase):
+    """Unit tests for the generator of the static bindings."""
+
+    def setUp(self):
+        self.addCleanup(unregister_bindings)
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _generate(self) -> dict:
+        """Generate the bindings of the test WSDL, returning the globals of the module."""
+        path = os.path.join(self.directory, "test.wsdl")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(_wsdl())
+        module = {}
+        exec(generate_bindings(path), module)  # pylint: disable=exec-used
+        return module
+
+    def test_supported(self):
+        """Test that the supported operation is generated, with its parameters, headers and types."""
+        module = self._generate()
+        self.assertEqual(module["SERVICE"], "TestService")
+        self.assertEqual(module["NAMESPACE"], "urn:test")
+        self.assertEqual(module["HEADERS"], {"AuthHeader": ("Username", "Token")})
+        self.assertEqual(
+            module["OPERATIONS"]["Item_Get"],
+            {
+                "soap_action": "urn:test/Item_Get",
+                "params": (("Id", "xsd:int", True), ("Name", "xsd:string", False)),
+                "headers": ("AuthHeader",),
+                "response": "Item_GetResponse",
+            },
+        )
+        self.assertEqual(
+            module["TYPES"]["Item"],
+            (("Id", "xsd:int", False), ("Child", "Item", False), ("Inline", "Item.Inline", False)),
+        )
+        self.assertEqual(module["TYPES"]["Item.Inline"], (("Value", "xsd:decimal", False),))
+
+    def test_unsupported(self):
+        """Test that operations with unsupported types are left out, and listed in the docstring."""
+        module = self._generate()
+        self.assertEqual(list(module["OPERATIONS"]), ["Item_Get"])
+        for name in OPERATIONS[1:]:
+            self.assertIn(name, module["__doc__"])
+        self.assertNotIn("Choice_GetResponse", module["TYPES"])
+
+    def test_main(self):
+        """Test that the modules of the services are written and can be loaded."""
+        with FakeNmbrsServer(Dataset.generate(companies=1, employees=1)) as server:
+            main([f"{server.base_uri}CompanyService.asmx?WSDL", "--output-dir", self.directory])
+
+        path = os.path.join(self.directory, "company_service.py")
+        self.assertTrue(os.path.exists(path))
+        self.assertIsNone(get_static_operation("CompanyService:List_GetAll"))
+        load_bindings(path)
+        self.assertIsNotNone(get_static_operation("CompanyService:List_GetAll"))
+
+    def test_module_name(self):
+        """Test the names of the modules of the services."""
+        self.assertEqual(module_name("EmployeeService"), "employee_service")
+        self.assertEqual(module_name("SingleSignOnService"), "single_sign_on_service")
@@ -0,0 +1,213 @@
+"""Unit tests for the static bindings, against the fake server."""
+
+import unittest
+from datetime import date
+from types import ModuleType
+from unittest.mock import patch
+
+import requests
+from lxml import etree
+from zeep import Transport
+from zeep.helpers import serialize_object
+from zeep.plugins import HistoryPlugin
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.bindings.generate import generate_bindings
+from src.nmbrs.bindings.static import StaticBinding, StaticValue, get_static_operation, register_bindings, unregister_bindings
+from src.nmbrs.exceptions import UnauthorizedCompanyException
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.testing.operations import OPERATIONS
+from src.nmbrs.utils.tracing import InMemoryTracer, set_tracer
+
+SERVICES = ("DebtorService", "CompanyService", "EmployeeService", "ReportService")
+HEADER = {"AuthHeaderWithDomain": {"Username": "username", "Token": "token", "Domain": "fake"}}
+ARGUMENTS = {"int": 1, "string": "text", "boolean": True}
+SOAP = "http://schemas.xmlsoap.org/soap/envelope/"
+
+
+def _envelope(body: str) -> bytes:
+    return f'<soap:Envelope xmlns:soap="{SOAP}"><soap:Body>{body}</soap:Body></soap:Envelope>'.encode()
+
+
+class _FaultTransport(Transport):
+    """A transport answering every request with a fault, with status 200."""
+
+    def post(self, address, message, headers):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = _envelope(  # pylint: disable=protected-access
+            "<soap:Fault><faultcode>soap:Server</faultcode><faultstring>---> 2004: Unauthorized company</faultstring></soap:Fault>"
+        )
+        return response
+
+
+class TestStaticBindings(unittest.TestCase):
+    """Unit tests for the static bindings, against the fake server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeNmbrsServer(Dataset.generate(companies=2, employees=20)).start()
+        cls.modules = {}
+        for service in SERVICES:
+            module = ModuleType(service)
+            exec(generate_bindings(f"{cls.server.base_uri}{service}.asmx?WSDL"), module.__dict__)  # pylint: disable=exec-used
+            cls.modules[service] = module
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+        self.addCleanup(unregister_bindings)
+
+    def _register(self):
+        for module in self.modules.values():
+            register_bindings(module)
+
+    def _client(self, service: str):
+        return {"DebtorService": self.api.debtor, "CompanyService": self.api.company}.get(service, self.api.employee).client
+
+    def test_same_results(self):
+        """Test that the static bindings return the same values as zeep, for every operation of the fake server."""
+        for operation in OPERATIONS:
+            if operation.service == "ReportService" or not all(isinstance(type_, str) for type_ in operation.params.values()):
+                continue
+            with self.subTest(operation=operation.name):
+                service = self._client(operation.service).service
+                arguments = {param: ARGUMENTS[type_] for param, type_ in operation.params.items()}
+                unregister_bindings()
+                expected = serialize_object(service[operation.name](**arguments, _soapheaders=HEADER))
+                self._register()
+                self.assertIsNotNone(get_static_operation(f"{operation.service}:{operation.name}"))
+                self.assertEqual(serialize_object(service[operation.name](**arguments, _soapheaders=HEADER)), expected)
+
+    def test_data_classes(self):
+        """Test that the methods of the services construct the same data classes with the static bindings."""
+        expected = [vars(salary) for salary in self.api.employee.salary.get_all_by_company(1)]
+        self._register()
+        self.assertEqual([vars(salary) for salary in self.api.employee.salary.get_all_by_company(1)], expected)
+
+    def test_faults(self):
+        """Test that faults are raised as the exceptions of the SDK."""
+        self._register()
+        self.server.inject_fault("List_GetAll", code=2004, message="Unauthorized company")
+        with self.assertRaises(UnauthorizedCompanyException):
+            self.api.company.get_all()
+
+        api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri, transport=_FaultTransport())
+        with self.assertRaises(UnauthorizedCompanyException):
+            api.company.get_all()
+
+    def test_fallback(self):
+        """Test that calls the static bindings do not support are made with zeep."""
+        self._register()
+        static = get_static_operation("EmployeeService:WageComponentFixed_Get")
+        arguments = {"EmployeeId": 1, "Period": 1, "Year": 2024}
+        self.assertIsNotNone(static.render(arguments, HEADER))
+        self.assertIsNone(static.render({**arguments, "Unknown": 1}, HEADER))
+        self.assertIsNone(static.render({**arguments, "Year": None}, HEADER))
+        self.assertIsNone(static.render(arguments, {"OtherHeader": {"Username": "username"}}))
+        self.assertIsNone(static.render(arguments, {"AuthHeader": {"Unknown": "username"}}))
+        self.assertIsNotNone(static.render(arguments, None))
+
+        # Positional arguments are bound by zeep
+        service = self.api.employee.client.service
+        with patch.object(static, "render", side_effect=AssertionError):
+            self.assertTrue(service.WageComponentFixed_Get(1, 1, 2024, _soapheaders=HEADER))
+
+        history = HistoryPlugin()
+        self.api.company.client.plugins.append(history)
+        self.api.company.get_all()
+        self.assertIsNotNone(history.last_sent)
+
+    def test_other_wsdl(self):
+        """Test that bindings generated from a WSDL with other SOAP actions are not used."""
+        static = register_bindings(self.modules["CompanyService"]).operations["List_GetAll"]
+        static.soap_action = "urn:other/List_GetAll"
+        with patch.object(static, "render", side_effect=AssertionError):
+            self.assertEqual(len(self.api.company.get_all()), 2)
+
+    def test_span(self):
+        """Test that the phases of a call with a static binding are traced."""
+        self._register()
+        tracer = InMemoryTracer()
+        set_tracer(tracer)
+        self.addCleanup(set_tracer, None)
+        self.api.employee.salary.get_all_by_company(1)
+        phases = tracer.spans[-1].phases
+        self.assertTrue(all(phases[phase] > 0 for phase in ("serialize_request", "http", "parse_response", "build_objects")))
+
+    def test_unregister(self):
+        """Test that the bindings of a single service can be unregistered."""
+        self._register()
+        unregister_bindings("CompanyService")
+        self.assertIsNone(get_static_operation("CompanyService:List_GetAll"))
+        self.assertIsNotNone(get_static_operation("EmployeeService:Salary_GetAll_AllEmployeesByCompany"))
+
+
+class TestStaticBinding(unittest.TestCase):
+    """Unit tests for the parsing of responses by the static bindings."""
+
+    def setUp(self):
+        types = {
+            "Item": (("Id", "xsd:int", False), ("Date", "xsd:dateTime", False)),
+            "Single": (("Item", "Item", False),),
+            "Both_GetResponse": (("Count", "xsd:int", False), ("Total", "xsd:decimal", False)),
+            "None_GetResponse": (),
+            "Count_GetResponse": (("Count_GetResult", "xsd:int", False),),
+            "Single_GetResponse": (("Single_GetResult", "Single", False),),
+        }
+        operations = {
+            name: {"soap_action": f"urn:test/{name}", "params": (), "headers": (), "response": f"{name}Response"}
+            for name in ("Both_Get", "None_Get", "Count_Get", "Single_Get")
+        }
+        operations["Count_Get"]["params"] = (("Since", "xsd:dateTime", False),)
+        self.bindings = StaticBinding("TestService", "urn:test", {}, types, operations)
+
+    def _parse(self, operation: str, body: str):
+        return self.bindings.operations[operation].parse(self._doc(body))
+
+    @staticmethod
+    def _doc(body: str):
+        return etree.fromstring(_envelope(body))
+
+    def test_unwrap(self):
+        """Test that the results are unwrapped as zeep does."""
+        self.assertEqual(
+            self._parse("Both_Get", '<Both_GetResponse xmlns="urn:test"><Count>2</Count><Total/><Extra>1</Extra></Both_GetResponse>'),
+            {"Count": 2, "Total": None},
+        )
+        self.assertIsNone(self._parse("None_Get", '<None_GetResponse xmlns="urn:test"/>'))
+        self.assertIsNone(self._parse("Count_Get", ""))
+        self.assertEqual(
+            self._parse("Count_Get", '<Count_GetResponse xmlns="urn:test"><Count_GetResult>3</Count_GetResult></Count_GetResponse>'), 3
+        )
+        item = self._parse(
+            "Single_Get",
+            '<Single_GetResponse xmlns="urn:test"><Single_GetResult><Item><Id>x</Id><Date>2024-01-01T00:00:00</Date></Item>'
+            "</Single_GetResult></Single_GetResponse>",
+        )
+        self.assertIsNone(item.Id)
+        self.assertEqual(item.Date.year, 2024)
+        self.assertIsNone(self._parse("Single_Get", '<Single_GetResponse xmlns="urn:test"/>'))
+
+    def test_render(self):
+        """Test that optional parameters without a value are left out, and values of the wrong type are rendered by zeep."""
+        operation = self.bindings.operations["Count_Get"]
+        self.assertIn(b"<ns0:Since>2024-01-01</ns0:Since>", operation.render({"Since": date(2024, 1, 1)}, None))
+        self.assertNotIn(b"Since", operation.render({"Since": None}, None))
+        self.assertIsNone(operation.render({"Since": object()}, None))
+
+    def test_static_value(self):
+        """Test that the fields of a static value can be read as attributes."""
+        value = StaticValue(Id=1)
+        self.assertEqual(value.Id, 1)
+        with self.assertRaises(AttributeError):
+            value.Name  # pylint: disable=pointless-statement
+
+    def test_has_fault(self):
+        """Test that faults are recognized."""
+        operation = self.bindings.operations["Count_Get"]
+        self.assertTrue(operation.has_fault(self._doc("<soap:Fault/>")))
+        self.assertFalse(operation.has_fault(self._doc("")))
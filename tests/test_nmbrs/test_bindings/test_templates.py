@@ -0,0 +1,115 @@
+"""Unit tests for the request templates, against the fake server."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from lxml import etree
+from zeep.plugins import HistoryPlugin
+from zeep.wsdl.utils import etree_to_string
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.bindings.templates import request_template, use_request_templates
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.testing.operations import OPERATIONS
+
+HEADER = {"AuthHeaderWithDomain": {"Username": "username", "Token": "token", "Domain": "fake"}}
+ARGUMENTS = {"int": 1, "string": "text & <more>", "boolean": True}
+
+
+def _canonical(message: bytes) -> bytes:
+    return etree.tostring(etree.fromstring(message), method="c14n")
+
+
+class TestRequestTemplates(unittest.TestCase):
+    """Unit tests for the request templates, against the fake server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeNmbrsServer(Dataset.generate(companies=1, employees=5, seed=1)).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+
+    def _client(self, service: str):
+        services = {"DebtorService": self.api.debtor, "CompanyService": self.api.company, "ReportService": self.api.report}
+        return services.get(service, self.api.employee).client
+
+    def test_same_requests(self):
+        """Test that the templates render the same envelopes as zeep, for every operation of the fake server."""
+        for operation in OPERATIONS:
+            with self.subTest(operation=operation.name):
+                client = self._client(operation.service)
+                binding = client.service._binding  # pylint: disable=protected-access
+                template = request_template(binding.get(operation.name))
+                if not all(isinstance(type_, str) for type_ in operation.params.values()):
+                    self.assertIsNone(template)
+                    continue
+                arguments = {param: ARGUMENTS[type_] for param, type_ in operation.params.items()}
+                envelope, http_headers = binding._create(  # pylint: disable=protected-access
+                    operation.name, (), {**arguments, "_soapheaders": HEADER}, client=client
+                )
+                self.assertEqual(_canonical(template.render(arguments, HEADER)), _canonical(etree_to_string(envelope)))
+                self.assertEqual(template.http_headers, http_headers)
+
+    def test_cached(self):
+        """Test that the template of an operation is built once, and used instead of zeep to create the requests."""
+        use_request_templates(self.api.employee.schedule)
+        employee_id = self.server.dataset.employees(1)[0]["Id"]
+        expected = vars(self.api.employee.schedule.get_current(employee_id))
+        self.api.employee.absence.get_current(employee_id)
+        binding = self.api.employee.client.service._binding  # pylint: disable=protected-access
+        with patch("src.nmbrs.bindings.proxy.request_template") as template, patch.object(binding, "_create", side_effect=AssertionError):
+            self.assertEqual(vars(self.api.employee.schedule.get_current(employee_id)), expected)
+            self.api.employee.absence.get_current(employee_id)
+        template.assert_not_called()
+
+    def test_disabled(self):
+        """Test that the templates are only used by the clients they are enabled for."""
+        binding = self.api.company.client.service._binding  # pylint: disable=protected-access
+        with patch.object(binding, "_create", wraps=binding._create) as create:  # pylint: disable=protected-access
+            self.api.company.get_all()
+            use_request_templates(self.api.company)
+            self.api.company.get_all()
+            use_request_templates(self.api.company, False)
+            self.api.company.get_all()
+        self.assertEqual(create.call_count, 2)
+
+    def test_fallback(self):
+        """Test that calls the templates do not support are made with zeep."""
+        use_request_templates(self.api.employee)
+        use_request_templates(self.api.company)
+        service = self.api.employee.client.service
+        self.assertTrue(service.WageComponentFixed_Get(1, 1, 2024, _soapheaders=HEADER))
+        self.assertIsNone(service.DaysFixed_Set_Batch(EmployeesDaysWorked=None, UnprotectedMode=False, _soapheaders=HEADER))
+
+        history = HistoryPlugin()
+        self.api.company.client.plugins.append(history)
+        self.api.company.get_all()
+        self.assertIsNotNone(history.last_sent)
+
+        self.assertIsNone(request_template(Mock(binding=None)))
+
+    def test_soap_headers_list(self):
+        """Test that authentication headers in the list form of zeep are rendered by zeep."""
+        binding = self.api.company.client.service._binding  # pylint: disable=protected-access
+        template = request_template(binding.get("List_GetAll"))
+        header = dict(binding.get("List_GetAll").input.header.type.elements)["AuthHeaderWithDomain"]
+        soap_headers = [header(**HEADER["AuthHeaderWithDomain"])]
+        self.assertIsNone(template.render({}, soap_headers))
+
+        use_request_templates(self.api.company)
+        companies = self.api.company.client.service.List_GetAll(_soapheaders=soap_headers)
+        self.assertEqual(len(companies), 1)
+
+    def test_extra_http_headers(self):
+        """Test that the extra HTTP headers of the settings of the client are sent."""
+        use_request_templates(self.api.company)
+        client = self.api.company.client
+        client.settings.extra_http_headers = {"X-Request-Id": "1"}
+        with patch.object(client.transport, "post", wraps=client.transport.post) as post:
+            self.api.company.get_all()
+        self.assertEqual(post.call_args.args[2]["X-Request-Id"], "1")
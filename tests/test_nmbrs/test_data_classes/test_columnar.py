@@ -0,0 +1,102 @@
+"""Unit tests for the columnar module."""
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.nmbrs.data_classes.columnar import to_columns, to_structured_array
+from src.nmbrs.data_classes.employee import Absence, HourComponent, Salary
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestColumnar(unittest.TestCase):
+    """Unit tests for the columnar module."""
+
+    def setUp(self):
+        self.hour_components = [
+            HourComponent(employee_id=1, data={"Id": 10, "HourCode": 1, "Hours": Decimal("8.25")}),
+            HourComponent(employee_id=2, data={"Id": 11, "HourCode": 1, "Hours": Decimal("4.125")}),
+            HourComponent(employee_id=3, data={"Id": None, "HourCode": 2, "Hours": None}),
+        ]
+        self.salaries = [
+            Salary(employee_id=1, data={"ID": 1, "Value": Decimal("3000.50"), "StartDate": datetime(2024, 1, 1)}),
+            Salary(employee_id=2, data={"ID": 2, "Value": Decimal("2500.00"), "StartDate": None}),
+        ]
+
+    def test_to_columns(self):
+        """Test converting objects to a dictionary of lists."""
+        columns = to_columns(self.hour_components)
+        self.assertEqual(list(columns), ["employee_id", "id", "hour_code", "hours"])
+        self.assertEqual(columns["employee_id"], [1, 2, 3])
+        self.assertEqual(columns["hours"], [Decimal("8.25"), Decimal("4.125"), None])
+
+    def test_to_columns_decimal_modes(self):
+        """Test converting Decimal values to floats and cents."""
+        self.assertEqual(to_columns(self.hour_components, decimal="float")["hours"], [8.25, 4.125, None])
+        self.assertEqual(to_columns(self.hour_components, decimal="cents")["hours"], [825, 413, None])
+
+    def test_to_columns_unknown_decimal_mode(self):
+        """Test an unknown decimal mode raises an exception."""
+        with self.assertRaises(ValueError):
+            to_columns(self.hour_components, decimal="double")
+
+    def test_to_columns_nested(self):
+        """Test nested DataClass objects are flattened."""
+        absences = [Absence(employee_id=1, data={"AbsenceId": 1, "AbsenceCause": {"CauseId": 5, "Cause": "Flu"}})]
+        columns = to_columns(absences)
+        self.assertEqual(columns["cause.id"], [5])
+        self.assertEqual(columns["cause.cause"], ["Flu"])
+
+    def test_to_columns_empty(self):
+        """Test converting an empty list."""
+        self.assertEqual(to_columns([]), {})
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_columns_numpy(self):
+        """Test converting objects to NumPy arrays."""
+        columns = to_columns(self.hour_components, use_numpy=True, decimal="float")
+        self.assertEqual(columns["employee_id"].dtype, np.int64)
+        self.assertEqual(columns["hours"].dtype, np.float64)
+        self.assertEqual(np.nansum(columns["hours"]), 12.375)
+        self.assertTrue(np.ma.isMaskedArray(columns["id"]))
+        self.assertEqual(columns["id"].sum(), 21)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_columns_numpy_cents_and_datetime(self):
+        """Test converting Decimal values to int64 cents and datetime values to datetime64."""
+        columns = to_columns(self.salaries, use_numpy=True, decimal="cents")
+        self.assertEqual(columns["value"].dtype, np.int64)
+        self.assertEqual(columns["value"].sum(), 550050)
+        self.assertEqual(columns["start_date"].dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(columns["start_date"][0], np.datetime64("2024-01-01"))
+        self.assertTrue(np.isnat(columns["start_date"][1]))
+        self.assertEqual(columns["table_code"].dtype, object)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_structured_array(self):
+        """Test converting objects to a NumPy structured array."""
+        array = to_structured_array(self.hour_components)
+        self.assertEqual(array.shape, (3,))
+        self.assertEqual(array.dtype.names, ("employee_id", "id", "hour_code", "hours"))
+        self.assertEqual(array["hour_code"].sum(), 4)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_to_columns_numpy_kinds(self):
+        """Test bool, float, date and timezone aware datetime values are converted to typed arrays."""
+        components = [
+            HourComponent(employee_id=1, data={"Id": True, "HourCode": date(2024, 1, 1), "Hours": 1.5, "Comment": "a"}),
+            HourComponent(employee_id=2, data={"Id": False, "HourCode": None, "Hours": 2, "Comment": None}),
+        ]
+        columns = to_columns(components, use_numpy=True)
+        self.assertEqual(columns["id"].dtype, np.bool_)
+        self.assertEqual(columns["hours"].dtype, np.float64)
+        self.assertEqual(columns["hour_code"].dtype, np.dtype("datetime64[D]"))
+        self.assertTrue(np.isnat(columns["hour_code"][1]))
+
+        start = datetime(2024, 1, 1, 10, tzinfo=timezone(timedelta(hours=1)))
+        columns = to_columns([Salary(employee_id=1, data={"StartDate": start})], use_numpy=True)
+        self.assertEqual(columns["start_date"][0], np.datetime64("2024-01-01T09:00"))
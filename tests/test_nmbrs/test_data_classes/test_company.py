@@ -1,6 +1,7 @@
 """Unit tests for the Company level data classes."""
 
 import unittest
+from unittest.mock import patch
 
 from src.nmbrs.data_classes.company import WageTaxXML, PensionXML
 
@@ -21,3 +22,34 @@ class TestCompanyClasses(unittest.TestCase):
         pension_xml = PensionXML(xml_data)
         expected_result = {"root": {"name": "John", "age": "30"}}
         self.assertEqual(pension_xml.to_dict(), expected_result)
+
+    def test_wage_tax_xml_parsed_once(self):
+        """Test the XML of the WageTaxXML class is only parsed once."""
+        wage_tax_xml = WageTaxXML("<root><name>John</name></root>")
+        with patch("src.nmbrs.data_classes.xml_data_class.parse_xml_to_dict", return_value={"root": None}) as mock_parse:
+            wage_tax_xml.to_dict()
+            wage_tax_xml.to_dict()
+            self.assertTrue(wage_tax_xml == WageTaxXML("<root />"))
+        self.assertEqual(mock_parse.call_count, 2)
+        self.assertEqual(len(wage_tax_xml), 1)
+
+    def test_wage_tax_xml_release_xml(self):
+        """Test releasing the raw XML after parsing."""
+        wage_tax_xml = WageTaxXML("<root><NatPers><SofiNr>1</SofiNr></NatPers><NatPers><SofiNr>2</SofiNr></NatPers></root>")
+        parsed = wage_tax_xml.parse_xml(release_xml=True)
+        self.assertIsNone(wage_tax_xml.xml)
+        self.assertIs(wage_tax_xml.to_dict(), parsed)
+        self.assertEqual(list(wage_tax_xml.iter_records("NatPers")), [{"SofiNr": "1"}, {"SofiNr": "2"}])
+
+    def test_wage_tax_xml_assigned(self):
+        """Test the parsed document is discarded when another XML document is assigned."""
+        wage_tax_xml = WageTaxXML("<root><name>John</name></root>")
+        self.assertEqual(wage_tax_xml.to_dict(), {"root": {"name": "John"}})
+        wage_tax_xml.xml = "<root><name>Jane</name></root>"
+        self.assertEqual(wage_tax_xml.to_dict(), {"root": {"name": "Jane"}})
+        self.assertEqual(wage_tax_xml, WageTaxXML("<root><name>Jane</name></root>"))
+
+    def test_pension_xml_iter_records(self):
+        """Test iterating over the records of the PensionXML class."""
+        pension_xml = PensionXML("<root><Employee><Id>1</Id></Employee><Employee><Id>2</Id></Employee></root>")
+        self.assertEqual(list(pension_xml.iter_records("Employee")), [{"Id": "1"}, {"Id": "2"}])
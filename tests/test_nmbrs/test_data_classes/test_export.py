@@ -0,0 +1,98 @@
+"""Unit tests for the export module."""
+
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from src.nmbrs.data_classes.employee import Absence, HourComponent
+from src.nmbrs.data_classes.export import write_csv, write_jsonl
+
+
+class TestExport(unittest.TestCase):
+    """Unit tests for the export module."""
+
+    def setUp(self):
+        self.absences = [
+            Absence(
+                employee_id=1,
+                data={"AbsenceId": 1, "Percentage": 100, "Start": datetime(2024, 1, 1, 9), "AbsenceCause": {"CauseId": 2, "Cause": "Flu"}},
+            ),
+            Absence(employee_id=2, data={"AbsenceId": 2, "Percentage": 50, "Start": None, "AbsenceCause": {"CauseId": 3, "Cause": None}}),
+        ]
+        self.hour_components = [HourComponent(employee_id=1, data={"Id": 1, "HourCode": 5, "Hours": Decimal("7.5")})]
+
+    def test_write_jsonl(self):
+        """Test writing objects as JSON Lines to a stream."""
+        stream = io.StringIO()
+        count = write_jsonl(iter(self.absences), stream)
+        self.assertEqual(count, 2)
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines[0]["start"], "2024-01-01T09:00:00")
+        self.assertEqual(lines[0]["cause"], {"id": 2, "cause": "Flu"})
+        self.assertIsNone(lines[1]["start"])
+
+    def test_write_jsonl_decimal(self):
+        """Test Decimal values are written as numbers."""
+        stream = io.StringIO()
+        write_jsonl(self.hour_components, stream)
+        self.assertEqual(json.loads(stream.getvalue())["hours"], 7.5)
+
+    def test_write_csv(self):
+        """Test writing objects as CSV to a stream."""
+        stream = io.StringIO()
+        count = write_csv(self.absences, stream)
+        self.assertEqual(count, 2)
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        self.assertEqual(rows[0][:4], ["employee_id", "id", "comment", "percentage"])
+        self.assertIn("cause.cause", rows[0])
+        self.assertEqual(rows[1][rows[0].index("start")], "2024-01-01T09:00:00")
+        self.assertEqual(rows[2][rows[0].index("start")], "")
+
+    def test_write_csv_columns(self):
+        """Test writing only the selected columns."""
+        stream = io.StringIO()
+        with self.assertLogs("src.nmbrs.data_classes.export", level="WARNING"):
+            write_csv(self.hour_components, stream, columns=["hours", "employee_id"])
+        self.assertEqual(stream.getvalue().splitlines(), ["hours,employee_id", "7.5,1"])
+
+    def test_write_csv_empty(self):
+        """Test writing no objects."""
+        stream = io.StringIO()
+        self.assertEqual(write_csv([], stream), 0)
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_write_compressed_path(self):
+        """Test writing compressed output to a file path."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "absences.jsonl.gz")
+            write_jsonl(self.absences, path)
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                self.assertEqual(len(file.readlines()), 2)
+
+    def test_write_compressed_stream(self):
+        """Test writing compressed output to a binary stream."""
+        stream = io.BytesIO()
+        write_csv(self.hour_components, stream, compress=True)
+        self.assertFalse(stream.closed)
+        self.assertEqual(gzip.decompress(stream.getvalue()).decode("utf-8").splitlines()[1], "1,1,5,7.5")
+
+    def test_write_csv_path(self):
+        """Test writing uncompressed output to a file path, lists are written as JSON."""
+        components = [HourComponent(employee_id=1, data={"Id": 1, "HourCode": [1, 2], "Hours": None})]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hour_components.csv")
+            write_csv(components, path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read().splitlines()[1], '1,1,"[1,2]",')
+
+    def test_write_jsonl_unsupported_value(self):
+        """Test values that cannot be written as JSON raise an exception."""
+        components = [HourComponent(employee_id=1, data={"Id": object()})]
+        with self.assertRaises(TypeError):
+            write_jsonl(components, io.StringIO())
@@ -0,0 +1,87 @@
+"""Unit tests for the journal module."""
+
+import unittest
+from decimal import Decimal
+from itertools import chain
+
+from src.nmbrs.data_classes.journal import Journal, journal_totals
+
+JOURNAL_XML = """<?xml version="1.0" encoding="utf-8"?>
+<Journal>
+  <JournalEntry>
+    <LedgerAccount>4000</LedgerAccount><Description>Salary</Description><Debit>1000.00</Debit><Credit>0</Credit>
+    <CostCenter>A</CostCenter><Department>1</Department>
+  </JournalEntry>
+  <JournalEntry>
+    <LedgerAccount>4000</LedgerAccount><Description>Salary</Description><Debit>500,25</Debit>
+    <CostCenter>B</CostCenter><Department>1</Department>
+  </JournalEntry>
+  <JournalEntry>
+    <LedgerAccount>1600</LedgerAccount><Description>Net wages</Description><Credit>1500.25</Credit>
+    <CostCenter>A</CostCenter><Department>2</Department>
+  </JournalEntry>
+</Journal>"""
+
+
+class TestJournal(unittest.TestCase):
+    """Unit tests for the journal module."""
+
+    def setUp(self):
+        self.journal = Journal(company_id=1, run_id=2, xml=JOURNAL_XML)
+
+    def test_iter_entries(self):
+        """Test the entries are parsed into typed objects."""
+        entries = list(self.journal.iter_entries())
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(entries[0].ledger_account, "4000")
+        self.assertEqual(entries[0].debit, Decimal("1000.00"))
+        self.assertEqual(entries[1].debit, Decimal("500.25"))
+        self.assertEqual(entries[1].credit, Decimal(0))
+        self.assertEqual(entries[2].company_id, 1)
+        self.assertEqual(entries[2].run_id, 2)
+
+    def test_journal_totals(self):
+        """Test totalling the entries per ledger account."""
+        totals = journal_totals(self.journal.iter_entries())
+        self.assertEqual(totals["4000"].debit, Decimal("1500.25"))
+        self.assertEqual(totals["4000"].count, 2)
+        self.assertEqual(totals["1600"].balance, Decimal("-1500.25"))
+
+    def test_journal_totals_multiple_attributes(self):
+        """Test totalling the entries of several journals per company and cost center."""
+        other = Journal(company_id=3, run_id=4, xml=JOURNAL_XML)
+        totals = journal_totals(chain(self.journal.iter_entries(), other.iter_entries()), by=("company_id", "cost_center"))
+        self.assertEqual(set(totals), {(1, "A"), (1, "B"), (3, "A"), (3, "B")})
+        self.assertEqual(totals[(3, "A")].debit, Decimal("1000.00"))
+        self.assertEqual(totals[(3, "A")].credit, Decimal("1500.25"))
+
+    def test_invalid_amount(self):
+        """Test invalid amounts raise a ValueError instead of being totalled."""
+        for amount in ("n/a", "NaN", "1,2,3.4.5", "1,234", "12.34.5", "1.23,45"):
+            with self.subTest(amount=amount):
+                journal = Journal(company_id=1, run_id=2, xml=f"<Journal><JournalEntry><Debit>{amount}</Debit></JournalEntry></Journal>")
+                with self.assertRaises(ValueError):
+                    next(journal.iter_entries())
+
+    def test_amount_formats(self):
+        """Test amounts with a decimal comma or point, and with thousands separators."""
+        amounts = {
+            "1.234,56": "1234.56",
+            "1,234.56": "1234.56",
+            "12,5": "12.5",
+            "12.5": "12.5",
+            " 1 234,56 ": "1234.56",
+            "": "0",
+            # A single point is the decimal point of the API, repeated separators separate thousands
+            "1.234": "1.234",
+            "1.234.567": "1234567",
+            "-1,234,567.89": "-1234567.89",
+        }
+        for amount, expected in amounts.items():
+            with self.subTest(amount=amount):
+                journal = Journal(company_id=1, run_id=2, xml=f"<Journal><JournalEntry><Debit>{amount}</Debit></JournalEntry></Journal>")
+                self.assertEqual(next(journal.iter_entries()).debit, Decimal(expected))
+
+    def test_to_dict(self):
+        """Test the XML is converted to a dictionary."""
+        self.assertEqual(self.journal.to_dict()["xml"]["Journal"]["JournalEntry"][2]["LedgerAccount"], "1600")
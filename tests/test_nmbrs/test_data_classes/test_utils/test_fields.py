@@ -0,0 +1,29 @@
+"""Unit tests for the flatten and get_columns functions."""
+
+import unittest
+
+from src.nmbrs.data_classes.employee import Absence
+from src.nmbrs.data_classes.utils.fields import flatten, get_columns
+
+
+class TestFields(unittest.TestCase):
+    """Unit tests for the flatten and get_columns functions."""
+
+    def test_flatten(self):
+        """Test flattening a DataClass with a nested DataClass."""
+        absence = Absence(employee_id=1, data={"AbsenceId": 2, "AbsenceCause": {"CauseId": 3, "Cause": "Flu"}})
+        result = flatten(absence)
+        self.assertEqual(result["employee_id"], 1)
+        self.assertEqual(result["cause.id"], 3)
+        self.assertEqual(result["cause.cause"], "Flu")
+        self.assertNotIn("cause", result)
+
+    def test_flatten_separator(self):
+        """Test flattening a DataClass with a custom separator."""
+        absence = Absence(employee_id=1, data={"AbsenceCause": {"CauseId": 3, "Cause": "Flu"}})
+        self.assertIn("cause__id", flatten(absence, separator="__"))
+
+    def test_get_columns(self):
+        """Test retrieving the columns in order of first appearance."""
+        rows = [{"a": 1, "b": 2}, {"a": 1, "c": 3}]
+        self.assertEqual(get_columns(rows), ["a", "b", "c"])
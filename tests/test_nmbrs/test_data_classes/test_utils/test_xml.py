@@ -1,8 +1,12 @@
 """Unit tests for the  parse_xml_to_dict and get_xml functions."""
 
+import io
+import os
+import pathlib
+import tempfile
 import unittest
 
-from src.nmbrs.data_classes.utils.xml import parse_xml_to_dict, get_xml
+from src.nmbrs.data_classes.utils.xml import parse_xml_to_dict, get_xml, iter_xml_records, find_records
 
 
 class TestXMLParser(unittest.TestCase):
@@ -29,3 +33,41 @@ class TestXMLParser(unittest.TestCase):
         """Test retrieving XML data as a dictionary with invalid XML."""
         xml_string = "<root><name>John</name><age>30</age>"
         self.assertIsNone(get_xml(xml_string))
+
+    def test_iter_xml_records(self):
+        """Test yielding records from an XML string, matching xmltodict."""
+        xml_string = (
+            '<root xmlns="urn:test"><Header>1</Header>'
+            '<Record id="1"><Name>John</Name><Item>a</Item><Item>b</Item></Record>'
+            '<Record id="2">text</Record><Record /></root>'
+        )
+        expected_result = [
+            {"@id": "1", "Name": "John", "Item": ["a", "b"]},
+            {"@id": "2", "#text": "text"},
+            None,
+        ]
+        self.assertEqual(list(iter_xml_records(xml_string, "Record")), expected_result)
+
+    def test_iter_xml_records_stream(self):
+        """Test yielding records from a binary stream."""
+        stream = io.BytesIO(b"<root><Record><Id>1</Id></Record><Record><Id>2</Id></Record></root>")
+        self.assertEqual(list(iter_xml_records(stream, "Record")), [{"Id": "1"}, {"Id": "2"}])
+
+    def test_iter_xml_records_nested(self):
+        """Test records nested in a record are part of the outer record."""
+        xml_string = "<root><Record><Record>1</Record></Record></root>"
+        self.assertEqual(list(iter_xml_records(xml_string, "Record")), [{"Record": "1"}])
+
+    def test_find_records(self):
+        """Test finding records in a parsed document."""
+        data = {"ns:root": {"ns:Record": [{"Id": "1"}, {"Id": "2"}], "Other": {"ns:Record": {"Id": "3"}}}}
+        self.assertEqual(list(find_records(data, "Record")), [{"Id": "1"}, {"Id": "2"}, {"Id": "3"}])
+        self.assertEqual(list(find_records([{"Record": "1"}, {"Record": "2"}], "Record")), ["1", "2"])
+
+    def test_iter_xml_records_path(self):
+        """Test yielding records from a file path, repeated children are collected in one list."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory, "records.xml")
+            path.write_bytes(b"<root><Record><Item>a</Item><Item>b</Item><Item>c</Item></Record></root>")
+            self.assertEqual(list(iter_xml_records(path, "Record")), [{"Item": ["a", "b", "c"]}])
+            self.assertTrue(os.path.exists(path))
@@ -1,7 +1,8 @@
 """Unit tests for the Error class."""
 
+import pickle
 import unittest
-from src.nmbrs.exceptions import NmbrsBaseException
+from src.nmbrs.exceptions import NmbrsBaseException, NmbrsFault, NotFoundException, UnknownNmbrsException
 
 
 class TestError(unittest.TestCase):
@@ -12,3 +13,42 @@ class TestError(unittest.TestCase):
         error = NmbrsBaseException(1001, "test")
         self.assertEqual(error.error_code, 1001)
         self.assertEqual(error.resource, "test")
+        self.assertEqual(repr(error), f"NmbrsBaseException({error.message})")
+
+    def test_lazy_message(self):
+        """Test that the message is formatted when it is first read."""
+        error = NotFoundException("EmployeeService:Absence_GetList")
+        self.assertNotIn("message", vars(error))
+        self.assertEqual(
+            str(error),
+            "Error: Not Found\n"
+            "  Resource: EmployeeService:Absence_GetList\n"
+            "  Cause: Could not find the requested resource\n"
+            "  Solution: Input a valid resource, use a GET call to retrieve the data.\n",
+        )
+        self.assertIn("message", vars(error))
+
+    def test_unknown_error(self):
+        """Test the title, cause and solution of unknown errors."""
+        self.assertEqual(UnknownNmbrsException("test").error_code, 9999)
+        self.assertEqual(UnknownNmbrsException("test").title, "Unkown")
+        error = NmbrsBaseException(3001, "test")
+        self.assertEqual((error.title, error.cause), ("Unknown Nmbrs error", "Unknown"))
+        self.assertIn("Create a issue", error.solution)
+
+    def test_retryable(self):
+        """Test whether errors are retryable or client errors, from the fault or else the error code."""
+        self.assertTrue(NotFoundException("test").client_error)
+        self.assertFalse(NotFoundException("test").retryable)
+        self.assertTrue(UnknownNmbrsException("test").retryable)
+        self.assertFalse(UnknownNmbrsException("test").client_error)
+        self.assertTrue(NmbrsFault(1006).exception("test").retryable)
+
+    def test_pickle(self):
+        """Test that exceptions can be pickled, e.g. to return them from other processes."""
+        error = NmbrsFault(2046, "---> 2046: Not found").exception("test")
+        restored = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(restored, NotFoundException)
+        self.assertEqual(restored.resource, "test")
+        self.assertEqual(restored.fault.code, 2046)
+        self.assertEqual(str(restored), str(error))
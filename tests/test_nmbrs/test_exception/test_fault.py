@@ -0,0 +1,57 @@
+"""Unit tests for the NmbrsFault class."""
+
+import unittest
+
+import zeep.exceptions
+
+from src.nmbrs.exceptions import (
+    InvalidCredentialsException,
+    LoginSecurityFailureException,
+    NmbrsFault,
+    NotFoundException,
+    UnknownException,
+    UnknownNmbrsException,
+)
+
+
+class TestNmbrsFault(unittest.TestCase):
+    """Unit tests for the NmbrsFault class."""
+
+    def test_from_fault(self):
+        """Test that the error code is parsed from the fault string."""
+        detail = "Server was unable to process request. ---> 2046: Not found"
+        fault = NmbrsFault.from_fault(zeep.exceptions.Fault(detail))
+        self.assertEqual(fault.code, 2046)
+        self.assertEqual(fault.detail, detail)
+        self.assertTrue(fault.client_error)
+        self.assertFalse(fault.retryable)
+        self.assertEqual(repr(fault), f"NmbrsFault(code=2046, detail={detail!r})")
+
+        self.assertEqual(NmbrsFault.from_fault(zeep.exceptions.Fault("---> Invalid combination email/password")).code, 1000)
+        fault = NmbrsFault.from_fault(zeep.exceptions.Fault(None))
+        self.assertIsNone(fault.code)
+        self.assertEqual(fault.detail, "")
+        self.assertFalse(fault.client_error)
+
+    def test_retryable(self):
+        """Test that login security failures and unknown Nmbrs errors are retryable, and not client errors."""
+        for code in (1006, 9999):
+            self.assertTrue(NmbrsFault(code).retryable)
+            self.assertFalse(NmbrsFault(code).client_error)
+        self.assertFalse(NmbrsFault(3001).client_error)
+
+    def test_exception(self):
+        """Test that the exception of the code is created, with the fault."""
+        fault = NmbrsFault(2046, "---> 2046: Not found")
+        exception = fault.exception("EmployeeService:Absence_GetList")
+        self.assertIsInstance(exception, NotFoundException)
+        self.assertIs(exception.fault, fault)
+        self.assertEqual(exception.resource, "EmployeeService:Absence_GetList")
+        self.assertTrue(exception.client_error)
+        self.assertFalse(exception.retryable)
+
+        self.assertIsInstance(NmbrsFault(1000).exception("resource"), InvalidCredentialsException)
+        self.assertIsInstance(NmbrsFault(1006).exception("resource"), LoginSecurityFailureException)
+        self.assertIsInstance(NmbrsFault(9999).exception("resource"), UnknownNmbrsException)
+        self.assertIsInstance(NmbrsFault(3001).exception("resource"), UnknownException)
+        self.assertIsInstance(NmbrsFault(None).exception("resource"), UnknownException)
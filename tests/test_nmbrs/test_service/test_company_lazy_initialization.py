@@ -102,6 +102,7 @@ class TestCompanyService(unittest.TestCase):
         salary_documents = self.company_service.salary_documents
         self.assertIsInstance(salary_documents, CompanySalaryDocumentService)
         self.assertIsNotNone(self.company_service._salary_documents)
+        self.assertIs(salary_documents.run, self.company_service.run)
 
     def test_salary_table_lazy_initialization(self):
         """Test lazy initialization of the salary_table property."""
@@ -2,7 +2,7 @@
 
 import unittest
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.nmbrs.auth.token_manager import AuthManager
 from src.nmbrs.data_classes.company import (
@@ -178,6 +178,22 @@ class TestCompanyService(unittest.TestCase):
             _soapheaders=self.mock_auth_header,
         )
 
+    @patch("src.nmbrs.service.company_service.post_document")
+    def test_upload_file_from(self, mock_post_document):
+        """Test uploading a file for a company without reading it into memory."""
+        self.company_service.upload_file_from(123, "/tmp/report.pdf", "sub_folder")
+
+        mock_post_document.assert_called_once_with(
+            self.mock_client,
+            "FileExplorer_UploadFile",
+            "Body",
+            "/tmp/report.pdf",
+            CompanyId=123,
+            StrDocumentName="report.pdf",
+            StrDocumentSubFolder="sub_folder",
+            _soapheaders=self.mock_auth_header,
+        )
+
     def test_get_current_schedule(self):
         """Test retrieving the current schedules for a company."""
         company_id = 123
@@ -0,0 +1,73 @@
+"""Unit tests for the CompanyJournalService class."""
+
+import unittest
+from unittest.mock import Mock
+
+from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.data_classes.journal import Journal
+from src.nmbrs.service.microservices.company.journal import CompanyJournalService
+
+
+class TestCompanyJournalService(unittest.TestCase):
+    """Unit tests for the CompanyJournalService class."""
+
+    def setUp(self):
+        self.auth_manager = AuthManager()
+        self.auth_manager.set_auth_header("test_username", "test_token", "test_domain")
+        self.mock_auth_header = {
+            "AuthHeaderWithDomain": {
+                "Username": "test_username",
+                "Token": "test_token",
+                "Domain": "test_domain",
+            }
+        }
+        self.client = Mock()
+        self.journal_service = CompanyJournalService(self.auth_manager, self.client)
+        self.xml = "<Journal><JournalEntry><LedgerAccount>4000</LedgerAccount><Debit>100.50</Debit></JournalEntry></Journal>"
+
+    def test_get_run_by_company(self):
+        """Test retrieving the journal of a run, using the active year of the company."""
+        self.client.service.Journals_GetByRunCompany.return_value = self.xml
+        journal = self.journal_service.get_run_by_company(1, 2)
+        self.assertIsInstance(journal, Journal)
+        self.assertEqual(journal.xml, self.xml)
+        self.client.service.Journals_GetByRunCompany.assert_called_once_with(CompanyId=1, RunId=2, _soapheaders=self.mock_auth_header)
+
+    def test_get_run_by_cost_center_2(self):
+        """Test retrieving the journal of a run per cost center for a specific year."""
+        self.client.service.Journals_GetByRunCostCenter_v2.return_value = self.xml
+        journal = self.journal_service.get_run_by_cost_center_2(1, 2, 2024)
+        self.assertEqual(journal.run_id, 2)
+        self.client.service.Journals_GetByRunCostCenter_v2.assert_called_once_with(
+            CompanyId=1, RunId=2, Year=2024, _soapheaders=self.mock_auth_header
+        )
+
+    def test_get_run_by_cost_center_nad_cost_unit_per_year(self):
+        """Test retrieving the journal of a run with cost center and cost unit information for a specific year."""
+        self.client.service.Journals_GetByRunCostCenterCostUnitPerYear.return_value = self.xml
+        journal = self.journal_service.get_run_by_cost_center_nad_cost_unit_per_year(1, 2, 2024)
+        self.assertEqual([entry.ledger_account for entry in journal.iter_entries()], ["4000"])
+        self.client.service.Journals_GetByRunCostCenterCostUnitPerYear.assert_called_once_with(
+            CompanyId=1, RunId=2, Year=2024, _soapheaders=self.mock_auth_header
+        )
+
+    def test_get_run_endpoints(self):
+        """Test every journal endpoint calls its operation and wraps the result in a Journal."""
+        endpoints = {
+            "get_run_by_company_2": ("Journals_GetByRunCompany_v2", True),
+            "get_run_by_cost_center": ("Journals_GetByRunCostCenter", False),
+            "get_run_by_cost_center_nad_cost_unit": ("Journals_GetByRunCostCenterCostUnit", False),
+            "get_run_by_department": ("Journals_GetByRunDepartment", False),
+            "get_run_by_department_2": ("Journals_GetByRunDepartment_v2", True),
+            "get_run_by_employee": ("Journals_GetByRunEmployee", False),
+            "get_run_by_employee_2": ("Journals_GetByRunEmployee_v2", True),
+        }
+        for method, (operation, with_year) in endpoints.items():
+            with self.subTest(method=method):
+                getattr(self.client.service, operation).return_value = self.xml
+                args, kwargs = ((1, 2, 2024), {"Year": 2024}) if with_year else ((1, 2), {})
+                journal = getattr(self.journal_service, method)(*args)
+                self.assertEqual((journal.company_id, journal.run_id, journal.xml), (1, 2, self.xml))
+                getattr(self.client.service, operation).assert_called_once_with(
+                    CompanyId=1, RunId=2, **kwargs, _soapheaders=self.mock_auth_header
+                )
@@ -1,8 +1,10 @@
 """Unit tests for the CompanyPensionService class."""
 
+import os
+import tempfile
 import unittest
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.nmbrs.auth.token_manager import AuthManager
 from src.nmbrs.service.microservices.company.pension import CompanyPensionService, Pension, PensionXML
@@ -72,3 +74,66 @@ class TestCompanyPensionService(unittest.TestCase):
         self.client.service.PensionExport_GetXML.assert_called_once_with(
             CompanyId=1, PensionExportID=123, _soapheaders=self.mock_auth_header
         )
+
+    def test_export(self):
+        """Test storing the pension exports of several companies and years and reading their employee records."""
+
+        def export_list(CompanyId, intYear, _soapheaders):  # pylint: disable=invalid-name,unused-argument
+            return [{"PensionExportID": CompanyId * 100 + intYear % 100, "Period": 1, "Year": intYear}]
+
+        def export_xml(CompanyId, PensionExportID, _soapheaders):  # pylint: disable=invalid-name,unused-argument
+            employees = "".join(f"<Employee><Number>{PensionExportID}{number}</Number></Employee>" for number in (1, 2))
+            return f"<Export>{employees}</Export>"
+
+        self.client.service.PensionExport_GetList.side_effect = export_list
+        self.client.service.PensionExport_GetXML.side_effect = export_xml
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = self.pension_service.export([1, 2], [2023, 2024], directory, max_workers=4)
+            self.assertEqual(len(summary.harvested), 4)
+            self.assertTrue(os.path.exists(os.path.join(directory, "2", "224.xml.gz")))
+
+            records = list(self.pension_service.iter_exported_records(directory))
+            self.assertEqual(len(records), 8)
+            self.assertEqual(records[0].company_id, 1)
+            self.assertEqual(records[0].pension_export_id, 123)
+            self.assertEqual(records[0].data, {"Number": "1231"})
+
+            self.client.service.PensionExport_GetXML.reset_mock()
+            summary = self.pension_service.export([1, 2], [2024], directory)
+
+        self.assertEqual(len(summary.skipped), 2)
+        self.client.service.PensionExport_GetXML.assert_not_called()
+
+    def test_export_interrupted(self):
+        """Test that the exports stored before an interruption are skipped and read, the manifest is written per export."""
+        self.client.service.PensionExport_GetList.side_effect = lambda CompanyId, intYear, _soapheaders: [
+            {"PensionExportID": CompanyId * 100 + intYear % 100, "Period": 1, "Year": intYear}
+        ]
+        self.client.service.PensionExport_GetXML.return_value = "<Export><Employee><Number>1</Number></Employee></Export>"
+
+        with tempfile.TemporaryDirectory() as directory:
+            # The process stops before the manifest is saved at the end
+            with patch("src.nmbrs.service.microservices.company.pension.Manifest.save"):
+                self.pension_service.export([1, 2], [2024], directory)
+            self.assertFalse(os.path.exists(os.path.join(directory, "manifest.json")))
+            self.assertEqual(len(list(self.pension_service.iter_exported_records(directory))), 2)
+
+            self.client.service.PensionExport_GetXML.reset_mock()
+            summary = self.pension_service.export([1, 2], [2024], directory)
+            self.assertTrue(os.path.exists(os.path.join(directory, "manifest.json")))
+
+        self.assertEqual(len(summary.skipped), 2)
+        self.client.service.PensionExport_GetXML.assert_not_called()
+
+    def test_export_iterators(self):
+        """Test that the companies and years can be given as iterators, which can be iterated once."""
+        self.client.service.PensionExport_GetList.side_effect = lambda CompanyId, intYear, _soapheaders: [
+            {"PensionExportID": CompanyId * 100 + intYear % 100, "Period": 1, "Year": intYear}
+        ]
+        self.client.service.PensionExport_GetXML.return_value = "<Export/>"
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = self.pension_service.export(iter([1, 2]), (year for year in (2023, 2024)), directory)
+
+        self.assertEqual(len(summary.harvested), 4)
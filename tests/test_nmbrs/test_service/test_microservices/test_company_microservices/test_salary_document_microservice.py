@@ -0,0 +1,355 @@
+"""Unit tests for the CompanySalaryDocumentService class."""
+
+import base64
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+from lxml import etree
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.data_classes.document import DocumentFile
+from src.nmbrs.exceptions import UnauthorizedCompanyException
+from src.nmbrs.service.microservices.company.salary_document import CompanySalaryDocumentService
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.testing.wsdl import ArrayOf, Operation
+
+
+def soap_response(operation: str, content: str) -> bytes:
+    """Build a SOAP response body for an operation."""
+    return (
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>'
+        f'<{operation}Response xmlns="https://api.nmbrs.nl/soap/v3/CompanyService">'
+        f"<{operation}Result>{content}</{operation}Result>"
+        f"</{operation}Response></soap:Body></soap:Envelope>"
+    ).encode()
+
+
+def http_response(status_code: int, content: bytes = b"") -> requests.Response:
+    """Build an HTTP response, as returned by a transport."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+class TestCompanySalaryDocumentService(unittest.TestCase):
+    """Unit tests for the CompanySalaryDocumentService class."""
+
+    def setUp(self):
+        self.auth_manager = AuthManager()
+        self.auth_manager.set_auth_header("test_username", "test_token", "test_domain")
+        self.mock_auth_header = {
+            "AuthHeaderWithDomain": {
+                "Username": "test_username",
+                "Token": "test_token",
+                "Domain": "test_domain",
+            }
+        }
+        self.client = Mock()
+        self.client.settings.return_value = MagicMock()
+        self.salary_document_service = CompanySalaryDocumentService(self.auth_manager, self.client)
+        self.pdf = b"%PDF-1.4 payslip" * 1000
+
+        # Requests sent without zeep are answered by respond, called with the operation and its arguments
+        self.respond = Mock()
+        self.client.service._binding_options = {"address": "https://api.nmbrs.nl/soap/v3/CompanyService.asmx"}
+        self.client.service._binding._create.side_effect = self._create
+        self.client.transport.post.side_effect = self._post
+
+    @staticmethod
+    def _create(operation, args, kwargs, client, options):  # pylint: disable=unused-argument
+        """Create a request holding the operation and its arguments."""
+        request = etree.Element(operation)
+        request.text = json.dumps({name: value for name, value in kwargs.items() if name != "_soapheaders"})
+        return request, {"SOAPAction": operation}
+
+    def _post(self, address, message, headers):  # pylint: disable=unused-argument
+        """Answer a request with the response of respond."""
+        request = etree.fromstring(message)
+        return self.respond(request.tag, **json.loads(request.text))
+
+    def test_get_annual_statement(self):
+        """Test retrieving a document as bytes."""
+        self.client.service.SalaryDocuments_AnnualDocument_AnualStatement.return_value = self.pdf
+        result = self.salary_document_service.get_annual_statement(1, 2024)
+        self.assertEqual(result, self.pdf)
+        self.client.service.SalaryDocuments_AnnualDocument_AnualStatement.assert_called_once_with(
+            CompanyId=1, Year=2024, _soapheaders=self.mock_auth_header
+        )
+
+    def test_get_all_payslips_to_file(self):
+        """Test writing a document to a file without decoding it in memory."""
+        operation = "SalaryDocuments_GetAllPayslipsPDFByRunCompany_v2"
+        self.respond.return_value = http_response(200, soap_response(operation, base64.encodebytes(self.pdf).decode()))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "payslips.pdf")
+            result = self.salary_document_service.get_annual_all_payslips_2(1, 2, 2024, target=path)
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), self.pdf)
+
+        self.assertIsInstance(result, DocumentFile)
+        self.assertEqual(result.path, path)
+        self.assertEqual(result.size, len(self.pdf))
+        self.respond.assert_called_once_with(operation, CompanyId=1, RunId=2, Year=2024)
+        self.assertEqual(self.client.service._binding._create.call_args.args[2]["_soapheaders"], self.mock_auth_header)
+        getattr(self.client.service, operation).assert_not_called()
+
+    def test_get_sepa_to_stream(self):
+        """Test writing a document to a stream."""
+        operation = "SalaryDocuments_GetSEPA"
+        self.respond.return_value = http_response(200, soap_response(operation, base64.b64encode(b"<Document/>").decode()))
+        stream = io.BytesIO()
+        result = self.salary_document_service.get_SEPA(1, 2, 2024, target=stream)
+        self.assertEqual(stream.getvalue(), b"<Document/>")
+        self.assertIsNone(result.path)
+        self.assertEqual(result.size, 11)
+
+    def test_get_payslips_by_employee_to_directory(self):
+        """Test writing a payslip per employee to a directory."""
+        operation = "SalaryDocuments_GetEmployeePayslipsPDFByRunCompany"
+        items = "".join(
+            f"<EmployeePayslip><EmployeeId>{employee_id}</EmployeeId><PDF>{base64.b64encode(self.pdf).decode()}</PDF></EmployeePayslip>"
+            for employee_id in (10, 11)
+        )
+        self.respond.return_value = http_response(200, soap_response(operation, items))
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.salary_document_service.get_annual_all_payslips_by_employee(1, 2, directory=directory)
+            self.assertEqual(sorted(os.listdir(directory)), ["10.pdf", "11.pdf"])
+
+        self.assertEqual([document.employee_id for document in result], [10, 11])
+        self.assertEqual(result[0].sha256, result[1].sha256)
+
+    def test_fault_response(self):
+        """Test SOAP faults are processed by zeep when the response is not parsed."""
+        operation = "SalaryDocuments_GetSEPA_Tax"
+        self.respond.return_value = http_response(500)
+        self.client.service._binding.process_reply.side_effect = ValueError("fault")
+
+        with self.assertRaises(ValueError):
+            self.salary_document_service.get_SEPA_tax(1, 2, 2024, target=io.BytesIO())
+        self.client.service._binding.get.assert_called_once_with(operation)
+
+    def _mock_run(self, employee_ids, failing=()):
+        """Mock a run with employees, the payslip content is the employee ID."""
+        self.client.service.Run_GetList.return_value = [{"ID": 2}]
+        self.client.service.Run_GetEmployeesByRunCompany.return_value = [{"EmployeeId": employee_id} for employee_id in employee_ids]
+
+        def payslip(operation, **kwargs):
+            employee_id = kwargs["EmployeeIds"]["int"][0]
+            if employee_id in failing:
+                raise ConnectionError()
+            return http_response(200, soap_response(operation, base64.b64encode(str(employee_id).encode()).decode()))
+
+        self.respond.side_effect = payslip
+        return self.respond
+
+    def test_download_payslips(self):
+        """Test downloading the payslips of all employees in a run."""
+        mock_payslip = self._mock_run([10, 11, 12], failing=(12,))
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.salary_document_service.download_payslips(1, 2024, 2, directory, max_workers=2)
+            self.assertEqual(sorted(os.listdir(directory)), ["10.pdf", "11.pdf", "SHA256SUMS"])
+            with open(os.path.join(directory, "10.pdf"), "rb") as file:
+                self.assertEqual(file.read(), b"10")
+
+            self.assertEqual(sorted(document.employee_id for document in result.downloaded), [10, 11])
+            self.assertEqual(list(result.failed), [12])
+            self.assertIsInstance(result.failed[12], ConnectionError)
+            self.assertEqual(mock_payslip.call_count, 3)
+
+            # Payslips with a matching checksum are skipped, changed files are downloaded again
+            with open(os.path.join(directory, "11.pdf"), "wb") as file:
+                file.write(b"changed")
+            mock_payslip.reset_mock()
+            result = self.salary_document_service.download_payslips(1, 2024, 2, directory)
+
+        self.assertEqual([document.employee_id for document in result.skipped], [10])
+        self.assertEqual([document.employee_id for document in result.downloaded], [11])
+        self.assertEqual(mock_payslip.call_count, 2)
+
+    def test_download_payslips_manifest(self):
+        """Test the checksum of every payslip is written to the manifest as soon as the payslip is downloaded."""
+        mock_payslip = self._mock_run([10, 11])
+        payslip = mock_payslip.side_effect
+        manifests = []
+
+        def record_manifest(operation, **kwargs):
+            with open(os.path.join(directory, "SHA256SUMS"), encoding="utf-8") as file:
+                manifests.append(file.read())
+            return payslip(operation, **kwargs)
+
+        mock_payslip.side_effect = record_manifest
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.salary_document_service.download_payslips(1, 2024, 2, directory, max_workers=1)
+            with open(os.path.join(directory, "SHA256SUMS"), encoding="utf-8") as file:
+                manifest = file.read()
+
+        first = result.downloaded[0]
+        self.assertEqual(manifests, ["", f"{first.sha256}  {first.employee_id}.pdf\n"])
+        self.assertEqual(manifest, "".join(f"{document.sha256}  {document.employee_id}.pdf\n" for document in result.downloaded))
+
+    def test_download_payslips_unknown_run(self):
+        """Test downloading the payslips of a run that does not exist."""
+        self._mock_run([10])
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                self.salary_document_service.download_payslips(1, 2024, 3, directory)
+
+    def test_get_document_endpoints(self):
+        """Test every document endpoint calls its operation with the arguments of the document."""
+        yearly = {
+            "get_annual_wage_components": "SalaryDocuments_AnnualDocument_CompanyWageComponentsCumulative",
+            "get_annual_journal_entries_company": "SalaryDocuments_AnnualDocument_JournalEntriesCompanyrCumulative",
+            "get_annual_journal_entries_cost_center": "SalaryDocuments_AnnualDocument_JournalEntriesCostCenterCumulative",
+            "get_annual_journal_entries_department": "SalaryDocuments_AnnualDocument_JournalEntriesDepartmentCumulative",
+            "get_annual_journal_entries_employee": "SalaryDocuments_AnnualDocument_JournalEntriesEmployeeCumulative",
+            "get_annual_leave_saldo": "SalaryDocuments_AnnualDocument_LeaveSaldos",
+            "get_annual_payment_list": "SalaryDocuments_AnnualDocument_PaymentListCumulative",
+            "get_annual_payroll": "SalaryDocuments_AnnualDocument_PayrollRegister",
+            "get_annual_payroll_employees": "SalaryDocuments_AnnualDocument_PayrollRegisterAllEmployees",
+            "get_annual_payroll_summary": "SalaryDocuments_AnnualDocument_PayrollRegisterSummaryCumulative",
+            "get_annual_reservation_saldo": "SalaryDocuments_AnnualDocument_ReservationSaldos",
+            "get_annual_wage_tax_declaration": "SalaryDocuments_AnnualDocument_SentWageTaxDeclarations",
+            "get_annual_wage_tax_declaration_by_period": "SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewByPeriod",
+            "get_annual_wage_tax_declaration_cumulative": "SalaryDocuments_AnnualDocument_WageTaxDeclarationOverviewCumulative",
+        }
+        by_run = {"get_annual_all_payslips": "SalaryDocuments_GetAllPayslipsPDFByRunCompany"}
+        for method, operation in {**yearly, **by_run}.items():
+            with self.subTest(method=method):
+                getattr(self.client.service, operation).return_value = self.pdf
+                result = getattr(self.salary_document_service, method)(1, 2024 if method in yearly else 2)
+                self.assertEqual(result, self.pdf)
+                kwargs = {"Year": 2024} if method in yearly else {"RunId": 2}
+                getattr(self.client.service, operation).assert_called_once_with(CompanyId=1, **kwargs, _soapheaders=self.mock_auth_header)
+
+    def test_get_payslips_in_one(self):
+        """Test the payslips in one PDF are requested with the year and the employees, by default of the whole run."""
+        operation = "SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany"
+        self._mock_run([10, 11])
+        getattr(self.client.service, operation).return_value = self.pdf
+
+        self.assertEqual(self.salary_document_service.get_annual_all_payslips_as_one(1, 2, 2024), self.pdf)
+        self.assertEqual(self.salary_document_service.get_annual_all_payslips_as_one(1, 2, 2024, employee_ids=[11]), self.pdf)
+        self.assertEqual(self.salary_document_service.get_employee_payslip(1, 2, 2024, 10), self.pdf)
+
+        self.client.service.Run_GetEmployeesByRunCompany.assert_called_once_with(
+            CompanyId=1, Year=2024, RunId=2, _soapheaders=self.mock_auth_header
+        )
+        self.assertEqual(
+            [call.kwargs for call in getattr(self.client.service, operation).call_args_list],
+            [
+                {"CompanyId": 1, "RunId": 2, "Year": 2024, "EmployeeIds": {"int": employee_ids}, "_soapheaders": self.mock_auth_header}
+                for employee_ids in ([10, 11], [11], [10])
+            ],
+        )
+
+    def test_get_payslips_by_employee(self):
+        """Test retrieving the payslip per employee without a directory."""
+        operation = "SalaryDocuments_GetEmployeePayslipsPDFByRunCompany_v2"
+        getattr(self.client.service, operation).return_value = [{"EmployeeId": 10, "PDF": self.pdf}]
+        result = self.salary_document_service.get_annual_all_payslips_by_employee_2(1, 2, 2024)
+        self.assertEqual(result, [{"EmployeeId": 10, "PDF": self.pdf}])
+        getattr(self.client.service, operation).assert_called_once_with(CompanyId=1, RunId=2, Year=2024, _soapheaders=self.mock_auth_header)
+
+    def test_download_payslips_removes_partial_file(self):
+        """Test a payslip that fails while being written leaves no partial file behind."""
+        operation = "SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany"
+        self._mock_run([10])
+        self.respond.side_effect = None
+        self.respond.return_value = http_response(200, soap_response(operation, base64.b64encode(self.pdf).decode())[:-200])
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.salary_document_service.download_payslips(1, 2024, 2, directory)
+            self.assertEqual(sorted(os.listdir(directory)), ["SHA256SUMS"])
+
+        self.assertEqual(list(result.failed), [10])
+
+    def test_download_payslips_without_payslip(self):
+        """Test a response without a payslip, or with an empty one, fails and is not added to the manifest."""
+        operation = "SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany"
+        self._mock_run([10, 11, 12])
+        payslip = self.respond.side_effect
+        empty = {
+            10: http_response(200, soap_response(operation, "")),
+            11: http_response(200, soap_response(operation, "").replace(f"<{operation}Result></{operation}Result>".encode(), b"")),
+        }
+        self.respond.side_effect = lambda operation, **kwargs: empty.get(kwargs["EmployeeIds"]["int"][0]) or payslip(operation, **kwargs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = self.salary_document_service.download_payslips(1, 2024, 2, directory)
+            self.assertEqual(sorted(os.listdir(directory)), ["12.pdf", "SHA256SUMS"])
+            with open(os.path.join(directory, "SHA256SUMS"), encoding="utf-8") as file:
+                self.assertEqual([line.split()[1] for line in file], ["12.pdf"])
+
+        self.assertEqual(sorted(result.failed), [10, 11])
+        self.assertIsInstance(result.failed[10], ValueError)
+        self.assertEqual([document.employee_id for document in result.downloaded], [12])
+
+
+class TestCompanySalaryDocumentStreaming(unittest.TestCase):
+    """Unit tests for streaming the documents of the CompanySalaryDocumentService class, against the fake server."""
+
+    def setUp(self):
+        self.server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+        self.document = os.urandom(3 * 1024 * 1024)
+        self.server.register(
+            Operation(
+                "CompanyService",
+                "SalaryDocuments_GetSEPA",
+                {"CompanyId": "int", "RunId": "int", "Year": "int"},
+                "string",
+                lambda server, CompanyId, RunId, Year: base64.encodebytes(self.document).decode(),
+            )
+        )
+
+    def test_streamed(self):
+        """Test that the body of the response is streamed into the document."""
+        with self.server:
+            api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+            stream = io.BytesIO()
+            with patch.object(requests.Session, "post", autospec=True, side_effect=requests.Session.post) as post:
+                result = api.company.salary_documents.get_SEPA(1, 2, 2024, target=stream)
+
+        self.assertEqual(stream.getvalue(), self.document)
+        self.assertEqual(result.size, len(self.document))
+        self.assertTrue(post.call_args.kwargs["stream"])
+
+    def test_payslips_in_one(self):
+        """Test that the payslips in one PDF are requested with the parameters the operation requires."""
+        self.server.register(
+            Operation(
+                "CompanyService",
+                "SalaryDocuments_GetEmployeePayslipsInOnePDFByRunCompany",
+                {"CompanyId": "int", "RunId": "int", "Year": "int", "EmployeeIds": ArrayOf("int")},
+                "string",
+                lambda server, CompanyId, RunId, Year, EmployeeIds: base64.b64encode(json.dumps(EmployeeIds).encode()).decode(),
+            )
+        )
+        with self.server:
+            api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+            company_id = self.server.dataset.companies()[0]["ID"]
+            run = self.server.dataset.runs(company_id)[0]
+            employee_ids = [employee["Id"] for employee in self.server.dataset.employees(company_id)]
+            stream = io.BytesIO()
+            api.company.salary_documents.get_annual_all_payslips_as_one(company_id, run["ID"], run["Year"], target=stream)
+            self.assertEqual(json.loads(stream.getvalue()), employee_ids)
+            stream = io.BytesIO()
+            api.company.salary_documents.get_employee_payslip(company_id, run["ID"], run["Year"], employee_ids[0], target=stream)
+            self.assertEqual(json.loads(stream.getvalue()), employee_ids[:1])
+
+    def test_fault(self):
+        """Test that SOAP faults of streamed responses raise the exceptions of the SDK."""
+        self.server.inject_fault("CompanyService:SalaryDocuments_GetSEPA", code=2004)
+        with self.server:
+            api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+            with self.assertRaises(UnauthorizedCompanyException):
+                api.company.salary_documents.get_SEPA(1, 2, 2024, target=io.BytesIO())
@@ -1,7 +1,11 @@
 """Unit tests for the CompanyWageTaxService class."""
 
+import gzip
+import json
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.nmbrs.auth.token_manager import AuthManager
 from src.nmbrs.service.microservices.company.wage_tax import (
@@ -61,3 +65,57 @@ class TestCompanyWageTaxService(unittest.TestCase):
         self.client.service.WageTax_SetSentExternal.assert_called_once_with(
             CompanyId=company_id, LoonaangifteID=loonaangifte_id, _soapheaders=self.mock_auth_header
         )
+
+    def test_harvest(self):
+        """Test storing the declarations of several companies, skipping declarations stored before."""
+
+        def wage_tax_list(CompanyId, intYear, _soapheaders):  # pylint: disable=invalid-name,unused-argument
+            if CompanyId == 3:
+                raise ConnectionError()
+            return [{"LoonaangifteID": CompanyId * 10 + period, "Period": period, "Year": intYear} for period in (1, 2)]
+
+        self.client.service.WageTax_GetList.side_effect = wage_tax_list
+        self.client.service.WageTax_GetXML.side_effect = (
+            lambda CompanyId, LoonaangifteID, _soapheaders: f"<Loonaangifte>{LoonaangifteID}</Loonaangifte>"
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = self.company_wagetax_service.harvest([1, 2, 3], 2024, directory, max_workers=3)
+            self.assertEqual(len(summary.harvested), 4)
+            self.assertEqual([result.key for result in summary.failed], [3])
+            with gzip.open(os.path.join(directory, "2", "21.xml.gz"), "rt", encoding="utf-8") as file:
+                self.assertEqual(file.read(), "<Loonaangifte>21</Loonaangifte>")
+            with open(os.path.join(directory, "index.json"), encoding="utf-8") as file:
+                index = json.load(file)
+            self.assertEqual(sorted(index), ["1/11", "1/12", "2/21", "2/22"])
+            self.assertEqual(index["2/21"]["period"], 1)
+            self.assertEqual(index["2/21"]["path"], os.path.join("2", "21.xml.gz"))
+
+            self.client.service.WageTax_GetXML.reset_mock()
+            summary = self.company_wagetax_service.harvest([1, 2], 2024, directory)
+
+        self.assertEqual(len(summary.skipped), 4)
+        self.assertEqual(summary.harvested, [])
+        self.client.service.WageTax_GetXML.assert_not_called()
+
+    def test_harvest_interrupted(self):
+        """Test that the declarations stored before an interruption are skipped, the index is written per declaration."""
+        self.client.service.WageTax_GetList.side_effect = lambda CompanyId, intYear, _soapheaders: [
+            {"LoonaangifteID": CompanyId * 10 + period, "Period": period, "Year": intYear} for period in (1, 2)
+        ]
+        self.client.service.WageTax_GetXML.side_effect = (
+            lambda CompanyId, LoonaangifteID, _soapheaders: f"<Loonaangifte>{LoonaangifteID}</Loonaangifte>"
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            # The process stops before the index is saved at the end
+            with patch("src.nmbrs.service.microservices.company.wage_tax.Manifest.save"):
+                self.company_wagetax_service.harvest([1, 2], 2024, directory)
+            self.assertFalse(os.path.exists(os.path.join(directory, "index.json")))
+
+            self.client.service.WageTax_GetXML.reset_mock()
+            summary = self.company_wagetax_service.harvest([1, 2], 2024, directory)
+            self.assertTrue(os.path.exists(os.path.join(directory, "index.json")))
+
+        self.assertEqual(len(summary.skipped), 4)
+        self.client.service.WageTax_GetXML.assert_not_called()
@@ -0,0 +1,119 @@
+"""Unit tests for the EmployeeDocumentService class."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.data_classes.document import DocumentUpload
+from src.nmbrs.exceptions import InvalidDocumentTypeException
+from src.nmbrs.service.microservices.employee.document import EmployeeDocumentService
+
+
+class TestEmployeeDocumentService(unittest.TestCase):
+    """Unit tests for the EmployeeDocumentService class."""
+
+    def setUp(self):
+        self.auth_manager = AuthManager()
+        self.auth_manager.set_auth_header("test_username", "test_token", "test_domain")
+        self.mock_auth_header = {
+            "AuthHeaderWithDomain": {
+                "Username": "test_username",
+                "Token": "test_token",
+                "Domain": "test_domain",
+            }
+        }
+        self.client = Mock()
+        self.document_service = EmployeeDocumentService(self.auth_manager, self.client)
+
+    def test_upload(self):
+        """Test uploading a document for an employee."""
+        self.client.service.EmployeeDocument_UploadDocument.return_value = True
+        result = self.document_service.upload(1, "contract.pdf", b"data", "guid")
+        self.assertTrue(result)
+        self.client.service.EmployeeDocument_UploadDocument.assert_called_once_with(
+            EmployeeId=1, StrDocumentName="contract.pdf", Body=b"data", GuidDocumentType="guid", _soapheaders=self.mock_auth_header
+        )
+
+    def test_upload_full(self):
+        """Test uploading a document for an employee with all the fields."""
+        self.client.service.EmployeeDocument_UploadDocumentFull.return_value = True
+        result = self.document_service.upload_full(1, "contract.pdf", b"data", "guid", 2024, 3)
+        self.assertTrue(result)
+        self.client.service.EmployeeDocument_UploadDocumentFull.assert_called_once_with(
+            EmployeeId=1,
+            StrDocumentName="contract.pdf",
+            Body=b"data",
+            GuidDocumentType="guid",
+            Year=2024,
+            Period=3,
+            _soapheaders=self.mock_auth_header,
+        )
+
+    @patch("src.nmbrs.service.microservices.employee.document.post_document")
+    def test_upload_from(self, mock_post_document):
+        """Test uploading a file for an employee."""
+        mock_post_document.return_value = True
+        result = self.document_service.upload_from(1, "/tmp/contract.pdf", "guid")
+        self.assertTrue(result)
+        mock_post_document.assert_called_once_with(
+            self.client,
+            "EmployeeDocument_UploadDocument",
+            "Body",
+            "/tmp/contract.pdf",
+            EmployeeId=1,
+            StrDocumentName="contract.pdf",
+            GuidDocumentType="guid",
+            _soapheaders=self.mock_auth_header,
+        )
+
+    @patch("src.nmbrs.service.microservices.employee.document.post_document")
+    def test_upload_full_from(self, mock_post_document):
+        """Test uploading a file for an employee with all the fields."""
+        mock_post_document.return_value = True
+        result = self.document_service.upload_full_from(1, "/tmp/contract.pdf", "guid", 2024, 3, document_name="2024-03.pdf")
+        self.assertTrue(result)
+        mock_post_document.assert_called_once_with(
+            self.client,
+            "EmployeeDocument_UploadDocumentFull",
+            "Body",
+            "/tmp/contract.pdf",
+            EmployeeId=1,
+            StrDocumentName="2024-03.pdf",
+            GuidDocumentType="guid",
+            Year=2024,
+            Period=3,
+            _soapheaders=self.mock_auth_header,
+        )
+
+    @patch("src.nmbrs.service.microservices.employee.document.sleep")
+    @patch("src.nmbrs.service.microservices.employee.document.post_document")
+    def test_upload_many(self, mock_post_document, mock_sleep):
+        """Test uploading many documents, retrying connection errors."""
+        failures = {"a.pdf": [requests.exceptions.ConnectionError()], "c.pdf": [InvalidDocumentTypeException(resource="test")]}
+
+        def post_document(*_, **kwargs):
+            if failures.get(kwargs["StrDocumentName"]):
+                raise failures[kwargs["StrDocumentName"]].pop()
+            return True
+
+        mock_post_document.side_effect = post_document
+        uploads = [DocumentUpload(employee_id, f"/tmp/{name}", "guid") for employee_id, name in enumerate(["a.pdf", "b.pdf", "c.pdf"])]
+
+        results = self.document_service.upload_many(uploads, max_workers=2)
+
+        self.assertEqual([result.success for result in results], [True, True, False])
+        self.assertEqual([result.attempts for result in results], [2, 1, 1])
+        self.assertIsInstance(results[2].error, InvalidDocumentTypeException)
+        mock_sleep.assert_called_once_with(1)
+
+    @patch("src.nmbrs.service.microservices.employee.document.sleep")
+    @patch("src.nmbrs.service.microservices.employee.document.post_document")
+    def test_upload_many_retries_exhausted(self, mock_post_document, mock_sleep):
+        """Test an upload fails after the retries are exhausted."""
+        mock_post_document.side_effect = requests.exceptions.Timeout()
+        results = self.document_service.upload_many([DocumentUpload(1, "/tmp/a.pdf", "guid")], retries=2)
+        self.assertFalse(results[0].success)
+        self.assertEqual(results[0].attempts, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [1, 2])
@@ -1,8 +1,12 @@
 """Unit tests for the ReportService class."""
 
+import threading
 import unittest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
+import requests
+
+from src.nmbrs.api import Nmbrs
 from src.nmbrs.service.report_service import ReportService
 from src.nmbrs.exceptions.nmbrs_exceptions.background_task import (
     BackgroundTaskException,
@@ -10,6 +14,23 @@ from src.nmbrs.exceptions.nmbrs_exceptions.background_task import (
     UnknownCall,
 )
 from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.exceptions import UnknownNmbrsException
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+
+
+class FakeClock:
+    """Replaces monotonic and sleep, so time only passes when sleeping."""
+
+    def __init__(self, mock_monotonic, mock_sleep):
+        self.now = 0
+        self.sleeps = []
+        mock_monotonic.side_effect = lambda: self.now
+        mock_sleep.side_effect = self.sleep
+
+    def sleep(self, seconds):
+        """Advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
 
 
 class TestReportService(unittest.TestCase):
@@ -71,15 +92,43 @@ class TestReportService(unittest.TestCase):
 
         self.mock_client.service.Reports_BackgroundTask_Result.assert_called_once_with(TaskId="task_id", _soapheaders=self.mock_auth_header)
 
-    def test_background_task_result_timeout(self):
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_background_task_result_timeout(self, mock_monotonic, mock_sleep):
         """Test retrieving background task result timeout."""
+        clock = FakeClock(mock_monotonic, mock_sleep)
         mock_response = {"Status": "Executing"}
         self.mock_client.service.Reports_BackgroundTask_Result.return_value = mock_response
 
         result = self.report_service.background_task_result("task_id", wait_limit=1)
         self.assertIsNone(result)
 
-        self.mock_client.service.Reports_BackgroundTask_Result.assert_called_once_with(TaskId="task_id", _soapheaders=self.mock_auth_header)
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 3)
+        self.mock_client.service.Reports_BackgroundTask_Result.assert_called_with(TaskId="task_id", _soapheaders=self.mock_auth_header)
+
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_background_task_result_backoff(self, mock_monotonic, mock_sleep):
+        """Test the time between checks grows exponentially up to the maximum."""
+        clock = FakeClock(mock_monotonic, mock_sleep)
+        self.mock_client.service.Reports_BackgroundTask_Result.side_effect = [{"Status": "Enqueued"}] * 5 + [
+            {"Status": "Success", "Content": "<report>test</report>"}
+        ]
+        progress = []
+
+        result = self.report_service.background_task_result(
+            "task_id",
+            poll_interval=1,
+            max_poll_interval=5,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        self.assertEqual(result, {"report": "test"})
+        self.assertEqual(clock.sleeps, [1, 2, 4, 5, 5])
+        self.assertEqual(len(progress), 6)
+        self.assertEqual(progress[0], ("task_id", "Enqueued", 1, 0))
+        self.assertEqual(progress[-1], ("task_id", "Success", 6, 17))
 
     def test_get_task_id_success(self):
         """Test getting task ID successfully."""
@@ -108,3 +157,209 @@ class TestReportService(unittest.TestCase):
 
         with self.assertRaises(UnknownCall):
             self.report_service.get_task_id("unknown_task_name", {})
+
+    def test_background_task_records(self):
+        """Test retrieving the rows of a background task one at a time."""
+        mock_response = {
+            "Status": "Success",
+            "Content": "<report><Employee><Id>1</Id></Employee><Employee><Id>2</Id></Employee></report>",
+        }
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = mock_response
+
+        records = self.report_service.background_task_records("task_id", "Employee")
+        self.assertEqual(list(records), [{"Id": "1"}, {"Id": "2"}])
+
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_background_task_records_timeout(self, mock_monotonic, mock_sleep):
+        """Test retrieving the rows of a background task that does not complete."""
+        FakeClock(mock_monotonic, mock_sleep)
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = {"Status": "Executing"}
+
+        self.assertIsNone(self.report_service.background_task_records("task_id", "Employee", wait_limit=1))
+
+    def test_background_task_status(self):
+        """Test checking the status of a background task once."""
+        mock_response = {"Status": "Executing"}
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = mock_response
+
+        result = self.report_service.background_task_status("task_id")
+
+        self.assertEqual(result, mock_response)
+        self.mock_client.service.Reports_BackgroundTask_Result.assert_called_once_with(TaskId="task_id", _soapheaders=self.mock_auth_header)
+
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_run_background_tasks(self, mock_monotonic, mock_sleep):
+        """Test running multiple background tasks, yielding them in the order they complete."""
+        clock = FakeClock(mock_monotonic, mock_sleep)
+        submitted = []
+
+        def submit(**kwargs):
+            submitted.append(kwargs["CompanyId"])
+            return f"task_{kwargs['CompanyId']}"
+
+        statuses = {
+            "task_1": iter([{"Status": "Executing"}, {"Status": "Executing"}, {"Status": "Success", "Content": "<report>1</report>"}]),
+            "task_2": iter([{"Status": "Success", "Content": "<report>2</report>"}]),
+            "task_3": iter([{"Status": "Error"}]),
+        }
+        self.mock_client.service.__getitem__ = Mock(return_value=submit)
+        self.mock_client.service.Reports_BackgroundTask_Result.side_effect = lambda TaskId, _soapheaders: next(statuses[TaskId])
+
+        tasks = {company_id: ("Reports_Company", {"CompanyId": company_id}) for company_id in (1, 2, 3)}
+        results = list(self.report_service.run_background_tasks(tasks, max_concurrency=2))
+
+        self.assertEqual([result.key for result in results], [2, 3, 1])
+        self.assertEqual(results[0].result, {"report": "2"})
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[1].status, "Error")
+        self.assertIsInstance(results[1].error, BackgroundTaskException)
+        self.assertEqual(results[2].result, {"report": "1"})
+        self.assertEqual(submitted, [1, 2, 3])
+        self.assertEqual(clock.sleeps, [1])
+
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_run_background_tasks_errors(self, mock_monotonic, mock_sleep):
+        """Test errors and timeouts are reported per task."""
+        FakeClock(mock_monotonic, mock_sleep)
+
+        def raise_attribute_error(*args, **kwargs):
+            """Raise AttributeError exception"""
+            raise AttributeError
+
+        self.mock_client.service.__getitem__ = raise_attribute_error
+        results = list(self.report_service.run_background_tasks({"unknown": ("Unknown_Report", {})}))
+        self.assertEqual(results[0].status, "Error")
+        self.assertIsInstance(results[0].error, UnknownCall)
+
+        self.mock_client.service.__getitem__ = Mock(return_value=Mock(return_value="task_id"))
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = {"Status": "Executing"}
+        results = list(self.report_service.run_background_tasks({"slow": ("Slow_Report", {})}, wait_limit=5))
+        self.assertEqual(results[0].status, "Timeout")
+        self.assertEqual(results[0].task_id, "task_id")
+
+    def test_request_report_cached(self):
+        """Test identical reports are generated once."""
+        mock_func = Mock(return_value="task_id")
+        self.mock_client.service.__getitem__ = Mock(return_value=mock_func)
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = {"Status": "Success", "Content": "<report/>"}
+
+        first = self.report_service.wage_codes_by_year(1, 2024)
+        second = self.report_service.wage_codes_by_year(1, 2024)
+        self.report_service.wage_codes_by_year(2, 2024)
+
+        self.assertEqual(first, {"report": None})
+        self.assertEqual(second, first)
+        self.mock_client.service.__getitem__.assert_called_with("Reports_GetWageCodesByYear_Background")
+        mock_func.assert_any_call(CompanyId=1, Year=2024, _soapheaders=self.mock_auth_header)
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 2)
+
+    def test_request_report_without_cache(self):
+        """Test the cache can be bypassed."""
+        mock_func = Mock(return_value="task_id")
+        self.mock_client.service.__getitem__ = Mock(return_value=mock_func)
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = {"Status": "Success", "Content": "<report/>"}
+
+        self.report_service.journals_by_year(1, 2024, use_cache=False)
+        self.report_service.journals_by_year(1, 2024, use_cache=False)
+
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 2)
+
+    def test_request_report_cache_key(self):
+        """Test reports with list arguments are cached, and reports with unhashable arguments are generated uncached."""
+        self.mock_client.service.__getitem__ = Mock(return_value=Mock(return_value="task_id"))
+        self.mock_client.service.Reports_BackgroundTask_Result.return_value = {"Status": "Success", "Content": "<report/>"}
+
+        for _ in range(2):
+            self.report_service.request_report("Report", {"EmployeeIds": {"int": [1, 2]}, "Periods": {3, 4}})
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 1)
+        for _ in range(2):
+            self.assertEqual(self.report_service.request_report("Report", {"Filter": bytearray(b"1")}), {"report": None})
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 3)
+
+    @patch("src.nmbrs.service.report_service.sleep")
+    @patch("src.nmbrs.service.report_service.monotonic")
+    def test_request_report_timeout_not_cached(self, mock_monotonic, mock_sleep):
+        """Test reports that did not complete are not cached."""
+        FakeClock(mock_monotonic, mock_sleep)
+        mock_func = Mock(return_value="task_id")
+        self.mock_client.service.__getitem__ = Mock(return_value=mock_func)
+        self.mock_client.service.Reports_BackgroundTask_Result.side_effect = [
+            {"Status": "Executing"},
+            {"Status": "Success", "Content": "<report/>"},
+        ]
+
+        self.assertIsNone(self.report_service.wage_codes_by_run(1, 5, 2024, wait_limit=0))
+        self.assertEqual(self.report_service.report_cache._entries, {})
+        self.assertEqual(self.report_service.wage_codes_by_run(1, 5, 2024, wait_limit=0), {"report": None})
+
+    def test_request_report_timeout_waiting(self):
+        """Test threads waiting for a report that did not complete generate it again, instead of getting None."""
+        self.mock_client.service.__getitem__ = Mock(return_value=Mock(return_value="task_id"))
+        polled, release = threading.Event(), threading.Event()
+
+        def result(**_):
+            if not polled.is_set():
+                polled.set()
+                release.wait(5)
+                return {"Status": "Executing"}
+            return {"Status": "Success", "Content": "<report/>"}
+
+        self.mock_client.service.Reports_BackgroundTask_Result.side_effect = result
+        results = []
+        first = threading.Thread(target=lambda: results.append(self.report_service.wage_codes_by_year(1, 2024, wait_limit=0)))
+        first.start()
+        polled.wait(5)
+        second = threading.Thread(target=lambda: results.append(self.report_service.wage_codes_by_year(1, 2024, wait_limit=0)))
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+
+        self.assertCountEqual(results, [None, {"report": None}])
+        self.assertEqual(self.mock_client.service.Reports_BackgroundTask_Result.call_count, 2)
+
+
+class TestReportServiceSpool(unittest.TestCase):
+    """Unit tests for spooling background reports of the ReportService class, against the fake server."""
+
+    def setUp(self):
+        self.server = FakeNmbrsServer(Dataset.generate(companies=1, employees=20, seed=1), task_duration=0.2).start()
+        self.addCleanup(self.server.stop)
+        self.api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=self.server.base_uri)
+        self.company_id = self.server.dataset.companies()[0]["ID"]
+        self.year = self.server.dataset.runs(self.company_id)[0]["Year"]
+
+    def test_spooled_records(self):
+        """Test that the report is streamed to the spool file, with the same records as without spooling."""
+        task_args = {"CompanyId": self.company_id, "Year": self.year}
+        task_id = self.api.report.get_task_id("Reports_Accountant_JournalsReportByYear_Background", task_args)
+        statuses = []
+        with patch.object(requests.Session, "post", autospec=True, side_effect=requests.Session.post) as post:
+            records = self.api.report.background_task_records(
+                task_id, "JournalEntry", spool=True, poll_interval=0.05, progress_callback=lambda *args: statuses.append(args[1])
+            )
+            spooled = list(records)
+        self.assertTrue(all(call.kwargs["stream"] for call in post.call_args_list))
+        self.assertEqual(statuses[-1], "Success")
+        self.assertIn("Running", statuses)
+        self.assertEqual(spooled, list(self.api.report.background_task_records(task_id, "JournalEntry")))
+        self.assertTrue(spooled)
+
+    def test_company_contact_persons(self):
+        """Test the typed report of the contact persons of the companies."""
+        report = self.api.report.company_contact_persons(wait_limit=5)
+
+        contact = report["ContactPersons"]["ContactPerson"]
+        self.assertEqual(contact["CompanyId"], str(self.company_id))
+        self.assertIs(self.api.report.company_contact_persons(), report)
+
+    def test_spool_fault_and_timeout(self):
+        """Test that SOAP faults of the streamed responses raise the exceptions of the SDK, and a timeout returns None."""
+        task_id = self.api.report.get_task_id("Reports_GetWageCodesByYear_Background", {"CompanyId": self.company_id, "Year": self.year})
+        self.server.inject_fault("ReportService:Reports_BackgroundTask_Result")
+        with self.assertRaises(UnknownNmbrsException):
+            self.api.report.background_task_records(task_id, "WageCode", spool=True)
+        self.assertIsNone(self.api.report.background_task_records(task_id, "WageCode", spool=True, wait_limit=0))
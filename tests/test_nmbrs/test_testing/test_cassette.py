@@ -0,0 +1,110 @@
+"""Unit tests for recording and replaying the SOAP traffic of the services."""
+
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.exceptions import UnknownNmbrsException
+from src.nmbrs.testing import Cassette, CassetteMiss, Dataset, FakeNmbrsServer, RecordingTransport, ReplayTransport
+from src.nmbrs.testing.cassette import scrub
+
+
+class TestCassette(unittest.TestCase):
+    """Unit tests for the RecordingTransport and ReplayTransport classes."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "traffic.cassette.gz")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _record(self, server: FakeNmbrsServer, calls) -> tuple[str, list]:
+        """Record the calls against the server, returning the base URI and the results of the calls."""
+        transport = RecordingTransport()
+        with server:
+            api = Nmbrs("secret-user", "secret-token", base_uri=server.base_uri, transport=transport)
+            results = [call(api) for call in calls]
+        transport.cassette.save(self.path)
+        return server.base_uri, results
+
+    def test_record_and_replay(self):
+        """Test the recorded traffic is replayed with other credentials and without the server."""
+        server = FakeNmbrsServer(Dataset.generate(companies=2, employees=10))
+        calls = [
+            lambda api: [company.id for company in api.company.get_all()],
+            lambda api: [salary.id for salary in api.employee.salary.get_all_by_company(1)],
+        ]
+        base_uri, recorded = self._record(server, calls)
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            content = file.read()
+        self.assertNotIn("secret-token", content)
+        self.assertNotIn("secret-user", content)
+
+        api = Nmbrs("other-user", "other-token", base_uri=base_uri, transport=ReplayTransport(self.path))
+        self.assertEqual([call(api) for call in calls], recorded)
+        self.assertEqual(api.auth_manager.get_domain(), "fake")
+
+    def test_replay_in_recorded_order(self):
+        """Test identical requests are answered in the recorded order, repeating the last response."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+        server.inject_fault("CompanyService:List_GetAll")
+
+        def fail(api):
+            with self.assertRaises(UnknownNmbrsException):
+                api.company.get_all()
+
+        base_uri, _ = self._record(server, [fail, lambda api: api.company.get_all()])
+
+        api = Nmbrs("username", "token", base_uri=base_uri, transport=ReplayTransport(Cassette.load(self.path)))
+        fail(api)
+        self.assertEqual(len(api.company.get_all()), 1)
+        self.assertEqual(len(api.company.get_all()), 1)
+
+    def test_replay_miss(self):
+        """Test requests that were not recorded raise an exception."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+        base_uri, _ = self._record(server, [lambda api: api.company.get_all()])
+
+        api = Nmbrs("username", "token", base_uri=base_uri, transport=ReplayTransport(self.path))
+        with self.assertRaises(CassetteMiss) as context:
+            api.company.get_by_debtor(1)
+        self.assertIn("List_GetByDebtor", str(context.exception))
+
+    def test_replay_latency(self):
+        """Test the recorded latency is replayed with a factor."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1), latency=0.1)
+        base_uri, _ = self._record(server, [lambda api: api.company.get_all()])
+        api = Nmbrs("username", "token", base_uri=base_uri, transport=ReplayTransport(self.path))
+        company = api.company
+
+        for latency, minimum, maximum in ((0.0, 0.0, 0.05), (1.0, 0.1, 0.5)):
+            company.client.transport.latency = latency
+            start = time.monotonic()
+            company.get_all()
+            self.assertTrue(minimum <= time.monotonic() - start < maximum)
+
+    def test_scrub(self):
+        """Test the fields of both authentication headers are scrubbed, and other elements are kept."""
+        message = (
+            '<soap-env:Header><ns0:AuthHeaderWithDomain xmlns:ns0="urn:nmbrs"><ns0:Username>user</ns0:Username>'
+            "<ns0:Token>token</ns0:Token><ns0:Domain>domain</ns0:Domain></ns0:AuthHeaderWithDomain>"
+            "<AuthHeader><Username>user</Username><Token/></AuthHeader></soap-env:Header>"
+            "<soap-env:Body><CompanyId>1</CompanyId></soap-env:Body>"
+        )
+        scrubbed = scrub(message)
+        self.assertNotIn("user", scrubbed)
+        self.assertNotIn(">token<", scrubbed)
+        self.assertIn("<ns0:Domain>***</ns0:Domain>", scrubbed)
+        self.assertIn("<CompanyId>1</CompanyId>", scrubbed)
+
+    def test_invalid_file(self):
+        """Test loading a file that is not a cassette."""
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            file.write('{"format": "nmbrs-dataset", "version": 1}\n')
+        with self.assertRaises(ValueError):
+            Cassette.load(self.path)
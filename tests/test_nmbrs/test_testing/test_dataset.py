@@ -0,0 +1,94 @@
+"""Unit tests for the synthetic dataset."""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from src.nmbrs.data_classes.employee import Absence, Contract
+from src.nmbrs.testing.dataset import COUNTS, SIZES, Dataset, read_records
+
+
+class TestDataset(unittest.TestCase):
+    """Unit tests for the Dataset class."""
+
+    def setUp(self):
+        self.dataset = Dataset.generate(companies=3, employees=12, year=2023, periods=2, seed=1, debtors=2)
+
+    def test_generate_sizes(self):
+        """Test that the requested numbers of records are generated."""
+        self.assertEqual(len(self.dataset.debtors), 2)
+        self.assertEqual(len(self.dataset.companies()), 3)
+        self.assertEqual(len(self.dataset.data["employees"]), 12)
+        self.assertEqual(len(self.dataset.employees(2)), 4)
+        self.assertEqual(len(self.dataset.runs(1)), 2)
+        self.assertEqual(len(self.dataset.wage_taxes(3, 2023)), 2)
+
+    def test_generate_counts(self):
+        """Test that the number of nested records per employee is within the configured range."""
+        dataset = Dataset.generate(employees=50, counts={"absences": (3, 3), "hour_components": (0, 0)})
+        for employee in dataset.data["employees"]:
+            self.assertEqual(len(employee["Absences"]), 3)
+            self.assertEqual(employee["HourComponents"], [])
+            self.assertTrue(COUNTS["contracts"][0] <= len(employee["Contracts"]) <= COUNTS["contracts"][1])
+
+    def test_generate_distribution(self):
+        """Test that all employees are divided over the companies, evenly or skewed."""
+        dataset = Dataset.generate(companies=10, employees=1000, distribution="zipf", counts=dict.fromkeys(COUNTS, (0, 0)))
+        sizes = sorted(len(dataset.employees(company["ID"])) for company in dataset.companies())
+        self.assertEqual(sum(sizes), 1000)
+        self.assertGreater(sizes[-1], 3 * sizes[0])
+        with self.assertRaises(ValueError):
+            Dataset.generate(distribution="normal")
+
+    def test_generate_is_deterministic(self):
+        """Test that the same seed generates the same dataset."""
+        self.assertEqual(Dataset.generate(companies=3, employees=12, year=2023, periods=2, seed=1, debtors=2).data, self.dataset.data)
+        self.assertNotEqual(Dataset.generate(companies=3, employees=12, year=2023, periods=2, seed=2, debtors=2).data, self.dataset.data)
+
+    def test_sizes(self):
+        """Test the presets of the scale tests."""
+        self.assertEqual([SIZES[size]["employees"] for size in ("1k", "10k", "100k")], [1_000, 10_000, 100_000])
+
+    def test_queries(self):
+        """Test filtering by debtor, company and year."""
+        self.assertEqual(len(self.dataset.companies(debtor_id=1)), 2)
+        self.assertEqual(self.dataset.companies(debtor_id=3), [])
+        self.assertEqual(self.dataset.employees(99), [])
+        self.assertEqual(self.dataset.runs(1, 2022), [])
+        self.assertEqual({employee["CompanyId"] for employee in self.dataset.employees(3)}, {3})
+        self.assertEqual(self.dataset.employee(5)["Id"], 5)
+        self.assertIsNone(self.dataset.employee(99))
+
+    def test_save_and_load(self):
+        """Test that a saved dataset is loaded identically, and can be streamed by kind."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data", "dataset.jsonl.gz")
+            size = self.dataset.save(path)
+            self.assertEqual(size, os.path.getsize(path))
+            self.assertFalse(os.path.exists(f"{path}.part"))
+
+            loaded = Dataset.load(path)
+            self.assertEqual(loaded.data, self.dataset.data)
+            self.assertEqual(loaded.config["seed"], 1)
+            self.assertEqual(len(loaded.employees(2)), 4)
+
+            companies = list(read_records(path, "companies"))
+            self.assertEqual([record["ID"] for _, record in companies], [1, 2, 3])
+
+    def test_load_invalid_file(self):
+        """Test that files in another format are rejected."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "other.jsonl.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as file:
+                file.write('{"format": "other"}\n')
+            with self.assertRaises(ValueError):
+                list(read_records(path))
+
+    def test_parsers(self):
+        """Test that the records can be parsed by the data classes."""
+        employee = self.dataset.employee(1)
+        contract = Contract(employee["Id"], employee["Contracts"][0])
+        self.assertEqual(contract.id, employee["Contracts"][0]["ContractID"])
+        for absence in employee["Absences"]:
+            self.assertEqual(Absence(employee["Id"], absence).cause.id, absence["AbsenceCause"]["CauseId"])
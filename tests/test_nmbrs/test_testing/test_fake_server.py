@@ -0,0 +1,243 @@
+"""Unit tests for the fake Nmbrs SOAP server, using the services of the package over HTTP."""
+
+import gzip
+import time
+import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.exceptions import UnauthorizedCompanyException, UnknownNmbrsException
+from src.nmbrs.testing import ArrayOf, ComplexType, Dataset, FakeFault, FakeNmbrsServer, Operation
+from src.nmbrs.testing.wsdl import render_response
+
+
+class TestFakeNmbrsServer(unittest.TestCase):
+    """Unit tests for the FakeNmbrsServer class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeNmbrsServer(Dataset.generate(companies=2, employees=10)).start()
+        cls.api = Nmbrs("username", "token", base_uri=cls.server.base_uri)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def tearDown(self):
+        self.server.latency = 0.0
+        self.server.fault_rate = 0.0
+
+    def test_wsdl(self):
+        """Test that the WSDL of a service is served and unknown paths are not found."""
+        with urlopen(f"{self.server.base_uri}CompanyService.asmx?WSDL") as response:
+            wsdl = response.read().decode()
+        self.assertIn('name="List_GetAll"', wsdl)
+        self.assertIn(f'location="{self.server.base_uri}CompanyService.asmx"', wsdl)
+        self.assertEqual(self.server.handle_get("/soap/v3/UnknownService.asmx"), (404, b""))
+        self.assertEqual(self.server.handle_get("/other/CompanyService.asmx"), (404, b""))
+        self.assertEqual(self.server.handle_post("/soap/v3/UnknownService.asmx", b""), (404, b""))
+
+    def test_auth_with_token(self):
+        """Test that the domain is retrieved by authenticating with a token."""
+        self.assertEqual(self.api.auth_manager.get_domain(), "fake")
+        self.assertGreaterEqual(self.server.calls["DebtorService:Environment_Get"], 1)
+
+    def test_listings(self):
+        """Test that the listing operations answer from the dataset."""
+        self.assertEqual([debtor.name for debtor in self.api.debtor.get_all()], ["Debtor 1"])
+        self.assertEqual([company.id for company in self.api.company.get_all()], [1, 2])
+        self.assertEqual(len(self.api.company.get_by_debtor(1)), 2)
+        self.assertEqual(len(self.api.employee.get_by_company(2, 1)), 5)
+        salaries = self.api.employee.salary.get_all_by_company(1)
+        self.assertEqual(sorted({salary.employee_id for salary in salaries}), [1, 2, 3, 4, 5])
+        self.assertEqual(self.api.company.get_by_debtor(2), [])
+
+    def test_runs_and_wage_taxes(self):
+        """Test the run and wage tax operations."""
+        runs = self.api.company.run.get(1, 2024)
+        self.assertEqual(len(runs), 12)
+        employees = self.api.company.run.get_all_employees_by_run(1, 2024, runs[0].id)
+        self.assertEqual([employee.id for employee in employees], [1, 2, 3, 4, 5])
+        wage_taxes = self.api.company.wage_tax.get_all_wagetax(2, 2024)
+        self.assertEqual(len(wage_taxes), 12)
+        details = self.api.company.wage_tax.get_wagetax_details(2, wage_taxes[0].loonaangifte_id)
+        self.assertIn("<LoonaangifteID>2001</LoonaangifteID>", details.xml)
+        self.assertIsNone(self.api.company.wage_tax.get_wagetax_details(2, 999999).xml)
+        self.assertEqual(self.api.company.run.get_all_employees_by_run(1, 2024, 999999), [])
+
+    def test_background_report(self):
+        """Test that background reports are started and polled until they succeed."""
+        self.server.task_duration = 0.2
+        try:
+            report = self.api.report.request_report(
+                "Reports_GetWageCodesByYear_Background", {"CompanyId": 1, "Year": 2024}, use_cache=False
+            )
+        finally:
+            self.server.task_duration = 0.0
+        salaries = sum(len(employee["Salaries"]) for employee in self.server.dataset.employees(1))
+        self.assertEqual(len(report["WageCodes"]["WageCode"]), salaries)
+        self.assertGreater(self.server.calls["ReportService:Reports_BackgroundTask_Result"], 1)
+
+    def test_journals_report(self):
+        """Test the journals report has a debit and a credit entry per salary in every run, and unknown tasks."""
+        report = self.api.report.journals_by_year(1, 2024, use_cache=False)
+        salaries = sum(len(employee["Salaries"]) for employee in self.server.dataset.employees(1))
+        self.assertEqual(len(report["Journals"]["JournalEntry"]), 2 * 12 * salaries)
+        self.assertEqual(self.api.report.background_task_status("unknown")["Status"], "Unknown")
+
+    def test_all_employees_by_company(self):
+        """Test that the bulk operations return the nested records of every employee of the company."""
+        employees = self.server.dataset.employees(2)
+
+        def expected(kind):
+            return sum(len(employee[kind]) for employee in employees)
+
+        self.assertEqual(len(self.api.employee.contract.get_all_by_company(2)), expected("Contracts"))
+        self.assertEqual(len(self.api.employee.schedule.get_all_by_company(2)), expected("Schedules"))
+        self.assertEqual(len(self.api.employee.address.get_all_by_company(2)), expected("Addresses"))
+        absences = self.api.employee.absence.get_all_by_company(2)
+        self.assertEqual(len(absences), expected("Absences"))
+        if absences:
+            self.assertIsNotNone(absences[0].cause.cause)
+        contract = self.api.employee.contract.get_all_by_company(2)[0]
+        self.assertEqual(contract.employee_id, employees[0]["Id"])
+        self.assertEqual(contract.id, employees[0]["Contracts"][0]["ContractID"])
+
+    def test_hour_components(self):
+        """Test that the fixed and variable hour components of an employee are returned."""
+        employee = self.server.dataset.employees(1)[0]
+        fixed = self.api.employee.hour_component.get_fixed(employee["Id"], 1, 2024)
+        variable = self.api.employee.hour_component.get_variable(employee["Id"], 1, 2024)
+        self.assertEqual(len(fixed) + len(variable), len(employee["HourComponents"]))
+        self.assertEqual(self.api.employee.hour_component.get_fixed(999999, 1, 2024), [])
+
+    def test_inject_fault(self):
+        """Test that injected faults are raised as the mapped exceptions, for the given number of calls."""
+        self.server.inject_fault("CompanyService:List_GetAll", times=2)
+        for _ in range(2):
+            with self.assertRaises(UnknownNmbrsException):
+                self.api.company.get_all()
+        self.assertEqual(len(self.api.company.get_all()), 2)
+
+        self.server.inject_fault("List_GetByCompany", code=2004, message="Unauthorized company")
+        with self.assertRaises(UnauthorizedCompanyException):
+            self.api.employee.get_by_company(1, 1)
+
+    def test_fault_rate(self):
+        """Test that random faults are raised at the configured rate."""
+        self.server.fault_rate = 1.0
+        with self.assertRaises(UnknownNmbrsException):
+            self.api.debtor.get_all()
+
+    def test_latency(self):
+        """Test that responses are delayed, and that concurrent requests are served concurrently."""
+        self.server.latency = lambda resource: 0.2 if resource == "DebtorService:List_GetAll" else 0.0
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: self.api.debtor.get_all(), range(4)))
+        elapsed = time.monotonic() - start
+        self.assertEqual(len(results), 4)
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.6)
+
+    def test_register(self):
+        """Test that additional operations can be registered, and that handlers can raise faults."""
+
+        def handler(server, CompanyId):  # pylint: disable=invalid-name
+            if CompanyId not in [company["ID"] for company in server.dataset.companies()]:
+                raise FakeFault(2004, "Unauthorized company")
+            return [{"Id": 1, "Description": "Sales"}]
+
+        department = ComplexType("Department", {"Id": "int", "Description": "string"})
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+        server.register(Operation("CompanyService", "Department_GetList", {"CompanyId": "int"}, ArrayOf(department), handler))
+        with server:
+            api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=server.base_uri)
+            departments = api.company.client.service.Department_GetList(CompanyId=1, _soapheaders=api.auth_manager.header)
+            self.assertEqual(departments[0]["Description"], "Sales")
+            with self.assertRaises(Exception) as context:
+                api.company.client.service.Department_GetList(CompanyId=2, _soapheaders=api.auth_manager.header)
+            self.assertIn("---> 2004: Unauthorized company", str(context.exception))
+
+    def test_invalid_request(self):
+        """Test that malformed requests are answered with a fault."""
+        status, body = self.server.handle_post("/soap/v3/CompanyService.asmx", b"<not-soap/>")
+        self.assertEqual(status, 500)
+        self.assertIn(b"---&gt; 9999: Invalid request", body)
+
+    def test_render_response_escapes(self):
+        """Test that values are escaped and empty values are left out."""
+        operation = Operation("DebtorService", "Test", {}, ComplexType("Test", {"Name": "string", "Email": "string"}), None)
+        body = render_response(operation, {"Name": "A & B", "Email": None})
+        self.assertIn(b"<Name>A &amp; B</Name>", body)
+        self.assertNotIn(b"Email", body)
+
+    def test_complex_parameters(self):
+        """Test that array parameters of complex types are parsed into dictionaries."""
+        calls = []
+        self.server.register(
+            Operation(
+                "EmployeeService",
+                "DaysFixed_Set_Batch",
+                {
+                    "EmployeesDaysWorked": ArrayOf(ComplexType("DaysWorked", {"EmployeeId": "int", "Days": "int"})),
+                    "UnprotectedMode": "boolean",
+                },
+                None,
+                lambda server, **arguments: calls.append(arguments),
+            )
+        )
+        api = Nmbrs("username", "token", base_uri=self.server.base_uri)
+        api.employee.client.service.DaysFixed_Set_Batch(
+            EmployeesDaysWorked={"DaysWorked": [{"EmployeeId": 1, "Days": 5}, {"EmployeeId": 2, "Days": 3}]},
+            UnprotectedMode=True,
+            _soapheaders=api.auth_manager.header,
+        )
+        self.assertEqual(
+            calls, [{"EmployeesDaysWorked": [{"EmployeeId": 1, "Days": 5}, {"EmployeeId": 2, "Days": 3}], "UnprotectedMode": True}]
+        )
+
+    def test_response_encoding(self):
+        """Test that responses are compressed with an accepted encoding, only when enabled."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1), compress_responses=True)
+        self.assertEqual(server.response_encoding("gzip, deflate, br"), "gzip")
+        self.assertEqual(server.response_encoding("br, deflate"), "deflate")
+        self.assertEqual(server.response_encoding("gzip;q=0, deflate;q=0.5"), "deflate")
+        self.assertIsNone(server.response_encoding("identity"))
+        self.assertIsNone(self.server.response_encoding("gzip"))
+
+    def test_compression(self):
+        """Test that compressed responses are sent and compressed requests are accepted or refused with 415."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1), compress_responses=True, accept_compressed_requests=True)
+        with server:
+            request = Request(f"{server.base_uri}CompanyService.asmx?WSDL", headers={"Accept-Encoding": "deflate"})
+            with urlopen(request) as response:
+                self.assertEqual(response.headers["Content-Encoding"], "deflate")
+                self.assertIn(b"wsdl:definitions", zlib.decompress(response.read()))
+            request = Request(
+                f"{server.base_uri}CompanyService.asmx", data=gzip.compress(b"<not-soap/>"), headers={"Content-Encoding": "gzip"}
+            )
+            with self.assertRaises(HTTPError) as context:
+                urlopen(request)  # pylint: disable=consider-using-with
+            self.assertEqual(context.exception.code, 500)
+            request = Request(f"{server.base_uri}CompanyService.asmx", data=b"<not-soap/>", headers={"Content-Encoding": "br"})
+            with self.assertRaises(HTTPError) as context:
+                urlopen(request)  # pylint: disable=consider-using-with
+            self.assertEqual(context.exception.code, 415)
+
+        request = Request(
+            f"{self.server.base_uri}CompanyService.asmx", data=gzip.compress(b"<not-soap/>"), headers={"Content-Encoding": "gzip"}
+        )
+        with self.assertRaises(HTTPError) as context:
+            urlopen(request)  # pylint: disable=consider-using-with
+        self.assertEqual(context.exception.code, 415)
+
+    def test_bandwidth(self):
+        """Test that the transfer of the bodies is delayed by the bandwidth."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1), bandwidth=100_000)
+        start = time.monotonic()
+        server.transfer(10_000)
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
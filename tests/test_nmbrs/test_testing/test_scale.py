@@ -0,0 +1,42 @@
+"""
+Scale tests of the bulk *_GetAll_AllEmployeesByCompany code paths against the fake server.
+
+The tests only run when NMBRS_SCALE lists the sizes to test, e.g. NMBRS_SCALE=1k,10k,100k python -m pytest tests.
+"""
+
+import os
+import time
+import unittest
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.testing.dataset import SIZES
+
+SCALE_SIZES = [size for size in os.environ.get("NMBRS_SCALE", "").split(",") if size]
+
+
+@unittest.skipUnless(SCALE_SIZES, "set NMBRS_SCALE, e.g. NMBRS_SCALE=1k,10k, to run the scale tests")
+class TestScale(unittest.TestCase):
+    """Fetch and parse the bulk endpoints of every company, for every size in NMBRS_SCALE."""
+
+    def test_all_employees_by_company(self):
+        """Test that every record of every employee is returned by the bulk endpoints."""
+        for size in SCALE_SIZES:
+            with self.subTest(size=size):
+                dataset = Dataset.generate(**SIZES[size])
+                with FakeNmbrsServer(dataset) as server:
+                    api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=server.base_uri)
+                    endpoints = {
+                        "Contracts": api.employee.contract.get_all_by_company,
+                        "Salaries": api.employee.salary.get_all_by_company,
+                        "Schedules": api.employee.schedule.get_all_by_company,
+                        "Addresses": api.employee.address.get_all_by_company,
+                        "Absences": api.employee.absence.get_all_by_company,
+                    }
+                    for kind, get_all_by_company in endpoints.items():
+                        start = time.perf_counter()
+                        records = sum(len(get_all_by_company(company["ID"])) for company in dataset.companies())
+                        elapsed = time.perf_counter() - start
+                        expected = sum(len(employee[kind]) for employee in dataset.data["employees"])
+                        self.assertEqual(records, expected)
+                        print(f"{size} {kind}: {records} records in {elapsed:.2f}s ({records / elapsed:.0f} records/s)")
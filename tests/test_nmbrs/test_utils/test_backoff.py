@@ -0,0 +1,18 @@
+"""Unit tests for the backoff_delays function."""
+
+import unittest
+from itertools import islice
+
+from src.nmbrs.utils.backoff import backoff_delays
+
+
+class TestBackoffDelays(unittest.TestCase):
+    """Unit tests for the backoff_delays function."""
+
+    def test_backoff_delays(self):
+        """Test the delays grow exponentially."""
+        self.assertEqual(list(islice(backoff_delays(0.5), 4)), [0.5, 1, 2, 4])
+
+    def test_backoff_delays_maximum(self):
+        """Test the delays are capped at the maximum."""
+        self.assertEqual(list(islice(backoff_delays(1, factor=3, maximum=5), 4)), [1, 3, 5, 5])
@@ -0,0 +1,68 @@
+"""Unit tests for the CompressionTransport class."""
+
+from unittest import TestCase
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.data_classes.employee import DaysWorked
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.compression import CompressionTransport
+from src.nmbrs.utils.metrics import metrics
+
+SALARIES = "EmployeeService:Salary_GetAll_AllEmployeesByCompany"
+DAYS = "EmployeeService:DaysFixed_Set_Batch"
+
+
+class TestCompressionTransport(TestCase):
+    """Unit tests for the CompressionTransport class."""
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.days = [DaysWorked(employee_id, 5, 1, 2024) for employee_id in range(500)]
+
+    def _call(self, server: FakeNmbrsServer, transport: CompressionTransport) -> dict:
+        """Retrieve salaries and set the fixed days of a batch, returning the payload sizes by resource."""
+        api = Nmbrs("username", "token", auth_type="domain", domain="fake", base_uri=server.base_uri, transport=transport)
+        api.employee.salary.get_all_by_company(1)
+        api.employee.days.post_batch_fixed(self.days, False)
+        return {resource: tenants["fake"] for resource, tenants in metrics.payloads().items()}
+
+    def test_compressed(self):
+        """Test that responses are compressed when accepted, and large requests are compressed when enabled."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=50), compress_responses=True, accept_compressed_requests=True)
+        with server:
+            payloads = self._call(server, CompressionTransport(compress_requests=True))
+
+        self.assertLess(payloads[SALARIES]["response_wire_bytes"] * 5, payloads[SALARIES]["response_bytes"])
+        self.assertEqual(payloads[SALARIES]["request_wire_bytes"], payloads[SALARIES]["request_bytes"])
+        self.assertLess(payloads[DAYS]["request_wire_bytes"] * 5, payloads[DAYS]["request_bytes"])
+
+    def test_uncompressed(self):
+        """Test that uncompressed responses are requested without an accepted encoding, and requests are not compressed by default."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=50), compress_responses=True, accept_compressed_requests=True)
+        with server:
+            payloads = self._call(server, CompressionTransport(accept_encoding=None))
+
+        self.assertEqual(payloads[SALARIES]["response_wire_bytes"], payloads[SALARIES]["response_bytes"])
+        self.assertEqual(payloads[DAYS]["request_wire_bytes"], payloads[DAYS]["request_bytes"])
+
+    def test_small_requests(self):
+        """Test that requests smaller than the minimum size are not compressed."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1), accept_compressed_requests=True)
+        with server:
+            payloads = self._call(server, CompressionTransport(compress_requests=True, min_request_size=10**7))
+
+        self.assertEqual(payloads[DAYS]["request_wire_bytes"], payloads[DAYS]["request_bytes"])
+
+    def test_refused(self):
+        """Test that a refused compressed request is sent again uncompressed, and later requests are not compressed."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=1))
+        transport = CompressionTransport(compress_requests=True)
+        with server:
+            with self.assertLogs("src.nmbrs.utils.compression", level="WARNING"):
+                self._call(server, transport)
+            self._call(server, transport)
+
+        self.assertEqual(server.calls[DAYS], 2)
+        self.assertEqual(transport._uncompressed_addresses, {f"{server.base_uri}EmployeeService.asmx"})  # pylint: disable=protected-access
+        self.assertEqual(metrics.payloads()[DAYS]["fake"]["requests"], 2)
@@ -0,0 +1,91 @@
+"""Unit tests for the document_stream module."""
+
+import base64
+import binascii
+import io
+import os
+import tempfile
+import unittest
+
+from src.nmbrs.utils.document_stream import Base64Writer, write_base64_element, write_base64_elements, write_text_elements
+
+
+class TestDocumentStream(unittest.TestCase):
+    """Unit tests for the document_stream module."""
+
+    def test_base64_writer(self):
+        """Test decoding base64 text split at arbitrary positions."""
+        data = bytes(range(256)) * 10
+        text = base64.encodebytes(data).decode()
+        stream = io.BytesIO()
+        writer = Base64Writer(stream)
+        for start in range(0, len(text), 7):
+            writer.write(text[start : start + 7])
+        writer.close()
+        self.assertEqual(stream.getvalue(), data)
+        self.assertEqual(writer.size, len(data))
+
+    def test_base64_writer_incomplete(self):
+        """Test incomplete base64 text raises an exception."""
+        writer = Base64Writer(io.BytesIO())
+        writer.write("YWJjZ")
+        with self.assertRaises(binascii.Error):
+            writer.close()
+
+    def test_write_base64_element_missing(self):
+        """Test an empty document is written when the element does not exist."""
+        stream = io.BytesIO()
+        with self.assertLogs("src.nmbrs.utils.document_stream", level="WARNING"):
+            document = write_base64_element(b"<root><Other>YWJj</Other></root>", "Result", stream)
+        self.assertEqual(document.size, 0)
+
+    def test_write_base64_elements_without_name(self):
+        """Test temporary files are removed when a document has no name."""
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                write_base64_elements(b"<root><Item><PDF>YWJj</PDF></Item></root>", "PDF", "EmployeeId", directory)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_write_base64_elements_path_traversal(self):
+        """Test names that are not plain file names are rejected, no file is written outside of the directory."""
+        with tempfile.TemporaryDirectory() as parent:
+            directory = os.path.join(parent, "payslips")
+            for name in ("../escaped", "sub/1234", os.path.join(parent, "absolute"), ".."):
+                with self.subTest(name=name):
+                    source = f"<root><Item><PDF>YWJj</PDF><EmployeeId>{name}</EmployeeId></Item></root>".encode()
+                    with self.assertRaises(ValueError):
+                        write_base64_elements(source, "PDF", "EmployeeId", directory, suffix="")
+            self.assertEqual(os.listdir(parent), ["payslips"])
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_base64_writer_ignores_invalid_characters(self):
+        """Test characters outside the base64 alphabet are ignored when closing."""
+        stream = io.BytesIO()
+        writer = Base64Writer(stream)
+        writer.write("YWJj!")
+        writer.close()
+        self.assertEqual(stream.getvalue(), b"abc")
+
+    def test_write_base64_element_nested(self):
+        """Test the text of elements nested in the element is not part of the document."""
+        stream = io.BytesIO()
+        write_base64_element(b"<root><Result>YWJj<Note>ZGVm</Note></Result></root>", "Result", stream)
+        self.assertEqual(stream.getvalue(), b"abc")
+
+    def test_write_base64_elements_nested(self):
+        """Test documents are named after non-numeric names and nested elements are ignored."""
+        source = b"<root><Item><PDF>YWJj<PDF>ZGVm</PDF></PDF><EmployeeId>abc</EmployeeId></Item></root>"
+        with tempfile.TemporaryDirectory() as directory:
+            documents = write_base64_elements(source, "PDF", "EmployeeId", directory)
+            self.assertEqual(os.listdir(directory), ["abc.pdf"])
+        self.assertEqual(documents[0].employee_id, "abc")
+
+    def test_write_text_elements(self):
+        """Test the unescaped text of elements is written to their streams or returned, in chunks."""
+        source = b"<s:Body xmlns:s='urn:s'><s:Status>Success</s:Status><Content>&lt;report&gt;a<b/>b&lt;/report&gt;</Content></s:Body>"
+        stream = io.StringIO()
+        texts = write_text_elements(
+            (source[start : start + 5] for start in range(0, len(source), 5)), {"Status": None, "Content": stream, "Other": None}
+        )
+        self.assertEqual(texts, {"Status": "Success", "Content": "", "Other": None})
+        self.assertEqual(stream.getvalue(), "<report>ab</report>")
@@ -0,0 +1,129 @@
+"""Unit tests for the document_upload module."""
+
+import base64
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from lxml import etree
+from zeep import Client
+
+from src.nmbrs.utils.document_upload import Base64Body, get_document_name, post_document
+
+WSDL = """<?xml version="1.0" encoding="utf-8"?>
+<wsdl:definitions xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:s="http://www.w3.org/2001/XMLSchema" xmlns:tns="urn:test" targetNamespace="urn:test">
+  <wsdl:types>
+    <s:schema elementFormDefault="qualified" targetNamespace="urn:test">
+      <s:element name="Upload">
+        <s:complexType><s:sequence>
+          <s:element name="Id" type="s:int"/>
+          <s:element name="Body" type="s:base64Binary"/>
+        </s:sequence></s:complexType>
+      </s:element>
+      <s:element name="UploadResponse">
+        <s:complexType><s:sequence><s:element name="UploadResult" type="s:boolean"/></s:sequence></s:complexType>
+      </s:element>
+    </s:schema>
+  </wsdl:types>
+  <wsdl:message name="UploadIn"><wsdl:part name="parameters" element="tns:Upload"/></wsdl:message>
+  <wsdl:message name="UploadOut"><wsdl:part name="parameters" element="tns:UploadResponse"/></wsdl:message>
+  <wsdl:portType name="TestPort">
+    <wsdl:operation name="Upload"><wsdl:input message="tns:UploadIn"/><wsdl:output message="tns:UploadOut"/></wsdl:operation>
+  </wsdl:portType>
+  <wsdl:binding name="TestBinding" type="tns:TestPort">
+    <soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>
+    <wsdl:operation name="Upload">
+      <soap:operation soapAction="urn:test/Upload" style="document"/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+  </wsdl:binding>
+  <wsdl:service name="TestService">
+    <wsdl:port name="TestPort" binding="tns:TestBinding"><soap:address location="http://localhost/test"/></wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>
+"""
+
+RESPONSE = b"""<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>
+<UploadResponse xmlns="urn:test"><UploadResult>true</UploadResult></UploadResponse>
+</soap:Body></soap:Envelope>"""
+
+
+class TestDocumentUpload(unittest.TestCase):
+    """Unit tests for the document_upload module."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        wsdl_path = os.path.join(self.directory.name, "test.wsdl")
+        with open(wsdl_path, "w", encoding="utf-8") as file:
+            file.write(WSDL)
+        self.client = Client(wsdl_path)
+        self.requests = []
+
+        def post(address, body, headers):
+            self.requests.append((address, b"".join(body), len(body), headers))
+            return Mock(status_code=200, content=RESPONSE, headers={"Content-Type": "text/xml"}, encoding="utf-8")
+
+        self.client.transport.post = post
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_base64_body(self):
+        """Test the body is encoded in chunks and can be iterated more than once."""
+        data = os.urandom(1000)
+        stream = io.BytesIO(data)
+        body = Base64Body(b"<a>", stream, b"</a>")
+        self.assertEqual(b"".join(body), b"<a>" + base64.b64encode(data) + b"</a>")
+        self.assertEqual(b"".join(body), b"<a>" + base64.b64encode(data) + b"</a>")
+        self.assertEqual(len(body), len(b"".join(body)))
+
+    def test_base64_body_short_reads(self):
+        """Test only the last chunk is padded when the stream returns fewer bytes than requested."""
+
+        class ShortReads(io.BytesIO):
+            """A stream returning at most 1000 bytes per read."""
+
+            def read(self, size=-1):
+                return super().read(min(size, 1000) if size >= 0 else 1000)
+
+        data = os.urandom(10_000)
+        chunks = list(Base64Body(b"", ShortReads(data), b""))
+        self.assertEqual(b"".join(chunks), base64.b64encode(data))
+        self.assertFalse(any(b"=" in chunk for chunk in chunks[:-2]))
+
+    def test_post_document_without_field(self):
+        """Test a request without the placeholder of the field is not sent."""
+        with patch("src.nmbrs.utils.document_upload.create_request") as create_request:
+            create_request.return_value = (etree.fromstring(b"<Upload><Body>b3RoZXI=</Body></Upload>"), {}, "http://localhost/test")
+            with self.assertRaises(ValueError):
+                post_document(self.client, "Upload", "Body", io.BytesIO(b"data"), Id=5)
+        self.assertEqual(self.requests, [])
+
+    def test_post_document(self):
+        """Test the file is streamed into the envelope created by zeep."""
+        data = os.urandom(500_000)
+        path = os.path.join(self.directory.name, "document.pdf")
+        with open(path, "wb") as file:
+            file.write(data)
+
+        result = post_document(self.client, "Upload", "Body", path, Id=5)
+
+        self.assertTrue(result)
+        address, body, length, headers = self.requests[0]
+        self.assertEqual(address, "http://localhost/test")
+        self.assertEqual(len(body), length)
+        self.assertEqual(headers["SOAPAction"], '"urn:test/Upload"')
+        envelope = etree.fromstring(body)
+        self.assertEqual(envelope.findtext(".//{urn:test}Id"), "5")
+        self.assertEqual(base64.b64decode(envelope.findtext(".//{urn:test}Body")), data)
+
+    def test_get_document_name(self):
+        """Test the document name is taken from the file name."""
+        self.assertEqual(get_document_name(os.path.join("dir", "document.pdf")), "document.pdf")
+        with self.assertRaises(ValueError):
+            get_document_name(io.BytesIO())
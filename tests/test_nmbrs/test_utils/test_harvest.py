@@ -0,0 +1,78 @@
+"""Unit tests for the harvest module."""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from src.nmbrs.utils.harvest import Manifest, fan_out, write_compressed
+
+
+class TestHarvest(unittest.TestCase):
+    """Unit tests for the harvest module."""
+
+    def test_fan_out(self):
+        """Test listing and processing items, skipping and reporting errors per item."""
+
+        def list_items(key):
+            if key == "c":
+                raise ValueError("list")
+            return [f"{key}1", f"{key}2", f"{key}3"]
+
+        def process(item):
+            if item == "b2":
+                raise ValueError("process")
+            return item.upper()
+
+        results = list(fan_out(["a", "b", "c"], list_items, process, max_workers=2, skip=lambda item: item.endswith("3")))
+
+        statuses = {(result.key, result.item): result.status for result in results}
+        self.assertEqual(statuses[("a", "a1")], "Success")
+        self.assertEqual(statuses[("a", "a3")], "Skipped")
+        self.assertEqual(statuses[("b", "b2")], "Error")
+        self.assertEqual(statuses[("c", None)], "Error")
+        self.assertEqual(len(results), 7)
+        self.assertIn("A1", [result.result for result in results])
+
+    def test_manifest(self):
+        """Test the manifest is persisted."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+            manifest = Manifest(path)
+            manifest.add("1/2", {"period": 1})
+            manifest.save()
+
+            manifest = Manifest(path)
+            self.assertIn("1/2", manifest)
+            self.assertEqual(manifest.get("1/2"), {"period": 1})
+            self.assertEqual(len(manifest), 1)
+
+    def test_manifest_journal(self):
+        """Test the entries are kept when the manifest is not saved, e.g. when the process is interrupted."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+            manifest = Manifest(path)
+            manifest.add("1/2", {"period": 1})
+            manifest.save()
+            manifest = Manifest(path)
+            manifest.add("1/3", {"period": 2})
+            manifest._journal.close()  # pylint: disable=protected-access
+            with open(f"{path}.log", "a", encoding="utf-8") as journal:
+                journal.write('{"key": "1/4", "meta')
+
+            with self.assertLogs("src.nmbrs.utils.harvest", level="WARNING"):
+                manifest = Manifest(path)
+            self.assertEqual(manifest.entries, {"1/2": {"period": 1}, "1/3": {"period": 2}})
+            manifest.save()
+            self.assertEqual(sorted(os.listdir(directory)), ["manifest.json"])
+            self.assertEqual(len(Manifest(path)), 2)
+
+    def test_write_compressed(self):
+        """Test writing a compressed file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sub", "file.xml.gz")
+            size = write_compressed(path, "<xml/>" * 100)
+            self.assertEqual(size, os.path.getsize(path))
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["file.xml.gz"])
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                self.assertEqual(file.read(), "<xml/>" * 100)
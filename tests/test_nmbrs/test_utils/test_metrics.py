@@ -0,0 +1,172 @@
+"""Unit tests for the metrics registry."""
+
+from unittest import TestCase
+
+import zeep.exceptions
+
+from src.nmbrs.exceptions import AuthenticationException
+from src.nmbrs.utils.metrics import LATENCY_BUCKETS, MetricsRegistry, metrics
+from src.nmbrs.utils.nmbrs_exception_handler import nmbrs_exception_handler
+
+
+class TestMetricsRegistry(TestCase):
+    """Unit tests for the MetricsRegistry class."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_record(self):
+        """Test that calls, records, errors and latency are recorded per resource."""
+        self.registry.record("Service:A", 0.003, records=10)
+        self.registry.record("Service:A", 0.2, records=5)
+        self.registry.record("Service:A", 500, error=ValueError())
+
+        snapshot = self.registry.snapshot()
+
+        self.assertEqual(list(snapshot), ["Service:A"])
+        self.assertEqual(snapshot["Service:A"]["count"], 3)
+        self.assertEqual(snapshot["Service:A"]["records"], 15)
+        self.assertEqual(snapshot["Service:A"]["error_count"], 1)
+        self.assertEqual(snapshot["Service:A"]["errors"], {"ValueError": 1})
+        self.assertAlmostEqual(snapshot["Service:A"]["latency_sum"], 500.203)
+        buckets = snapshot["Service:A"]["latency_buckets"]
+        self.assertEqual(list(buckets), [*LATENCY_BUCKETS, float("inf")])
+        self.assertEqual(buckets[0.005], 1)
+        self.assertEqual(buckets[0.1], 1)
+        self.assertEqual(buckets[0.25], 2)
+        self.assertEqual(buckets[120.0], 2)
+        self.assertEqual(buckets[float("inf")], 3)
+
+    def test_bucket_upper_bound_is_inclusive(self):
+        """Test that a latency equal to a bound is counted in the bucket of that bound."""
+        self.registry.record("Service:A", 0.01)
+
+        self.assertEqual(self.registry.snapshot()["Service:A"]["latency_buckets"][0.005], 0)
+        self.assertEqual(self.registry.snapshot()["Service:A"]["latency_buckets"][0.01], 1)
+
+    def test_top(self):
+        """Test that the resources are sorted by the metric, highest first."""
+        self.registry.record("Service:A", 1.0, records=1)
+        self.registry.record("Service:B", 3.0, records=1)
+        self.registry.record("Service:C", 2.0, records=7)
+
+        self.assertEqual([resource for resource, _ in self.registry.top()], ["Service:B", "Service:C", "Service:A"])
+        self.assertEqual([resource for resource, _ in self.registry.top(1, key="records")], ["Service:C"])
+
+    def test_reset(self):
+        """Test that reset removes all metrics."""
+        self.registry.record("Service:A", 1.0)
+        self.registry.reset()
+
+        self.assertEqual(self.registry.snapshot(), {})
+
+    def test_disabled(self):
+        """Test that a disabled registry does not record calls."""
+        self.registry.enabled = False
+        self.registry.record("Service:A", 1.0)
+
+        self.assertEqual(self.registry.snapshot(), {})
+
+    def test_render_prometheus(self):
+        """Test the Prometheus text format of the metrics."""
+        self.registry.record("Service:A", 0.003, records=2)
+        self.registry.record('Service:"B"', 200.0, error=KeyError())
+
+        text = self.registry.render_prometheus(prefix="test")
+
+        self.assertTrue(text.endswith("\n"))
+        lines = text.splitlines()
+        self.assertIn("# TYPE test_calls_total counter", lines)
+        self.assertIn('test_calls_total{resource="Service:A"} 1', lines)
+        self.assertIn('test_errors_total{resource="Service:\\"B\\"",exception="KeyError"} 1', lines)
+        self.assertIn('test_records_total{resource="Service:A"} 2', lines)
+        self.assertIn("# TYPE test_call_duration_seconds histogram", lines)
+        self.assertIn('test_call_duration_seconds_bucket{resource="Service:A",le="0.005"} 1', lines)
+        self.assertIn('test_call_duration_seconds_bucket{resource="Service:\\"B\\"",le="120.0"} 0', lines)
+        self.assertIn('test_call_duration_seconds_bucket{resource="Service:\\"B\\"",le="+Inf"} 1', lines)
+        self.assertIn('test_call_duration_seconds_sum{resource="Service:\\"B\\""} 200.0', lines)
+        self.assertIn('test_call_duration_seconds_count{resource="Service:A"} 1', lines)
+
+    def test_record_payload(self):
+        """Test that the sizes of the requests and responses are recorded by resource and tenant."""
+        self.registry.record_payload("Service:A", "tenant", 100, 40, 1000, 100)
+        self.registry.record_payload("Service:A", "tenant", 100, 40, 3000, 300)
+        self.registry.record_payload("Service:A", "", 10, 10, 20, 20)
+
+        self.assertEqual(
+            self.registry.payloads()["Service:A"]["tenant"],
+            {"requests": 2, "request_bytes": 200, "request_wire_bytes": 80, "response_bytes": 4000, "response_wire_bytes": 400},
+        )
+        self.assertEqual(self.registry.payloads()["Service:A"][""]["requests"], 1)
+        lines = self.registry.render_prometheus().splitlines()
+        self.assertIn("# TYPE nmbrs_response_wire_bytes_total counter", lines)
+        self.assertIn('nmbrs_request_bytes_total{resource="Service:A",tenant="tenant"} 200', lines)
+        self.assertIn('nmbrs_request_wire_bytes_total{resource="Service:A",tenant=""} 10', lines)
+        self.assertIn('nmbrs_response_bytes_total{resource="Service:A",tenant="tenant"} 4000', lines)
+        self.assertIn('nmbrs_response_wire_bytes_total{resource="Service:A",tenant="tenant"} 400', lines)
+
+        self.registry.reset()
+        self.assertEqual(self.registry.payloads(), {})
+
+        self.registry.enabled = False
+        self.registry.record_payload("Service:A", "tenant", 1, 1, 1, 1)
+        self.assertEqual(self.registry.payloads(), {})
+
+
+class TestExceptionHandlerMetrics(TestCase):
+    """Unit tests for the metrics recorded by the nmbrs_exception_handler decorator."""
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_records_returned(self):
+        """Test that the number of records returned is recorded."""
+
+        @nmbrs_exception_handler(resource="Test:List")
+        def get_list():
+            return [1, 2, 3]
+
+        @nmbrs_exception_handler(resource="Test:Single")
+        def get_single():
+            return 1
+
+        @nmbrs_exception_handler(resource="Test:None")
+        def get_none():
+            return None
+
+        get_list()
+        get_list()
+        get_single()
+        get_none()
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["Test:List"]["count"], 2)
+        self.assertEqual(snapshot["Test:List"]["records"], 6)
+        self.assertEqual(snapshot["Test:Single"]["records"], 1)
+        self.assertEqual(snapshot["Test:None"]["records"], 0)
+        self.assertEqual(snapshot["Test:None"]["error_count"], 0)
+
+    def test_fault_recorded_by_exception_class(self):
+        """Test that a SOAP fault is recorded by the class of the Nmbrs exception it is mapped to."""
+
+        @nmbrs_exception_handler(resource="Test:Fault")
+        def raise_fault():
+            raise zeep.exceptions.Fault("---> 1001: Invalid Authentication")
+
+        with self.assertRaises(AuthenticationException):
+            raise_fault()
+
+        self.assertEqual(metrics.snapshot()["Test:Fault"]["errors"], {"AuthenticationException": 1})
+
+    def test_other_error_recorded(self):
+        """Test that other exceptions are recorded and raised unchanged."""
+
+        @nmbrs_exception_handler(resource="Test:Error")
+        def raise_error():
+            raise ConnectionError("unreachable")
+
+        with self.assertRaises(ConnectionError):
+            raise_error()
+
+        self.assertEqual(metrics.snapshot()["Test:Error"]["errors"], {"ConnectionError": 1})
@@ -17,6 +17,7 @@ from src.nmbrs.exceptions import (
     UnknownException,
     NoValidSubscriptionException,
     InvalidCredentialsException,
+    NotFoundException,
 )
 from src.nmbrs.utils.nmbrs_exception_handler import nmbrs_exception_handler
 
@@ -184,3 +185,18 @@ class TestNmbrsExceptionHandler(TestCase):
             exception_raised()
 
         self.assertEqual(context.exception.resource, "resource1")
+
+    def test_fault(self):
+        """Test that the exception has the structured fault, with the code and the raw fault string."""
+
+        @nmbrs_exception_handler(resource="resource1")
+        def exception_raised():
+            raise zeep.exceptions.Fault("Server was unable to process request. ---> 2046: Not found")
+
+        with self.assertRaises(NotFoundException) as context:
+            exception_raised()
+
+        self.assertEqual(context.exception.fault.code, 2046)
+        self.assertEqual(context.exception.fault.detail, "Server was unable to process request. ---> 2046: Not found")
+        self.assertTrue(context.exception.client_error)
+        self.assertIsInstance(context.exception.__cause__, zeep.exceptions.Fault)
@@ -0,0 +1,129 @@
+"""Unit tests for the accounting of the request and response sizes."""
+
+import gzip
+import io
+import logging
+from unittest import TestCase
+
+import requests
+from urllib3 import HTTPResponse
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.metrics import metrics
+from src.nmbrs.utils.payload_size import get_resource, payload_sizes, record_payload
+
+
+def _response(content: bytes, headers: dict | None = None, compress: bool = False) -> requests.Response:
+    """Create a response read from a urllib3 response, optionally compressed with gzip."""
+    headers = dict(headers or {})
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+        body = gzip.compress(content)
+    else:
+        body = content
+    response = requests.Response()
+    response.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=200, preload_content=False)
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.status_code = 200
+    return response
+
+
+class TestPayloadSize(TestCase):
+    """Unit tests for the payload_size module."""
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_get_resource(self):
+        """Test the resource is named after the service of the address and the operation."""
+        self.assertEqual(
+            get_resource("https://api.nmbrs.nl/soap/v3/EmployeeService.asmx", "Absence_GetList"), "EmployeeService:Absence_GetList"
+        )
+        self.assertEqual(get_resource("http://127.0.0.1:8080/soap/v3/SingleSignOn.asmx?x=1", "GetToken"), "SingleSignOn:GetToken")
+
+    def test_compressed_response(self):
+        """Test the size of a compressed response is the number of bytes read before decompressing."""
+        content = b"<Envelope>" + b"<Row>value</Row>" * 1000 + b"</Envelope>"
+        response = _response(content, compress=True)
+
+        request_size, request_wire_size, response_size, response_wire_size = payload_sizes(b"<Envelope/>", response)
+
+        self.assertEqual((request_size, request_wire_size), (11, 11))
+        self.assertEqual(response_size, len(content))
+        self.assertEqual(response_wire_size, len(gzip.compress(content)))
+        self.assertLess(response_wire_size * 10, response_size)
+
+    def test_compressed_request(self):
+        """Test the size of a request as sent is the size of the prepared body, e.g. when it was compressed."""
+        response = _response(b"<Envelope/>")
+        response.request = requests.Request("POST", "http://localhost/", data=gzip.compress(b"<Envelope>" * 100)).prepare()
+
+        request_size, request_wire_size, _, _ = payload_sizes(b"<Envelope>" * 100, response)
+
+        self.assertEqual(request_size, 1000)
+        self.assertEqual(request_wire_size, len(gzip.compress(b"<Envelope>" * 100)))
+
+    def test_without_raw_response(self):
+        """Test the size of responses not read from the network, e.g. replayed responses."""
+        response = requests.Response()
+        response._content = b"<Envelope/>"  # pylint: disable=protected-access
+        self.assertEqual(payload_sizes(b"", response)[3], 11)
+
+        response.headers["Content-Length"] = "5"
+        self.assertEqual(payload_sizes(b"", response)[3], 5)
+
+    def test_streamed_response(self):
+        """Test the size of a streamed response is the number of bytes read, its content is not read again."""
+        response = requests.Response()
+        self.assertEqual(payload_sizes(b"123", response, 42), (3, 3, 42, 42))
+
+    def test_record_payload(self):
+        """Test the sizes are recorded by resource and tenant, and logged."""
+        header = {"AuthHeaderWithDomain": {"Username": "user", "Token": "token", "Domain": "domain"}}
+
+        with self.assertLogs("src.nmbrs.utils.payload_size", level="DEBUG") as logs:
+            record_payload("Service:Operation", header, b"12345", _response(b"1234567890"))
+        record_payload("Service:Operation", None, b"123", _response(b"1"))
+
+        self.assertIn("Service:Operation (domain): sent 5 bytes (5 transferred), received 10 bytes (10 transferred).", logs.output[0])
+        self.assertEqual(
+            metrics.payloads(),
+            {
+                "Service:Operation": {
+                    "domain": {"requests": 1, "request_bytes": 5, "request_wire_bytes": 5, "response_bytes": 10, "response_wire_bytes": 10},
+                    "": {"requests": 1, "request_bytes": 3, "request_wire_bytes": 3, "response_bytes": 1, "response_wire_bytes": 1},
+                }
+            },
+        )
+
+    def test_record_payload_disabled(self):
+        """Test nothing is measured when the metrics are disabled and debug logging is off."""
+        metrics.enabled = False
+        self.addCleanup(setattr, metrics, "enabled", True)
+        logger = logging.getLogger("src.nmbrs.utils.payload_size")
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, level)
+
+        record_payload("Service:Operation", None, None, None)
+
+        self.assertEqual(metrics.payloads(), {})
+
+    def test_service_calls(self):
+        """Test the sizes of the calls of the services are recorded with the resources of the decorators."""
+        server = FakeNmbrsServer(Dataset.generate(companies=2, employees=5))
+        with server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri)
+            metrics.reset()
+            api.company.get_all()
+            api.company.get_all()
+
+        payloads = metrics.payloads()
+        self.assertEqual(list(payloads), ["CompanyService:List_GetAll"])
+        self.assertEqual(list(metrics.snapshot()), ["CompanyService:List_GetAll"])
+        sizes = payloads["CompanyService:List_GetAll"]["fake"]
+        self.assertEqual(sizes["requests"], 2)
+        self.assertEqual(sizes["request_bytes"], sizes["request_wire_bytes"])
+        self.assertGreater(sizes["response_bytes"], 0)
@@ -0,0 +1,99 @@
+"""Unit tests for the raw calls of the services."""
+
+import unittest
+
+import requests
+import zeep.exceptions
+from lxml import etree
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.exceptions import UnauthorizedCompanyException
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.metrics import metrics
+from src.nmbrs.utils.raw import raw_call, raw_reply
+from src.nmbrs.utils.tracing import InMemoryTracer, set_tracer
+
+SOAP = "http://schemas.xmlsoap.org/soap/envelope/"
+
+
+def _response(body: str) -> requests.Response:
+    """Create a response with status 200 and a SOAP envelope with the given body."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = f'<soap:Envelope xmlns:soap="{SOAP}"><soap:Body>{body}</soap:Body></soap:Envelope>'.encode()
+    return response
+
+
+class TestRawMode(unittest.TestCase):
+    """Unit tests for the raw calls of the services."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeNmbrsServer(Dataset.generate(companies=2, employees=10)).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.api = Nmbrs("username", "token", base_uri=self.server.base_uri)
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_element(self):
+        """Test that the response element of the operation is returned by default."""
+        element = raw_call(self.api.employee, "Salary_GetAll_AllEmployeesByCompany", CompanyID=1)
+
+        self.assertIsInstance(element, etree._Element)  # pylint: disable=protected-access
+        self.assertEqual(etree.QName(element).localname, "Salary_GetAll_AllEmployeesByCompanyResponse")
+        salaries = element.findall(".//{*}Salary_V2")  # pylint: disable=no-member
+        self.assertEqual(len(salaries), len(self.api.employee.salary.get_all_by_company(1)))
+        self.assertEqual(metrics.snapshot()["EmployeeService:Salary_GetAll_AllEmployeesByCompany"]["count"], 2)
+
+    def test_bytes(self):
+        """Test that the body of the HTTP response is returned in bytes mode, and data classes by the methods."""
+        content = raw_call(self.api.company, "List_GetAll", "bytes")
+
+        self.assertIsInstance(content, bytes)
+        self.assertIn(b"List_GetAllResponse", content)
+        self.assertEqual(len(self.api.company.get_all()), 2)
+
+    def test_microservice(self):
+        """Test that the operations of a service are called through its microservices, with their client."""
+        content = raw_call(self.api.employee.salary, "Salary_GetAll_AllEmployeesByCompany", "bytes", CompanyID=1)
+
+        self.assertEqual(content, raw_call(self.api.employee, "Salary_GetAll_AllEmployeesByCompany", "bytes", CompanyID=1))
+
+    def test_span(self):
+        """Test that the span of a raw call ends without error, and without the build_objects phase."""
+        tracer = InMemoryTracer()
+        set_tracer(tracer)
+        self.addCleanup(set_tracer, None)
+        raw_call(self.api.company, "List_GetAll", "bytes")
+
+        span = tracer.spans[-1]
+        self.assertEqual(span.name, "CompanyService:List_GetAll")
+        self.assertIsNone(span.error)
+        self.assertEqual(span.phases["build_objects"], 0.0)
+
+    def test_fault(self):
+        """Test that faults are raised as the exceptions of the SDK."""
+        for mode in ("bytes", "element"):
+            self.server.inject_fault("List_GetAll", code=2004, message="Unauthorized company")
+            with self.assertRaises(UnauthorizedCompanyException):
+                raw_call(self.api.company, "List_GetAll", mode)
+
+    def test_unknown_mode(self):
+        """Test that unknown modes are refused."""
+        with self.assertRaises(ValueError):
+            raw_call(self.api.company, "List_GetAll", "dict")
+
+    def test_raw_reply(self):
+        """Test that faults answered with status 200 are raised, and an empty body returns None."""
+        client = self.api.company.client
+        binding = client.service._binding  # pylint: disable=protected-access
+        fault = "<soap:Fault><faultcode>soap:Server</faultcode><faultstring>---> 2004: Unauthorized company</faultstring></soap:Fault>"
+        with self.assertRaises(zeep.exceptions.Fault) as context:
+            raw_reply(client, binding, "List_GetAll", _response(fault), "element")
+        self.assertIn("2004", str(context.exception))
+        self.assertIsNone(raw_reply(client, binding, "List_GetAll", _response(""), "element"))
@@ -0,0 +1,83 @@
+"""Unit tests for the soap_request module."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+from zeep import Transport
+from zeep.wsdl.utils import etree_to_string
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.testing.cassette import RecordingTransport
+from src.nmbrs.utils.metrics import metrics
+from src.nmbrs.utils.soap_request import create_request, iter_body, post_stream, stream_operation
+from src.nmbrs.utils.tracing import InMemoryTracer, end_span, set_tracer, start_span
+
+
+class TestSoapRequest(unittest.TestCase):
+    """Unit tests for the soap_request module."""
+
+    def _post(self, transport: Transport) -> tuple[bytes, Mock]:
+        """Send a request of CompanyService:List_GetAll to the fake server, with a transport."""
+        with FakeNmbrsServer(Dataset.generate(companies=2, employees=1)) as server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri, transport=transport)
+            envelope, http_headers, address = create_request(api.company.client, "List_GetAll", {"_soapheaders": api.auth_manager.header})
+            self.assertEqual(address, f"{server.base_uri}CompanyService.asmx")
+            self.assertIn("List_GetAll", http_headers["SOAPAction"])
+            with patch.object(requests.Session, "post", autospec=True, side_effect=requests.Session.post) as post:
+                with post_stream(api.company.client, address, etree_to_string(envelope), http_headers) as response:
+                    body = b"".join(iter_body(response, 16))
+        return body, post
+
+    def test_streamed(self):
+        """Test that the response of the default transport is streamed."""
+        body, post = self._post(Transport())
+        self.assertIn(b"List_GetAllResponse", body)
+        self.assertTrue(post.call_args.kwargs["stream"])
+
+    def test_stream_operation(self):
+        """Test that the phases and the payload sizes of a streamed call are recorded, as for the other calls."""
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        tracer = InMemoryTracer()
+        set_tracer(tracer)
+        self.addCleanup(set_tracer, None)
+        with FakeNmbrsServer(Dataset.generate(companies=2, employees=1)) as server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri)
+            span = start_span("CompanyService:List_GetAll", api.company)
+            with stream_operation(api.company.client, "List_GetAll", {"_soapheaders": api.auth_manager.header}, 16) as body:
+                streamed = b"".join(body)
+            end_span(span)
+
+        self.assertEqual([phase for phase, _, _ in span.intervals], ["serialize_request", "http"])
+        payload = metrics.payloads()["CompanyService:List_GetAll"]["fake"]
+        self.assertEqual(payload["requests"], 1)
+        self.assertEqual(payload["response_bytes"], len(streamed))
+        self.assertGreater(payload["request_bytes"], 0)
+
+    def test_custom_transport(self):
+        """Test that transports overriding post receive the request, e.g. to record it."""
+        transport = RecordingTransport()
+        body, post = self._post(transport)
+        self.assertIn(b"List_GetAllResponse", body)
+        self.assertNotIn("stream", post.call_args.kwargs)
+        self.assertIn("List_GetAll", transport.cassette.interactions[-1]["action"])
+
+    def test_response_without_connection(self):
+        """Test the body of a response created without a connection, e.g. by a cassette."""
+        response = requests.Response()
+        response._content = b"<Envelope/>"  # pylint: disable=protected-access
+        self.assertEqual(list(iter_body(response, 4)), [b"<Envelope/>"])
+        with post_stream(Mock(transport=Mock(post=Mock(return_value=response))), "address", b"", {}) as posted:
+            self.assertIs(posted, response)
+
+    def test_unsupported_zeep(self):
+        """Test that a zeep version whose private API may have changed raises an ImportError."""
+        client = Mock()
+        client.service._binding_options = {"address": "address"}
+        with patch("src.nmbrs.utils.soap_request.ZEEP_MAJOR_VERSION", "5"), self.assertRaises(ImportError):
+            create_request(client, "List_GetAll", {})
+        del client.service._binding_options
+        with self.assertRaises(ImportError):
+            create_request(client, "List_GetAll", {})
@@ -0,0 +1,213 @@
+"""Unit tests for tracing the calls of the SOAP operations."""
+
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeep import Client
+from zeep.plugins import HistoryPlugin
+
+from src.nmbrs.api import Nmbrs
+from src.nmbrs.auth.token_manager import AuthManager
+from src.nmbrs.exceptions import UnknownNmbrsException
+from src.nmbrs.testing import Dataset, FakeNmbrsServer
+from src.nmbrs.utils.metrics import metrics
+from src.nmbrs.utils.nmbrs_exception_handler import nmbrs_exception_handler
+from src.nmbrs.utils.tracing import PHASES, InMemoryTracer, InstrumentedOperationProxy, OpenTelemetryTracer, Span, Tracer, get_tracer
+from src.nmbrs.utils.tracing import instrument_client, set_tracer, start_span
+from src.nmbrs.utils.tracing import _current_span
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:  # pragma: no cover
+    TracerProvider = None
+
+
+class TestSpan(TestCase):
+    """Unit tests for the Span class."""
+
+    def test_phases(self):
+        """Test that the intervals are assigned to the phases and marking the same phase continues it."""
+        span = Span("Service:Operation", {"nmbrs.resource": "Service:Operation"})
+        span.mark("serialize_request")
+        span.mark("http")
+        span.mark("parse_response")
+        span.mark("build_objects")
+        span.mark("http")
+        span.finish()
+
+        self.assertEqual([phase for phase, _, _ in span.intervals], [*PHASES, "http"])
+        self.assertEqual(list(span.phases), list(PHASES))
+        self.assertAlmostEqual(sum(span.phases.values()), span.duration)
+        self.assertEqual(
+            span.to_dict(),
+            {
+                "name": "Service:Operation",
+                "attributes": {"nmbrs.resource": "Service:Operation"},
+                "duration": span.duration,
+                "phases": span.phases,
+                "error": None,
+            },
+        )
+
+    def test_open_span(self):
+        """Test the duration of a span that did not finish."""
+        span = Span("Service:Operation")
+
+        self.assertIsNone(span.end)
+        self.assertGreaterEqual(span.duration, 0)
+
+
+class TestTracing(TestCase):
+    """Unit tests for the spans of the nmbrs_exception_handler decorator."""
+
+    def setUp(self):
+        self.tracer = InMemoryTracer()
+        set_tracer(self.tracer)
+        self.addCleanup(set_tracer, None)
+
+    def test_default_tracer(self):
+        """Test that no spans are opened with the default tracer."""
+        set_tracer(None)
+
+        self.assertIs(type(get_tracer()), Tracer)
+        self.assertIsNone(start_span("Service:Operation"))
+        Tracer().export(Span("Service:Operation"))
+
+    def test_tenant(self):
+        """Test the tenant of the spans, the domain of the authentication header or else the username."""
+        auth_manager = AuthManager()
+
+        class Owner:  # pylint: disable=too-few-public-methods
+            """A service with an authentication manager."""
+
+            def __init__(self):
+                self.auth_manager = auth_manager
+
+        self.assertNotIn("nmbrs.tenant", start_span("Service:Operation", Owner()).attributes)
+        auth_manager.set_auth_header("user", "token", "domain")
+        self.assertEqual(start_span("Service:Operation", Owner()).attributes["nmbrs.tenant"], "domain")
+        auth_manager.header = {"AuthHeader": {"Username": "user", "Token": "token"}}
+        self.assertEqual(start_span("Service:Operation", Owner()).attributes["nmbrs.tenant"], "user")
+
+    def test_nested_spans(self):
+        """Test that the spans of nested calls finish in order, with an error for the failed call."""
+
+        @nmbrs_exception_handler(resource="Test:Inner")
+        def inner():
+            raise ValueError("invalid")
+
+        @nmbrs_exception_handler(resource="Test:Outer")
+        def outer():
+            with self.assertRaises(ValueError):
+                inner()
+            return [1, 2]
+
+        outer()
+
+        self.assertEqual([span.name for span in self.tracer.spans], ["Test:Inner", "Test:Outer"])
+        self.assertIsInstance(self.tracer.spans[0].error, ValueError)
+        self.assertIsNone(self.tracer.spans[1].error)
+        self.assertIsNone(_current_span.get())
+
+    def test_phases_of_service_calls(self):
+        """Test that the phases of the calls made against the fake server are measured, with resource and tenant."""
+        server = FakeNmbrsServer(Dataset.generate(companies=1, employees=5))
+        server.inject_fault("CompanyService:List_GetAll")
+        with server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri)
+            self.tracer.clear()
+            salaries = api.employee.salary.get_all_by_company(1)
+            with self.assertRaises(UnknownNmbrsException):
+                api.company.get_all()
+
+        self.assertEqual(len(self.tracer.spans), 2)
+        span, failed = self.tracer.spans[0], self.tracer.spans[1]
+        self.assertEqual(span.attributes, {"nmbrs.resource": span.name, "nmbrs.tenant": "fake"})
+        self.assertEqual([phase for phase, _, _ in span.intervals], list(PHASES))
+        self.assertTrue(all(seconds > 0 for seconds in span.phases.values()))
+        self.assertTrue(salaries)
+        self.assertEqual(failed.name, "CompanyService:List_GetAll")
+        self.assertIsInstance(failed.error, UnknownNmbrsException)
+        self.assertEqual([phase for phase, _, _ in failed.intervals], ["serialize_request", "http", "parse_response"])
+
+    def test_phases_of_zeep_calls(self):
+        """Test that the phases of the calls whose requests are created by zeep are measured."""
+        with FakeNmbrsServer(Dataset.generate(companies=1, employees=1)) as server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri)
+            api.company.client.plugins.append(HistoryPlugin())
+            self.tracer.clear()
+            api.company.get_all()
+
+        self.assertEqual([phase for phase, _, _ in self.tracer.spans[0].intervals], list(PHASES))
+
+    def test_instrumented_operations(self):
+        """Test that the operations instrumented without the bindings create their requests with zeep."""
+        with FakeNmbrsServer(Dataset.generate(companies=2, employees=1)) as server:
+            header = Nmbrs("user", "token", base_uri=server.base_uri).auth_manager.header
+            client = instrument_client(Client(f"{server.base_uri}CompanyService.asmx?WSDL"))
+            binding = client.service._binding  # pylint: disable=protected-access
+            with patch.object(binding, "_create", wraps=binding._create) as create:  # pylint: disable=protected-access
+                companies = client.service.List_GetAll(_soapheaders=header)
+
+        self.assertEqual(len(companies), 2)
+        create.assert_called_once()
+        self.assertIsInstance(client.service["List_GetAll"], InstrumentedOperationProxy)
+
+    def test_zeep_send_path(self):
+        """Test that calls are sent by zeep while nothing is measured, and by the proxy when the metrics are enabled."""
+        set_tracer(None)
+        self.addCleanup(_current_span.reset, _current_span.set(None))
+        self.addCleanup(setattr, metrics, "enabled", True)
+        with FakeNmbrsServer(Dataset.generate(companies=2, employees=1)) as server:
+            header = Nmbrs("user", "token", base_uri=server.base_uri).auth_manager.header
+            client = instrument_client(Client(f"{server.base_uri}CompanyService.asmx?WSDL"))
+            binding = client.service._binding  # pylint: disable=protected-access
+            with patch.object(binding, "send", wraps=binding.send) as send:
+                metrics.enabled = False
+                self.assertEqual(len(client.service.List_GetAll(_soapheaders=header)), 2)
+                send.assert_called_once()
+                metrics.enabled = True
+                self.assertEqual(len(client.service.List_GetAll(_soapheaders=header)), 2)
+                send.assert_called_once()
+
+    def test_without_span(self):
+        """Test that instrumented clients work while no span is open, also when returning the raw response."""
+        set_tracer(None)
+        server = FakeNmbrsServer(Dataset.generate(companies=2, employees=1))
+        with server:
+            api = Nmbrs("user", "token", base_uri=server.base_uri)
+            self.assertEqual(len(api.company.get_all()), 2)
+            client = api.company.client
+            with client.settings(raw_response=True):
+                response = client.service.List_GetAll(_soapheaders=api.auth_manager.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"List_GetAllResponse", response.content)
+
+
+@unittest.skipIf(TracerProvider is None, "OpenTelemetry SDK is not installed")
+class TestOpenTelemetryTracer(TestCase):
+    """Unit tests for the OpenTelemetryTracer class."""
+
+    def test_export(self):
+        """Test that a span per call is exported with a child span per phase interval and the error status."""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = OpenTelemetryTracer(tracer_provider=provider)
+
+        span = Span("Service:Operation", {"nmbrs.resource": "Service:Operation", "nmbrs.tenant": "domain"})
+        span.mark("http")
+        span.finish(ValueError("invalid"))
+        tracer.export(span)
+
+        exported = {otel_span.name: otel_span for otel_span in exporter.get_finished_spans()}
+        self.assertEqual(list(exported), ["serialize_request", "http", "Service:Operation"])
+        parent = exported["Service:Operation"]
+        self.assertEqual(dict(parent.attributes), {"nmbrs.resource": "Service:Operation", "nmbrs.tenant": "domain"})
+        self.assertEqual(parent.status.status_code.name, "ERROR")
+        self.assertEqual(parent.start_time, span.start_time)
+        self.assertEqual(exported["http"].parent.span_id, parent.context.span_id)
+        self.assertLessEqual(exported["http"].end_time, parent.end_time)
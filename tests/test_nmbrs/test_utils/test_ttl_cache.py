@@ -0,0 +1,98 @@
+"""Unit tests for the TTLCache class."""
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from src.nmbrs.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Unit tests for the TTLCache class."""
+
+    @patch("src.nmbrs.utils.ttl_cache.monotonic")
+    def test_get_or_compute(self, mock_monotonic):
+        """Test values are reused until they expire."""
+        mock_monotonic.return_value = 0
+        cache = TTLCache(10)
+        compute = Mock(side_effect=[1, 2])
+
+        self.assertEqual(cache.get_or_compute("key", compute), 1)
+        mock_monotonic.return_value = 9
+        self.assertEqual(cache.get_or_compute("key", compute), 1)
+        mock_monotonic.return_value = 10
+        self.assertEqual(cache.get_or_compute("key", compute), 2)
+        self.assertEqual(compute.call_count, 2)
+
+    def test_get_or_compute_disabled(self):
+        """Test a TTL of 0 disables caching."""
+        cache = TTLCache(0)
+        compute = Mock(side_effect=[1, 2])
+        self.assertEqual(cache.get_or_compute("key", compute), 1)
+        self.assertEqual(cache.get_or_compute("key", compute), 2)
+
+    def test_get_or_compute_exception(self):
+        """Test exceptions are not cached."""
+        cache = TTLCache(10)
+        compute = Mock(side_effect=[ValueError, 1])
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("key", compute)
+        self.assertEqual(cache.get_or_compute("key", compute), 1)
+
+    def test_get_or_compute_concurrent(self):
+        """Test a value requested by several threads at once is computed once."""
+        cache = TTLCache(10)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "report"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["report"] * 5)
+
+    def test_discard_and_clear(self):
+        """Test removing entries from the cache."""
+        cache = TTLCache(10)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.discard("a")
+        self.assertEqual(cache.get_or_compute("a", lambda: 3), 3)
+        cache.clear()
+        self.assertEqual(cache.get_or_compute("b", lambda: 4), 4)
+
+    @patch("src.nmbrs.utils.ttl_cache.monotonic")
+    def test_prune(self, mock_monotonic):
+        """Test expired entries are removed."""
+        mock_monotonic.return_value = 0
+        cache = TTLCache(10)
+        cache.get_or_compute("a", lambda: 1)
+        mock_monotonic.return_value = 5
+        cache.get_or_compute("b", lambda: 2)
+        mock_monotonic.return_value = 10
+        cache.prune()
+        self.assertEqual(list(cache._entries), ["b"])
+
+    @patch("src.nmbrs.utils.ttl_cache.monotonic")
+    def test_prune_on_insert(self, mock_monotonic):
+        """Test expired entries are removed when a value is stored."""
+        mock_monotonic.return_value = 0
+        cache = TTLCache(10)
+        cache.get_or_compute("a", lambda: 1)
+        mock_monotonic.return_value = 10
+        cache.get_or_compute("b", lambda: 2)
+        self.assertEqual(list(cache._entries), ["b"])